@@ -13,18 +13,48 @@ from analyzeAudio._theTypes import (
 	SpectrogramMagnitude as SpectrogramMagnitude, SpectrogramPower as SpectrogramPower, 个 as 个, 归个 as 归个, 形 as 形)
 
 # isort: split
-from analyzeAudio._dataBaskets import BleedFull as BleedFull, BleedFullArray as BleedFullArray
+from analyzeAudio._dataBaskets import (
+	BleedFull as BleedFull, BleedFullArray as BleedFullArray, LinearDecibels as LinearDecibels,
+	RecordInstrumentation as RecordInstrumentation)
 
 # isort: split
 from analyzeAudio._beDRY import KValue as KValue
 
 # isort: split
 from analyzeAudio.registry import (
-	audioAspects as audioAspects, audioContests as audioContests, getListAvailableAudioAspects as getListAvailableAudioAspects,
-	getListAvailableAudioContests as getListAvailableAudioContests)
+	audioAspects as audioAspects, audioAspectsStreaming as audioAspectsStreaming, audioContests as audioContests,
+	getListAvailableAudioAspects as getListAvailableAudioAspects, getListAvailableAudioContests as getListAvailableAudioContests)
 
 # isort: split
-from analyzeAudio.analyze import analyzeAudioFile as analyzeAudioFile, analyzeAudioListPathFilenames as analyzeAudioListPathFilenames
+from analyzeAudio._analysisSession import AnalysisSession as AnalysisSession
+
+# isort: split
+from analyzeAudio._cacheAspectValues import CacheAspectValues as CacheAspectValues
+
+# isort: split
+from analyzeAudio._cacheFFprobe import CacheFFprobe as CacheFFprobe
+from analyzeAudio.analyzersUseFilename._wideRange import cacheFFprobe as cacheFFprobe
+
+# isort: split
+from analyzeAudio._cacheSTFT import CacheSTFT as CacheSTFT
+
+# isort: split
+from analyzeAudio._spectralFeatures import CacheSpectralFeatures as CacheSpectralFeatures, SpectralFeatures as SpectralFeatures
+
+# isort: split
+from analyzeAudio._summaryStatistics import SummaryStatistics as SummaryStatistics
+
+# isort: split
+from analyzeAudio.analyzersUseFilename._ebur128NumPy import blockEnergiesEBUR128 as blockEnergiesEBUR128
+
+# isort: split
+from analyzeAudio._instrumentation import InstrumentationAnalysis as InstrumentationAnalysis
+
+# isort: split
+from analyzeAudio.analyze import (
+	analyzeAudioFile as analyzeAudioFile, analyzeAudioFileStreaming as analyzeAudioFileStreaming,
+	analyzeAudioIterablePathFilenames as analyzeAudioIterablePathFilenames, analyzeAudioListPathFilenames as analyzeAudioListPathFilenames,
+	analyzeContestListPathFilenames as analyzeContestListPathFilenames, analyzeContestReference as analyzeContestReference)
 
 # isort: split
 from analyzeAudio._misfit import dataTabularTOpathFilenameDelimited as dataTabularTOpathFilenameDelimited
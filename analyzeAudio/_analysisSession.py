@@ -0,0 +1,127 @@
+"""Keep a pool of warm worker processes for repeated many-file analysis.
+
+(AI generated docstring)
+
+You can use this module to pay the start-up cost of the worker processes once. Because
+`analyzeAudio.registry` selects the `spawn` start method, each new worker process starts a fresh
+interpreter and imports `analyzeAudio` with every analyzer dependency, such as `torch`, `librosa`,
+`torchmetrics`, and `auraloss`. An `AnalysisSession` starts its workers when you enter it, and every
+batch that you submit through the session reuses the same workers.
+
+Contents
+--------
+Classes
+	AnalysisSession
+		Own a process pool whose workers have already imported `analyzeAudio`.
+
+References
+----------
+[1] `analyzeAudio.analyze.analyzeAudioIterablePathFilenames`
+
+[2] `analyzeAudio.analyze.analyzeAudioListPathFilenames`
+
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, wait
+from hunterMakesPy.parseParameters import defineConcurrencyLimit
+from typing import TYPE_CHECKING
+import os
+
+if TYPE_CHECKING:
+	from types import TracebackType
+	from typing_extensions import Self
+
+def _initializeWorker() -> int:
+	# Unpickling this function in a new worker imports `analyzeAudio`, and therefore the registry and every analyzer module.
+	return os.getpid()
+
+class AnalysisSession:
+	"""Own a process pool whose workers have already imported `analyzeAudio`.
+
+	You can use this class as a context manager around many calls to
+	`analyzeAudioIterablePathFilenames` [1] or `analyzeAudioListPathFilenames` [2]. Pass the session as
+	the `analysisSession` keyword argument, and the function submits its files to the workers of the
+	session instead of starting a new process pool.
+
+	Attributes
+	----------
+	max_workers : int
+		Number of worker processes.
+	warmUp : bool
+		If `True`, entering the session waits until every worker has started and imported
+		`analyzeAudio`.
+
+	Examples
+	--------
+	```python
+	from analyzeAudio import AnalysisSession, analyzeAudioListPathFilenames
+
+	with AnalysisSession(CPUlimit=4) as analysisSession:
+		for listPathFilenames in batches:
+			rows = analyzeAudioListPathFilenames(listPathFilenames, ['LUFS integrated'], analysisSession=analysisSession)
+	```
+
+	References
+	----------
+	[1] `analyzeAudio.analyze.analyzeAudioIterablePathFilenames`
+
+	[2] `analyzeAudio.analyze.analyzeAudioListPathFilenames`
+
+	"""
+
+	def __init__(self, *, CPUlimit: bool | float | int | None = None, warmUp: bool = True) -> None:
+		"""Describe a session; the worker processes start when you enter the session.
+
+		Parameters
+		----------
+		CPUlimit : bool | float | int | None = None
+			Worker-count value, forwarded to `hunterMakesPy.parseParameters.defineConcurrencyLimit`.
+		warmUp : bool = True
+			If `True`, entering the session waits until every worker has started.
+
+		"""
+		self.max_workers: int = defineConcurrencyLimit(limit=CPUlimit)
+		self.warmUp: bool = warmUp
+		self._concurrencyManager: ProcessPoolExecutor | None = None
+
+	@property
+	def concurrencyManager(self) -> ProcessPoolExecutor:
+		"""Process pool of the session.
+
+		Raises
+		------
+		RuntimeError
+			If the session is not open.
+
+		"""
+		if self._concurrencyManager is None:
+			message: str = 'I received a request for the worker pool of an `AnalysisSession`, but the session is not open. Use `with AnalysisSession() as analysisSession:`.'
+			raise RuntimeError(message)
+		return self._concurrencyManager
+
+	def __enter__(self) -> Self:
+		"""Start the worker processes and, if `warmUp` is `True`, wait until each worker has started.
+
+		Returns
+		-------
+		analysisSession : Self
+			The open session.
+
+		"""
+		if self._concurrencyManager is None:
+			self._concurrencyManager = ProcessPoolExecutor(self.max_workers, initializer=_initializeWorker)
+			if self.warmUp:
+				# Each submission finds no idle worker, so the pool starts one worker per submission.
+				wait([self._concurrencyManager.submit(_initializeWorker) for _worker in range(self.max_workers)])
+		return self
+
+	def __exit__(self, type_: type[BaseException] | None, value: BaseException | None, traceback: TracebackType | None) -> None:
+		"""Stop the worker processes after pending files finish; files not yet started are cancelled."""
+		self.close()
+
+	def close(self) -> None:
+		"""Stop the worker processes after pending files finish; files not yet started are cancelled."""
+		if self._concurrencyManager is not None:
+			self._concurrencyManager.shutdown(wait=True, cancel_futures=True)
+			self._concurrencyManager = None
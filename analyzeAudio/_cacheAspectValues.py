@@ -0,0 +1,402 @@
+"""Persist computed aspect values on disk so that unchanged files are not analyzed again.
+
+(AI generated docstring)
+
+You can use this module to keep the aspect values that `analyzeAudio.analyzeAudioFile` [1]
+computes in a SQLite database. Each stored value is keyed by the identity of the audio file, the
+aspect name, and the version of the registered analyzer with the engine of its FFmpeg filter and the
+number of FFprobe time segments, so a changed file, a changed analyzer, a different engine, or a
+different number of segments never receives a stale value.
+
+Contents
+--------
+Classes
+	CacheAspectValues
+		Store and retrieve aspect values in a size-capped SQLite database.
+
+Functions
+	getAnalyzerVersion
+		Return a text identifier that changes when a registered analyzer changes.
+
+References
+----------
+[1] `analyzeAudio.analyze.analyzeAudioFile`
+
+[2] Python standard library documentation for `sqlite3`
+	https://docs.python.org/3/library/sqlite3.html
+
+"""
+from __future__ import annotations
+
+from analyzeAudio.analyzersUseFilename._wideRange import getFilterFFmpeg, getSegmentsFilter
+from analyzeAudio.registry import audioAspects
+from contextlib import contextmanager
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
+import ast
+import hashlib
+import importlib.util
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+
+if TYPE_CHECKING:
+	from collections.abc import Callable, Iterable, Iterator, Mapping
+	from typing import Any
+
+try:
+	versionAnalyzeAudio: str = version('analyzeAudio')
+except PackageNotFoundError:
+	versionAnalyzeAudio = '0'
+
+@cache
+def getAnalyzerVersion(analyzer: Callable[..., Any]) -> str:
+	"""Return a text identifier that changes when a registered analyzer changes.
+
+	The identifier combines the installed version of `analyzeAudio` with a digest of the source of
+	the module of `analyzer` and of each function that `analyzer` wraps, such as the framewise
+	analyzer of a summary analyzer, of the source of each module of `analyzeAudio` that those
+	modules import from, directly or through another module, and of the compiled code and constants
+	of those functions. Editing `analyzer`, editing a helper that it calls, such as
+	`ffprobeAllInclusiveCache` or an engine, or installing a different release of the package
+	therefore invalidates every value that `analyzer` stored, but editing a module that `analyzer`
+	does not import from, such as another analyzer, does not.
+
+	Parameters
+	----------
+	analyzer : Callable[..., Any]
+		A registered analyzer function.
+
+	Returns
+	-------
+	analyzerVersion : str
+		Text identifier of the current version of `analyzer`.
+
+	"""
+	hashAnalyzer = hashlib.blake2b(digest_size=16)
+	hashAnalyzer.update(f'{analyzer.__module__}.{analyzer.__qualname__}'.encode())
+	analyzerLayer: Callable[..., Any] | None = analyzer
+	while analyzerLayer is not None:
+		hashAnalyzer.update(_getDigestModule(getattr(analyzerLayer, '__module__', None)))
+		codeAnalyzer = getattr(analyzerLayer, '__code__', None)
+		if codeAnalyzer is not None:
+			hashAnalyzer.update(codeAnalyzer.co_code)
+			hashAnalyzer.update(repr(codeAnalyzer.co_consts).encode())
+		analyzerLayer = getattr(analyzerLayer, '__wrapped__', None)
+	return f'{versionAnalyzeAudio}:{hashAnalyzer.hexdigest()}'
+
+class CacheAspectValues:
+	"""Store and retrieve aspect values in a size-capped SQLite database.
+
+	You can pass an instance to `analyzeAudio.analyzeAudioFile` or to the functions that analyze
+	many files. Before it decodes a file, `analyzeAudioFile` asks the cache for each requested
+	aspect, computes only the aspects that the cache does not have, and stores the new values.
+
+	A file is identified either by its resolved path, size in bytes, and modification time, which
+	costs one `os.stat`, or by a digest of its content, which survives renaming and copying but
+	costs one full read of the file. The database keeps the recorded size of the stored values as a
+	running total, and when the total exceeds `bytesLimit`, the least recently used values are
+	evicted.
+
+	An instance is safe to send to worker processes and to share between threads: each process and
+	each thread opens its own connection to the same database file, and SQLite serializes the
+	writes [1].
+
+	Attributes
+	----------
+	pathFilenameCache : Path
+		Path of the SQLite database file.
+	bytesLimit : int | None
+		Maximum recorded size of the stored values in bytes, or `None` for no limit.
+	identifyByContent : bool
+		If `True`, identify files by a digest of their content instead of by path, size, and
+		modification time.
+
+	References
+	----------
+	[1] Python standard library documentation for `sqlite3`
+		https://docs.python.org/3/library/sqlite3.html
+
+	"""
+
+	def __init__(self, pathFilenameCache: str | os.PathLike[str], *, bytesLimit: int | None = 2**28, identifyByContent: bool = False) -> None:
+		"""Open or create the cache database at `pathFilenameCache`.
+
+		Parameters
+		----------
+		pathFilenameCache : str | os.PathLike[str]
+			Path of the SQLite database file. The parent directory is created if necessary.
+		bytesLimit : int | None = 2**28
+			Maximum recorded size of the stored values in bytes. The recorded size of one value is
+			the length of its key text plus the length of its serialized value; the database file is
+			somewhat larger. Use `None` for no limit.
+		identifyByContent : bool = False
+			If `True`, identify files by a digest of their content.
+
+		Raises
+		------
+		ValueError
+			If `bytesLimit` is less than `0`.
+
+		"""
+		if bytesLimit is not None and bytesLimit < 0:
+			message: str = f'I received `{bytesLimit = }`, but I need `None` or an integer greater than or equal to `0`.'
+			raise ValueError(message)
+		self.pathFilenameCache: Path = Path(pathFilenameCache)
+		self.bytesLimit: int | None = bytesLimit
+		self.identifyByContent: bool = identifyByContent
+		self._dictionaryConnections: dict[tuple[int, int], sqlite3.Connection] = {}
+
+	def __getstate__(self) -> dict[str, Any]:
+		"""I use this method to leave the open connections behind when an instance is sent to another process."""
+		state: dict[str, Any] = self.__dict__.copy()
+		state['_dictionaryConnections'] = {}
+		return state
+
+	@property
+	def connection(self) -> sqlite3.Connection:
+		"""Connection to the cache database that belongs to the current process and thread."""
+		identifierConnection: tuple[int, int] = (os.getpid(), threading.get_ident())
+		connection: sqlite3.Connection | None = self._dictionaryConnections.get(identifierConnection)
+		if connection is None:
+			self.pathFilenameCache.parent.mkdir(parents=True, exist_ok=True)
+			# A new thread can reuse the identifier of a finished thread, and therefore its connection.
+			connection = sqlite3.connect(self.pathFilenameCache, timeout=60, isolation_level=None, check_same_thread=False)
+			self._dictionaryConnections[identifierConnection] = connection
+			connection.execute('PRAGMA journal_mode=WAL')
+			# The triggers keep the sum of `sizeBytes` in the one row of `aspectValuesSize`, so no store needs to sum the table.
+			connection.executescript(
+				'BEGIN IMMEDIATE;'
+				'CREATE TABLE IF NOT EXISTS aspectValues ('
+				'identityFile TEXT NOT NULL, aspectName TEXT NOT NULL, analyzerVersion TEXT NOT NULL, '
+				'aspectValue BLOB NOT NULL, sizeBytes INTEGER NOT NULL, timeAccessed REAL NOT NULL, '
+				'PRIMARY KEY (identityFile, aspectName, analyzerVersion));'
+				'CREATE INDEX IF NOT EXISTS aspectValuesTimeAccessed ON aspectValues (timeAccessed);'
+				'CREATE TABLE IF NOT EXISTS aspectValuesSize (identifier INTEGER PRIMARY KEY CHECK (identifier = 0), sizeBytes INTEGER NOT NULL);'
+				'INSERT OR IGNORE INTO aspectValuesSize SELECT 0, COALESCE(SUM(sizeBytes), 0) FROM aspectValues;'
+				'CREATE TRIGGER IF NOT EXISTS aspectValuesInsert AFTER INSERT ON aspectValues '
+				'BEGIN UPDATE aspectValuesSize SET sizeBytes = sizeBytes + NEW.sizeBytes; END;'
+				'CREATE TRIGGER IF NOT EXISTS aspectValuesUpdate AFTER UPDATE OF sizeBytes ON aspectValues '
+				'BEGIN UPDATE aspectValuesSize SET sizeBytes = sizeBytes - OLD.sizeBytes + NEW.sizeBytes; END;'
+				'CREATE TRIGGER IF NOT EXISTS aspectValuesDelete AFTER DELETE ON aspectValues '
+				'BEGIN UPDATE aspectValuesSize SET sizeBytes = sizeBytes - OLD.sizeBytes; END;'
+				'COMMIT;')
+		return connection
+
+	def identifyFile(self, pathFilename: str | os.PathLike[Any]) -> str:
+		"""Return the identity text of `pathFilename` that keys the stored values.
+
+		Parameters
+		----------
+		pathFilename : str | os.PathLike[Any]
+			Path of an audio file.
+
+		Returns
+		-------
+		identityFile : str
+			A digest of the content of `pathFilename` if `identifyByContent` is `True`, otherwise the
+			resolved path, size, and modification time of `pathFilename`.
+
+		"""
+		if self.identifyByContent:
+			hashFile = hashlib.blake2b()
+			with Path(pathFilename).open('rb') as readStream:
+				while chunk := readStream.read(2**20):
+					hashFile.update(chunk)
+			return f'blake2b:{hashFile.hexdigest()}'
+		pathResolved: Path = Path(pathFilename).resolve()
+		statFile: os.stat_result = pathResolved.stat()
+		return f'{pathResolved.as_posix()}\x00{statFile.st_size}\x00{statFile.st_mtime_ns}'
+
+	def getAspectValues(self, identityFile: str, listAspectNames: Iterable[str], *, dictionaryEngines: Mapping[str, str] | None = None, segmentsFFprobe: int = 1) -> dict[str, Any]:
+		"""Return the stored values of the current analyzers for one file.
+
+		Parameters
+		----------
+		identityFile : str
+			Identity text from `identifyFile`.
+		listAspectNames : Iterable[str]
+			Registered aspect names to look up.
+		dictionaryEngines : Mapping[str, str] | None = None
+			Engine of each FFmpeg filter, from `getEnginesFFmpeg` [1]. The value of an aspect from one
+			engine is not the value of the aspect from another engine. If `None`, FFmpeg computes the
+			statistics of each filter.
+		segmentsFFprobe : int = 1
+			Number of time segments that concurrent FFprobe processes measure. The value of an aspect
+			from joined segments can differ from the value from one process.
+
+		Returns
+		-------
+		dictionaryAspectValues : dict[str, Any]
+			Stored value for each aspect name in `listAspectNames` that the cache has. Aspect names
+			without a stored value are absent.
+
+		References
+		----------
+		[1] `analyzeAudio.analyzersUseFilename._wideRange.getEnginesFFmpeg`
+
+		"""
+		dictionaryAnalyzerVersions: dict[str, str] = {aspectName: _getAnalyzerVersionEngine(aspectName, dictionaryEngines, segmentsFFprobe) for aspectName in listAspectNames}
+		dictionaryAspectValues: dict[str, Any] = {}
+		if not dictionaryAnalyzerVersions:
+			return dictionaryAspectValues
+		connection: sqlite3.Connection = self.connection
+		cursor: sqlite3.Cursor = connection.execute(
+			f"SELECT aspectName, analyzerVersion, aspectValue FROM aspectValues WHERE identityFile = ? AND aspectName IN ({', '.join('?' * len(dictionaryAnalyzerVersions))})"  # noqa: S608
+			, (identityFile, *dictionaryAnalyzerVersions))
+		for aspectName, analyzerVersion, aspectValuePickled in cursor:
+			if analyzerVersion == dictionaryAnalyzerVersions[aspectName]:
+				dictionaryAspectValues[aspectName] = pickle.loads(aspectValuePickled)  # noqa: S301
+		if dictionaryAspectValues:
+			timeAccessed: float = time.time()
+			with self._transaction():
+				connection.executemany(
+					'UPDATE aspectValues SET timeAccessed = ? WHERE identityFile = ? AND aspectName = ? AND analyzerVersion = ?'
+					, [(timeAccessed, identityFile, aspectName, dictionaryAnalyzerVersions[aspectName]) for aspectName in dictionaryAspectValues])
+		return dictionaryAspectValues
+
+	def setAspectValues(self, identityFile: str, dictionaryAspectValues: Mapping[str, Any], *, dictionaryEngines: Mapping[str, str] | None = None, segmentsFFprobe: int = 1) -> None:
+		"""Store newly computed values for one file and enforce `bytesLimit`.
+
+		Parameters
+		----------
+		identityFile : str
+			Identity text from `identifyFile`.
+		dictionaryAspectValues : Mapping[str, Any]
+			Computed value for each registered aspect name.
+		dictionaryEngines : Mapping[str, str] | None = None
+			Engine of each FFmpeg filter that computed the values, as in `getAspectValues`.
+		segmentsFFprobe : int = 1
+			Number of time segments that concurrent FFprobe processes measured, as in `getAspectValues`.
+
+		"""
+		timeAccessed: float = time.time()
+		listRows: list[tuple[str, str, str, bytes, int, float]] = []
+		for aspectName, aspectValue in dictionaryAspectValues.items():
+			analyzerVersion: str = _getAnalyzerVersionEngine(aspectName, dictionaryEngines, segmentsFFprobe)
+			aspectValuePickled: bytes = pickle.dumps(aspectValue)
+			sizeBytes: int = len(identityFile) + len(aspectName) + len(analyzerVersion) + len(aspectValuePickled)
+			listRows.append((identityFile, aspectName, analyzerVersion, aspectValuePickled, sizeBytes, timeAccessed))
+		with self._transaction() as connection:
+			connection.executemany(
+				'INSERT INTO aspectValues VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (identityFile, aspectName, analyzerVersion) DO UPDATE SET '
+				'aspectValue = excluded.aspectValue, sizeBytes = excluded.sizeBytes, timeAccessed = excluded.timeAccessed'
+				, listRows)
+			if self.bytesLimit is not None:
+				self.evict(self.bytesLimit)
+
+	def evict(self, bytesLimit: int = 0) -> None:
+		"""Remove the least recently used values until the recorded size is at most `bytesLimit`.
+
+		Parameters
+		----------
+		bytesLimit : int = 0
+			Maximum recorded size in bytes after eviction. The default removes every value.
+
+		"""
+		with self._transaction() as connection:
+			sizeTotal: int = self.getSizeBytes()
+			if sizeTotal <= bytesLimit:
+				return
+			cursor: sqlite3.Cursor = connection.execute('SELECT rowid, sizeBytes FROM aspectValues ORDER BY timeAccessed')
+			listRowIdentifiers: list[int] = []
+			for rowIdentifier, sizeBytes in cursor:
+				if sizeTotal <= bytesLimit:
+					break
+				listRowIdentifiers.append(rowIdentifier)
+				sizeTotal -= sizeBytes
+			cursor.close()
+			connection.executemany('DELETE FROM aspectValues WHERE rowid = ?', [(rowIdentifier,) for rowIdentifier in listRowIdentifiers])
+
+	def getSizeBytes(self) -> int:
+		"""Return the recorded size of the stored values in bytes.
+
+		Returns
+		-------
+		sizeBytes : int
+			Sum of the recorded sizes of every stored value, from the running total in the database.
+
+		"""
+		return self.connection.execute('SELECT sizeBytes FROM aspectValuesSize').fetchone()[0]
+
+	@contextmanager
+	def _transaction(self) -> Iterator[sqlite3.Connection]:
+		"""I use this method to run several statements in one transaction, so that SQLite locks the database and writes the journal once instead of once for each statement."""
+		connection: sqlite3.Connection = self.connection
+		if connection.in_transaction:
+			yield connection
+			return
+		connection.execute('BEGIN IMMEDIATE')
+		try:
+			yield connection
+		except BaseException:
+			connection.execute('ROLLBACK')
+			raise
+		connection.execute('COMMIT')
+
+	def close(self) -> None:
+		"""Close every connection of the current process, if any."""
+		processIdentifier: int = os.getpid()
+		for identifierConnection in [identifierConnection for identifierConnection in self._dictionaryConnections if identifierConnection[0] == processIdentifier]:
+			self._dictionaryConnections.pop(identifierConnection).close()
+
+def _getAnalyzerVersionEngine(aspectName: str, dictionaryEngines: Mapping[str, str] | None, segmentsFFprobe: int) -> str:
+	"""I use this function to add the engine and the time segments of the FFmpeg filter of an aspect to the version of its analyzer, because they change the values somewhat."""
+	analyzer: Callable[..., Any] = audioAspects[aspectName]['analyzer']
+	filterName: str | None = getFilterFFmpeg(analyzer)
+	if filterName is None:
+		return getAnalyzerVersion(analyzer)
+	engine: str = (dictionaryEngines or {}).get(filterName, 'FFmpeg')
+	segmentsFilter: int = getSegmentsFilter(filterName, engine, segmentsFFprobe)
+	return f"{getAnalyzerVersion(analyzer)}:{engine}" + (f":segments{segmentsFilter}" if segmentsFilter > 1 else '')
+
+@cache
+def _getDigestModule(moduleName: str | None) -> bytes:
+	"""I use this function to digest the source of the module of an analyzer and of each module of `analyzeAudio` that it depends on."""
+	hashModules = hashlib.blake2b(digest_size=16)
+	for moduleNameDependency in sorted(_getModulesDependency(moduleName)):
+		pathFilename: str | None = getattr(sys.modules.get(moduleNameDependency), '__file__', None)
+		if pathFilename is not None and Path(pathFilename).is_file():
+			hashModules.update(moduleNameDependency.encode())
+			hashModules.update(Path(pathFilename).read_bytes())
+	return hashModules.digest()
+
+def _getModulesDependency(moduleName: str | None) -> set[str]:
+	"""I use this function to find `moduleName` and, transitively, each module of `analyzeAudio` that defines a name that it imports.
+
+	A module that is imported as a whole, such as the analyzer modules that `analyzeAudio.registry`
+	imports to register their analyzers, is not a dependency, so one analyzer does not depend on
+	every other analyzer.
+	"""
+	setModuleNames: set[str] = set()
+	listModuleNamesPending: list[str] = [moduleName] if moduleName in sys.modules else []
+	while listModuleNamesPending:
+		moduleNameCurrent: str = listModuleNamesPending.pop()
+		if moduleNameCurrent in setModuleNames:
+			continue
+		setModuleNames.add(moduleNameCurrent)
+		module = sys.modules[moduleNameCurrent]
+		pathFilename: str | None = getattr(module, '__file__', None)
+		if pathFilename is None or not Path(pathFilename).is_file():
+			continue
+		for node in ast.walk(ast.parse(Path(pathFilename).read_bytes())):
+			if not isinstance(node, ast.ImportFrom):
+				continue
+			moduleNameImported: str = importlib.util.resolve_name('.' * node.level + (node.module or ''), module.__package__) if node.level else (node.module or '')
+			moduleImported = sys.modules.get(moduleNameImported)
+			for alias in node.names:
+				objectImported: Any = getattr(moduleImported, alias.name, None)
+				if objectImported is None or isinstance(objectImported, ModuleType):
+					continue
+				moduleNameDefinition: Any = getattr(objectImported, '__module__', None)
+				if not isinstance(moduleNameDefinition, str) or moduleNameDefinition not in sys.modules:
+					moduleNameDefinition = moduleNameImported
+				if moduleNameDefinition.partition('.')[0] == __name__.partition('.')[0]:
+					listModuleNamesPending.append(moduleNameDefinition)
+	return setModuleNames
@@ -0,0 +1,212 @@
+"""Keep the FFprobe statistics of recently analyzed files in memory, within a size limit.
+
+(AI generated docstring)
+
+You can use this module to bound the memory that the FFprobe statistics of analyzed files hold in a
+long-running process. Each file is identified by its resolved path, size in bytes, and modification
+time, so the spellings `str` and `Path` of one file share one entry, and a file that is rewritten in
+place is analyzed again. When the statistics of all files exceed the size limit, the statistics of
+the least recently used files are evicted.
+
+Contents
+--------
+Classes
+	CacheFFprobe
+		Keep the statistics of each FFmpeg filter for recently analyzed files, within a size limit.
+
+References
+----------
+[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+import threading
+
+if TYPE_CHECKING:
+	from analyzeAudio import ArrayChannelData, ArrayOverallData
+	from collections.abc import Iterable, Mapping
+	from os import PathLike, stat_result
+	from typing import Any
+
+class CacheFFprobe:
+	"""Keep the statistics of each FFmpeg filter for recently analyzed files, within a size limit.
+
+	`ffprobeAllInclusiveCache` [1] keeps its statistics in the instance `analyzeAudio.cacheFFprobe`.
+	One entry holds, for one file, the statistics of each FFmpeg filter that already ran on the file.
+	The statistics of a filter that an engine other than FFmpeg computed have their own key, such as
+	'astats:NumPy', so the statistics of each engine stay apart.
+	The recorded size of an entry is the number of bytes of its arrays. When the recorded size of all
+	entries exceeds `bytesLimit`, the least recently used entries are evicted.
+
+	An instance is safe to share between threads. Each process has its own instance.
+
+	Attributes
+	----------
+	bytesLimit : int | None
+		Maximum recorded size of the entries in bytes, or `None` for no limit.
+	hits : int
+		Number of lookups that found the statistics of every requested filter.
+	misses : int
+		Number of lookups that did not find the statistics of every requested filter.
+	evictions : int
+		Number of entries evicted to enforce `bytesLimit` or because the file changed.
+
+	Examples
+	--------
+	```python
+	from analyzeAudio import cacheFFprobe
+
+	cacheFFprobe.bytesLimit = 2**26
+	print(cacheFFprobe.hits, cacheFFprobe.misses, cacheFFprobe.getSizeBytes())
+	```
+
+	References
+	----------
+	[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+	"""
+
+	def __init__(self, *, bytesLimit: int | None = 2**28) -> None:
+		"""Create an empty cache.
+
+		Parameters
+		----------
+		bytesLimit : int | None = 2**28
+			Maximum recorded size of the entries in bytes. Use `None` for no limit.
+
+		Raises
+		------
+		ValueError
+			If `bytesLimit` is less than `0`.
+
+		"""
+		if bytesLimit is not None and bytesLimit < 0:
+			message: str = f'I received `{bytesLimit = }`, but I need `None` or an integer greater than or equal to `0`.'
+			raise ValueError(message)
+		self.bytesLimit: int | None = bytesLimit
+		self.hits: int = 0
+		self.misses: int = 0
+		self.evictions: int = 0
+		self._entries: OrderedDict[str, dict[str, dict[str, ArrayChannelData | ArrayOverallData]]] = OrderedDict()
+		self._sizesBytes: dict[str, int] = {}
+		self._identityOfPath: dict[str, str] = {}
+		self._lock: threading.Lock = threading.Lock()
+
+	def identifyFile(self, pathFilename: str | PathLike[Any]) -> str:
+		"""Return the identity text of `pathFilename` that keys its entry.
+
+		Parameters
+		----------
+		pathFilename : str | PathLike[Any]
+			Path of an audio file.
+
+		Returns
+		-------
+		identityFile : str
+			The resolved path, size, and modification time of `pathFilename`.
+
+		"""
+		pathResolved: Path = Path(pathFilename).resolve()
+		statFile: stat_result = pathResolved.stat()
+		return f'{pathResolved.as_posix()}\x00{statFile.st_size}\x00{statFile.st_mtime_ns}'
+
+	def getFilterAspects(self, identityFile: str, filterNames: Iterable[str]) -> dict[str, dict[str, ArrayChannelData | ArrayOverallData]]:
+		"""Return the stored statistics of the requested filters for one file and count the lookup.
+
+		Parameters
+		----------
+		identityFile : str
+			Identity text from `identifyFile`.
+		filterNames : Iterable[str]
+			Names of the requested FFmpeg filters.
+
+		Returns
+		-------
+		dictionaryFilterAspects : dict[str, dict[str, ArrayChannelData | ArrayOverallData]]
+			Stored statistics of each requested filter that already ran on the file. Filters that did
+			not run yet are absent.
+
+		"""
+		setFilterNames: set[str] = set(filterNames)
+		with self._lock:
+			dictionaryFilterAspectsStored: dict[str, dict[str, ArrayChannelData | ArrayOverallData]] = self._entries.get(identityFile, {})
+			if identityFile in self._entries:
+				self._entries.move_to_end(identityFile)
+			dictionaryFilterAspects = {filterName: dictionaryFilterAspectsStored[filterName] for filterName in setFilterNames if filterName in dictionaryFilterAspectsStored}
+			if len(dictionaryFilterAspects) == len(setFilterNames):
+				self.hits += 1
+			else:
+				self.misses += 1
+		return dictionaryFilterAspects
+
+	def setFilterAspects(self, identityFile: str, dictionaryFilterAspects: Mapping[str, dict[str, ArrayChannelData | ArrayOverallData]]) -> None:
+		"""Add the statistics of newly run filters to the entry of one file and enforce `bytesLimit`.
+
+		An entry of an earlier version of the same file is evicted.
+
+		Parameters
+		----------
+		identityFile : str
+			Identity text from `identifyFile`.
+		dictionaryFilterAspects : Mapping[str, dict[str, ArrayChannelData | ArrayOverallData]]
+			Statistics of each filter that ran on the file.
+
+		"""
+		pathResolved: str = identityFile.partition('\x00')[0]
+		with self._lock:
+			identityPrevious: str | None = self._identityOfPath.get(pathResolved)
+			if identityPrevious is not None and identityPrevious != identityFile and identityPrevious in self._entries:
+				self._evictEntry(identityPrevious)
+			self._identityOfPath[pathResolved] = identityFile
+			self._entries.setdefault(identityFile, {}).update(dictionaryFilterAspects)
+			self._entries.move_to_end(identityFile)
+			self._sizesBytes[identityFile] = self._sizesBytes.get(identityFile, 0) + sum(
+				arrayAspect.nbytes for dictionaryAspects in dictionaryFilterAspects.values() for arrayAspect in dictionaryAspects.values())
+			if self.bytesLimit is not None:
+				self._evict(self.bytesLimit, identityFile)
+
+	def evict(self, bytesLimit: int = 0) -> None:
+		"""Remove the least recently used entries until the recorded size is at most `bytesLimit`.
+
+		Parameters
+		----------
+		bytesLimit : int = 0
+			Maximum recorded size in bytes after eviction. The default removes every entry.
+
+		"""
+		with self._lock:
+			self._evict(bytesLimit, None)
+
+	def getSizeBytes(self) -> int:
+		"""Return the recorded size of the entries in bytes.
+
+		Returns
+		-------
+		sizeBytes : int
+			Sum of the number of bytes of every stored array.
+
+		"""
+		with self._lock:
+			return sum(self._sizesBytes.values())
+
+	def _evict(self, bytesLimit: int, identityFileKeep: str | None) -> None:
+		# The entry that was just stored stays even if it alone exceeds `bytesLimit`: its statistics are about to be read.
+		sizeTotal: int = sum(self._sizesBytes.values())
+		for identityFile in list(self._entries):
+			if sizeTotal <= bytesLimit:
+				break
+			if identityFile != identityFileKeep:
+				sizeTotal -= self._sizesBytes[identityFile]
+				self._evictEntry(identityFile)
+
+	def _evictEntry(self, identityFile: str) -> None:
+		del self._entries[identityFile]
+		del self._sizesBytes[identityFile]
+		pathResolved: str = identityFile.partition('\x00')[0]
+		if self._identityOfPath.get(pathResolved) == identityFile:
+			del self._identityOfPath[pathResolved]
+		self.evictions += 1
@@ -0,0 +1,197 @@
+"""Share the short-time Fourier transform of one signal at one resolution among the contests of a request.
+
+(AI generated docstring)
+
+You can use this module to compute each short-time Fourier transform (STFT) of a signal once, even
+when many contests ask for it. `analyzeAudio.analyzeContestReference` [1] opens a `CacheSTFT` for
+the reference and its comparands: the contests that compare spectrograms, such as the `auraloss`
+losses [2], then read the STFT of the reference at each resolution from the cache instead of
+computing it again for each contest and each comparand. Outside an open `CacheSTFT`, `stftShared`
+computes each STFT.
+
+Contents
+--------
+Classes
+	CacheSTFT
+		Hold the STFTs of the signals of one request at each resolution.
+
+Functions
+	stftShared
+		Return the complex STFT of `signal` from the open `CacheSTFT`, or compute it.
+
+References
+----------
+[1] `analyzeAudio.analyze.analyzeContestReference`
+
+[2] Steinmetz, C. J., Reiss, J. D., & Bryan, N. J. `csteinmetz1/auraloss`.
+	https://github.com/csteinmetz1/auraloss
+
+"""
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+import torch
+import weakref
+
+if TYPE_CHECKING:
+	from contextvars import Token
+	from torch import Tensor
+	from types import TracebackType
+	from typing import Any
+	from typing_extensions import Self
+
+_contextCacheSTFT: ContextVar[CacheSTFT | None] = ContextVar('_contextCacheSTFT', default=None)
+
+class CacheSTFT:
+	"""Hold the STFTs of the signals of one request at each resolution.
+
+	Each entry is the complex STFT of one signal at one resolution: the FFT length, the hop, the
+	window, and whether the frames are centered. A signal is a view of a tensor, such as the
+	`tensorAudio` of `AudioIntermediates`, so the STFT of a channel, a batch, or a reshaped view of
+	the same samples is a different entry. If the samples of the tensor change in place, the entry no
+	longer matches.
+
+	The cache does not keep the tensors of the signals alive. When the tensor of a signal is released,
+	such as the comparand after its contests, I release its STFTs, and when the `with` block ends, I
+	release every STFT.
+
+	Attributes
+	----------
+	hits : int
+		Number of requests that read an STFT that the cache already held.
+	misses : int
+		Number of requests that computed an STFT.
+
+	Examples
+	--------
+	```python
+	from analyzeAudio._cacheSTFT import CacheSTFT
+	from analyzeAudio.contestsTensor import analyzeMultiResolutionSTFTLossMean, analyzeSTFTLossMean
+
+	with CacheSTFT():
+		for tensorAudioBeta in listTensorsAudioBeta:
+			analyzeSTFTLossMean(tensorAudioAlfa, tensorAudioBeta)
+			analyzeMultiResolutionSTFTLossMean(tensorAudioAlfa, tensorAudioBeta)
+	```
+
+	"""
+
+	def __init__(self) -> None:
+		"""Prepare an empty cache."""
+		self.hits: int = 0
+		self.misses: int = 0
+		self._dictionarySTFT: dict[tuple[Any, ...], Tensor] = {}
+		self._dictionaryFinalizers: dict[int, weakref.finalize[..., Any]] = {}
+		self._tokenContext: Token[CacheSTFT | None] | None = None
+
+	def __enter__(self) -> Self:
+		"""Make this cache the cache of `stftShared` until the `with` block ends."""
+		self._tokenContext = _contextCacheSTFT.set(self)
+		return self
+
+	def __exit__(self, typeException: type[BaseException] | None, exception: BaseException | None, traceback: TracebackType | None) -> None:
+		"""Release every STFT and restore the cache that was open before."""
+		if self._tokenContext is not None:
+			_contextCacheSTFT.reset(self._tokenContext)
+			self._tokenContext = None
+		self.clear()
+
+	def __len__(self) -> int:
+		"""Return the number of STFTs in the cache."""
+		return len(self._dictionarySTFT)
+
+	def clear(self) -> None:
+		"""Release every STFT."""
+		for finalizer in self._dictionaryFinalizers.values():
+			finalizer.detach()
+		self._dictionaryFinalizers.clear()
+		self._dictionarySTFT.clear()
+
+	def getSTFT(self, signal: Tensor, lengthFFT: int, lengthHop: int, lengthWindow: int, window: Tensor, *, center: bool = True) -> Tensor:
+		"""Return the complex STFT of `signal`, and compute it only the first time.
+
+		Parameters
+		----------
+		signal : Tensor
+			Samples with shape (samples,) or (batch, samples).
+		lengthFFT : int
+			Length of the FFT of each frame.
+		lengthHop : int
+			Number of samples between the starts of two frames.
+		lengthWindow : int
+			Length of `window`.
+		window : Tensor
+			Window of each frame.
+		center : bool = True
+			If `True`, pad `signal` so that frame `t` is centered on sample `t * lengthHop`.
+
+		Returns
+		-------
+		spectrogram : Tensor
+			Complex STFT from `torch.stft` [1] with shape (batch, lengthFFT // 2 + 1, frames).
+
+		References
+		----------
+		[1] PyTorch `torch.stft`
+			https://pytorch.org/docs/stable/generated/torch.stft.html
+
+		"""
+		# Every view of a tensor has the same base, and `_version` counts the changes in place of the samples of the base.
+		tensorBase: Tensor = signal if signal._base is None else signal._base
+		keySTFT: tuple[Any, ...] = (id(tensorBase), signal.storage_offset(), tuple(signal.shape), signal.stride(), signal.dtype, signal.device, signal._version
+			, lengthFFT, lengthHop, lengthWindow, window.dtype, window.detach().cpu().numpy().tobytes(), center)
+		spectrogram: Tensor | None = self._dictionarySTFT.get(keySTFT)
+		if spectrogram is not None:
+			self.hits += 1
+			return spectrogram
+		spectrogram = torch.stft(signal, lengthFFT, lengthHop, lengthWindow, window, center=center, return_complex=True)
+		self.misses += 1
+		self._dictionarySTFT[keySTFT] = spectrogram
+		if id(tensorBase) not in self._dictionaryFinalizers:
+			self._dictionaryFinalizers[id(tensorBase)] = weakref.finalize(tensorBase, self._releaseSignal, id(tensorBase))
+		return spectrogram
+
+	def _releaseSignal(self, identifierBase: int) -> None:
+		"""I use this method to release the STFTs of a tensor that Python released, before Python can reuse its `id`."""
+		self._dictionaryFinalizers.pop(identifierBase, None)
+		for keySTFT in [keySTFT for keySTFT in self._dictionarySTFT if keySTFT[0] == identifierBase]:
+			del self._dictionarySTFT[keySTFT]
+
+def stftShared(signal: Tensor, lengthFFT: int, lengthHop: int, lengthWindow: int, window: Tensor, *, center: bool = True) -> Tensor:
+	"""Return the complex STFT of `signal` from the open `CacheSTFT`, or compute it.
+
+	You can use this function in an analyzer or a contest instead of `torch.stft` [1]: inside a
+	`with CacheSTFT():` block, each STFT of a signal at one resolution is computed once; outside, the
+	function computes the STFT.
+
+	Parameters
+	----------
+	signal : Tensor
+		Samples with shape (samples,) or (batch, samples).
+	lengthFFT : int
+		Length of the FFT of each frame.
+	lengthHop : int
+		Number of samples between the starts of two frames.
+	lengthWindow : int
+		Length of `window`.
+	window : Tensor
+		Window of each frame.
+	center : bool = True
+		If `True`, pad `signal` so that frame `t` is centered on sample `t * lengthHop`.
+
+	Returns
+	-------
+	spectrogram : Tensor
+		Complex STFT with shape (batch, lengthFFT // 2 + 1, frames).
+
+	References
+	----------
+	[1] PyTorch `torch.stft`
+		https://pytorch.org/docs/stable/generated/torch.stft.html
+
+	"""
+	cacheSTFT: CacheSTFT | None = _contextCacheSTFT.get()
+	if cacheSTFT is None:
+		return torch.stft(signal, lengthFFT, lengthHop, lengthWindow, window, center=center, return_complex=True)
+	return cacheSTFT.getSTFT(signal, lengthFFT, lengthHop, lengthWindow, window, center=center)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import NamedTuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
+	from analyzeAudio._summaryStatistics import SummaryStatistics
 	from numpy import dtype, floating, ndarray
 	from typing import Any
 
@@ -13,3 +14,15 @@ class BleedFull(NamedTuple):
 class BleedFullArray(NamedTuple):
 	arrayBleed: ndarray[tuple[int, int, int], dtype[floating[Any]]]
 	arrayFull: ndarray[tuple[int, int, int], dtype[floating[Any]]]
+
+class LinearDecibels(NamedTuple):
+	linear: SummaryStatistics
+	decibels: SummaryStatistics
+
+class RecordInstrumentation(NamedTuple):
+	pathFilename: str
+	kind: str
+	name: str
+	secondsWall: float
+	secondsCPU: float
+	bytesPeak: int
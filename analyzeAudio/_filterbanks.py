@@ -0,0 +1,164 @@
+"""Build each mel and chroma filterbank once per process.
+
+(AI generated docstring)
+
+You can use this module to read the mel filterbank [1] and the chroma filterbank [2] of `librosa`
+from a bounded cache that every analyzer and every contest of the process shares. A filterbank
+depends only on its parameters, such as the sample rate, the FFT length, and the number of bands,
+so a batch of calls with the same parameters builds the matrix once instead of once for each call.
+
+Contents
+--------
+Variables
+	filterbanksLimit
+		Number of mel filterbanks that the cache holds.
+	filterbanksChromaLimit
+		Number of chroma filterbanks that the cache holds.
+	resolutionTuning
+		Resolution of an estimated tuning in fractions of a chroma bin.
+
+Functions
+	filterbankChroma
+		Return the chroma filterbank of `librosa.filters.chroma` from the cache.
+	filterbankMel
+		Return the mel filterbank of `librosa.filters.mel` from the cache.
+
+References
+----------
+[1] librosa.filters.mel.
+	https://librosa.org/doc/latest/generated/librosa.filters.mel.html
+
+[2] librosa.filters.chroma.
+	https://librosa.org/doc/latest/generated/librosa.filters.chroma.html
+
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+import librosa
+import numpy
+import warnings
+
+if TYPE_CHECKING:
+	from numpy import dtype, floating, ndarray
+	from numpy.typing import DTypeLike
+	from typing import Any, Literal
+
+filterbanksLimit: int = 64
+"""Number of mel filterbanks that the cache holds: the least recently used filterbank leaves first."""
+
+resolutionTuning: float = 0.01
+"""Resolution of an estimated tuning in fractions of a chroma bin, which is the default resolution of `librosa.estimate_tuning`."""
+
+filterbanksChromaLimit: int = 2 * (round(1 / resolutionTuning) + 1)
+"""Number of chroma filterbanks that the cache holds: every estimated tuning of two sets of the other parameters, such as two sample rates."""
+
+def filterbankMel(*, sr: float, n_fft: int, n_mels: int = 128, fmin: float = 0.0, fmax: float | None = None, htk: bool = False
+	, norm: float | Literal['slaney'] | None = 'slaney', dtype: DTypeLike = numpy.float32) -> ndarray[tuple[int, int], dtype[floating[Any]]]:
+	"""Return the mel filterbank of `librosa.filters.mel` [1] from the cache.
+
+	The parameters are the parameters of `librosa.filters.mel`. The first call with a set of
+	parameters builds the filterbank, and the other calls return the same read-only array. If
+	`librosa` warned when it built the filterbank, such as for empty mel bands, I repeat the warning
+	on each call.
+
+	Parameters
+	----------
+	sr : float
+		Sample rate in hertz.
+	n_fft : int
+		Length of the FFT.
+	n_mels : int = 128
+		Number of mel bands.
+	fmin : float = 0.0
+		Lowest frequency in hertz.
+	fmax : float | None = None
+		Highest frequency in hertz. If `None`, `sr / 2`.
+	htk : bool = False
+		If `True`, use the HTK formula instead of the Slaney formula.
+	norm : float | Literal['slaney'] | None = 'slaney'
+		Normalization of each mel band.
+	dtype : DTypeLike = numpy.float32
+		Data type of the filterbank.
+
+	Returns
+	-------
+	filterbank : ndarray[tuple[int, int], dtype[floating[Any]]]
+		Read-only filterbank with shape (n_mels, 1 + n_fft // 2).
+
+	References
+	----------
+	[1] librosa.filters.mel.
+		https://librosa.org/doc/latest/generated/librosa.filters.mel.html
+
+	"""
+	filterbank, listWarnings = _filterbankMel(float(sr), int(n_fft), int(n_mels), float(fmin), None if fmax is None else float(fmax), bool(htk), norm, numpy.dtype(dtype))
+	_repeatWarnings(listWarnings)
+	return filterbank
+
+def filterbankChroma(*, sr: float, n_fft: int, n_chroma: int = 12, tuning: float = 0.0, ctroct: float = 5.0, octwidth: float | None = 2
+	, norm: float | None = 2, base_c: bool = True, dtype: DTypeLike = numpy.float32) -> ndarray[tuple[int, int], dtype[floating[Any]]]:
+	"""Return the chroma filterbank of `librosa.filters.chroma` [1] from the cache.
+
+	The parameters are the parameters of `librosa.filters.chroma`. The first call with a set of
+	parameters builds the filterbank, and the other calls return the same read-only array.
+
+	Parameters
+	----------
+	sr : float
+		Sample rate in hertz.
+	n_fft : int
+		Length of the FFT.
+	n_chroma : int = 12
+		Number of chroma bins.
+	tuning : float = 0.0
+		Deviation from A440 tuning in fractions of a chroma bin. Each value of `tuning` is its own
+		filterbank, so round an estimated tuning to `resolutionTuning` before the call.
+	ctroct : float = 5.0
+		Center of the Gaussian weight of the octaves.
+	octwidth : float | None = 2
+		Width of the Gaussian weight of the octaves. If `None`, the octaves have the same weight.
+	norm : float | None = 2
+		Normalization of each column of the filterbank.
+	base_c : bool = True
+		If `True`, the filterbank starts at C; if `False`, at A.
+	dtype : DTypeLike = numpy.float32
+		Data type of the filterbank.
+
+	Returns
+	-------
+	filterbank : ndarray[tuple[int, int], dtype[floating[Any]]]
+		Read-only filterbank with shape (n_chroma, 1 + n_fft // 2).
+
+	References
+	----------
+	[1] librosa.filters.chroma.
+		https://librosa.org/doc/latest/generated/librosa.filters.chroma.html
+
+	"""
+	filterbank, listWarnings = _filterbankChroma(float(sr), int(n_fft), int(n_chroma), float(tuning), float(ctroct)
+		, None if octwidth is None else float(octwidth), None if norm is None else float(norm), bool(base_c), numpy.dtype(dtype))
+	_repeatWarnings(listWarnings)
+	return filterbank
+
+@lru_cache(maxsize=filterbanksLimit)
+def _filterbankMel(sr: float, n_fft: int, n_mels: int, fmin: float, fmax: float | None, htk: bool, norm: float | str | None, dtype: numpy.dtype[Any]) -> tuple[ndarray[tuple[int, int], numpy.dtype[floating[Any]]], tuple[warnings.WarningMessage, ...]]:
+	with warnings.catch_warnings(record=True) as listWarnings:
+		warnings.simplefilter('always')
+		filterbank = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels, fmin=fmin, fmax=fmax, htk=htk, norm=norm, dtype=dtype)  # pyright: ignore[reportArgumentType]
+	filterbank.setflags(write=False)
+	return filterbank, tuple(listWarnings)
+
+@lru_cache(maxsize=filterbanksChromaLimit)
+def _filterbankChroma(sr: float, n_fft: int, n_chroma: int, tuning: float, ctroct: float, octwidth: float | None, norm: float | None, base_c: bool, dtype: numpy.dtype[Any]) -> tuple[ndarray[tuple[int, int], numpy.dtype[floating[Any]]], tuple[warnings.WarningMessage, ...]]:
+	with warnings.catch_warnings(record=True) as listWarnings:
+		warnings.simplefilter('always')
+		filterbank = librosa.filters.chroma(sr=sr, n_fft=n_fft, n_chroma=n_chroma, tuning=tuning, ctroct=ctroct, octwidth=octwidth, norm=norm, base_c=base_c, dtype=dtype)  # pyright: ignore[reportArgumentType]
+	filterbank.setflags(write=False)
+	return filterbank, tuple(listWarnings)
+
+def _repeatWarnings(listWarnings: tuple[warnings.WarningMessage, ...]) -> None:
+	"""I use this function to give each caller the warnings of `librosa`, because only the first caller builds the filterbank."""
+	for warningMessage in listWarnings:
+		warnings.warn(str(warningMessage.message), warningMessage.category, stacklevel=3)
@@ -0,0 +1,206 @@
+"""Record how long each aspect and each intermediate value takes and how much memory it allocates.
+
+(AI generated docstring)
+
+You can use this module to learn which registered aspects and which intermediate values, such as
+decoding, the short-time Fourier transform, or the magnitude spectrogram, dominate the runtime and
+the memory of an analysis. Instrumentation is opt-in: pass an `InstrumentationAnalysis` to
+`analyzeAudio.analyzeAudioFile` [1] or to the functions that analyze many files, and the functions
+record one `RecordInstrumentation` for each aspect and each intermediate value that they compute.
+
+Contents
+--------
+Classes
+	InstrumentationAnalysis
+		Collect timing and memory records and summarize them as a table.
+
+References
+----------
+[1] `analyzeAudio.analyze.analyzeAudioFile`
+
+[2] Python standard library documentation for `tracemalloc`
+	https://docs.python.org/3/library/tracemalloc.html
+
+"""
+from __future__ import annotations
+
+from analyzeAudio._dataBaskets import RecordInstrumentation
+from analyzeAudio._misfit import dataTabularTOpathFilenameDelimited
+from contextlib import contextmanager
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+import os
+import threading
+import time
+import tracemalloc
+
+if TYPE_CHECKING:
+	from collections.abc import Iterable, Iterator
+	from typing import Any, ClassVar
+
+class InstrumentationAnalysis:
+	"""Collect timing and memory records and summarize them as a table.
+
+	Each record measures one aspect analyzer call or the computation of one intermediate value for
+	one file. An intermediate value is measured without the intermediate values that it is computed
+	from, and an aspect is measured without the intermediate values that its analyzer receives, so
+	the records do not overlap.
+
+	Measurements
+	------------
+	secondsWall : float
+		Elapsed time from `time.perf_counter`.
+	secondsCPU : float
+		CPU time of the process from `time.process_time`, plus the CPU time of finished child
+		processes, such as `ffprobe`, from `os.times`.
+	bytesPeak : int
+		Peak of the memory allocated through Python and NumPy above the memory allocated at the
+		start of the measurement, from `tracemalloc` [1]. Memory that PyTorch allocates is not traced.
+		If other code already traces allocations with `tracemalloc`, `measure` does not disturb its
+		trace, and each `bytesPeak` is `0`.
+
+	The shared `ffprobe` run of a file is its own intermediate record, such as 'FFprobe astats
+	ebur128', so the FFprobe aspects only measure the reading of its result. When threads analyze
+	files concurrently, as with `FFprobeLimit`, the CPU time and the peak allocation of concurrent
+	measurements overlap.
+
+	Attributes
+	----------
+	traceAllocations : bool
+		If `True`, measure the peak allocation with `tracemalloc`, which slows the analysis.
+	listRecords : list[RecordInstrumentation]
+		Every record, in the order that the measurements finished.
+
+	Examples
+	--------
+	```python
+	from analyzeAudio import InstrumentationAnalysis, analyzeAudioListPathFilenames
+
+	instrumentation = InstrumentationAnalysis()
+	rows = analyzeAudioListPathFilenames(listPathFilenames, ['SRMR mean', 'LUFS integrated'], instrumentation=instrumentation)
+	instrumentation.writeTable('instrumentation.tsv')
+	```
+
+	References
+	----------
+	[1] Python standard library documentation for `tracemalloc`
+		https://docs.python.org/3/library/tracemalloc.html
+
+	"""
+
+	tableColumns: tuple[str, ...] = ('kind', 'name', 'count', 'secondsWall total', 'secondsWall mean', 'secondsCPU total', 'secondsCPU mean', 'bytesPeak maximum')
+	"""Column labels of the rows from `getTableRows`."""
+
+	_countMeasuresTracing: ClassVar[int] = 0
+	"""Number of unfinished measurements that share the trace that `measure` started."""
+
+	_lockTracing: ClassVar[threading.Lock] = threading.Lock()
+	"""Serialize the start and the stop of the trace that `measure` shares."""
+
+	def __init__(self, *, traceAllocations: bool = True) -> None:
+		"""Prepare an empty collection of records.
+
+		Parameters
+		----------
+		traceAllocations : bool = True
+			If `True`, measure the peak allocation of each record. If `False`, each `bytesPeak` is `0`.
+
+		"""
+		self.traceAllocations: bool = traceAllocations
+		self.listRecords: list[RecordInstrumentation] = []
+
+	@contextmanager
+	def measure(self, pathFilename: str | os.PathLike[Any], kind: str, name: str) -> Iterator[None]:
+		"""Measure the enclosed code and append one record.
+
+		Parameters
+		----------
+		pathFilename : str | os.PathLike[Any]
+			Path of the audio file that the enclosed code analyzes.
+		kind : str
+			Kind of the measured work, such as `'aspect'` or `'intermediate'`.
+		name : str
+			Aspect name or intermediate identifier.
+
+		Yields
+		------
+		None
+			Control returns to the enclosed code.
+
+		"""
+		sharesTracing: bool = False
+		bytesBaseline: int = 0
+		if self.traceAllocations:
+			with InstrumentationAnalysis._lockTracing:
+				# Tracing that other code started is not reset, so its peak stays intact.
+				if InstrumentationAnalysis._countMeasuresTracing or not tracemalloc.is_tracing():
+					if not tracemalloc.is_tracing():
+						tracemalloc.start()
+					InstrumentationAnalysis._countMeasuresTracing += 1
+					sharesTracing = True
+					bytesBaseline = tracemalloc.get_traced_memory()[0]
+		timesChildrenStart: os.times_result = os.times()
+		secondsCPUStart: float = time.process_time()
+		secondsWallStart: float = time.perf_counter()
+		try:
+			yield
+		finally:
+			secondsWall: float = time.perf_counter() - secondsWallStart
+			secondsCPU: float = time.process_time() - secondsCPUStart
+			timesChildrenStop: os.times_result = os.times()
+			secondsCPU += (timesChildrenStop.children_user - timesChildrenStart.children_user) + (timesChildrenStop.children_system - timesChildrenStart.children_system)
+			bytesPeak: int = 0
+			if sharesTracing:
+				with InstrumentationAnalysis._lockTracing:
+					bytesPeak = max(tracemalloc.get_traced_memory()[1] - bytesBaseline, 0)
+					InstrumentationAnalysis._countMeasuresTracing -= 1
+					if not InstrumentationAnalysis._countMeasuresTracing:
+						tracemalloc.stop()
+			self.listRecords.append(RecordInstrumentation(PurePath(pathFilename).as_posix(), kind, name, secondsWall, secondsCPU, bytesPeak))
+
+	def extend(self, listRecords: Iterable[RecordInstrumentation]) -> None:
+		"""Append records, such as the records that a worker process returned.
+
+		Parameters
+		----------
+		listRecords : Iterable[RecordInstrumentation]
+			Records to append.
+
+		"""
+		self.listRecords.extend(listRecords)
+
+	def getTableRows(self) -> list[list[str | float]]:
+		"""Summarize the records with one row for each kind and name.
+
+		Returns
+		-------
+		tableRows : list[list[str | float]]
+			One row per (kind, name), aligned with `tableColumns`, in order of decreasing total
+			`secondsWall`.
+
+		"""
+		dictionaryRecords: dict[tuple[str, str], list[RecordInstrumentation]] = {}
+		for record in self.listRecords:
+			dictionaryRecords.setdefault((record.kind, record.name), []).append(record)
+		tableRows: list[list[str | float]] = []
+		for (kind, name), listRecordsName in dictionaryRecords.items():
+			count: int = len(listRecordsName)
+			secondsWallTotal: float = sum(record.secondsWall for record in listRecordsName)
+			secondsCPUTotal: float = sum(record.secondsCPU for record in listRecordsName)
+			tableRows.append([kind, name, count, secondsWallTotal, secondsWallTotal / count, secondsCPUTotal, secondsCPUTotal / count
+				, max(record.bytesPeak for record in listRecordsName)])
+		tableRows.sort(key=lambda row: row[3], reverse=True)
+		return tableRows
+
+	def writeTable(self, pathFilename: str | os.PathLike[Any], delimiterOutput: str = '\t') -> None:
+		"""Write the rows of `getTableRows` to a delimited text file.
+
+		Parameters
+		----------
+		pathFilename : str | os.PathLike[Any]
+			Path of the output text file.
+		delimiterOutput : str = '\t'
+			Text delimiter inserted between adjacent cells.
+
+		"""
+		dataTabularTOpathFilenameDelimited(PurePath(pathFilename), self.getTableRows(), self.tableColumns, delimiterOutput)
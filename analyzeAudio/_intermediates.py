@@ -0,0 +1,261 @@
+"""Compute shared analyzer inputs for one audio file only when a requested aspect needs them.
+
+(AI generated docstring)
+
+You can use this module to plan and build the intermediate values, such as the decoded waveform
+and the spectrogram, that registered analyzers receive as arguments. The planner reads the
+`analyzerParameters` of each registry entry, so an aspect that only needs `pathFilename` never
+causes the audio file to be decoded.
+
+Contents
+--------
+Variables
+	dictionaryIntermediateDependencies
+		Map each intermediate identifier to the intermediate identifiers that it is computed from.
+
+Classes
+	AudioIntermediates
+		Compute and hold the intermediate values of one audio file on demand.
+
+Functions
+	getIntermediatesRequired
+		Return the closure of intermediate identifiers needed by analyzer parameter names.
+
+References
+----------
+[1] `analyzeAudio.registry.audioAspects`
+
+"""
+from __future__ import annotations
+
+from analyzeAudio._memoryMapWAV import memoryMapWAV, toFloat32
+from functools import cached_property
+from hunterHearsPy import stft
+from typing import TYPE_CHECKING
+import numpy
+import soundfile
+import torch
+
+if TYPE_CHECKING:
+	from analyzeAudio import Audio, SpectrogramMagnitude, SpectrogramPower
+	from analyzeAudio._instrumentation import InstrumentationAnalysis
+	from collections.abc import Iterable
+	from hunterHearsPy.theTypes import Spectrogram
+	from os import PathLike
+	from torch import Tensor
+	from typing import Any
+
+dictionaryIntermediateDependencies: dict[str, tuple[str, ...]] = {
+	'pathFilename': (),
+	'pytorchOnCPU': (),
+	'sampleRate': ('pathFilename',),
+	'waveform': ('pathFilename',),
+	'tensorAudio': ('waveform',),
+	'spectrogram': ('waveform', 'sampleRate'),
+	'spectrogramMagnitude': ('spectrogram',),
+	'spectrogramPower': ('spectrogramMagnitude',),
+	'tensorSpectrogram': ('spectrogram',),
+	'tensorSpectrogramMagnitude': ('spectrogramMagnitude',),
+}
+"""Map each intermediate identifier to the intermediate identifiers that it is computed from.
+
+Each key is also an analyzer parameter name: an analyzer that declares a parameter with the same
+name as a key receives the matching intermediate value.
+"""
+
+def getIntermediatesRequired(listParameterNames: Iterable[str]) -> frozenset[str]:
+	"""Return every intermediate identifier needed to supply `listParameterNames`.
+
+	You can use this function to learn which intermediate values must be computed before analyzers
+	that declare `listParameterNames` can run. The returned set contains each parameter name that is
+	an intermediate identifier and, transitively, every intermediate identifier that it depends on
+	in `dictionaryIntermediateDependencies`. Parameter names that are not intermediate identifiers,
+	such as keyword-only options, are ignored.
+
+	Parameters
+	----------
+	listParameterNames : Iterable[str]
+		Analyzer parameter names, usually collected from the `analyzerParameters` of registry entries.
+
+	Returns
+	-------
+	setIntermediatesRequired : frozenset[str]
+		Closure of intermediate identifiers needed for `listParameterNames`.
+
+	"""
+	setIntermediatesRequired: set[str] = set()
+	listIntermediatesPending: list[str] = [parameterName for parameterName in listParameterNames if parameterName in dictionaryIntermediateDependencies]
+	while listIntermediatesPending:
+		intermediate: str = listIntermediatesPending.pop()
+		if intermediate not in setIntermediatesRequired:
+			setIntermediatesRequired.add(intermediate)
+			listIntermediatesPending.extend(dictionaryIntermediateDependencies[intermediate])
+	return frozenset(setIntermediatesRequired)
+
+class AudioIntermediates:
+	"""Compute and hold the intermediate values of one audio file on demand.
+
+	You can use this class to supply analyzer arguments for one audio file without computing values
+	that no analyzer reads. Each intermediate value is computed the first time that it is accessed.
+	When an intermediate value is computed, the intermediate values that it was derived from are
+	released if no requested analyzer reads them directly and no pending intermediate value still
+	needs them, so, for example, the complex spectrogram does not stay resident next to the
+	magnitude spectrogram.
+
+	Attributes
+	----------
+	pathFilename : str | PathLike[Any]
+		Path of the audio file.
+	setParametersRequested : frozenset[str]
+		Intermediate identifiers that analyzers read directly.
+	setIntermediatesRequired : frozenset[str]
+		Closure of `setParametersRequested` over `dictionaryIntermediateDependencies`.
+	instrumentation : InstrumentationAnalysis | None
+		If not `None`, `getIntermediate` records the computation of each intermediate value.
+
+	"""
+
+	def __init__(self, pathFilename: str | PathLike[Any], listParameterNames: Iterable[str] = (), *, instrumentation: InstrumentationAnalysis | None = None) -> None:
+		"""Prepare on-demand intermediate values for `pathFilename`.
+
+		Parameters
+		----------
+		pathFilename : str | PathLike[Any]
+			Path of the audio file that the intermediate values describe.
+		listParameterNames : Iterable[str] = ()
+			Analyzer parameter names that will be requested. The class uses `listParameterNames` only
+			to decide when a computed intermediate value can be released.
+		instrumentation : InstrumentationAnalysis | None = None
+			Collection that receives one record for each intermediate value that is computed.
+
+		"""
+		self.pathFilename: str | PathLike[Any] = pathFilename
+		self.instrumentation: InstrumentationAnalysis | None = instrumentation
+		self.setParametersRequested: frozenset[str] = frozenset(listParameterNames).intersection(dictionaryIntermediateDependencies)
+		self.setIntermediatesRequired: frozenset[str] = getIntermediatesRequired(self.setParametersRequested)
+
+	def getIntermediate(self, parameterName: str) -> Any:
+		"""Return the intermediate value for one analyzer parameter name.
+
+		Parameters
+		----------
+		parameterName : str
+			Analyzer parameter name.
+
+		Returns
+		-------
+		intermediate : Any
+			The intermediate value named `parameterName`, or `None` if `parameterName` is not an
+			intermediate identifier.
+
+		"""
+		if parameterName in dictionaryIntermediateDependencies:
+			if self.instrumentation is not None:
+				return self._getIntermediateMeasured(parameterName)
+			return getattr(self, parameterName)
+		return None
+
+	def _getIntermediateMeasured(self, intermediate: str) -> Any:
+		"""I use this method to compute the dependencies of `intermediate` first, so each record measures one computation."""
+		if intermediate in self.__dict__ or not isinstance(getattr(type(self), intermediate, None), cached_property):
+			return getattr(self, intermediate)
+		for dependency in dictionaryIntermediateDependencies[intermediate]:
+			self._getIntermediateMeasured(dependency)
+		with self.instrumentation.measure(self.pathFilename, 'intermediate', intermediate):  # pyright: ignore[reportOptionalMemberAccess]
+			return getattr(self, intermediate)
+
+	def _releaseDependencies(self, intermediate: str) -> None:
+		"""I use this method to drop cached intermediate values that `intermediate` has made redundant.
+
+		Parameters
+		----------
+		intermediate : str
+			Identifier of the intermediate value that was just computed.
+
+		"""
+		for dependency in dictionaryIntermediateDependencies[intermediate]:
+			if dependency in self.setParametersRequested or dependency not in self.__dict__:
+				continue
+			if not isinstance(getattr(type(self), dependency, None), cached_property):
+				continue
+			if all(dependent == intermediate or dependent in self.__dict__
+					for dependent in self.setIntermediatesRequired if dependency in dictionaryIntermediateDependencies[dependent]):
+				del self.__dict__[dependency]
+
+	@cached_property
+	def pytorchOnCPU(self) -> bool:
+		"""`True` if PyTorch has no CUDA device, otherwise `False`."""
+		return not torch.cuda.is_available()
+
+	@cached_property
+	def sampleRate(self) -> int:
+		"""Sample rate of `pathFilename` in hertz, read from the file header."""
+		return soundfile.info(self.pathFilename).samplerate
+
+	@cached_property
+	def waveform(self) -> Audio:
+		"""Samples of `pathFilename` as 32-bit floating point with shape (channels, samples).
+
+		If `pathFilename` is a PCM WAV file, the samples are memory-mapped [1]. Only 32-bit
+		floating-point samples are not copied: integer samples are converted to 32-bit floating point
+		all at once, so the converted copy is as large as the waveform that `soundfile` would decode.
+		Other files are decoded with `soundfile`. Either way, `waveform` is a view with positive
+		strides.
+
+		References
+		----------
+		[1] `analyzeAudio._memoryMapWAV.memoryMapWAV`
+
+		"""
+		samplesAndSampleRate: tuple[numpy.ndarray[tuple[int, int], numpy.dtype[Any]], int] | None = memoryMapWAV(self.pathFilename)
+		if samplesAndSampleRate is not None:
+			samples, self.__dict__['sampleRate'] = samplesAndSampleRate
+			return toFloat32(samples).T
+		# TODO I don't use `hunterHearsPy.readAudioFile` here because the sample rate is set by the
+		# function instead of being read from the file.
+		with soundfile.SoundFile(self.pathFilename) as readSoundFile:
+			self.__dict__['sampleRate'] = readSoundFile.samplerate
+			waveform: Audio = readSoundFile.read(dtype='float32', always_2d=True)
+		return waveform.T
+
+	@cached_property
+	def tensorAudio(self) -> Tensor:
+		"""`waveform` as a `torch.Tensor`, sharing memory with `waveform`."""
+		tensorAudio: Tensor = torch.from_numpy(self.waveform)  # pyright: ignore[reportUnknownMemberType]
+		self._releaseDependencies('tensorAudio')
+		return tensorAudio
+
+	@cached_property
+	def spectrogram(self) -> Spectrogram:
+		"""Complex-valued short-time Fourier transform of `waveform`."""
+		spectrogram: Spectrogram = stft(self.waveform, sampleRate=self.sampleRate)
+		self._releaseDependencies('spectrogram')
+		return spectrogram
+
+	@cached_property
+	def spectrogramMagnitude(self) -> SpectrogramMagnitude:
+		"""Magnitude of `spectrogram`."""
+		spectrogramMagnitude: SpectrogramMagnitude = numpy.absolute(self.spectrogram)
+		self._releaseDependencies('spectrogramMagnitude')
+		return spectrogramMagnitude
+
+	@cached_property
+	def spectrogramPower(self) -> SpectrogramPower:
+		"""Power of `spectrogram`: the square of `spectrogramMagnitude`."""
+		spectrogramPower: SpectrogramPower = self.spectrogramMagnitude ** 2
+		self._releaseDependencies('spectrogramPower')
+		return spectrogramPower
+
+	@cached_property
+	def tensorSpectrogram(self) -> Tensor:
+		"""`spectrogram` as a real `torch.Tensor` with a last axis of (real, imaginary), sharing memory with `spectrogram`."""
+		tensorSpectrogram: Tensor = torch.view_as_real(torch.from_numpy(self.spectrogram))  # pyright: ignore[reportUnknownMemberType]
+		self._releaseDependencies('tensorSpectrogram')
+		return tensorSpectrogram
+
+	@cached_property
+	def tensorSpectrogramMagnitude(self) -> Tensor:
+		"""`spectrogramMagnitude` as a `torch.Tensor`, sharing memory with `spectrogramMagnitude`."""
+		tensorSpectrogramMagnitude: Tensor = torch.from_numpy(self.spectrogramMagnitude)  # pyright: ignore[reportUnknownMemberType]
+		self._releaseDependencies('tensorSpectrogramMagnitude')
+		return tensorSpectrogramMagnitude
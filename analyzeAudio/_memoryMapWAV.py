@@ -0,0 +1,137 @@
+"""Map the samples of an uncompressed PCM WAV file into memory without decoding the file.
+
+(AI generated docstring)
+
+You can use this module to read the samples of a PCM WAV file through the operating-system page
+cache instead of through a decoder. The samples stay in the file: pages are read when an analyzer
+touches them, and every process that maps the same file shares the same pages. Only a WAV file
+whose samples are 32-bit floating point is used as-is, with no copy. `toFloat32` copies the 16-bit
+or 32-bit integer samples of the slice that it receives to 32-bit floating point: the streaming
+analysis converts one block at a time, but `AudioIntermediates.waveform` converts the whole file
+at once.
+
+Contents
+--------
+Functions
+	memoryMapWAV
+		Return the memory-mapped samples and the sample rate of a PCM WAV file.
+	toFloat32
+		Return memory-mapped samples as 32-bit floating point with the scale of `soundfile`.
+
+References
+----------
+[1] Microsoft. Multiple channel audio data and WAVE files.
+	https://learn.microsoft.com/en-us/windows-hardware/drivers/audio/extensible-wave-format-descriptors
+
+[2] NumPy `numpy.memmap`
+	https://numpy.org/doc/stable/reference/generated/numpy.memmap.html
+
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+import numpy
+import struct
+
+if TYPE_CHECKING:
+	from analyzeAudio import Audio
+	from os import PathLike
+	from typing import Any
+
+WAVE_FORMAT_PCM: int = 0x0001
+WAVE_FORMAT_IEEE_FLOAT: int = 0x0003
+WAVE_FORMAT_EXTENSIBLE: int = 0xFFFE
+
+dictionaryFormatDtype: dict[tuple[int, int], numpy.dtype[Any]] = {
+	(WAVE_FORMAT_PCM, 16): numpy.dtype('<i2'),
+	(WAVE_FORMAT_PCM, 32): numpy.dtype('<i4'),
+	(WAVE_FORMAT_IEEE_FLOAT, 32): numpy.dtype('<f4'),
+}
+"""Map (format tag, bits per sample) of a WAV file to the dtype of its samples on disk."""
+
+def memoryMapWAV(pathFilename: str | PathLike[Any]) -> tuple[numpy.ndarray[tuple[int, int], numpy.dtype[Any]], int] | None:
+	"""Return the memory-mapped samples and the sample rate of a PCM WAV file.
+
+	You can use this function to read a RIFF WAV file without a decoder. The function reads the
+	`fmt ` chunk and the position of the `data` chunk, then maps the `data` chunk into memory in
+	copy-on-write mode, so writing to the returned array never changes the file.
+
+	Parameters
+	----------
+	pathFilename : str | PathLike[Any]
+		Path of an audio file.
+
+	Returns
+	-------
+	samplesAndSampleRate : tuple[numpy.ndarray[tuple[int, int], numpy.dtype[Any]], int] | None
+		A view of the mapped samples with shape (samples, channels) and the dtype of the file, and
+		the sample rate in hertz; or `None` if `pathFilename` is not a RIFF WAV file with 16-bit
+		integer, 32-bit integer, or 32-bit floating-point samples. If the result is `None`, read the
+		file with `soundfile`.
+
+	"""
+	pathFilename = Path(pathFilename)
+	try:
+		sizeFile: int = pathFilename.stat().st_size
+		with pathFilename.open('rb') as readStream:
+			header: bytes = readStream.read(12)
+			if len(header) < 12 or header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
+				return None
+			dtypeSamples: numpy.dtype[Any] | None = None
+			channels: int = 0
+			sampleRate: int = 0
+			while len(headerChunk := readStream.read(8)) == 8:
+				identifierChunk: bytes = headerChunk[0:4]
+				sizeChunk: int = struct.unpack('<I', headerChunk[4:8])[0]
+				if identifierChunk == b'fmt ':
+					chunkFormat: bytes = readStream.read(sizeChunk)
+					if len(chunkFormat) < 16:
+						return None
+					formatTag, channels, sampleRate, _bytesPerSecond, blockAlign, bitsPerSample = struct.unpack('<HHIIHH', chunkFormat[0:16])
+					if formatTag == WAVE_FORMAT_EXTENSIBLE and 26 <= len(chunkFormat):
+						# The first two bytes of the SubFormat GUID are the format tag.
+						formatTag = struct.unpack('<H', chunkFormat[24:26])[0]
+					dtypeSamples = dictionaryFormatDtype.get((formatTag, bitsPerSample))
+					if dtypeSamples is None or channels < 1 or blockAlign != channels * dtypeSamples.itemsize:
+						return None
+					readStream.seek(sizeChunk % 2, 1)
+				elif identifierChunk == b'data':
+					if dtypeSamples is None:
+						return None
+					offsetData: int = readStream.tell()
+					# A WAV file that was written as a stream can record a `data` size that is larger than the file.
+					sizeData: int = min(sizeChunk, sizeFile - offsetData)
+					countFrames: int = sizeData // (channels * dtypeSamples.itemsize)
+					if countFrames < 1:
+						return None
+					samples = numpy.memmap(pathFilename, dtype=dtypeSamples, mode='c', offset=offsetData, shape=(countFrames, channels))
+					# A plain `ndarray` view keeps the mapping alive, and the results of analyzers are not `numpy.memmap` objects.
+					return samples.view(numpy.ndarray), sampleRate
+				else:
+					readStream.seek(sizeChunk + sizeChunk % 2, 1)
+	except (OSError, ValueError, struct.error):
+		return None
+	return None
+
+def toFloat32(samples: numpy.ndarray[Any, numpy.dtype[Any]]) -> Audio:
+	"""Return memory-mapped samples as 32-bit floating point with the scale of `soundfile`.
+
+	Parameters
+	----------
+	samples : numpy.ndarray[Any, numpy.dtype[Any]]
+		Samples, or a slice of samples, from `memoryMapWAV`.
+
+	Returns
+	-------
+	samplesFloat32 : Audio
+		`samples` itself if the samples are already 32-bit floating point; otherwise a new array in
+		which the integer samples are divided by 2 ** (bits per sample - 1), so full scale is 1.0.
+
+	"""
+	if samples.dtype == numpy.float32:
+		return samples
+	samplesFloat32: Audio = samples.astype(numpy.float32)
+	# Multiplication by a power of two is exact, so the values equal the values from `soundfile`.
+	samplesFloat32 *= numpy.float32(2.0 ** (1 - 8 * samples.dtype.itemsize))
+	return samplesFloat32
@@ -0,0 +1,316 @@
+"""Compute the framewise spectral features of one magnitude spectrogram together.
+
+(AI generated docstring)
+
+You can use this module to compute the spectral centroid, the spectral bandwidth, the spectral
+flatness, the root-mean-square (RMS) magnitude, and the spectral contrast of `librosa` [1] from one
+magnitude spectrogram while sharing the terms that the features have in common: the frequency of
+each bin, the column-normalized spectrogram of the centroid and the bandwidth, and the squared
+magnitudes of the flatness and the RMS. `analyzeAudio.analyzeAudioFile` [2] opens a
+`CacheSpectralFeatures` for each file, so the registered mean aspects of `analyzersUseSpectrogram`
+read one `SpectralFeatures` instead of each making a pass over the spectrogram with `librosa`.
+
+Contents
+--------
+Classes
+	CacheSpectralFeatures
+		Hold the `SpectralFeatures` of the spectrograms of one request.
+	SpectralFeatures
+		Compute each framewise spectral feature of one magnitude spectrogram on demand.
+
+Functions
+	spectralFeaturesShared
+		Return the `SpectralFeatures` of `spectrogramMagnitude` from the open `CacheSpectralFeatures`.
+
+References
+----------
+[1] librosa.feature.
+	https://librosa.org/doc/latest/feature.html
+
+[2] `analyzeAudio.analyze.analyzeAudioFile`
+
+"""
+from __future__ import annotations
+
+from contextvars import ContextVar
+from functools import cached_property
+from numpy import log10
+from typing import TYPE_CHECKING
+import librosa
+import numpy
+
+if TYPE_CHECKING:
+	from analyzeAudio import ArrayAspect, ArrayAspectSpectrogramFramewise, SpectrogramMagnitude
+	from contextvars import Token
+	from numpy import dtype, float64, ndarray
+	from types import TracebackType
+	from typing import Any
+	from typing_extensions import Self
+
+_contextCacheSpectralFeatures: ContextVar[CacheSpectralFeatures | None] = ContextVar('_contextCacheSpectralFeatures', default=None)
+
+class SpectralFeatures:
+	"""Compute each framewise spectral feature of one magnitude spectrogram on demand.
+
+	Each feature is the feature of the `librosa` function of the same name with the spectrogram input
+	path, and each feature and each shared term is computed the first time that it is accessed. The
+	keyword parameters are the keyword parameters of the `librosa` functions; a parameter applies to
+	each feature whose `librosa` function accepts it.
+
+	Attributes
+	----------
+	spectrogramMagnitude : SpectrogramMagnitude
+		Magnitude spectrogram with shape (..., frequency bins, frames).
+	frequencies : ndarray[tuple[int], dtype[float64]]
+		Frequency of each bin in hertz.
+	spectralCentroid : ArrayAspectSpectrogramFramewise
+		Framewise spectral centroid of `librosa.feature.spectral_centroid`.
+	spectralBandwidth : ArrayAspectSpectrogramFramewise
+		Framewise spectral bandwidth of `librosa.feature.spectral_bandwidth`.
+	spectralContrast : ArrayAspect
+		Framewise spectral contrast of `librosa.feature.spectral_contrast`.
+	spectralFlatness : ArrayAspectSpectrogramFramewise
+		Framewise spectral flatness of `librosa.feature.spectral_flatness`.
+	spectralFlatness_dB : ArrayAspectSpectrogramFramewise
+		`spectralFlatness` in decibels.
+	rootMeanSquare : ArrayAspectSpectrogramFramewise
+		Framewise RMS magnitude of `librosa.feature.rms`.
+	rootMeanSquare_dB : ArrayAspectSpectrogramFramewise
+		`rootMeanSquare` in decibels.
+
+	"""
+
+	parametersAccepted: frozenset[str] = frozenset({'amin', 'fmin', 'frame_length', 'linear', 'n_bands', 'norm', 'p', 'power', 'quantile', 'sr'})
+	"""Keyword parameters of the `librosa` functions that `SpectralFeatures` accepts."""
+
+	def __init__(self, spectrogramMagnitude: SpectrogramMagnitude, *, sr: float = 22050, p: float = 2.0, norm: bool = True, amin: float = 1e-10, power: float = 2.0
+		, frame_length: int = 2048, fmin: float = 200.0, n_bands: int = 6, quantile: float = 0.02, linear: bool = False) -> None:
+		"""Prepare the features of `spectrogramMagnitude`.
+
+		Parameters
+		----------
+		spectrogramMagnitude : SpectrogramMagnitude
+			Non-negative magnitude spectrogram with shape (..., frequency bins, frames).
+		sr : float = 22050
+			Sample rate in hertz of the centroid, the bandwidth, and the contrast.
+		p : float = 2.0
+			Order of the bandwidth.
+		norm : bool = True
+			If `True`, normalize each frame before the bandwidth.
+		amin : float = 1e-10
+			Least power of the flatness.
+		power : float = 2.0
+			Exponent of the magnitudes of the flatness.
+		frame_length : int = 2048
+			Length of the frames of the RMS.
+		fmin : float = 200.0
+			Upper frequency of the lowest band of the contrast.
+		n_bands : int = 6
+			Number of octave bands of the contrast.
+		quantile : float = 0.02
+			Share of each band that the contrast reads as the peak or the valley.
+		linear : bool = False
+			If `True`, the contrast is the difference of the peak and the valley instead of the difference of their logarithms.
+
+		"""
+		self.spectrogramMagnitude: SpectrogramMagnitude = spectrogramMagnitude
+		self.sr: float = sr
+		self.p: float = p
+		self.norm: bool = norm
+		self.amin: float = amin
+		self.power: float = power
+		self.frame_length: int = frame_length
+		self.fmin: float = fmin
+		self.n_bands: int = n_bands
+		self.quantile: float = quantile
+		self.linear: bool = linear
+		self._checkedNonNegative: bool = False
+
+	@cached_property
+	def frequencies(self) -> ndarray[tuple[int], dtype[float64]]:
+		"""Frequency of each bin in hertz."""
+		return librosa.fft_frequencies(sr=self.sr, n_fft=2 * (self.spectrogramMagnitude.shape[-2] - 1))
+
+	@cached_property
+	def spectrogramNormalized(self) -> SpectrogramMagnitude:
+		"""`spectrogramMagnitude` with each frame divided by its sum, which the centroid and the bandwidth share."""
+		return librosa.util.normalize(self.spectrogramMagnitude, norm=1, axis=-2)
+
+	@cached_property
+	def spectrogramSquared(self) -> SpectrogramMagnitude:
+		"""Square of `spectrogramMagnitude`, which the flatness and the RMS share."""
+		return self.spectrogramMagnitude ** 2
+
+	@cached_property
+	def spectralCentroid(self) -> ArrayAspectSpectrogramFramewise:
+		"""Framewise spectral centroid of `librosa.feature.spectral_centroid`."""
+		self._checkNonNegative()
+		return numpy.sum(self.frequencies[:, None] * self.spectrogramNormalized, axis=-2, keepdims=True)
+
+	@cached_property
+	def spectralBandwidth(self) -> ArrayAspectSpectrogramFramewise:
+		"""Framewise spectral bandwidth of `librosa.feature.spectral_bandwidth` around `spectralCentroid`."""
+		deviation = numpy.abs(self.frequencies[:, None] - self.spectralCentroid)
+		weights: SpectrogramMagnitude = self.spectrogramNormalized if self.norm else self.spectrogramMagnitude
+		return numpy.sum(weights * deviation ** self.p, axis=-2, keepdims=True) ** (1.0 / self.p)
+
+	@cached_property
+	def spectralContrast(self) -> ArrayAspect:
+		"""Framewise spectral contrast of `librosa.feature.spectral_contrast`."""
+		return librosa.feature.spectral_contrast(S=self.spectrogramMagnitude, sr=self.sr, freq=self.frequencies, fmin=self.fmin, n_bands=self.n_bands, quantile=self.quantile, linear=self.linear)
+
+	@cached_property
+	def spectralFlatness(self) -> ArrayAspectSpectrogramFramewise:
+		"""Framewise spectral flatness of `librosa.feature.spectral_flatness`."""
+		self._checkNonNegative()
+		spectrogramRaised: SpectrogramMagnitude = self.spectrogramSquared if self.power == 2 else self.spectrogramMagnitude ** self.power  # noqa: PLR2004
+		spectrogramThreshold = numpy.maximum(self.amin, spectrogramRaised)
+		meanGeometric = numpy.exp(numpy.mean(numpy.log(spectrogramThreshold), axis=-2, keepdims=True))
+		meanArithmetic = numpy.mean(spectrogramThreshold, axis=-2, keepdims=True)
+		return meanGeometric / meanArithmetic
+
+	@cached_property
+	def spectralFlatness_dB(self) -> ArrayAspectSpectrogramFramewise:
+		"""`spectralFlatness` in decibels."""
+		return 20 * log10(self.spectralFlatness, where=(self.spectralFlatness != 0), out=None)
+
+	@cached_property
+	def rootMeanSquare(self) -> ArrayAspectSpectrogramFramewise:
+		"""Framewise RMS magnitude of `librosa.feature.rms`."""
+		if self.spectrogramMagnitude.shape[-2] != self.frame_length // 2 + 1:
+			# `librosa` explains the mismatch of the shape and `frame_length`.
+			return librosa.feature.rms(S=self.spectrogramMagnitude, frame_length=self.frame_length)
+		# As in `librosa.feature.rms`, the power is float32, and the first bin, and the last bin of an even `frame_length`, count half.
+		spectrogramWeighted = self.spectrogramSquared.astype(numpy.float32)
+		spectrogramWeighted[..., 0, :] *= 0.5
+		if self.frame_length % 2 == 0:
+			spectrogramWeighted[..., -1, :] *= 0.5
+		return numpy.sqrt(2 * numpy.sum(spectrogramWeighted, axis=-2, keepdims=True) / self.frame_length ** 2)
+
+	@cached_property
+	def rootMeanSquare_dB(self) -> ArrayAspectSpectrogramFramewise:
+		"""`rootMeanSquare` in decibels."""
+		return 20 * log10(self.rootMeanSquare, where=(self.rootMeanSquare != 0), out=None)
+
+	def _checkNonNegative(self) -> None:
+		"""I use this method to reject the spectrograms that `librosa` rejects, once for every feature."""
+		if self._checkedNonNegative:
+			return
+		if not numpy.isrealobj(self.spectrogramMagnitude) or numpy.any(self.spectrogramMagnitude < 0):
+			message: str = f'I received `spectrogramMagnitude` with dtype {self.spectrogramMagnitude.dtype}, but I need real, non-negative magnitudes.'
+			raise librosa.ParameterError(message)
+		self._checkedNonNegative = True
+
+class CacheSpectralFeatures:
+	"""Hold the `SpectralFeatures` of the spectrograms of one request.
+
+	Each entry is the `SpectralFeatures` of one spectrogram with one set of parameters. A spectrogram
+	is an array, such as the `spectrogramMagnitude` of `AudioIntermediates`, so a view of the same
+	values with another shape is a different entry. If the values of the array change in place while
+	the `with` block is open, the entry no longer describes them, so only share arrays that the
+	analyzers do not change.
+
+	Each entry keeps its array alive, so open the cache for one request, such as the aspects of one
+	file: when the `with` block ends, I release every entry.
+
+	Attributes
+	----------
+	hits : int
+		Number of requests that read a `SpectralFeatures` that the cache already held.
+	misses : int
+		Number of requests that made a `SpectralFeatures`.
+
+	Examples
+	--------
+	```python
+	from analyzeAudio import CacheSpectralFeatures
+	from analyzeAudio.analyzersUseSpectrogram import analyzeSpectralBandwidthMean, analyzeSpectralCentroidMean
+
+	with CacheSpectralFeatures():
+		spectralCentroidMean = analyzeSpectralCentroidMean(spectrogramMagnitude)
+		spectralBandwidthMean = analyzeSpectralBandwidthMean(spectrogramMagnitude)
+	```
+
+	"""
+
+	def __init__(self) -> None:
+		"""Prepare an empty cache."""
+		self.hits: int = 0
+		self.misses: int = 0
+		self._dictionarySpectralFeatures: dict[tuple[Any, ...], SpectralFeatures] = {}
+		self._tokenContext: Token[CacheSpectralFeatures | None] | None = None
+
+	def __enter__(self) -> Self:
+		"""Make this cache the cache of `spectralFeaturesShared` until the `with` block ends."""
+		self._tokenContext = _contextCacheSpectralFeatures.set(self)
+		return self
+
+	def __exit__(self, typeException: type[BaseException] | None, exception: BaseException | None, traceback: TracebackType | None) -> None:
+		"""Release every entry and restore the cache that was open before."""
+		if self._tokenContext is not None:
+			_contextCacheSpectralFeatures.reset(self._tokenContext)
+			self._tokenContext = None
+		self.clear()
+
+	def __len__(self) -> int:
+		"""Return the number of `SpectralFeatures` in the cache."""
+		return len(self._dictionarySpectralFeatures)
+
+	def clear(self) -> None:
+		"""Release every entry."""
+		self._dictionarySpectralFeatures.clear()
+
+	def getSpectralFeatures(self, spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> SpectralFeatures:
+		"""Return the `SpectralFeatures` of `spectrogramMagnitude`, and make it only the first time.
+
+		Parameters
+		----------
+		spectrogramMagnitude : SpectrogramMagnitude
+			Magnitude spectrogram with shape (..., frequency bins, frames).
+		keywordArguments : Any
+			Keyword parameters of `SpectralFeatures`.
+
+		Returns
+		-------
+		spectralFeatures : SpectralFeatures
+			Features of `spectrogramMagnitude` with `keywordArguments`.
+
+		"""
+		keySpectralFeatures: tuple[Any, ...] = (id(spectrogramMagnitude), spectrogramMagnitude.__array_interface__['data'][0], spectrogramMagnitude.shape
+			, spectrogramMagnitude.strides, spectrogramMagnitude.dtype.str, tuple(sorted(keywordArguments.items())))
+		spectralFeatures: SpectralFeatures | None = self._dictionarySpectralFeatures.get(keySpectralFeatures)
+		if spectralFeatures is not None:
+			self.hits += 1
+			return spectralFeatures
+		spectralFeatures = SpectralFeatures(spectrogramMagnitude, **keywordArguments)
+		self.misses += 1
+		# The entry keeps `spectrogramMagnitude` alive, so Python cannot give its `id` to another array while the entry exists.
+		self._dictionarySpectralFeatures[keySpectralFeatures] = spectralFeatures
+		return spectralFeatures
+
+def spectralFeaturesShared(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> SpectralFeatures | None:
+	"""Return the `SpectralFeatures` of `spectrogramMagnitude` from the open `CacheSpectralFeatures`.
+
+	You can use this function in an analyzer of a spectral feature: inside a
+	`with CacheSpectralFeatures():` block, the analyzers of the features of one spectrogram share one
+	`SpectralFeatures`. Outside the block, or if `keywordArguments` has a parameter that
+	`SpectralFeatures` does not accept, the function returns `None`, and the analyzer computes its
+	feature with `librosa`.
+
+	Parameters
+	----------
+	spectrogramMagnitude : SpectrogramMagnitude
+		Magnitude spectrogram with shape (..., frequency bins, frames).
+	keywordArguments : Any
+		Keyword arguments of the analyzer.
+
+	Returns
+	-------
+	spectralFeatures : SpectralFeatures | None
+		Shared features of `spectrogramMagnitude`, or `None`.
+
+	"""
+	cacheSpectralFeatures: CacheSpectralFeatures | None = _contextCacheSpectralFeatures.get()
+	if cacheSpectralFeatures is None or not SpectralFeatures.parametersAccepted.issuperset(keywordArguments):
+		return None
+	return cacheSpectralFeatures.getSpectralFeatures(spectrogramMagnitude, **keywordArguments)
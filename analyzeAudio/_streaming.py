@@ -0,0 +1,198 @@
+"""Read one audio file in blocks of frames and build the block inputs of block analyzers.
+
+(AI generated docstring)
+
+You can use this module to analyze an audio file of any length with memory bounded by the block
+size. Each block covers a run of consecutive analysis frames. The module reads only the samples
+that those frames overlap, so consecutive blocks overlap by less than one frame, and it pads the
+file edges exactly as the whole-file analyzers do. The framewise values of a block are therefore
+identical to the matching frames of the whole-file framewise values.
+
+Contents
+--------
+Variables
+	lengthFrameWaveform
+		Frame length in samples of the waveform block analyzers.
+	lengthHopWaveform
+		Hop length in samples of the waveform block analyzers.
+
+Functions
+	getShortTimeFFT
+		Return the short-time Fourier transform that `hunterHearsPy.stft` uses.
+	iterateAudioBlocks
+		Yield the block inputs of block analyzers for consecutive blocks of frames.
+
+References
+----------
+[1] `analyzeAudio.registry.audioAspectsStreaming`
+
+[2] SciPy `scipy.signal.ShortTimeFFT`
+	https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.ShortTimeFFT.html
+
+"""
+from __future__ import annotations
+
+from analyzeAudio._memoryMapWAV import memoryMapWAV, toFloat32
+from hunterHearsPy import setting
+from hunterHearsPy.dataBaskets import ParametersShortTimeFFT
+from scipy.signal import ShortTimeFFT
+from typing import TYPE_CHECKING
+import dataclasses
+import math
+import numpy
+import soundfile
+
+if TYPE_CHECKING:
+	from analyzeAudio import Audio
+	from collections.abc import Iterable, Iterator
+	from os import PathLike
+	from typing import Any
+
+lengthFrameWaveform: int = 2048
+"""Frame length in samples of the waveform block analyzers, the default `frame_length` of `librosa`."""
+
+lengthHopWaveform: int = 512
+"""Hop length in samples of the waveform block analyzers, the default `hop_length` of `librosa`."""
+
+def getShortTimeFFT(sampleRate: int) -> ShortTimeFFT:
+	"""Return the short-time Fourier transform that `hunterHearsPy.stft` uses.
+
+	Parameters
+	----------
+	sampleRate : int
+		Sample rate of the waveform in hertz.
+
+	Returns
+	-------
+	shortTimeFFT : ShortTimeFFT
+		Transform with the window, hop, and FFT length of `hunterHearsPy.setting.ShortTimeFFT`.
+
+	"""
+	parametersShortTimeFFT = ParametersShortTimeFFT(**{**dataclasses.asdict(setting.ShortTimeFFT), 'sampleRate': sampleRate})
+	return ShortTimeFFT(**parametersShortTimeFFT.e733T)
+
+def iterateAudioBlocks(pathFilename: str | PathLike[Any], listParameterNames: Iterable[str], framesPerBlock: int) -> Iterator[dict[str, Any]]:
+	"""Yield the block inputs of block analyzers for consecutive blocks of frames.
+
+	You can use this generator to feed block analyzers registered in `audioAspectsStreaming` [1].
+	Each yielded dictionary maps block input names to values for one block of at most
+	`framesPerBlock` frames. The generator computes only the block inputs named in
+	`listParameterNames`.
+
+	Block inputs
+	------------
+	sampleRate : int
+		Sample rate of `pathFilename` in hertz.
+	spectrogram, spectrogramMagnitude, spectrogramPower
+		Frames of the block from the short-time Fourier transform of `hunterHearsPy.stft`, with
+		shape (channels, frequency bins, frames).
+	waveformPaddedConstant, waveformPaddedEdge
+		Samples of the frames of the block from the waveform after the waveform was padded on both
+		sides with `lengthFrameWaveform // 2` zeros or edge samples, respectively, with shape
+		(channels, samples). Frame `t` of the padded waveform begins at sample
+		`t * lengthHopWaveform`.
+
+	The spectrogram frames and the waveform frames are counted separately, so near the end of the
+	file one kind of block input can be absent from a yielded dictionary. If `pathFilename` is a PCM
+	WAV file, each block is sliced from the memory-mapped samples [3] instead of being decoded.
+
+	Parameters
+	----------
+	pathFilename : str | PathLike[Any]
+		Path to the audio file that the generator reads.
+	listParameterNames : Iterable[str]
+		Parameter names of the block analyzers that will receive the block inputs.
+	framesPerBlock : int
+		Maximum number of frames in one block.
+
+	Yields
+	------
+	dictionaryBlock : dict[str, Any]
+		Block inputs of one block.
+
+	References
+	----------
+	[1] `analyzeAudio.registry.audioAspectsStreaming`
+
+	[2] SciPy `scipy.signal.ShortTimeFFT.stft`
+		https://docs.scipy.org/doc/scipy/reference/generated/scipy.signal.ShortTimeFFT.stft.html
+
+	[3] `analyzeAudio._memoryMapWAV.memoryMapWAV`
+
+	"""
+	setParametersRequested: set[str] = set(listParameterNames)
+	needSpectrogram: bool = not setParametersRequested.isdisjoint({'spectrogram', 'spectrogramMagnitude', 'spectrogramPower'})
+	needWaveform: bool = not setParametersRequested.isdisjoint({'waveformPaddedConstant', 'waveformPaddedEdge'})
+
+	with soundfile.SoundFile(pathFilename) as readSoundFile:
+		sampleRate: int = readSoundFile.samplerate
+		lengthWaveform: int = readSoundFile.frames
+		shortTimeFFT: ShortTimeFFT = getShortTimeFFT(sampleRate)
+		samplesAndSampleRate: tuple[numpy.ndarray[tuple[int, int], numpy.dtype[Any]], int] | None = memoryMapWAV(pathFilename)
+		if samplesAndSampleRate is not None and samplesAndSampleRate[0].shape[0] != lengthWaveform:
+			samplesAndSampleRate = None
+
+		indexFrameSpectrogramFirst: int = shortTimeFFT.p_min
+		indexFrameSpectrogramStop: int = shortTimeFFT.p_max(lengthWaveform)
+		framesPerBlockSpectrogram: int = framesPerBlock
+		if lengthWaveform < shortTimeFFT.m_num:
+			# A waveform shorter than the window is one block, so the edge padding sees the whole waveform.
+			framesPerBlockSpectrogram = max(indexFrameSpectrogramStop - indexFrameSpectrogramFirst, 1)
+		countBlocksSpectrogram: int = math.ceil((indexFrameSpectrogramStop - indexFrameSpectrogramFirst) / framesPerBlockSpectrogram) if needSpectrogram else 0
+
+		countFramesWaveform: int = 1 + lengthWaveform // lengthHopWaveform if 0 < lengthWaveform else 0
+		countBlocksWaveform: int = math.ceil(countFramesWaveform / framesPerBlock) if needWaveform else 0
+
+		for indexBlock in range(max(countBlocksSpectrogram, countBlocksWaveform)):
+			dictionaryBlock: dict[str, Any] = {'sampleRate': sampleRate}
+
+			indexSampleStart: int = lengthWaveform
+			indexSampleStop: int = 0
+			if indexBlock < countBlocksSpectrogram:
+				indexFrameSpectrogram: int = indexFrameSpectrogramFirst + indexBlock * framesPerBlockSpectrogram
+				indexFrameSpectrogramEnd: int = min(indexFrameSpectrogram + framesPerBlockSpectrogram, indexFrameSpectrogramStop)
+				indexSampleSpectrogramEnd: int = (indexFrameSpectrogramEnd - 1) * shortTimeFFT.hop - shortTimeFFT.m_num_mid + shortTimeFFT.m_num
+				indexSampleSpectrogramStop: int = min(indexSampleSpectrogramEnd, lengthWaveform)
+				# At least one window of samples, so the reflection at the end of the file matches the whole-file transform.
+				indexSampleSpectrogramStart: int = max(0, min(indexFrameSpectrogram * shortTimeFFT.hop - shortTimeFFT.m_num_mid, indexSampleSpectrogramStop - shortTimeFFT.m_num))
+				indexSampleStart = min(indexSampleStart, indexSampleSpectrogramStart)
+				indexSampleStop = max(indexSampleStop, indexSampleSpectrogramStop)
+			if indexBlock < countBlocksWaveform:
+				indexFrameWaveform: int = indexBlock * framesPerBlock
+				indexFrameWaveformEnd: int = min(indexFrameWaveform + framesPerBlock, countFramesWaveform)
+				indexSampleWaveformPaddedStart: int = indexFrameWaveform * lengthHopWaveform - lengthFrameWaveform // 2
+				indexSampleWaveformPaddedStop: int = (indexFrameWaveformEnd - 1) * lengthHopWaveform + lengthFrameWaveform // 2
+				indexSampleStart = min(indexSampleStart, max(indexSampleWaveformPaddedStart, 0))
+				indexSampleStop = max(indexSampleStop, min(indexSampleWaveformPaddedStop, lengthWaveform))
+
+			if samplesAndSampleRate is not None:
+				waveformBlock: Audio = toFloat32(samplesAndSampleRate[0][indexSampleStart:indexSampleStop]).T
+			else:
+				readSoundFile.seek(indexSampleStart)
+				waveformBlock = readSoundFile.read(indexSampleStop - indexSampleStart, dtype='float32', always_2d=True).T
+
+			if indexBlock < countBlocksSpectrogram:
+				waveformSpectrogram: Audio = waveformBlock[:, indexSampleSpectrogramStart - indexSampleStart:indexSampleSpectrogramStop - indexSampleStart]
+				if 0 < indexSampleSpectrogramStart and lengthWaveform < indexSampleSpectrogramEnd:
+					waveformSpectrogram = numpy.pad(waveformSpectrogram, ((0, 0), (0, indexSampleSpectrogramEnd - lengthWaveform)), mode='reflect')
+				spectrogram = shortTimeFFT.stft(waveformSpectrogram, p0=0, p1=indexFrameSpectrogramEnd - indexFrameSpectrogram
+					, k_offset=indexFrameSpectrogram * shortTimeFFT.hop - indexSampleSpectrogramStart, padding=setting.padding)
+				if 'spectrogram' in setParametersRequested:
+					dictionaryBlock['spectrogram'] = spectrogram
+				if not setParametersRequested.isdisjoint({'spectrogramMagnitude', 'spectrogramPower'}):
+					dictionaryBlock['spectrogramMagnitude'] = numpy.absolute(spectrogram)
+				if 'spectrogramPower' in setParametersRequested:
+					dictionaryBlock['spectrogramPower'] = dictionaryBlock['spectrogramMagnitude'] ** 2
+				del spectrogram
+
+			if indexBlock < countBlocksWaveform:
+				indexSliceStart: int = max(indexSampleWaveformPaddedStart, 0) - indexSampleStart
+				indexSliceStop: int = min(indexSampleWaveformPaddedStop, lengthWaveform) - indexSampleStart
+				widthPad: tuple[tuple[int, int], tuple[int, int]] = (
+					(0, 0), (max(-indexSampleWaveformPaddedStart, 0), max(indexSampleWaveformPaddedStop - lengthWaveform, 0)))
+				if 'waveformPaddedConstant' in setParametersRequested:
+					dictionaryBlock['waveformPaddedConstant'] = numpy.pad(waveformBlock[:, indexSliceStart:indexSliceStop], widthPad, mode='constant')
+				if 'waveformPaddedEdge' in setParametersRequested:
+					dictionaryBlock['waveformPaddedEdge'] = numpy.pad(waveformBlock[:, indexSliceStart:indexSliceStop], widthPad, mode='edge')
+
+			yield dictionaryBlock
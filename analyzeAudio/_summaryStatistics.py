@@ -0,0 +1,151 @@
+"""Summarize the framewise values of one analyzer with several statistics.
+
+(AI generated docstring)
+
+You can use this module to compute the summary statistics of a framewise array, such as the
+spectral centroid of each frame, from one call of the framewise analyzer. A `SummaryStatistics`
+computes each statistic the first time you read it, and the order statistics, the median, the
+minimum, the maximum, and the percentiles [1], share one sorted copy of the array. The decorator
+`analyzeAudio.registry.registrationAudioAspectSummary` [2] registers one aspect name for each
+statistic of a framewise analyzer, so a request for several statistics calls the analyzer once.
+
+Contents
+--------
+Variables
+	dictionaryStatistics
+		Map each statistic name of an aspect name to the attribute of `SummaryStatistics`.
+
+Classes
+	SummaryStatistics
+		Compute the summary statistics of one framewise array when you read them.
+
+References
+----------
+[1] numpy.percentile.
+	https://numpy.org/doc/stable/reference/generated/numpy.percentile.html
+
+[2] `analyzeAudio.registry.registrationAudioAspectSummary`
+
+"""
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+import numpy
+
+if TYPE_CHECKING:
+	from numpy import dtype, ndarray
+	from numpy.typing import ArrayLike
+	from typing import Any
+
+dictionaryStatistics: dict[str, str] = {
+	'mean': 'mean',
+	'median': 'median',
+	'standard deviation': 'standardDeviation',
+	'minimum': 'minimum',
+	'maximum': 'maximum',
+	'5th percentile': 'percentile5',
+	'95th percentile': 'percentile95',
+}
+"""Map each statistic name of an aspect name, such as 'Spectral Centroid median', to the attribute of `SummaryStatistics` that holds its value."""
+
+class SummaryStatistics:
+	"""Compute the summary statistics of one framewise array when you read them.
+
+	Each statistic is over every value of the array, so the statistics of an array with shape
+	(channels, frames) summarize every channel and every frame together, as the mean aspects do. If
+	the array has a NaN value, each statistic is NaN. If the array is empty, each statistic is NaN.
+
+	Attributes
+	----------
+	arrayFramewise : ndarray[Any, dtype[Any]]
+		The framewise values.
+	mean : float
+		Arithmetic mean of the values.
+	median : float
+		Median of the values.
+	standardDeviation : float
+		Population standard deviation of the values.
+	minimum : float
+		Smallest value.
+	maximum : float
+		Largest value.
+	percentile5 : float
+		5th percentile of the values, with linear interpolation between the nearest values.
+	percentile95 : float
+		95th percentile of the values, with linear interpolation between the nearest values.
+
+	Examples
+	--------
+	```python
+	from analyzeAudio import SummaryStatistics
+	from analyzeAudio.analyzersUseSpectrogram import analyzeSpectralCentroid
+
+	summaryStatistics = SummaryStatistics(analyzeSpectralCentroid(spectrogramMagnitude, sr=sampleRate))
+	print(summaryStatistics.median, summaryStatistics.percentile95)
+	```
+
+	"""
+
+	def __init__(self, arrayFramewise: ArrayLike) -> None:
+		"""Hold `arrayFramewise` and compute no statistic yet.
+
+		Parameters
+		----------
+		arrayFramewise : ArrayLike
+			Framewise values, such as the result of a framewise analyzer.
+
+		"""
+		self.arrayFramewise: ndarray[Any, dtype[Any]] = numpy.asarray(arrayFramewise)
+
+	@cached_property
+	def arraySorted(self) -> ndarray[tuple[int], dtype[Any]]:
+		"""Every value of `arrayFramewise` in ascending order, with each NaN value last."""
+		return numpy.sort(self.arrayFramewise, axis=None)
+
+	@cached_property
+	def mean(self) -> float:
+		"""Arithmetic mean of the values."""
+		return float(self.arrayFramewise.mean().item())
+
+	@cached_property
+	def median(self) -> float:
+		"""Median of the values."""
+		return self._percentile(50)
+
+	@cached_property
+	def standardDeviation(self) -> float:
+		"""Population standard deviation of the values."""
+		if self.arrayFramewise.size == 0:
+			return numpy.nan
+		return float(self.arrayFramewise.std().item())
+
+	@cached_property
+	def minimum(self) -> float:
+		"""Smallest value."""
+		return self._percentile(0)
+
+	@cached_property
+	def maximum(self) -> float:
+		"""Largest value."""
+		return self._percentile(100)
+
+	@cached_property
+	def percentile5(self) -> float:
+		"""5th percentile of the values."""
+		return self._percentile(5)
+
+	@cached_property
+	def percentile95(self) -> float:
+		"""95th percentile of the values."""
+		return self._percentile(95)
+
+	def _percentile(self, percent: float) -> float:
+		"""I use this method to read a percentile from `arraySorted` with the linear interpolation of `numpy.percentile`, which would sort the values again for each percentile."""
+		arraySorted: ndarray[tuple[int], dtype[Any]] = self.arraySorted
+		if arraySorted.size == 0 or numpy.isnan(arraySorted[-1]):
+			return numpy.nan
+		index: float = percent / 100 * (arraySorted.size - 1)
+		indexLower: int = int(index)
+		indexUpper: int = min(indexLower + 1, arraySorted.size - 1)
+		return float(arraySorted[indexLower] + (arraySorted[indexUpper] - arraySorted[indexLower]) * (index - indexLower))
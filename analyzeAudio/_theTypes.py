@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 	from numpy.typing import ArrayLike, DTypeLike
 	from torch import device, Tensor
 	from typing import TypeAlias
+	from typing_extensions import NotRequired
 
 形 = ParamSpec('形')
 个 = TypeVar('个')
@@ -26,6 +27,7 @@ SpectrogramPower: TypeAlias = ndarray[tuple[int, int, int], dtype[floating[Any]]
 class AnalyzerAudioAspects(TypedDict):
 	analyzer: Callable[..., Any]
 	analyzerParameters: list[str]
+	analyzerOutput: NotRequired[str]
 
 class AuralossChromaSTFTLoss(Protocol):
 	fft_size: int
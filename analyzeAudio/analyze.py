@@ -10,8 +10,16 @@ Contents
 Functions
 	analyzeAudioFile
 		Compute requested aspect values for one audio file.
+	analyzeAudioFileStreaming
+		Compute requested aspect values for one audio file with memory bounded by the block size.
+	analyzeAudioIterablePathFilenames
+		Yield requested aspect values for many audio files as each file finishes.
 	analyzeAudioListPathFilenames
 		Compute requested aspect values for many audio files.
+	analyzeContestReference
+		Compute requested contest values of one reference audio file against many comparand files.
+	analyzeContestListPathFilenames
+		Compute requested contest values for many reference and comparand pairs.
 
 References
 ----------
@@ -20,27 +28,37 @@ References
 """
 from __future__ import annotations
 
-from analyzeAudio.registry import audioAspects
-from concurrent.futures import as_completed, ProcessPoolExecutor
-from hunterHearsPy import stft
+from analyzeAudio._cacheSTFT import CacheSTFT
+from analyzeAudio._instrumentation import InstrumentationAnalysis
+from analyzeAudio._intermediates import AudioIntermediates, dictionaryIntermediateDependencies
+from analyzeAudio._spectralFeatures import CacheSpectralFeatures
+from analyzeAudio._streaming import iterateAudioBlocks
+from analyzeAudio.analyzersUseFilename._wideRange import enginesFFmpeg, ffprobeAllInclusiveCache, getEnginesFFmpeg, getFilterFFmpeg
+from analyzeAudio.registry import audioAspects, audioAspectsStreaming, audioContests, getAnalyzerOutput
+from collections import defaultdict
+from concurrent.futures import as_completed, FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from hunterMakesPy.parseParameters import defineConcurrencyLimit
+from itertools import chain, islice
 from pathlib import PurePath
 from tqdm.auto import tqdm
 from typing import TYPE_CHECKING
+import math
 import numpy
 import soundfile
-import torch
+import subprocess  # noqa: S404
 
 if TYPE_CHECKING:
-	from analyzeAudio import Audio, SpectrogramMagnitude, SpectrogramPower
-	from collections.abc import Callable, Sequence
+	from analyzeAudio import AnalyzerAudioAspects, ArrayAspect, Audio, SpectrogramMagnitude
+	from analyzeAudio._analysisSession import AnalysisSession
+	from analyzeAudio._cacheAspectValues import CacheAspectValues
+	from analyzeAudio._dataBaskets import RecordInstrumentation
+	from collections.abc import Callable, Iterable, Iterator, Sequence
 	from concurrent.futures import Future
-	from hunterHearsPy.theTypes import Spectrogram
 	from os import PathLike
-	from torch import Tensor
-	from typing import Any
+	from typing import Any, Literal
 
-def analyzeAudioFile(pathFilename: str | PathLike[Any], listAspectNames: Sequence[str]) -> tuple[str | float, ...]:
+def analyzeAudioFile(pathFilename: str | PathLike[Any], listAspectNames: Sequence[str], *, cacheAspectValues: CacheAspectValues | None = None, instrumentation: InstrumentationAnalysis | None = None, shareWaveformWithFFmpeg: bool = False, astatsEngine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', ebur128Engine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', aspectralstatsEngine: Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg', segmentsFFprobe: int = 1) -> tuple[str | float, ...]:
 	"""
 	Compute requested aspect values for one audio file.
 
@@ -56,6 +74,32 @@ def analyzeAudioFile(pathFilename: str | PathLike[Any], listAspectNames: Sequenc
 	listAspectNames : Sequence[str]
 		Audio aspect name sequence to evaluate. The function preserves the order of
 		`listAspectNames` in the returned list.
+	cacheAspectValues : CacheAspectValues | None = None
+		Persistent cache of aspect values [3]. If you pass a cache, the function looks up each
+		requested aspect before it decodes `pathFilename`, computes only the missing aspects, and
+		stores the new values.
+	instrumentation : InstrumentationAnalysis | None = None
+		Collection of timing and memory records [4]. If you pass a collection, the function records
+		each aspect that it computes and each intermediate value that it computes.
+	shareWaveformWithFFmpeg : bool = False
+		If `True` and the requested aspects need both the decoded waveform and FFmpeg statistics, the
+		function writes the decoded waveform to FFprobe [5] instead of letting FFmpeg decode
+		`pathFilename` again. The values are the same; a compressed file, such as FLAC, is decoded once.
+	astatsEngine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `astats` [5]. 'NumPy' computes the same statistics from
+		the decoded waveform in this process, which is faster for short files.
+	ebur128Engine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `ebur128` [5]. 'NumPy' computes the same statistics of a
+		mono or stereo file from the decoded waveform in this process.
+	aspectralstatsEngine : Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg'
+		Engine that computes the statistics of `aspectralstats` [5]. 'NumPy' computes the statistics
+		with the window and hop of FFmpeg from the decoded waveform in this process. 'spectrogram'
+		computes the statistics from the spectrogram that the spectrogram analyzers receive, so a
+		request that mixes both kinds of aspects computes one STFT.
+	segmentsFFprobe : int = 1
+		Number of time segments of `pathFilename` that concurrent FFprobe processes measure [5], so one
+		long file can use more than one core. The integrated loudness and the loudness range can differ
+		from one process by 0.01 LU.
 
 	Returns
 	-------
@@ -63,49 +107,348 @@ def analyzeAudioFile(pathFilename: str | PathLike[Any], listAspectNames: Sequenc
 		One result for each entry in `listAspectNames`. Each result is either the analyzer
 		value or `'not found'` when no analyzer is registered for the matching aspect name.
 
+	Intermediate values
+	-------------------
+	The function reads the `analyzerParameters` of each requested aspect and computes only the
+	intermediate values, such as the decoded waveform, the spectrogram, or the tensor, that the
+	requested analyzers receive [2]. If every requested aspect only needs `pathFilename`, the
+	function does not decode `pathFilename`. Likewise, the function runs FFprobe once with only the
+	FFmpeg filters, such as `ebur128` or `astats`, that the requested aspects need [5]. The spectral
+	aspects, such as 'Spectral Centroid mean' and 'Spectral Bandwidth mean', share the frequencies,
+	the normalized spectrogram, and the squared magnitudes of one `SpectralFeatures` [6]. If one
+	analyzer computes several requested aspects, such as 'RMS Waveform mean' and 'RMS Waveform dB
+	mean', the function calls the analyzer once.
+
 	References
 	----------
 	[1] `analyzeAudio.audioAspectsRegistry.audioAspects`
 
+	[2] `analyzeAudio._intermediates.AudioIntermediates`
+
+	[3] `analyzeAudio.CacheAspectValues`
+
+	[4] `analyzeAudio.InstrumentationAnalysis`
+
+	[5] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+	[6] `analyzeAudio._spectralFeatures.SpectralFeatures`
+
 	"""  # noqa: DOC501
 	dictionaryAspectsAnalyzed: dict[str, str | float] = dict.fromkeys(listAspectNames, 'not found')
 	"""Despite returning a list, use a dictionary to preserve the order of the listAspectNames.
 	Similarly, 'not found' ensures the returned list length == len(listAspectNames)"""
 
-	# TODO I don't use `hunterHearsPy.readAudioFile` here because the sample rate is set by the
-	# function instead of being read from the file.
-	with soundfile.SoundFile(pathFilename) as readSoundFile:
-		sampleRate: int = readSoundFile.samplerate  # pyright: ignore[reportUnusedVariable]
-		waveform: Audio = readSoundFile.read(dtype='float32', always_2d=True).astype(numpy.float32)
-		waveform = waveform.T
+	listAspectNamesRegistered: list[str] = list(filter(audioAspects.__contains__, dictionaryAspectsAnalyzed))
+
+	identityFile: str = ''
+	dictionaryEngines: dict[str, str] = getEnginesFFmpeg(astatsEngine=astatsEngine, ebur128Engine=ebur128Engine, aspectralstatsEngine=aspectralstatsEngine)
+	if cacheAspectValues is not None:
+		identityFile = cacheAspectValues.identifyFile(pathFilename)
+		dictionaryAspectValuesCached: dict[str, Any] = cacheAspectValues.getAspectValues(identityFile, listAspectNamesRegistered, dictionaryEngines=dictionaryEngines, segmentsFFprobe=segmentsFFprobe)
+		dictionaryAspectsAnalyzed.update(dictionaryAspectValuesCached)
+		listAspectNamesRegistered = [aspectName for aspectName in listAspectNamesRegistered if aspectName not in dictionaryAspectValuesCached]
+
+	# One pass runs every FFmpeg filter that the requested aspects need, and no other filter.
+	setFiltersFFmpeg: set[str] = {filterName for aspectName in listAspectNamesRegistered if (filterName := getFilterFFmpeg(audioAspects[aspectName]['analyzer'])) is not None}
+
+	listParameterNames: list[str] = list(chain.from_iterable(audioAspects[aspectName]['analyzerParameters'] for aspectName in listAspectNamesRegistered))
+	shareSpectrogramWithFFmpeg: bool = aspectralstatsEngine == 'spectrogram' and 'aspectralstats' in setFiltersFFmpeg
+	if shareSpectrogramWithFFmpeg:
+		listParameterNames.append('spectrogramMagnitude')
+	audioIntermediates = AudioIntermediates(pathFilename, listParameterNames, instrumentation=instrumentation)
+
+	# The analyzers of FFprobe statistics read the statistics of the requested engines and segments, and the spectral aspects of the spectrogram
+	# share one computation of the terms that their features have in common.
+	with enginesFFmpeg(astatsEngine=astatsEngine, ebur128Engine=ebur128Engine, aspectralstatsEngine=aspectralstatsEngine, segmentsFFprobe=segmentsFFprobe), CacheSpectralFeatures():
+		if setFiltersFFmpeg:
+			waveformAndSampleRate: tuple[Audio, int] | None = None
+			if shareWaveformWithFFmpeg and 'waveform' in audioIntermediates.setIntermediatesRequired:
+				waveformAndSampleRate = (audioIntermediates.getIntermediate('waveform'), audioIntermediates.getIntermediate('sampleRate'))
+			spectrogramMagnitudeAndSampleRate: tuple[SpectrogramMagnitude, int] | None = None
+			if shareSpectrogramWithFFmpeg:
+				spectrogramMagnitudeAndSampleRate = (audioIntermediates.getIntermediate('spectrogramMagnitude'), audioIntermediates.getIntermediate('sampleRate'))
+			with nullcontext() if instrumentation is None else instrumentation.measure(pathFilename, 'intermediate', 'FFprobe ' + ' '.join(sorted(setFiltersFFmpeg))):
+				ffprobeAllInclusiveCache(pathFilename, setFiltersFFmpeg, waveformAndSampleRate=waveformAndSampleRate, spectrogramMagnitudeAndSampleRate=spectrogramMagnitudeAndSampleRate)
+
+		for analyzer, listAspectNamesAnalyzer in _groupByAnalyzer(audioAspects, listAspectNamesRegistered).items():
+			analyzerParameters: list[str] = audioAspects[listAspectNamesAnalyzer[0]]['analyzerParameters']
+			listArguments: list[Any] = list(map(audioIntermediates.getIntermediate, analyzerParameters))
+			with nullcontext() if instrumentation is None else instrumentation.measure(pathFilename, 'aspect', ', '.join(listAspectNamesAnalyzer)):
+				analyzerResult: Any = analyzer(*listArguments)
+			for aspectName in listAspectNamesAnalyzer:
+				dictionaryAspectsAnalyzed[aspectName] = getAnalyzerOutput(audioAspects[aspectName], analyzerResult)
+
+	if cacheAspectValues is not None and listAspectNamesRegistered:
+		cacheAspectValues.setAspectValues(identityFile, {aspectName: dictionaryAspectsAnalyzed[aspectName] for aspectName in listAspectNamesRegistered}, dictionaryEngines=dictionaryEngines, segmentsFFprobe=segmentsFFprobe)
 
-	tryAgain: bool = True
-	while tryAgain:
-		try:
-			# memory-sharing
-			tensorAudio: Tensor = torch.from_numpy(waveform)  # pyright: ignore[reportUnusedVariable, reportUnknownMemberType] # noqa: F841
-			tryAgain = False
-		except (RuntimeError, ValueError) as ERRORmessage:  # noqa: PERF203
-			if 'negative stride' in str(ERRORmessage):
-				waveform = waveform.copy()  # not memory-sharing
-				tryAgain = True
-			else:
-				raise RuntimeError from ERRORmessage
+	return tuple(map(dictionaryAspectsAnalyzed.__getitem__, listAspectNames))
+
+def analyzeAudioFileStreaming(pathFilename: str | PathLike[Any], listAspectNames: Sequence[str], *, framesPerBlock: int = 1024) -> tuple[str | float, ...]:
+	"""
+	Compute requested aspect values for one audio file with memory bounded by the block size.
+
+	You can use this function instead of `analyzeAudioFile` [1] for very long recordings. For each
+	aspect name registered in `audioAspectsStreaming` [2], the function reads `pathFilename` in
+	blocks of at most `framesPerBlock` frames, computes the framewise values of each block, and
+	accumulates the mean online, so the peak memory depends on `framesPerBlock` and not on the
+	length of `pathFilename`. The framewise values of each block are identical to the matching
+	frames of the whole-file analyzer, so the result equals the result of `analyzeAudioFile` up to
+	floating-point summation order.
+
+	Parameters
+	----------
+	pathFilename : str | PathLike[Any]
+		Path to the audio file that the function reads.
+	listAspectNames : Sequence[str]
+		Audio aspect name sequence to evaluate. The function preserves the order of
+		`listAspectNames` in the returned tuple.
+	framesPerBlock : int = 1024
+		Maximum number of analysis frames in one block. With the default hop of 512 samples, 1024
+		frames are about 12 seconds of audio at 44100 Hz.
+
+	Returns
+	-------
+	aspectValues : tuple[str | float, ...]
+		One result for each entry in `listAspectNames`. Each result is either the analyzer value or
+		`'not found'` when no analyzer is registered for the matching aspect name.
+
+	Raises
+	------
+	ValueError
+		If `framesPerBlock` is less than `1`.
+
+	Aspects without a block analyzer
+	--------------------------------
+	The function computes each registered aspect without a block analyzer with
+	`analyzeAudioFile` [1]. Aspects that only need `pathFilename`, such as the FFmpeg aspects, do
+	not decode the file in Python, but aspects that need the whole waveform, such as
+	'Tempo mean', still decode the whole file.
+
+	References
+	----------
+	[1] `analyzeAudioFile`
+
+	[2] `analyzeAudio.registry.audioAspectsStreaming`
 
-	spectrogram: Spectrogram = stft(waveform, sampleRate=sampleRate)
-	spectrogramMagnitude: SpectrogramMagnitude = numpy.absolute(spectrogram)
-	spectrogramPower: SpectrogramPower = spectrogramMagnitude ** 2  # pyright: ignore[reportUnusedVariable] # noqa: F841
+	[3] `analyzeAudio._streaming.iterateAudioBlocks`
 
-	pytorchOnCPU: bool = not torch.cuda.is_available()  # pyright: ignore[reportUnusedVariable] # False if GPU available, True if not  # noqa: F841
+	"""
+	if framesPerBlock < 1:
+		message: str = f'I received `{framesPerBlock = }`, but I need an integer greater than or equal to `1`.'
+		raise ValueError(message)
+
+	dictionaryAspectsAnalyzed: dict[str, str | float] = dict.fromkeys(listAspectNames, 'not found')
 
-	for aspectName in filter(audioAspects.__contains__, listAspectNames):
-		analyzer: Callable[..., Any] = audioAspects[aspectName]['analyzer']
-		analyzerParameters: list[str] = audioAspects[aspectName]['analyzerParameters']
-		dictionaryAspectsAnalyzed[aspectName] = analyzer(*map(vars().get, analyzerParameters))
+	listAspectNamesStreaming: list[str] = list(filter(audioAspectsStreaming.__contains__, dictionaryAspectsAnalyzed))
+	listAspectNamesWholeFile: list[str] = [aspectName for aspectName in dictionaryAspectsAnalyzed
+		if aspectName in audioAspects and aspectName not in audioAspectsStreaming]
+	if listAspectNamesWholeFile:
+		dictionaryAspectsAnalyzed.update(zip(listAspectNamesWholeFile, analyzeAudioFile(pathFilename, listAspectNamesWholeFile), strict=True))
+
+	dictionaryAspectSum: dict[str, float] = dict.fromkeys(listAspectNamesStreaming, 0.0)
+	dictionaryAspectCount: dict[str, int] = dict.fromkeys(listAspectNamesStreaming, 0)
+	if listAspectNamesStreaming:
+		for dictionaryBlock in iterateAudioBlocks(pathFilename, chain.from_iterable(
+				audioAspectsStreaming[aspectName]['analyzerParameters'] for aspectName in listAspectNamesStreaming), framesPerBlock):
+			for aspectName in listAspectNamesStreaming:
+				analyzerParameters: list[str] = audioAspectsStreaming[aspectName]['analyzerParameters']
+				if all(map(dictionaryBlock.__contains__, analyzerParameters)):
+					arrayAspect: ArrayAspect = audioAspectsStreaming[aspectName]['analyzer'](*map(dictionaryBlock.__getitem__, analyzerParameters))
+					dictionaryAspectSum[aspectName] += float(arrayAspect.sum(dtype=numpy.float64))
+					dictionaryAspectCount[aspectName] += arrayAspect.size
+
+	for aspectName in listAspectNamesStreaming:
+		dictionaryAspectsAnalyzed[aspectName] = dictionaryAspectSum[aspectName] / dictionaryAspectCount[aspectName] if dictionaryAspectCount[aspectName] else math.nan
 
 	return tuple(map(dictionaryAspectsAnalyzed.__getitem__, listAspectNames))
 
-def analyzeAudioListPathFilenames(listPathFilenames: Sequence[str | PathLike[Any]], listAspectNames: Sequence[str], *, CPUlimit: bool | float | int | None = None) -> list[list[str | float]]:
+def analyzeAudioIterablePathFilenames(iterablePathFilenames: Iterable[str | PathLike[Any]], listAspectNames: Sequence[str], *, CPUlimit: bool | float | int | None = None, inputOrder: bool = False, filesPendingLimit: int | None = None, cacheAspectValues: CacheAspectValues | None = None, analysisSession: AnalysisSession | None = None, FFprobeLimit: int | None = None, instrumentation: InstrumentationAnalysis | None = None, shareWaveformWithFFmpeg: bool = False, astatsEngine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', ebur128Engine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', aspectralstatsEngine: Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg', segmentsFFprobe: int = 1) -> Iterator[list[str | float]]:
+	"""
+	Yield requested aspect values for many audio files as each file finishes.
+
+	You can use this generator to evaluate the same `listAspectNames` against each path in
+	`iterablePathFilenames` without holding every row in memory. The generator reads
+	`iterablePathFilenames` lazily, keeps at most `filesPendingLimit` files submitted to the worker
+	pool but not yet yielded, and yields each row as soon as the row is available. Each row has the
+	same form as a row from `analyzeAudioListPathFilenames` [1], so you can pass the generator
+	directly to `analyzeAudio.dataTabularTOpathFilenameDelimited` [2].
+
+	Parameters
+	----------
+	iterablePathFilenames : Iterable[str | PathLike[Any]]
+		Paths of audio files to analyze. The generator consumes `iterablePathFilenames` only as
+		fast as the worker pool finishes files.
+	listAspectNames : Sequence[str]
+		Audio aspect name sequence to evaluate for each file.
+	CPUlimit : bool | float | int | None = None
+		Worker-count value for the process pool, forwarded to
+		`hunterMakesPy.parseParameters.defineConcurrencyLimit`.
+	inputOrder : bool = False
+		If `True`, yield rows in the order of `iterablePathFilenames`. If `False`, yield rows in
+		worker completion order.
+	filesPendingLimit : int | None = None
+		Maximum number of files submitted to the worker pool but not yet yielded. If `inputOrder` is
+		`True`, `filesPendingLimit` is the size of the reorder window: one slow file can hold back at
+		most `filesPendingLimit - 1` finished rows. Use `None` for twice the worker count.
+	cacheAspectValues : CacheAspectValues | None = None
+		Persistent cache of aspect values, forwarded to `analyzeAudioFile` [3].
+	analysisSession : AnalysisSession | None = None
+		Open session whose warm workers analyze the files [4]. If you pass a session, the generator
+		ignores `CPUlimit` and does not start or stop a process pool.
+	FFprobeLimit : int | None = None
+		Maximum number of files whose FFprobe aspects the generator analyzes at the same time. If you
+		pass an integer, the generator analyzes the FFprobe aspects on a pool of `FFprobeLimit`
+		threads in the current process instead of in the worker processes [5]. Each thread runs the
+		FFprobe processes of one file at the same time: one for `ebur128` and one for `astats` and
+		`aspectralstats`, so at most `2 * FFprobeLimit` processes; if `segmentsFFprobe` is greater
+		than `1`, one for each segment of `ebur128` and of `aspectralstats` and one for `astats`, so
+		at most `(2 * segmentsFFprobe + 1) * FFprobeLimit` processes. Use `None` to analyze every
+		aspect in the worker processes.
+	instrumentation : InstrumentationAnalysis | None = None
+		Collection of timing and memory records [6]. If you pass a collection, each worker records
+		its measurements and the generator adds the records of each file to `instrumentation` when
+		it yields the row of the file.
+	shareWaveformWithFFmpeg : bool = False
+		If `True`, each worker process writes the waveform that it decoded to FFprobe instead of
+		letting FFmpeg decode the file again. See `analyzeAudioFile`.
+	astatsEngine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `astats`. See `analyzeAudioFile`.
+	ebur128Engine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `ebur128`. See `analyzeAudioFile`.
+	aspectralstatsEngine : Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg'
+		Engine that computes the statistics of `aspectralstats`. See `analyzeAudioFile`.
+	segmentsFFprobe : int = 1
+		Number of time segments of each file that concurrent FFprobe processes measure. See `analyzeAudioFile`.
+
+	Yields
+	------
+	rowFilenameAspectValues : list[str | float]
+		The POSIX text form of one `pathFilename` in column `0`, followed by the aspect values
+		aligned with `listAspectNames`.
+
+	Raises
+	------
+	ValueError
+		If `filesPendingLimit` is less than `1`.
+	ValueError
+		If `FFprobeLimit` is less than `1`.
+
+	FFprobe aspects
+	---------------
+	An FFprobe aspect is an aspect whose analyzer only needs `pathFilename`, such as
+	'LUFS integrated' or 'Crest_factor mean'. The analyzer spends almost all of its time waiting for the
+	`ffprobe` subprocess, so a thread can wait for it as well as a worker process can, and a thread
+	does not import `torch` or `librosa` again. If every requested aspect is an FFprobe aspect and
+	you pass `FFprobeLimit`, the generator does not start any worker process.
+
+	Examples
+	--------
+	Write rows in input order while the files are still being analyzed.
+
+	```python
+	from analyzeAudio import analyzeAudioIterablePathFilenames, dataTabularTOpathFilenameDelimited
+	import pathlib
+
+	listAspectNames = ['LUFS integrated', 'true_peak maximum']
+	dataTabularTOpathFilenameDelimited(
+		'measurements.tsv',
+		analyzeAudioIterablePathFilenames(pathlib.Path('audio').rglob('*.wav'), listAspectNames, inputOrder=True),
+		['pathFilename', *listAspectNames],
+	)
+	```
+
+	References
+	----------
+	[1] `analyzeAudioListPathFilenames`
+
+	[2] `analyzeAudio.dataTabularTOpathFilenameDelimited`
+
+	[3] `analyzeAudioFile`
+
+	[4] `analyzeAudio.AnalysisSession`
+
+	[5] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+	[6] `analyzeAudio.InstrumentationAnalysis`
+
+	"""
+	max_workers: int = defineConcurrencyLimit(limit=CPUlimit) if analysisSession is None else analysisSession.max_workers
+	if filesPendingLimit is None:
+		filesPendingLimit = 2 * max(max_workers, FFprobeLimit or 0)
+	if filesPendingLimit < 1:
+		message: str = f'I received `{filesPendingLimit = }`, but I need an integer greater than or equal to `1`.'
+		raise ValueError(message)
+	if FFprobeLimit is not None and FFprobeLimit < 1:
+		message = f'I received `{FFprobeLimit = }`, but I need `None` or an integer greater than or equal to `1`.'
+		raise ValueError(message)
+
+	listAspectNamesThread: list[str] = []
+	listAspectNamesProcess: list[str] = list(filter(audioAspects.__contains__, dict.fromkeys(listAspectNames)))
+	if FFprobeLimit is not None:
+		listAspectNamesThread = [aspectName for aspectName in listAspectNamesProcess if audioAspects[aspectName]['analyzerParameters'] == ['pathFilename']]
+		listAspectNamesProcess = [aspectName for aspectName in listAspectNamesProcess if aspectName not in listAspectNamesThread]
+
+	iteratorPathFilenames: Iterator[str | PathLike[Any]] = iter(iterablePathFilenames)
+
+	concurrencyManager: ProcessPoolExecutor = ProcessPoolExecutor(max_workers) if analysisSession is None else analysisSession.concurrencyManager
+	concurrencyManagerThreads: ThreadPoolExecutor | None = ThreadPoolExecutor(FFprobeLimit) if listAspectNamesThread else None
+
+	# Every file gets at least one claim ticket, even if no requested aspect is registered.
+	listConcurrencyManagers: list[tuple[ProcessPoolExecutor | ThreadPoolExecutor, list[str]]] = []
+	if listAspectNamesProcess or concurrencyManagerThreads is None:
+		listConcurrencyManagers.append((concurrencyManager, listAspectNamesProcess))
+	if concurrencyManagerThreads is not None:
+		listConcurrencyManagers.append((concurrencyManagerThreads, listAspectNamesThread))
+
+	def submitPathFilename(pathFilename: str | PathLike[Any]) -> tuple[Future[Any], ...]:
+		if instrumentation is not None:
+			return tuple(concurrencyManagerFile.submit(_analyzeAudioFileInstrumented, pathFilename, listAspectNamesSubmitted
+				, cacheAspectValues=cacheAspectValues, traceAllocations=instrumentation.traceAllocations, shareWaveformWithFFmpeg=shareWaveformWithFFmpeg, astatsEngine=astatsEngine, ebur128Engine=ebur128Engine, aspectralstatsEngine=aspectralstatsEngine, segmentsFFprobe=segmentsFFprobe)
+				for concurrencyManagerFile, listAspectNamesSubmitted in listConcurrencyManagers)
+		return tuple(concurrencyManagerFile.submit(analyzeAudioFile, pathFilename, listAspectNamesSubmitted, cacheAspectValues=cacheAspectValues, shareWaveformWithFFmpeg=shareWaveformWithFFmpeg, astatsEngine=astatsEngine, ebur128Engine=ebur128Engine, aspectralstatsEngine=aspectralstatsEngine, segmentsFFprobe=segmentsFFprobe)
+			for concurrencyManagerFile, listAspectNamesSubmitted in listConcurrencyManagers)
+
+	# A dictionary preserves submission order, so the first key is the oldest pending file. Each key
+	# holds the claim tickets of one file: one from the worker processes, one from the threads, or both.
+	dictionaryConcurrency: dict[tuple[Future[Any], ...], str | PathLike[Any]] = {}
+
+	try:
+		for pathFilename in islice(iteratorPathFilenames, filesPendingLimit):
+			dictionaryConcurrency[submitPathFilename(pathFilename)] = pathFilename
+
+		while dictionaryConcurrency:
+			if inputOrder:
+				listClaimTickets: list[tuple[Future[Any], ...]] = [next(iter(dictionaryConcurrency))]
+			else:
+				listClaimTickets = [claimTicket for claimTicket in dictionaryConcurrency if all(future.done() for future in claimTicket)]
+				if not listClaimTickets:
+					# Wait only for the futures that are not done: a done future would end each `wait` at once.
+					wait([future for future in chain.from_iterable(dictionaryConcurrency) if not future.done()], return_when=FIRST_COMPLETED)
+					listClaimTickets = [claimTicket for claimTicket in dictionaryConcurrency if all(future.done() for future in claimTicket)]
+
+			for claimTicket in listClaimTickets:
+				pathFilename = dictionaryConcurrency.pop(claimTicket)
+				for pathFilenameNext in islice(iteratorPathFilenames, 1):
+					dictionaryConcurrency[submitPathFilename(pathFilenameNext)] = pathFilenameNext
+				dictionaryAspectsAnalyzed: dict[str, str | float] = dict.fromkeys(listAspectNames, 'not found')
+				for (_concurrencyManagerFile, listAspectNamesSubmitted), future in zip(listConcurrencyManagers, claimTicket, strict=True):
+					aspectValues: Any = future.result()
+					if instrumentation is not None:
+						aspectValues, listRecords = aspectValues
+						instrumentation.extend(listRecords)
+					dictionaryAspectsAnalyzed.update(zip(listAspectNamesSubmitted, aspectValues, strict=True))
+				yield [PurePath(pathFilename).as_posix(), *map(dictionaryAspectsAnalyzed.__getitem__, listAspectNames)]
+	finally:
+		# If the caller stops early, do not start the files that are still waiting for a worker.
+		if concurrencyManagerThreads is not None:
+			concurrencyManagerThreads.shutdown(cancel_futures=True)
+		if analysisSession is None:
+			concurrencyManager.shutdown(cancel_futures=True)
+		else:
+			for future in chain.from_iterable(dictionaryConcurrency):
+				future.cancel()
+
+def analyzeAudioListPathFilenames(listPathFilenames: Sequence[str | PathLike[Any]], listAspectNames: Sequence[str], *, CPUlimit: bool | float | int | None = None, cacheAspectValues: CacheAspectValues | None = None, scheduleLongestFirst: bool = True, analysisSession: AnalysisSession | None = None, FFprobeLimit: int | None = None, instrumentation: InstrumentationAnalysis | None = None, shareWaveformWithFFmpeg: bool = False, astatsEngine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', ebur128Engine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', aspectralstatsEngine: Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg', segmentsFFprobe: int = 1) -> list[list[str | float]]:
 	"""
 	Compute requested aspect values for many audio files.
 
@@ -126,6 +469,36 @@ def analyzeAudioListPathFilenames(listPathFilenames: Sequence[str | PathLike[Any
 		use a positive integer for an explicit worker count. The function forwards `CPUlimit`
 		directly to the worker pool without additional normalization, so values less than `1`
 		fail in the worker pool.
+	cacheAspectValues : CacheAspectValues | None = None
+		Persistent cache of aspect values, forwarded to `analyzeAudioFile` [1].
+	scheduleLongestFirst : bool = True
+		If `True`, submit the files to the worker pool in order of decreasing duration, so a long
+		file that comes late in `listPathFilenames` does not leave the other workers idle at the end
+		of the batch. Threads read the durations concurrently from the file headers with `soundfile`
+		[4], or with `ffprobe` if `soundfile` cannot read the file. A file whose duration is unknown
+		is submitted first.
+	analysisSession : AnalysisSession | None = None
+		Open session whose warm workers analyze the files [5]. If you pass a session, the function
+		ignores `CPUlimit` and does not start or stop a process pool.
+	FFprobeLimit : int | None = None
+		Maximum number of files whose FFprobe aspects the function analyzes at the same time. If you
+		pass an integer, the function analyzes the aspects whose analyzer only needs `pathFilename`
+		on a pool of `FFprobeLimit` threads instead of in the worker processes [3]. Each file runs up
+		to two FFprobe processes, or up to `2 * segmentsFFprobe + 1` processes if `segmentsFFprobe`
+		is greater than `1`. See `analyzeAudioIterablePathFilenames`.
+	instrumentation : InstrumentationAnalysis | None = None
+		Collection of timing and memory records from every worker [6].
+	shareWaveformWithFFmpeg : bool = False
+		If `True`, each worker process writes the waveform that it decoded to FFprobe instead of
+		letting FFmpeg decode the file again. See `analyzeAudioFile`.
+	astatsEngine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `astats`. See `analyzeAudioFile`.
+	ebur128Engine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `ebur128`. See `analyzeAudioFile`.
+	aspectralstatsEngine : Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg'
+		Engine that computes the statistics of `aspectralstats`. See `analyzeAudioFile`.
+	segmentsFFprobe : int = 1
+		Number of time segments of each file that concurrent FFprobe processes measure. See `analyzeAudioFile`.
 
 	Returns
 	-------
@@ -138,7 +511,13 @@ def analyzeAudioListPathFilenames(listPathFilenames: Sequence[str | PathLike[Any
 	---------------
 	row order : completion order
 		`rowsListFilenameAspectValues` follows worker completion order rather than the input
-		order of `listPathFilenames`.
+		order of `listPathFilenames`. If you want input order, or if you do not want to hold every
+		row in memory, use `analyzeAudioIterablePathFilenames` [3].
+
+	Progress
+	--------
+	If the duration of every file is known, the progress bar counts seconds of audio, not files, so
+	it advances in proportion to the work that is finished. Otherwise, the progress bar counts files.
 
 	Examples
 	--------
@@ -166,22 +545,288 @@ def analyzeAudioListPathFilenames(listPathFilenames: Sequence[str | PathLike[Any
 
 	[2] `analyzeAudio.dataTabularTOpathFilenameDelimited`
 
-	"""
-	max_workers: int = defineConcurrencyLimit(limit=CPUlimit)
+	[3] `analyzeAudioIterablePathFilenames`
 
-	with ProcessPoolExecutor(max_workers) as concurrencyManager:
-		dictionaryConcurrency: dict[Future[tuple[str | float, ...]], str | PathLike[Any]] = {
-			concurrencyManager.submit(analyzeAudioFile, pathFilename, listAspectNames): pathFilename
-				for pathFilename in listPathFilenames}
+	[4] `soundfile.info`
+		https://python-soundfile.readthedocs.io/en/latest/#soundfile.info
 
-		disabled: bool = True
-		if (3 < len(listPathFilenames) and (5 < (max(len(listPathFilenames) / max_workers, 1) * len(listAspectNames)))):
-			disabled = False
+	[5] `analyzeAudio.AnalysisSession`
 
-		rowsListFilenameAspectValues: list[list[str | float]] = [
-			[PurePath(dictionaryConcurrency[claimTicket]).as_posix(), *claimTicket.result()] for claimTicket
-				in tqdm(as_completed(dictionaryConcurrency), total=len(dictionaryConcurrency), unit='files', desc='Analyze audio file'
-					, leave=False, disable=disabled)
-		]
+	[6] `analyzeAudio.InstrumentationAnalysis`
+
+	"""
+	max_workers: int = defineConcurrencyLimit(limit=CPUlimit) if analysisSession is None else analysisSession.max_workers
+
+	disabled: bool = True
+	if (3 < len(listPathFilenames) and (5 < (max(len(listPathFilenames) / max_workers, 1) * len(listAspectNames)))):
+		disabled = False
+
+	listDurations: list[float | None] = [None] * len(listPathFilenames)
+	if scheduleLongestFirst or not disabled:
+		# Each duration waits on a file header or on `ffprobe`, so threads read the durations concurrently.
+		with ThreadPoolExecutor(max_workers) as concurrencyManager:
+			listDurations = list(concurrencyManager.map(_getDurationSeconds, listPathFilenames))
+	dictionaryPathFilenameDuration: dict[str, float | None] = {PurePath(pathFilename).as_posix(): duration
+		for pathFilename, duration in zip(listPathFilenames, listDurations, strict=True)}
+
+	listPathFilenamesScheduled: list[str | PathLike[Any]] = list(listPathFilenames)
+	if scheduleLongestFirst:
+		listPathFilenamesScheduled.sort(key=lambda pathFilename: _sortDuration(dictionaryPathFilenameDuration[PurePath(pathFilename).as_posix()]), reverse=True)
+
+	# A file whose duration is unknown would never move a progress bar of seconds, so the progress bar then counts files.
+	progressSeconds: bool = None not in listDurations
+	dictionaryPathFilenameProgress: dict[str, float] = {pathFilename: duration if progressSeconds and duration is not None else 1
+		for pathFilename, duration in dictionaryPathFilenameDuration.items()}
+
+	rowsListFilenameAspectValues: list[list[str | float]] = []
+	with tqdm(total=sum(dictionaryPathFilenameProgress[PurePath(pathFilename).as_posix()] for pathFilename in listPathFilenames), unit='s' if progressSeconds else 'file', desc='Analyze audio file', leave=False, disable=disabled) as progressBar:
+		for rowFilenameAspectValues in analyzeAudioIterablePathFilenames(listPathFilenamesScheduled, listAspectNames, CPUlimit=max_workers
+				, filesPendingLimit=max(len(listPathFilenames), 1), cacheAspectValues=cacheAspectValues, analysisSession=analysisSession, FFprobeLimit=FFprobeLimit, instrumentation=instrumentation, shareWaveformWithFFmpeg=shareWaveformWithFFmpeg, astatsEngine=astatsEngine, ebur128Engine=ebur128Engine, aspectralstatsEngine=aspectralstatsEngine, segmentsFFprobe=segmentsFFprobe):
+			rowsListFilenameAspectValues.append(rowFilenameAspectValues)
+			progressBar.update(dictionaryPathFilenameProgress[str(rowFilenameAspectValues[0])])
 
 	return rowsListFilenameAspectValues
+
+def _analyzeAudioFileInstrumented(pathFilename: str | PathLike[Any], listAspectNames: Sequence[str], *, cacheAspectValues: CacheAspectValues | None, traceAllocations: bool, shareWaveformWithFFmpeg: bool, astatsEngine: Literal['FFmpeg', 'NumPy'], ebur128Engine: Literal['FFmpeg', 'NumPy'], aspectralstatsEngine: Literal['FFmpeg', 'NumPy', 'spectrogram'], segmentsFFprobe: int) -> tuple[tuple[str | float, ...], list[RecordInstrumentation]]:
+	# A worker cannot add to the collection of the caller, so the worker returns its records with its values.
+	instrumentation = InstrumentationAnalysis(traceAllocations=traceAllocations)
+	return analyzeAudioFile(pathFilename, listAspectNames, cacheAspectValues=cacheAspectValues, instrumentation=instrumentation, shareWaveformWithFFmpeg=shareWaveformWithFFmpeg, astatsEngine=astatsEngine, ebur128Engine=ebur128Engine, aspectralstatsEngine=aspectralstatsEngine, segmentsFFprobe=segmentsFFprobe), instrumentation.listRecords
+
+def _getDurationSeconds(pathFilename: str | PathLike[Any]) -> float | None:
+	"""Return the duration of `pathFilename` in seconds from `soundfile` or from `ffprobe`, or `None` if neither can read it."""
+	try:
+		return soundfile.info(pathFilename).duration
+	except (OSError, RuntimeError):
+		commandLineFFprobe: list[str] = ["ffprobe", "-hide_banner", "-v", "error", "-show_entries", "format=duration", "-output_format", "csv=p=0", str(pathFilename)]
+		try:
+			return float(subprocess.run(commandLineFFprobe, capture_output=True, check=True).stdout)
+		except (OSError, ValueError, subprocess.CalledProcessError):
+			return None
+
+def _sortDuration(duration: float | None) -> float:
+	"""Return `duration`, or infinity if the duration is unknown, so the file is submitted first."""
+	return math.inf if duration is None else duration
+
+tupleContestRoles: tuple[str, ...] = ('Alfa', 'Beta', 'Mixture')
+"""Suffixes of contest analyzer parameter names: the reference, the comparand, and the mixture."""
+
+def _groupByAnalyzer(registry: dict[str, AnalyzerAudioAspects], listNamesRegistered: Iterable[str]) -> dict[Callable[..., Any], list[str]]:
+	"""I use this function to call each analyzer once, even if the analyzer computes several of the requested names."""
+	dictionaryAnalyzerNames: dict[Callable[..., Any], list[str]] = defaultdict(list)
+	for nameRegistered in listNamesRegistered:
+		dictionaryAnalyzerNames[registry[nameRegistered]['analyzer']].append(nameRegistered)
+	return dictionaryAnalyzerNames
+
+def _getContestParameterNames(listContestNames: Iterable[str], contestRole: str) -> list[str]:
+	"""I use this function to list the intermediate identifiers that the contests read from the audio file of `contestRole`."""
+	listParameterNames: list[str] = []
+	for parameterName in chain.from_iterable(audioContests[contestName]['analyzerParameters'] for contestName in listContestNames):
+		if parameterName.endswith(contestRole) and parameterName.removesuffix(contestRole) in dictionaryIntermediateDependencies:
+			listParameterNames.append(parameterName.removesuffix(contestRole))
+		elif contestRole == 'Alfa' and parameterName in dictionaryIntermediateDependencies:
+			listParameterNames.append(parameterName)
+	return listParameterNames
+
+def _getContestArguments(analyzerParameters: Iterable[str], dictionaryAudioIntermediates: dict[str, AudioIntermediates]) -> dict[str, Any]:
+	"""I use this function to map the parameter names of one contest analyzer to intermediate values.
+
+	A parameter name without a role suffix, such as `sampleRate`, receives the value of the reference.
+	A parameter name that is not an intermediate identifier, such as `metricFunction`, is left out, so
+	the analyzer uses its default value.
+	"""
+	dictionaryArguments: dict[str, Any] = {}
+	for parameterName in analyzerParameters:
+		for contestRole, audioIntermediates in dictionaryAudioIntermediates.items():
+			if parameterName.endswith(contestRole) and parameterName.removesuffix(contestRole) in dictionaryIntermediateDependencies:
+				dictionaryArguments[parameterName] = audioIntermediates.getIntermediate(parameterName.removesuffix(contestRole))
+		if parameterName in dictionaryIntermediateDependencies:
+			dictionaryArguments[parameterName] = dictionaryAudioIntermediates['Alfa'].getIntermediate(parameterName)
+	return dictionaryArguments
+
+def _checkContestMixture(listContestNames: Iterable[str], pathFilenameMixture: str | PathLike[Any] | None) -> None:
+	if pathFilenameMixture is None:
+		for contestName in listContestNames:
+			if contestName in audioContests and _getContestParameterNames([contestName], 'Mixture'):
+				message: str = f'I received `{contestName = }`, which needs a mixture, but I received `pathFilenameMixture = None`.'
+				raise ValueError(message)
+
+def analyzeContestReference(pathFilenameAlfa: str | PathLike[Any], listPathFilenamesBeta: Sequence[str | PathLike[Any]], listContestNames: Sequence[str], *, pathFilenameMixture: str | PathLike[Any] | None = None) -> list[tuple[str | float, ...]]:
+	"""
+	Compute requested contest values of one reference audio file against many comparand files.
+
+	You can use this function to evaluate each name in `listContestNames` for the reference
+	`pathFilenameAlfa` against each comparand in `listPathFilenamesBeta`. The function decodes and
+	transforms `pathFilenameAlfa` once, and every comparand and every contest reuses the same
+	intermediate values of the reference. A contest that compares spectrograms reads each
+	short-time Fourier transform from a `CacheSTFT` [3], so each resolution of the reference is
+	computed once for every contest and every comparand. If one analyzer computes several requested
+	contests, such as 'Bleedless Mel-scaled dB mean' and 'Fullness Mel-scaled dB mean', the function
+	calls the analyzer once for each comparand. If a name from `listContestNames` is absent from
+	`audioContests` [1], the matching entry is `'not found'`.
+
+	Parameters
+	----------
+	pathFilenameAlfa : str | PathLike[Any]
+		Path to the reference audio file.
+	listPathFilenamesBeta : Sequence[str | PathLike[Any]]
+		Paths to the comparand audio files.
+	listContestNames : Sequence[str]
+		Audio contest name sequence to evaluate. The function preserves the order of
+		`listContestNames` in each returned tuple.
+	pathFilenameMixture : str | PathLike[Any] | None = None
+		Path to the mixture audio file, for contests such as 'analyzeLogWMSE mean' that read a
+		mixture.
+
+	Returns
+	-------
+	listContestValues : list[tuple[str | float, ...]]
+		One tuple for each entry in `listPathFilenamesBeta`, with one result for each entry in
+		`listContestNames`.
+
+	Raises
+	------
+	ValueError
+		If a requested contest reads a mixture and `pathFilenameMixture` is `None`.
+
+	Intermediate values
+	-------------------
+	Each contest analyzer receives the intermediate values [2] that its parameter names select. The
+	suffix of a parameter name selects the audio file: `Alfa` the reference, `Beta` the comparand, and
+	`Mixture` the mixture. For example, `tensorAudioAlfa` receives the `tensorAudio` of
+	`pathFilenameAlfa`. A parameter name without a suffix, such as `sampleRate`, receives the value of
+	the reference.
+
+	References
+	----------
+	[1] `analyzeAudio.registry.audioContests`
+
+	[2] `analyzeAudio._intermediates.AudioIntermediates`
+
+	[3] `analyzeAudio._cacheSTFT.CacheSTFT`
+
+	"""
+	_checkContestMixture(listContestNames, pathFilenameMixture)
+	listContestNamesRegistered: list[str] = list(filter(audioContests.__contains__, dict.fromkeys(listContestNames)))
+
+	audioIntermediatesAlfa = AudioIntermediates(pathFilenameAlfa, _getContestParameterNames(listContestNamesRegistered, 'Alfa'))
+	dictionaryAudioIntermediates: dict[str, AudioIntermediates] = {'Alfa': audioIntermediatesAlfa}
+	if pathFilenameMixture is not None:
+		dictionaryAudioIntermediates['Mixture'] = AudioIntermediates(pathFilenameMixture, _getContestParameterNames(listContestNamesRegistered, 'Mixture'))
+
+	listContestValues: list[tuple[str | float, ...]] = []
+	# The contests share each STFT of the reference with every comparand; the STFTs of a comparand are released with the comparand.
+	with CacheSTFT():
+		for pathFilenameBeta in listPathFilenamesBeta:
+			dictionaryAudioIntermediates['Beta'] = AudioIntermediates(pathFilenameBeta, _getContestParameterNames(listContestNamesRegistered, 'Beta'))
+			dictionaryContestsAnalyzed: dict[str, str | float] = dict.fromkeys(listContestNames, 'not found')
+			for analyzer, listContestNamesAnalyzer in _groupByAnalyzer(audioContests, listContestNamesRegistered).items():
+				analyzerResult: Any = analyzer(**_getContestArguments(audioContests[listContestNamesAnalyzer[0]]['analyzerParameters'], dictionaryAudioIntermediates))
+				for contestName in listContestNamesAnalyzer:
+					dictionaryContestsAnalyzed[contestName] = getAnalyzerOutput(audioContests[contestName], analyzerResult)
+			listContestValues.append(tuple(map(dictionaryContestsAnalyzed.__getitem__, listContestNames)))
+	return listContestValues
+
+def analyzeContestListPathFilenames(listPathFilenamesContests: Sequence[tuple[str | PathLike[Any], str | PathLike[Any]]], listContestNames: Sequence[str], *, pathFilenameMixture: str | PathLike[Any] | None = None, CPUlimit: bool | float | int | None = None, analysisSession: AnalysisSession | None = None) -> list[list[str | float]]:
+	"""
+	Compute requested contest values for many reference and comparand pairs.
+
+	You can use this function to evaluate the same `listContestNames` for each (reference,
+	comparand) pair in `listPathFilenamesContests`. The function groups the pairs by reference and
+	sends each group to `analyzeContestReference` [1], so a reference that is shared by many
+	comparands is decoded and transformed once per group instead of once per pair.
+
+	Parameters
+	----------
+	listPathFilenamesContests : Sequence[tuple[str | PathLike[Any], str | PathLike[Any]]]
+		Pairs of paths: the reference audio file, then the comparand audio file.
+	listContestNames : Sequence[str]
+		Audio contest name sequence to evaluate for each pair.
+	pathFilenameMixture : str | PathLike[Any] | None = None
+		Path to the mixture audio file, forwarded to `analyzeContestReference` [1].
+	CPUlimit : bool | float | int | None = None
+		Worker-count value for the process pool, forwarded to
+		`hunterMakesPy.parseParameters.defineConcurrencyLimit`.
+	analysisSession : AnalysisSession | None = None
+		Open session whose warm workers analyze the groups [2]. If you pass a session, the function
+		ignores `CPUlimit` and does not start or stop a process pool.
+
+	Returns
+	-------
+	rowsListFilenamesContestValues : list[list[str | float]]
+		One row per pair. Each row contains the POSIX text form of the reference in column `0`, the
+		POSIX text form of the comparand in column `1`, followed by the contest values aligned with
+		`listContestNames`.
+
+	Raises
+	------
+	ValueError
+		If a requested contest reads a mixture and `pathFilenameMixture` is `None`.
+
+	Groups
+	------
+	If there are fewer references than workers, the function splits the comparands of each
+	reference into at most `ceil(workers / references)` groups so that every worker has work. Each
+	group decodes its reference once.
+
+	Result ordering
+	---------------
+	row order : completion order of the groups
+		Within one group, the rows follow the order of `listPathFilenamesContests`.
+
+	Examples
+	--------
+	```python
+	from analyzeAudio import analyzeContestListPathFilenames, dataTabularTOpathFilenameDelimited
+
+	listContestNames = ['SI-SDR mean', 'analyzeLogWMSE mean']
+	rows = analyzeContestListPathFilenames(
+		[('reference_vocals.flac', 'modelA_vocals.flac'), ('reference_vocals.flac', 'modelB_vocals.flac')],
+		listContestNames,
+		pathFilenameMixture='mixture.flac',
+	)
+	dataTabularTOpathFilenameDelimited('contests.tsv', rows, ['pathFilenameAlfa', 'pathFilenameBeta', *listContestNames])
+	```
+
+	References
+	----------
+	[1] `analyzeContestReference`
+
+	[2] `analyzeAudio.AnalysisSession`
+
+	"""
+	_checkContestMixture(listContestNames, pathFilenameMixture)
+	max_workers: int = defineConcurrencyLimit(limit=CPUlimit) if analysisSession is None else analysisSession.max_workers
+
+	dictionaryReferenceComparands: defaultdict[str, list[str | PathLike[Any]]] = defaultdict(list)
+	dictionaryReferencePathFilename: dict[str, str | PathLike[Any]] = {}
+	for pathFilenameAlfa, pathFilenameBeta in listPathFilenamesContests:
+		dictionaryReferencePathFilename.setdefault(PurePath(pathFilenameAlfa).as_posix(), pathFilenameAlfa)
+		dictionaryReferenceComparands[PurePath(pathFilenameAlfa).as_posix()].append(pathFilenameBeta)
+
+	countGroupsPerReference: int = math.ceil(max_workers / max(len(dictionaryReferenceComparands), 1))
+
+	concurrencyManager: ProcessPoolExecutor = ProcessPoolExecutor(max_workers) if analysisSession is None else analysisSession.concurrencyManager
+	dictionaryConcurrency: dict[Future[list[tuple[str | float, ...]]], tuple[str | PathLike[Any], list[str | PathLike[Any]]]] = {}
+	rowsListFilenamesContestValues: list[list[str | float]] = []
+	try:
+		for referencePOSIX, listPathFilenamesBeta in dictionaryReferenceComparands.items():
+			countComparandsPerGroup: int = math.ceil(len(listPathFilenamesBeta) / countGroupsPerReference)
+			for indexStart in range(0, len(listPathFilenamesBeta), countComparandsPerGroup):
+				listPathFilenamesBetaGroup: list[str | PathLike[Any]] = listPathFilenamesBeta[indexStart:indexStart + countComparandsPerGroup]
+				pathFilenameAlfa = dictionaryReferencePathFilename[referencePOSIX]
+				dictionaryConcurrency[concurrencyManager.submit(analyzeContestReference, pathFilenameAlfa, listPathFilenamesBetaGroup
+					, listContestNames, pathFilenameMixture=pathFilenameMixture)] = (pathFilenameAlfa, listPathFilenamesBetaGroup)
+
+		for claimTicket in tqdm(as_completed(dictionaryConcurrency), total=len(dictionaryConcurrency), desc='Analyze contest reference', leave=False
+				, disable=len(dictionaryConcurrency) < 4):
+			pathFilenameAlfa, listPathFilenamesBetaGroup = dictionaryConcurrency[claimTicket]
+			for pathFilenameBeta, contestValues in zip(listPathFilenamesBetaGroup, claimTicket.result(), strict=True):
+				rowsListFilenamesContestValues.append([PurePath(pathFilenameAlfa).as_posix(), PurePath(pathFilenameBeta).as_posix(), *contestValues])
+	finally:
+		if analysisSession is None:
+			concurrencyManager.shutdown(cancel_futures=True)
+		else:
+			for claimTicket in dictionaryConcurrency:
+				claimTicket.cancel()
+
+	return rowsListFilenamesContestValues
@@ -1,20 +1,21 @@
 """Analyzers that use the filename of an audio file to analyze its audio data."""
 from __future__ import annotations
 
+from analyzeAudio._summaryStatistics import SummaryStatistics
 from analyzeAudio.analyzersUseFilename._wideRange import ffprobeAllInclusiveCache
-from analyzeAudio.registry import registrationAudioAspect
+from analyzeAudio.registry import registrationAudioAspectSummary
 from typing import TYPE_CHECKING
 import numpy
 
 if TYPE_CHECKING:
 	from analyzeAudio import ArrayChannelData, ArrayOverallData
-	from collections.abc import Callable
 	from os import PathLike
 	from typing import Any
 
 arrayChannelDataEmpty: ArrayChannelData = numpy.array([], dtype=numpy.float64).reshape(0, 0)
 arrayOverallDataEmpty: ArrayOverallData = numpy.array([], dtype=numpy.float64).reshape(0)
 
+@registrationAudioAspectSummary('Spectral centroid')
 def analyzeSpectral_centroid(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral centroid trajectory of an audio file.
 
@@ -50,9 +51,8 @@ def analyzeSpectral_centroid(pathFilename: str | PathLike[Any]) -> ArrayChannelD
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('centroid', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('centroid', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral centroid mean')
 def analyzeSpectral_centroid_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral centroid mean': mean framewise spectral centroid.
 
@@ -62,9 +62,9 @@ def analyzeSpectral_centroid_mean(pathFilename: str | PathLike[Any]) -> float:
 		Mean value of the framewise spectral centroid.
 
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_centroid
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_centroid(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral crest')
 def analyzeSpectral_crest(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral crest of an audio file.
 
@@ -101,9 +101,8 @@ def analyzeSpectral_crest(pathFilename: str | PathLike[Any]) -> ArrayChannelData
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('crest', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('crest', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral crest mean')
 def analyzeSpectral_crest_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral crest mean': mean framewise spectral crest.
 
@@ -113,9 +112,9 @@ def analyzeSpectral_crest_mean(pathFilename: str | PathLike[Any]) -> float:
 		Mean value of the framewise spectral crest.
 
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_crest
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_crest(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral decrease')
 def analyzeSpectral_decrease(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral decrease trajectory of an audio file.
 
@@ -151,9 +150,8 @@ def analyzeSpectral_decrease(pathFilename: str | PathLike[Any]) -> ArrayChannelD
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('decrease', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('decrease', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral decrease mean')
 def analyzeSpectral_decrease_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral decrease mean': mean framewise spectral decrease.
 
@@ -167,9 +165,9 @@ def analyzeSpectral_decrease_mean(pathFilename: str | PathLike[Any]) -> float:
 	spectralDecreaseMean : float
 		Mean spectral decrease across analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_decrease
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_decrease(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral entropy')
 def analyzeSpectral_entropy(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral entropy trajectory of an audio file.
 
@@ -203,9 +201,8 @@ def analyzeSpectral_entropy(pathFilename: str | PathLike[Any]) -> ArrayChannelDa
 		for speech recognition in noisy environments.
 		https://www.ee.columbia.edu/~dpwe/papers/ShenHL98-endpoint.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('entropy', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('entropy', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral entropy mean')
 def analyzeSpectral_entropy_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral entropy mean': mean framewise spectral entropy.
 
@@ -219,9 +216,9 @@ def analyzeSpectral_entropy_mean(pathFilename: str | PathLike[Any]) -> float:
 	spectralEntropyMean : float
 		Mean spectral entropy across analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_entropy
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_entropy(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral flatness')
 def analyzeSpectral_flatness(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral flatness trajectory of an audio file.
 
@@ -256,9 +253,8 @@ def analyzeSpectral_flatness(pathFilename: str | PathLike[Any]) -> ArrayChannelD
 		IEEE Transactions on Acoustics, Speech, and Signal Processing, 24(5), 380–391.
 		https://ieeexplore.ieee.org/document/1162647
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('flatness', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('flatness', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral flatness mean')
 def analyzeSpectral_flatness_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral flatness mean': mean framewise spectral flatness.
 
@@ -268,9 +264,9 @@ def analyzeSpectral_flatness_mean(pathFilename: str | PathLike[Any]) -> float:
 		Mean value of the framewise spectral flatness.
 
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_flatness
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_flatness(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral flux')
 def analyzeSpectral_flux(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral flux trajectory of an audio file.
 
@@ -305,9 +301,8 @@ def analyzeSpectral_flux(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		method. Microsoft Research Technical Report MSR-TR-2001-79.
 		https://www.microsoft.com/en-us/research/wp-content/uploads/2016/02/tr-2001-79.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('flux', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('flux', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral flux mean')
 def analyzeSpectral_flux_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral flux mean': mean framewise spectral flux.
 
@@ -321,9 +316,9 @@ def analyzeSpectral_flux_mean(pathFilename: str | PathLike[Any]) -> float:
 	spectralFluxMean : float
 		Mean spectral flux across analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_flux
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_flux(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral kurtosis')
 def analyzeSpectral_kurtosis(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral kurtosis trajectory of an audio file.
 
@@ -361,9 +356,8 @@ def analyzeSpectral_kurtosis(pathFilename: str | PathLike[Any]) -> ArrayChannelD
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('kurtosis', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('kurtosis', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral kurtosis mean')
 def analyzeSpectral_kurtosis_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral kurtosis mean': mean framewise spectral kurtosis.
 
@@ -378,9 +372,9 @@ def analyzeSpectral_kurtosis_mean(pathFilename: str | PathLike[Any]) -> float:
 		Mean spectral kurtosis across analyzed frames.
 
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_kurtosis
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_kurtosis(pathFilename)).mean
 
+@registrationAudioAspectSummary('Power spectral density')
 def analyzeSpectral_mean(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the power spectral density trajectory of an audio file.
 
@@ -408,9 +402,8 @@ def analyzeSpectral_mean(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		PSDᵢ = (1/K) ∑_(k = 1)^K Pᵢ(k)
 	```
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('mean', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('mean', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Power spectral density mean')
 def analyzeSpectral_mean_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Power spectral density mean': mean framewise power spectral density.
 
@@ -424,9 +417,9 @@ def analyzeSpectral_mean_mean(pathFilename: str | PathLike[Any]) -> float:
 	powerSpectralDensityMean : float
 		Mean power spectral density across all frequency bins and analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_mean
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_mean(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral rolloff')
 def analyzeSpectral_rolloff(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral rolloff trajectory of an audio file.
 
@@ -462,9 +455,8 @@ def analyzeSpectral_rolloff(pathFilename: str | PathLike[Any]) -> ArrayChannelDa
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('rolloff', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('rolloff', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral rolloff mean')
 def analyzeSpectral_rolloff_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral rolloff mean': mean framewise spectral rolloff frequency.
 
@@ -478,9 +470,9 @@ def analyzeSpectral_rolloff_mean(pathFilename: str | PathLike[Any]) -> float:
 	spectralRolloffMean : float
 		Mean spectral rolloff frequency across analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_rolloff
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_rolloff(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral skewness')
 def analyzeSpectral_skewness(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral skewness trajectory of an audio file.
 
@@ -517,9 +509,8 @@ def analyzeSpectral_skewness(pathFilename: str | PathLike[Any]) -> ArrayChannelD
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('skewness', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('skewness', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral skewness mean')
 def analyzeSpectral_skewness_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral skewness mean': mean framewise spectral skewness.
 
@@ -533,9 +524,9 @@ def analyzeSpectral_skewness_mean(pathFilename: str | PathLike[Any]) -> float:
 	spectralSkewnessMean : float
 		Mean spectral skewness across analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_skewness
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_skewness(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral slope')
 def analyzeSpectral_slope(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral slope trajectory of an audio file.
 
@@ -572,9 +563,8 @@ def analyzeSpectral_slope(pathFilename: str | PathLike[Any]) -> ArrayChannelData
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('slope', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('slope', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral slope mean')
 def analyzeSpectral_slope_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral slope mean': mean framewise spectral slope.
 
@@ -588,9 +578,9 @@ def analyzeSpectral_slope_mean(pathFilename: str | PathLike[Any]) -> float:
 	spectralSlopeMean : float
 		Mean spectral slope across analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_slope
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_slope(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral spread')
 def analyzeSpectral_spread(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral spread trajectory of an audio file.
 
@@ -626,9 +616,8 @@ def analyzeSpectral_spread(pathFilename: str | PathLike[Any]) -> ArrayChannelDat
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('spread', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('spread', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral spread mean')
 def analyzeSpectral_spread_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral spread mean': mean framewise spectral spread.
 
@@ -638,9 +627,9 @@ def analyzeSpectral_spread_mean(pathFilename: str | PathLike[Any]) -> float:
 		Mean value of the framewise spectral spread.
 
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_spread
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_spread(pathFilename)).mean
 
+@registrationAudioAspectSummary('Spectral variance')
 def analyzeSpectral_variance(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	"""Compute the spectral variance trajectory of an audio file.
 
@@ -677,9 +666,8 @@ def analyzeSpectral_variance(pathFilename: str | PathLike[Any]) -> ArrayChannelD
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('variance', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',)).get('variance', arrayChannelDataEmpty)
 
-@registrationAudioAspect('Spectral variance mean')
 def analyzeSpectral_variance_mean(pathFilename: str | PathLike[Any]) -> float:
 	"""Aspect 'Spectral variance mean': mean framewise spectral variance.
 
@@ -693,5 +681,4 @@ def analyzeSpectral_variance_mean(pathFilename: str | PathLike[Any]) -> float:
 	spectralVarianceMean : float
 		Mean spectral variance across analyzed frames.
 	"""
-	theArrayCallable: Callable[[str | PathLike[Any]], ArrayChannelData] = analyzeSpectral_variance
-	return numpy.mean(theArrayCallable(pathFilename)).item()
+	return SummaryStatistics(analyzeSpectral_variance(pathFilename)).mean
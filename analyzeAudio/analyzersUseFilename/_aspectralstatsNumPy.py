@@ -0,0 +1,225 @@
+"""Compute the statistics of the FFmpeg filter `aspectralstats` from decoded samples or a spectrogram with NumPy.
+
+(AI generated docstring)
+
+You can use this module instead of an FFprobe process to compute the spectral statistics that
+`analyzeAudio.analyzersUseFilename._aspectralstats` reads. One kernel computes all thirteen
+statistics of a magnitude spectrogram: a single matrix product yields the spectral moments and the
+weighted sums of the slope and the decrease, and the other statistics share the logarithm and the
+cumulative sum of the magnitudes.
+
+`aspectralstatsNumPy` reproduces the framing of FFmpeg [2]: a 2048-sample Hann window, a hop of
+1024 samples, and, for each 100 ms frame that `ffprobeAllInclusiveCache` [1] reads, the statistics
+of the hop that contains the first sample of the frame. `aspectralstatsSpectrogram` computes the
+statistics of each frame of a magnitude spectrogram that you already have, such as
+`spectrogramMagnitude` of `AudioIntermediates`, so the samples are not transformed again.
+
+Contents
+--------
+Functions
+	aspectralstatsNumPy
+		Return the statistics of `aspectralstats` for decoded samples.
+	aspectralstatsSpectrogram
+		Return the statistics of `aspectralstats` for each frame of a magnitude spectrogram.
+
+References
+----------
+[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+[2] FFmpeg `af_aspectralstats.c`
+	https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_aspectralstats.c
+
+"""
+from __future__ import annotations
+
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import rfft
+from typing import TYPE_CHECKING
+import math
+import numpy
+
+if TYPE_CHECKING:
+	from analyzeAudio import ArrayChannelData, Audio, SpectrogramMagnitude
+	from typing import Any
+
+samplesPerWindowFFmpeg: int = 2048
+"""Number of samples in each window of `aspectralstats`, which is also the length of its FFT."""
+
+samplesPerHopFFmpeg: int = 1024
+"""Number of samples between the starts of consecutive windows of `aspectralstats`."""
+
+significantDigitsMetadataFFmpeg: int = 6
+"""Number of significant digits of each statistic in the metadata of `aspectralstats`, which formats it with '%g'."""
+
+fractionRolloff: float = 0.85
+"""Fraction of the sum of the magnitudes below the spectral rolloff."""
+
+epsilonFFmpeg: float = float(numpy.finfo(numpy.float32).eps)
+"""`FLT_EPSILON`, which `aspectralstats` adds to each magnitude before a logarithm and uses as the threshold of each division."""
+
+framesPerBlock: int = 2**10
+"""Number of 100 ms frames that `aspectralstatsNumPy` transforms at once, which bounds its memory."""
+
+def aspectralstatsNumPy(waveform: Audio, sampleRate: int) -> dict[str, ArrayChannelData]:
+	"""Return the statistics of `aspectralstats` for decoded samples.
+
+	You can use this function to compute, in this process, the statistics that FFprobe reports for
+	`aspectralstats` after FFmpeg decodes an audio file to 32-bit floating point. The windows, the
+	hops, the scale of the magnitudes, and the formula of each statistic are those of FFmpeg [2], and
+	each 100 ms frame has the statistics of the hop that contains its first sample, so only those hops
+	and the hops before them, for the spectral flux, are transformed. Both FFmpeg and this function
+	compute the FFT in 32-bit floating point, with different rounding, so most statistics differ from
+	FFmpeg by less than 1e-5 of their value, but a statistic that depends on quiet frequency bins,
+	such as the kurtosis of a nearly silent frame, can differ by about 1e-3 of its value.
+
+	Parameters
+	----------
+	waveform : Audio
+		Samples with shape (channels, samples), such as `waveform` of `AudioIntermediates`.
+	sampleRate : int
+		Sample rate of `waveform` in hertz.
+
+	Returns
+	-------
+	dictionaryAspects : dict[str, ArrayChannelData]
+		Dictionary mapping each statistic of `aspectralstats` to an array with shape (channels,
+		frames). The dictionary is empty if `waveform` has no samples.
+
+	References
+	----------
+	[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+	[2] FFmpeg `af_aspectralstats.c`
+		https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_aspectralstats.c
+
+	"""
+	channels, lengthWaveform = waveform.shape
+	if lengthWaveform == 0:
+		return {}
+	samplesPerFrame: int = max(sampleRate // 10, 1)
+	hopsFrame = numpy.arange(math.ceil(lengthWaveform / samplesPerFrame)) * samplesPerFrame // samplesPerHopFFmpeg
+	countHops: int = math.ceil(lengthWaveform / samplesPerHopFFmpeg)
+	# The first window ends with the first hop, and the last hop is padded with zeros.
+	samplesPadded = numpy.zeros((channels, samplesPerWindowFFmpeg - samplesPerHopFFmpeg + countHops * samplesPerHopFFmpeg), dtype=numpy.float32)
+	samplesPadded[:, samplesPerWindowFFmpeg - samplesPerHopFFmpeg:samplesPerWindowFFmpeg - samplesPerHopFFmpeg + lengthWaveform] = waveform
+	windowsHop = sliding_window_view(samplesPadded, samplesPerWindowFFmpeg, axis=-1)[:, 0:None:samplesPerHopFFmpeg]
+	windowFunction = (0.5 * (1 - numpy.cos(2 * numpy.pi * numpy.arange(samplesPerWindowFFmpeg) / (samplesPerWindowFFmpeg - 1)))).astype(numpy.float32)
+	# `aspectralstats` truncates half of the sample rate to an integer.
+	hertzPerBin: float = (sampleRate // 2) / (samplesPerWindowFFmpeg // 2)
+
+	def magnitudeHops(hops: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]) -> numpy.ndarray[tuple[int, int, int], numpy.dtype[numpy.float32]]:
+		"""I use this function to return the magnitudes of `hops` with shape (channels, bins, hops), without the bin of the Nyquist frequency, like FFmpeg."""
+		# Like FFmpeg, the windowed samples and the FFT are 32-bit floating point, so the magnitudes of quiet bins have errors of the same size as the errors of FFmpeg.
+		spectra = rfft(windowsHop[:, hops] * windowFunction, axis=-1)[..., 0:samplesPerWindowFFmpeg // 2]
+		return numpy.swapaxes(numpy.abs(spectra) / samplesPerWindowFFmpeg, -1, -2)
+
+	listDictionariesBlock: list[dict[str, ArrayChannelData]] = []
+	for startFrame in range(0, hopsFrame.size, framesPerBlock):
+		hops, indexHop = numpy.unique(hopsFrame[startFrame:startFrame + framesPerBlock], return_inverse=True)
+		hopsTransformed = numpy.union1d(hops, hops[hops > 0] - 1)
+		magnitudeTransformed = magnitudeHops(hopsTransformed)
+		magnitudePrevious = numpy.zeros((channels, samplesPerWindowFFmpeg // 2, hops.size), dtype=numpy.float32)
+		magnitudePrevious[..., hops > 0] = magnitudeTransformed[..., numpy.searchsorted(hopsTransformed, hops[hops > 0] - 1)]
+		dictionaryBlock = _spectralStatistics(magnitudeTransformed[..., numpy.searchsorted(hopsTransformed, hops)], hertzPerBin, magnitudePrevious)
+		listDictionariesBlock.append({keyName: arrayAspect[:, indexHop] for keyName, arrayAspect in dictionaryBlock.items()})
+
+	return {keyName: _roundSignificant(numpy.concatenate([dictionaryBlock[keyName] for dictionaryBlock in listDictionariesBlock], axis=-1), significantDigitsMetadataFFmpeg)
+		for keyName in listDictionariesBlock[0]}
+
+def aspectralstatsSpectrogram(spectrogramMagnitude: SpectrogramMagnitude, sampleRate: int) -> dict[str, ArrayChannelData]:
+	"""Return the statistics of `aspectralstats` for each frame of a magnitude spectrogram.
+
+	You can use this function to compute the spectral statistics from the magnitude spectrogram that
+	the spectrogram analyzers already use, so a request that needs both kinds of aspects transforms
+	the samples once. The formulas are those of `aspectralstats` [1], and the magnitudes are divided
+	by the length of the FFT, as FFmpeg divides them. The window, the hop, and so the frames are those
+	of `spectrogramMagnitude`, so the statistics differ from the statistics of FFmpeg.
+
+	Parameters
+	----------
+	spectrogramMagnitude : SpectrogramMagnitude
+		One-sided magnitude spectrogram with shape (channels, bins, frames) of an FFT with an even
+		length, such as `spectrogramMagnitude` of `AudioIntermediates`.
+	sampleRate : int
+		Sample rate in hertz of the samples of `spectrogramMagnitude`.
+
+	Returns
+	-------
+	dictionaryAspects : dict[str, ArrayChannelData]
+		Dictionary mapping each statistic of `aspectralstats` to an array with shape (channels,
+		frames). The spectral flux of the first frame compares the first frame with silence.
+
+	References
+	----------
+	[1] FFmpeg `af_aspectralstats.c`
+		https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_aspectralstats.c
+
+	"""
+	lengthFFT: int = 2 * (spectrogramMagnitude.shape[-2] - 1)
+	magnitude = spectrogramMagnitude / lengthFFT
+	magnitudePrevious = numpy.concatenate((numpy.zeros_like(magnitude[..., 0:1]), magnitude[..., 0:-1]), axis=-1)
+	return _spectralStatistics(magnitude, sampleRate / lengthFFT, magnitudePrevious)
+
+def _spectralStatistics(magnitude: numpy.ndarray[tuple[int, int, int], numpy.dtype[Any]], hertzPerBin: float
+		, magnitudePrevious: numpy.ndarray[tuple[int, int, int], numpy.dtype[Any]]) -> dict[str, ArrayChannelData]:
+	"""Return the thirteen statistics of `aspectralstats` for magnitudes with shape (channels, bins, frames).
+
+	One matrix product computes, for each frame, the sum of the magnitudes, the first four raw
+	moments of the frequency, and the weighted sums of the slope and the decrease. The central moments
+	come from the raw moments. Each division that FFmpeg guards with `FLT_EPSILON` returns the value
+	that FFmpeg returns.
+	"""
+	bins: int = magnitude.shape[-2]
+	frequency = numpy.arange(bins) * hertzPerBin
+	positionSlope = (numpy.arange(bins) - bins * 0.5) / (bins * 0.5)
+	weightsDecrease = numpy.concatenate(([0], 1 / numpy.arange(1, bins)))
+	weights = numpy.stack((numpy.ones(bins), frequency, frequency**2, frequency**3, frequency**4, positionSlope, weightsDecrease))
+	sumMagnitude, moment1, moment2, moment3, moment4, sumSlope, sumDecrease = numpy.moveaxis(numpy.matmul(weights, magnitude), -2, 0)
+
+	mean = sumMagnitude / bins
+	# FFmpeg sums the squared deviations in 32-bit floating point, one bin after another, which changes the variance by up to about 3e-5 of its value.
+	magnitudeFloat32 = magnitude.astype(numpy.float32)
+	meanFloat32 = numpy.cumsum(magnitudeFloat32, axis=-2, dtype=numpy.float32)[..., -1:, :] / numpy.float32(bins)
+	variance = numpy.cumsum(numpy.square(magnitudeFloat32 - meanFloat32), axis=-2, dtype=numpy.float32)[..., -1, :].astype(numpy.float64) / bins
+	logarithm = numpy.log(magnitude + epsilonFFmpeg)
+
+	with numpy.errstate(divide='ignore', invalid='ignore'):
+		isSilent = sumMagnitude <= epsilonFFmpeg
+		centroid = numpy.where(isSilent, 1, moment1 / sumMagnitude)
+		spreadSquared = numpy.maximum(moment2 / sumMagnitude - centroid**2, 0)
+		spread = numpy.where(isSilent, 1, numpy.sqrt(spreadSquared))
+		momentCentral3 = moment3 / sumMagnitude - 3 * centroid * moment2 / sumMagnitude + 2 * centroid**3
+		momentCentral4 = moment4 / sumMagnitude - 4 * centroid * moment3 / sumMagnitude + 6 * centroid**2 * moment2 / sumMagnitude - 3 * centroid**4
+		skewness = numpy.where(sumMagnitude * spread**3 <= epsilonFFmpeg, 1, momentCentral3 / spread**3)
+		kurtosis = numpy.where(sumMagnitude * spread**4 <= epsilonFFmpeg, 1, momentCentral4 / spread**4)
+		meanShifted = mean + epsilonFFmpeg
+		flatness = numpy.where(meanShifted <= epsilonFFmpeg, 0, numpy.exp(numpy.mean(logarithm, axis=-2)) / meanShifted)
+		crest = numpy.where(mean <= epsilonFFmpeg, 0, numpy.max(magnitude, axis=-2) / mean)
+		sumAboveFirst = sumMagnitude - magnitude[..., 0, :]
+		decrease = numpy.where(sumAboveFirst <= epsilonFFmpeg, 0, (sumDecrease - magnitude[..., 0, :] * numpy.sum(weightsDecrease)) / sumAboveFirst)
+
+	# FFmpeg sums the squares of the positions in 32-bit floating point, which shifts the slope by about 6e-6 of its value.
+	denominatorSlope: float = float(numpy.cumsum(numpy.square(positionSlope.astype(numpy.float32)), dtype=numpy.float32)[-1])
+	binRolloff = numpy.argmax(numpy.cumsum(magnitude, axis=-2, dtype=numpy.float64) >= fractionRolloff * sumMagnitude[..., None, :], axis=-2)
+	return {
+		'mean': mean,
+		'variance': variance,
+		'centroid': centroid,
+		'spread': spread,
+		'skewness': skewness,
+		'kurtosis': kurtosis,
+		'entropy': -numpy.sum(magnitude * logarithm, axis=-2) / math.log(bins),
+		'flatness': flatness,
+		'crest': crest,
+		'flux': numpy.sqrt(numpy.sum(numpy.square(magnitude - magnitudePrevious, dtype=numpy.float64), axis=-2)),
+		'slope': (sumSlope - mean * numpy.sum(positionSlope)) / denominatorSlope,
+		'decrease': decrease,
+		'rolloff': binRolloff * hertzPerBin,
+	}
+
+def _roundSignificant(arrayAspect: numpy.ndarray[Any, numpy.dtype[numpy.float64]], digits: int) -> numpy.ndarray[Any, numpy.dtype[numpy.float64]]:
+	"""Round each statistic to `digits` significant digits, as '%g' formats it in the metadata."""
+	with numpy.errstate(divide='ignore', invalid='ignore', over='ignore'):
+		exponent = numpy.floor(numpy.log10(numpy.abs(arrayAspect)))
+		scale = 10.0 ** numpy.where(numpy.isfinite(exponent), digits - 1 - exponent, 0)
+		return numpy.where(numpy.isfinite(exponent), numpy.round(arrayAspect * scale) / scale, arrayAspect)
@@ -30,7 +30,7 @@ def analyzeAbs_Peak_count(pathFilename: str | PathLike[Any]) -> ArrayOverallData
 	absPeakCount : ArrayOverallData
 		NumPy array containing overall counts per file, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Overall.Abs_Peak_count', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Overall.Abs_Peak_count', arrayOverallDataEmpty)
 
 @registrationAudioAspect('Abs_Peak_count total')
 def analyzeAbs_Peak_countTotal(pathFilename: str | PathLike[Any]) -> float | None:
@@ -72,7 +72,7 @@ def analyzeBit_depth(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	bitDepth : ArrayChannelData
 		NumPy array of per-channel bit depth values, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Bit_depth', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Bit_depth', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Bit_depth mean')
 def analyzeBit_depthMean(pathFilename: str | PathLike[Any]) -> float | None:
@@ -133,7 +133,7 @@ def analyzeCrest_factor(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Crest_factor', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Crest_factor', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Crest_factor mean')
 def analyzeCrest_factorMean(pathFilename: str | PathLike[Any]) -> float | None:
@@ -185,7 +185,7 @@ def analyzeDC_offset(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		DCoffset = (1/N) ∑_(n = 0)^(N - 1) x[n]
 	```
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('DC_offset', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('DC_offset', arrayChannelDataEmpty)
 
 @registrationAudioAspect('DC_offset mean')
 def analyzeDC_offsetMean(pathFilename: str | PathLike[Any]) -> float | None:
@@ -238,7 +238,7 @@ def analyzeDynamic_range(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		DynamicRange = Peak_level − Noise_floor
 	```
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Dynamic_range', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Dynamic_range', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Dynamic_range overall')
 def analyzeDynamic_rangeOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -296,7 +296,7 @@ def analyzeEntropy(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		for speech recognition in noisy environments.
 		https://www.ee.columbia.edu/~dpwe/papers/ShenHL98-endpoint.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Entropy', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Entropy', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Entropy mean')
 def analyzeEntropyMean(pathFilename: str | PathLike[Any]) -> float | None:
@@ -338,7 +338,7 @@ def analyzeFlat_factor(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	flatFactor : ArrayChannelData
 		NumPy array of per-channel flat-sample proportions, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Flat_factor', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Flat_factor', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Flat_factor mean')
 def analyzeFlat_factorMean(pathFilename: str | PathLike[Any]) -> float | None:
@@ -381,7 +381,7 @@ def analyzeMax_difference(pathFilename: str | PathLike[Any]) -> ArrayChannelData
 		NumPy array of per-channel maximum absolute differences, or an empty array when
 		unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Max_difference', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Max_difference', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Max_difference overall')
 def analyzeMax_differenceOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -423,7 +423,7 @@ def analyzeMax_level(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	maxLevel : ArrayChannelData
 		NumPy array of per-channel maximum sample values, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Max_level', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Max_level', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Max_level overall')
 def analyzeMax_levelOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -465,7 +465,7 @@ def analyzeMean_difference(pathFilename: str | PathLike[Any]) -> ArrayChannelDat
 	meanDifference : ArrayChannelData
 		NumPy array of per-channel mean absolute differences, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Mean_difference', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Mean_difference', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Mean_difference mean')
 def analyzeMean_differenceMean(pathFilename: str | PathLike[Any]) -> float | None:
@@ -508,7 +508,7 @@ def analyzeMin_difference(pathFilename: str | PathLike[Any]) -> ArrayChannelData
 		NumPy array of per-channel minimum absolute differences, or an empty array when
 		unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Min_difference', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Min_difference', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Min_difference overall')
 def analyzeMin_differenceOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -550,7 +550,7 @@ def analyzeMin_level(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	minLevel : ArrayChannelData
 		NumPy array of per-channel minimum sample values, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Min_level', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Min_level', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Min_level overall')
 def analyzeMin_levelOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -593,7 +593,7 @@ def analyzeNoise_floor(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		NumPy array of per-channel noise-floor levels in dBFS, or an empty array when
 		unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Noise_floor', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Noise_floor', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Noise_floor overall')
 def analyzeNoise_floorOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -635,7 +635,7 @@ def analyzeNoise_floor_count(pathFilename: str | PathLike[Any]) -> ArrayChannelD
 	noiseFloorCount : ArrayChannelData
 		NumPy array of per-channel counts, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Noise_floor_count', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Noise_floor_count', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Noise_floor_count total')
 def analyzeNoise_floor_countTotal(pathFilename: str | PathLike[Any]) -> float | None:
@@ -677,7 +677,7 @@ def analyzeNumber_of_samples(pathFilename: str | PathLike[Any]) -> ArrayOverallD
 	numberOfSamples : ArrayOverallData
 		NumPy array containing total sample counts per file, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Overall.Number_of_samples', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Overall.Number_of_samples', arrayOverallDataEmpty)
 
 @registrationAudioAspect('Number_of_samples total')
 def analyzeNumber_of_samplesTotal(pathFilename: str | PathLike[Any]) -> float | None:
@@ -719,7 +719,7 @@ def analyzePeak_count(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	peakCount : ArrayChannelData
 		NumPy array of per-channel peak counts, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Peak_count', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Peak_count', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Peak_count total')
 def analyzePeak_countTotal(pathFilename: str | PathLike[Any]) -> float | None:
@@ -777,7 +777,7 @@ def analyzePeak_level(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		method. Microsoft Research Technical Report MSR-TR-2001-79.
 		https://www.microsoft.com/en-us/research/wp-content/uploads/2016/02/tr-2001-79.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Peak_level', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Peak_level', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Peak_level overall')
 def analyzePeak_levelOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -819,7 +819,7 @@ def analyzeRMS_difference(pathFilename: str | PathLike[Any]) -> ArrayChannelData
 	RMSdifference : ArrayChannelData
 		NumPy array of per-channel RMS differences, or an empty array when unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('RMS_difference', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('RMS_difference', arrayChannelDataEmpty)
 
 @registrationAudioAspect('RMS_difference overall')
 def analyzeRMS_differenceOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -879,7 +879,7 @@ def analyzeRMS_level(pathFilename: str | PathLike[Any]) -> ArrayOverallData:
 		method. Microsoft Research Technical Report MSR-TR-2001-79.
 		https://www.microsoft.com/en-us/research/wp-content/uploads/2016/02/tr-2001-79.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Overall.RMS_level', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Overall.RMS_level', arrayOverallDataEmpty)
 
 @registrationAudioAspect('RMS_level overall')
 def analyzeRMS_levelOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -934,7 +934,7 @@ def analyzeRMS_peak(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		RMS_peak = 20 log₁₀(max_(i ∈ {1, …, T}) RMSᵢ)
 	```
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('RMS_peak', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('RMS_peak', arrayChannelDataEmpty)
 
 @registrationAudioAspect('RMS_peak overall')
 def analyzeRMS_peakOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -977,7 +977,7 @@ def analyzeRMS_trough(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 		NumPy array of per-channel short-term RMS trough values in dBFS, or an empty array when
 		unavailable.
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('RMS_trough', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('RMS_trough', arrayChannelDataEmpty)
 
 @registrationAudioAspect('RMS_trough overall')
 def analyzeRMS_troughOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -1044,7 +1044,7 @@ def analyzeZero_crossings(pathFilename: str | PathLike[Any]) -> ArrayChannelData
 		method. Microsoft Research Technical Report MSR-TR-2001-79.
 		https://www.microsoft.com/en-us/research/wp-content/uploads/2016/02/tr-2001-79.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Zero_crossings', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Zero_crossings', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Zero_crossings total')
 def analyzeZero_crossingsTotal(pathFilename: str | PathLike[Any]) -> float | None:
@@ -1111,7 +1111,7 @@ def analyzeZero_crossings_rate(pathFilename: str | PathLike[Any]) -> ArrayChanne
 		method. Microsoft Research Technical Report MSR-TR-2001-79.
 		https://www.microsoft.com/en-us/research/wp-content/uploads/2016/02/tr-2001-79.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('Zero_crossings_rate', arrayChannelDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('astats',)).get('Zero_crossings_rate', arrayChannelDataEmpty)
 
 @registrationAudioAspect('Zero_crossings_rate overall')
 def analyzeZero_crossings_rateOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -0,0 +1,432 @@
+"""Compute the statistics of the FFmpeg filter `astats` from decoded samples with NumPy.
+
+(AI generated docstring)
+
+You can use this module instead of an FFprobe process to compute the statistics that
+`analyzeAudio.analyzersUseFilename._astats` reads. The statistics have the keys, shapes, and framing
+of the statistics that `ffprobeAllInclusiveCache` [1] parses from FFprobe: `astats` receives frames
+of 1024 samples, and each 100 ms frame reports the cumulative statistics through the end of the
+1024-sample frame that contains the start of the 100 ms frame. The statistics are computed for
+every 100 ms frame at once, with prefix sums and segmented reductions, so no Python loop runs over
+the samples.
+
+Contents
+--------
+Functions
+	astatsNumPy
+		Return the statistics of `astats` for decoded samples.
+	roundMetadataFFmpeg
+		Round each statistic to the decimal places of the metadata of an FFmpeg filter.
+
+References
+----------
+[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+[2] FFmpeg `af_astats.c`
+	https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_astats.c
+
+"""
+from __future__ import annotations
+
+from scipy.ndimage import maximum_filter1d
+from scipy.signal import lfilter
+from typing import TYPE_CHECKING
+import math
+import numpy
+
+if TYPE_CHECKING:
+	from analyzeAudio import ArrayChannelData, ArrayOverallData, Audio
+	from typing import Any
+
+samplesPerFrameFFmpeg: int = 1024
+"""Number of samples in each frame that `astats` receives from `ffprobeAllInclusiveCache`."""
+
+decimalsMetadataFFmpeg: int = 6
+"""Number of decimal places of each statistic in the metadata of `astats`."""
+
+binsHistogram: int = 8192
+"""Number of bins of the histogram of absolute sample values in `astats`."""
+
+bitsIntegerFFmpeg: int = 32
+"""`astats` measures the bit depth of floating-point samples as if they were 32-bit integers."""
+
+samplesPerBlockNoiseFloor: int = 2**16
+"""Number of steps of the noise floor that `_noiseFloorMaxima` computes at once, which bounds its memory."""
+
+def astatsNumPy(waveform: Audio, sampleRate: int) -> dict[str, ArrayChannelData | ArrayOverallData]:
+	"""Return the statistics of `astats` for decoded samples.
+
+	You can use this function to compute, in this process, the statistics that FFprobe reports for
+	`astats=metadata=1:length=0.1:measure_perchannel=all:measure_overall=Number_of_samples+RMS_level+Abs_Peak_count`
+	after FFmpeg decodes an audio file to 32-bit floating point. Each statistic matches FFmpeg [2] to
+	the six decimal places that FFprobe prints, including the noise floor, which FFmpeg computes with
+	a sliding maximum that forgets a sample early when an equal sample leaves the window.
+
+	Parameters
+	----------
+	waveform : Audio
+		Samples with shape (channels, samples), such as `waveform` of `AudioIntermediates`.
+	sampleRate : int
+		Sample rate of `waveform` in hertz.
+
+	Returns
+	-------
+	dictionaryAspects : dict[str, ArrayChannelData | ArrayOverallData]
+		Dictionary mapping each statistic of `astats` to an array with shape (channels, frames), or,
+		for the keys that start with 'Overall.', shape (frames,). The dictionary is empty if
+		`waveform` has no samples.
+
+	References
+	----------
+	[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+	[2] FFmpeg `af_astats.c`
+		https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_astats.c
+
+	"""
+	channels, lengthWaveform = waveform.shape
+	if lengthWaveform == 0:
+		return {}
+	samplesPerFrame: int = max(sampleRate // 10, 1)
+	countFrames: int = math.ceil(lengthWaveform / samplesPerFrame)
+	# Each 100 ms frame carries the metadata of the 1024-sample frame that contains its first sample.
+	samplesCumulative = numpy.minimum((numpy.arange(countFrames) * samplesPerFrame // samplesPerFrameFFmpeg + 1) * samplesPerFrameFFmpeg, lengthWaveform)
+	endsSegment, indexSegment = numpy.unique(samplesCumulative, return_inverse=True)
+
+	listDictionariesChannel: list[dict[str, numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]]] = [
+		_astatsChannel(waveform[indexChannel, 0:int(endsSegment[-1])], sampleRate, endsSegment) for indexChannel in range(channels)]
+
+	dictionaryAspects: dict[str, ArrayChannelData | ArrayOverallData] = {
+		keyName: numpy.stack([dictionaryChannel[keyName] for dictionaryChannel in listDictionariesChannel])[:, indexSegment]
+		for keyName in listDictionariesChannel[0] if keyName != 'sumSquares'}
+	sumSquares = numpy.sum([dictionaryChannel['sumSquares'] for dictionaryChannel in listDictionariesChannel], axis=0)
+	with numpy.errstate(divide='ignore'):
+		dictionaryAspects['Overall.RMS_level'] = (20 * numpy.log10(numpy.sqrt(sumSquares / (endsSegment * channels))))[indexSegment]
+	dictionaryAspects['Overall.Abs_Peak_count'] = numpy.mean(dictionaryAspects['Peak_count'], axis=0)
+	dictionaryAspects['Overall.Number_of_samples'] = endsSegment.astype(numpy.float64)[indexSegment]
+	return {keyName: roundMetadataFFmpeg(arrayAspect, decimalsMetadataFFmpeg) for keyName, arrayAspect in dictionaryAspects.items()}
+
+def roundMetadataFFmpeg(arrayAspect: numpy.ndarray[Any, numpy.dtype[numpy.float64]], decimals: int) -> numpy.ndarray[Any, numpy.dtype[numpy.float64]]:
+	"""Round each statistic to `decimals` decimal places, as an FFmpeg filter writes it to the metadata with `printf`.
+
+	Parameters
+	----------
+	arrayAspect : numpy.ndarray[Any, numpy.dtype[numpy.float64]]
+		Statistics.
+	decimals : int
+		Number of decimal places in the metadata.
+
+	Returns
+	-------
+	arrayRounded : numpy.ndarray[Any, numpy.dtype[numpy.float64]]
+		Statistics with the values that FFprobe reports.
+
+	"""
+	arrayRounded = numpy.round(arrayAspect, decimals)
+	# The scaled value is rounded before `numpy.round` rounds it, so a scaled value that is exactly halfway is formatted like `printf` formats it.
+	with numpy.errstate(invalid='ignore'):
+		arrayScaled = arrayAspect * 10**decimals
+		isHalfway = arrayScaled - numpy.floor(arrayScaled) == 0.5
+	arrayRounded[isHalfway] = [float(f'{value:.{decimals}f}') for value in arrayAspect[isHalfway].tolist()]
+	return arrayRounded
+
+def _astatsChannel(samples: numpy.ndarray[tuple[int], numpy.dtype[Any]], sampleRate: int, endsSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]) -> dict[str, numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]]:
+	"""Return the cumulative statistics of one channel through each end of `endsSegment`."""
+	signal = numpy.asarray(samples, dtype=numpy.float64)
+	magnitude = numpy.abs(signal)
+	startsSegment = numpy.concatenate(([0], endsSegment[:-1]))
+	countSamples = endsSegment.astype(numpy.float64)
+	# `astats` starts the differences at the second sample, so the segment of each difference starts one sample earlier.
+	startsDifference = numpy.maximum(startsSegment - 1, 0)
+
+	def cumulativeSum(values: numpy.ndarray[Any, numpy.dtype[Any]], starts: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]] = startsSegment) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+		return numpy.cumsum(numpy.add.reduceat(values, starts), dtype=numpy.float64) if values.size else numpy.zeros(len(starts))
+
+	sumSamples = cumulativeSum(signal)
+	sumSquares = cumulativeSum(signal * signal)
+	minimumSegment = numpy.minimum.reduceat(signal, startsSegment)
+	minimumLevel = numpy.minimum.accumulate(minimumSegment)
+	maximumSegment = numpy.maximum.reduceat(signal, startsSegment)
+	maximumLevel = numpy.maximum.accumulate(maximumSegment)
+	peakSegment = numpy.maximum.reduceat(magnitude, startsSegment)
+	peak = numpy.maximum.accumulate(peakSegment)
+
+	difference = numpy.abs(numpy.diff(signal))
+	if difference.size:
+		minimumDifference = numpy.minimum.accumulate(numpy.minimum.reduceat(difference, startsDifference))
+		maximumDifference = numpy.maximum.accumulate(numpy.maximum.reduceat(difference, startsDifference))
+	else:
+		minimumDifference = maximumDifference = numpy.full(len(endsSegment), numpy.nan)
+
+	samplesTimeConstant: int = max(int(0.1 * sampleRate + 0.5), 1)
+	meanSquareMinimum, meanSquareMaximum = _meanSquareExtremes(signal, sampleRate, samplesTimeConstant, startsSegment, sumSquares)
+
+	peakCount = _countAtPrefixExtreme(magnitude, startsSegment, peakSegment, peak)
+	countMinimum = _countAtPrefixExtreme(signal, startsSegment, minimumSegment, minimumLevel)
+	countMaximum = _countAtPrefixExtreme(signal, startsSegment, maximumSegment, maximumLevel)
+	runsSquaredMinimum = _sumRunsSquared(signal, endsSegment, minimumLevel, isMinimum=True)
+	runsSquaredMaximum = _sumRunsSquared(signal, endsSegment, maximumLevel, isMinimum=False)
+
+	# The noise floor only compares samples, so it uses the 32-bit samples, which halves the memory traffic of its window maxima.
+	noiseFloor, noiseFloorCount = _noiseFloor(numpy.abs(numpy.asarray(samples, dtype=numpy.float32)), samplesTimeConstant, endsSegment)
+
+	peakNonZero = numpy.minimum.accumulate(numpy.minimum.reduceat(numpy.where(magnitude > 0, magnitude, numpy.inf), startsSegment))
+
+	# `astats` counts a sign change between nonzero samples, and the sign before the first nonzero sample is negative.
+	signNonZero = numpy.sign(signal[signal != 0])
+	crossing = numpy.zeros(signal.shape)
+	crossing[signal != 0] = signNonZero != numpy.concatenate(([-1.0], signNonZero[:-1]))
+	zeroCrossings = cumulativeSum(crossing)
+
+	with numpy.errstate(divide='ignore', invalid='ignore'):
+		return {
+			'DC_offset': sumSamples / countSamples,
+			'Min_level': minimumLevel,
+			'Max_level': maximumLevel,
+			'Min_difference': minimumDifference,
+			'Max_difference': maximumDifference,
+			'Mean_difference': cumulativeSum(difference, startsDifference) / (countSamples - 1),
+			'RMS_difference': numpy.sqrt(cumulativeSum(difference * difference, startsDifference) / (countSamples - 1)),
+			'Peak_level': 20 * numpy.log10(peak),
+			'RMS_level': 20 * numpy.log10(numpy.sqrt(sumSquares / countSamples)),
+			'RMS_peak': 20 * numpy.log10(numpy.sqrt(meanSquareMaximum)),
+			'RMS_trough': 20 * numpy.log10(numpy.sqrt(meanSquareMinimum)),
+			'Crest_factor': numpy.where(sumSquares != 0, peak / numpy.sqrt(sumSquares / countSamples), 1.0),
+			'Flat_factor': 20 * numpy.log10((runsSquaredMinimum + runsSquaredMaximum) / (countMinimum + countMaximum)),
+			'Peak_count': peakCount,
+			'Noise_floor': 20 * numpy.log10(noiseFloor),
+			'Noise_floor_count': noiseFloorCount,
+			'Entropy': _entropy(magnitude, startsSegment, countSamples),
+			**_bitDepths(signal, startsSegment, startsDifference),
+			'Dynamic_range': 20 * numpy.log10(2 * peak / peakNonZero),
+			'Zero_crossings': zeroCrossings,
+			'Zero_crossings_rate': zeroCrossings / countSamples,
+			'Number of NaNs': cumulativeSum(numpy.isnan(signal)),
+			'Number of Infs': cumulativeSum(numpy.isinf(signal)),
+			'Number of denormals': cumulativeSum((magnitude > 0) & (magnitude < numpy.finfo(numpy.float32).tiny)),
+			'sumSquares': sumSquares,
+		}
+
+def _countAtPrefixExtreme(values: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], startsSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]
+		, extremeSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], extremePrefix: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	"""Return, through the end of each segment, the number of samples equal to the extreme of the samples so far."""
+	lengthsSegment = numpy.diff(numpy.append(startsSegment, values.size))
+	countEqualSegment = numpy.add.reduceat(values == numpy.repeat(extremeSegment, lengthsSegment), startsSegment)
+	return _countSinceChange(numpy.where(extremeSegment == extremePrefix, countEqualSegment, 0), extremePrefix)
+
+def _countSinceChange(counts: numpy.ndarray[tuple[int], numpy.dtype[Any]], extremePrefix: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	"""Return the cumulative sum of `counts` since the last change of `extremePrefix`."""
+	countsCumulative = numpy.cumsum(counts, dtype=numpy.float64)
+	isChange = numpy.ones(extremePrefix.shape, dtype=numpy.bool_)
+	isChange[1:] = extremePrefix[1:] != extremePrefix[:-1]
+	indexChange = numpy.maximum.accumulate(numpy.where(isChange, numpy.arange(extremePrefix.size), 0))
+	return countsCumulative - numpy.concatenate(([0.0], countsCumulative))[indexChange]
+
+def _meanSquareExtremes(signal: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], sampleRate: int, samplesTimeConstant: int
+		, startsSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]], sumSquares: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]) -> tuple[numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]]:
+	"""Return the minimum and the maximum of the smoothed mean square through the end of each segment."""
+	multiplier: float = math.exp(-1 / (0.1 * sampleRate))
+	meanSquareSmoothed = lfilter([1 - multiplier], [1, -multiplier], signal * signal)
+	# The extremes ignore the first `samplesTimeConstant` samples, while the smoothed mean square settles.
+	meanSquareSmoothed[0:samplesTimeConstant] = numpy.nan
+	meanSquareMinimum = numpy.fmin.accumulate(numpy.fmin.reduceat(meanSquareSmoothed, startsSegment))
+	meanSquareMaximum = numpy.fmax.accumulate(numpy.fmax.reduceat(meanSquareSmoothed, startsSegment))
+	countSamples = numpy.concatenate((startsSegment[1:], [signal.size])).astype(numpy.float64)
+	# While fewer than `samplesTimeConstant` samples arrived, `astats` sets both extremes to the plain mean square at the end of each 1024-sample frame.
+	endsFrameFFmpeg = numpy.arange(samplesPerFrameFFmpeg, min(samplesTimeConstant, signal.size + 1), samplesPerFrameFFmpeg)
+	if signal.size < samplesTimeConstant:
+		endsFrameFFmpeg = numpy.append(endsFrameFFmpeg, signal.size)
+	if endsFrameFFmpeg.size:
+		countSettle: int = int(endsFrameFFmpeg[-1])
+		meanSquareSettle: float = float(numpy.sum(signal[0:countSettle] ** 2) / countSettle)
+		meanSquareMinimum = numpy.fmin(meanSquareMinimum, meanSquareSettle)
+		meanSquareMaximum = numpy.fmax(meanSquareMaximum, meanSquareSettle)
+	isSettling = countSamples < samplesTimeConstant
+	meanSquareMinimum = numpy.where(isSettling, sumSquares / countSamples, meanSquareMinimum)
+	meanSquareMaximum = numpy.where(isSettling, sumSquares / countSamples, meanSquareMaximum)
+	return meanSquareMinimum, meanSquareMaximum
+
+def _sumRunsSquared(signal: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], endsSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]
+		, extremePrefix: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], *, isMinimum: bool) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	"""Return, through the end of each segment, the sum of the squared lengths of the finished runs of the extreme value."""
+	extremeRunning = numpy.minimum.accumulate(signal) if isMinimum else numpy.maximum.accumulate(signal)
+	indicesCandidate = numpy.flatnonzero(signal == extremeRunning)
+	sumsRunsSquared = numpy.zeros(endsSegment.size)
+	if indicesCandidate.size == 0:
+		return sumsRunsSquared
+	indicesBreak = numpy.flatnonzero((numpy.diff(indicesCandidate) != 1) | (numpy.diff(signal[indicesCandidate]) != 0))
+	startsRun = indicesCandidate[numpy.concatenate(([0], indicesBreak + 1))]
+	endsRun = indicesCandidate[numpy.concatenate((indicesBreak, [indicesCandidate.size - 1]))] + 1
+	valuesRun = signal[startsRun]
+	# A run counts after the sample that ends it, and only while its value is the extreme of the samples so far.
+	indexFirst = numpy.searchsorted(endsSegment, endsRun, side='right')
+	extremeSorted = -extremePrefix if isMinimum else extremePrefix
+	valuesSorted = -valuesRun if isMinimum else valuesRun
+	indexStart = numpy.maximum(numpy.searchsorted(extremeSorted, valuesSorted, side='left'), indexFirst)
+	indexStop = numpy.searchsorted(extremeSorted, valuesSorted, side='right')
+	isCounted = indexStart < indexStop
+	lengthsSquared = (endsRun - startsRun)[isCounted].astype(numpy.float64) ** 2
+	changes = numpy.zeros(endsSegment.size + 1)
+	numpy.add.at(changes, indexStart[isCounted], lengthsSquared)
+	numpy.add.at(changes, indexStop[isCounted], -lengthsSquared)
+	return numpy.cumsum(changes[0:-1])
+
+def _entropy(magnitude: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], startsSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]
+		, countSamples: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	"""Return the entropy of the histogram of absolute sample values through the end of each segment."""
+	# 16-bit bin indices let the stable sort be a radix sort.
+	indexBin = numpy.clip(numpy.rint(magnitude * (binsHistogram - 1)), 0, binsHistogram - 1).astype(numpy.int16)
+	# When the count of a bin grows from `r - 1` to `r`, the sum of count * log2(count) grows by r * log2(r) - (r - 1) * log2(r - 1).
+	orderBin = numpy.argsort(indexBin, kind='stable')
+	countsBin = numpy.bincount(indexBin, minlength=binsHistogram)
+	startsBin = numpy.concatenate(([0], numpy.cumsum(countsBin)))
+	rankInBin = numpy.arange(1, indexBin.size + 1) - startsBin[indexBin[orderBin]]
+	countsPossible = numpy.arange(int(countsBin.max()) + 1, dtype=numpy.float64)
+	countLogCount = countsPossible * numpy.log2(numpy.maximum(countsPossible, 1))
+	growth = numpy.empty(indexBin.size)
+	growth[orderBin] = countLogCount[rankInBin] - countLogCount[rankInBin - 1]
+	sumCountLog = numpy.cumsum(numpy.add.reduceat(growth, startsSegment))
+	return (numpy.log2(countSamples) - sumCountLog / countSamples) / math.log2(binsHistogram)
+
+def _bitDepths(signal: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], startsSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]
+		, startsDifference: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]) -> dict[str, numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]]:
+	"""Return the four bit depths of `astats` through the end of each segment."""
+	integer = numpy.rint(signal * 2.0 ** (bitsIntegerFFmpeg - 1)).astype(numpy.int64)
+	maskLow: int = (1 << bitsIntegerFFmpeg) - 1
+	maskMagnitude = numpy.bitwise_or.accumulate(numpy.bitwise_or.reduceat(numpy.abs(integer), startsSegment)) & maskLow
+	maskOr = numpy.bitwise_or.accumulate(numpy.bitwise_or.reduceat(integer, startsSegment)) & maskLow
+	maskAnd = numpy.bitwise_and.accumulate(numpy.bitwise_and.reduceat(integer, startsSegment)) & maskLow
+	maskChange = numpy.zeros(startsSegment.size, dtype=numpy.int64)
+	if integer.size > 1:
+		maskChange = numpy.bitwise_or.accumulate(numpy.bitwise_or.reduceat(integer[1:] ^ integer[0:-1], startsDifference)) & maskLow
+	return {
+		'Bit_depth': _countBits(maskMagnitude),
+		'Bit_depth2': _countBits(maskOr),
+		'Bit_depth3': bitsIntegerFFmpeg - _countTrailingZeros(maskOr & ~maskAnd),
+		'Bit_depth4': bitsIntegerFFmpeg - _countTrailingZeros(maskChange),
+	}
+
+def _countBits(masks: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	countsByte = numpy.array([bin(byte).count('1') for byte in range(256)], dtype=numpy.float64)
+	return countsByte[masks.astype('<u8').view(numpy.uint8)].reshape(masks.size, 8).sum(axis=1)
+
+def _countTrailingZeros(masks: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	# `masks & -masks` keeps the lowest set bit, and the base-2 logarithm of a power of two is exact.
+	with numpy.errstate(divide='ignore'):
+		return numpy.where(masks == 0, bitsIntegerFFmpeg, numpy.log2(masks & -masks))
+
+def _noiseFloor(magnitude: numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]], samplesTimeConstant: int
+		, endsSegment: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]) -> tuple[numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]]:
+	"""Return the noise floor and the number of samples at the noise floor through the end of each segment.
+
+	`astats` slides a window of `samplesTimeConstant` samples over the absolute sample values and
+	keeps the maximum of the window in a monotonic deque. The noise floor is the minimum of the
+	maximum of every full window so far, and the count is the number of windows whose maximum equals
+	the noise floor.
+	"""
+	noiseFloor = numpy.full(endsSegment.size, numpy.nan)
+	noiseFloorCount = numpy.zeros(endsSegment.size)
+	if magnitude.size < samplesTimeConstant:
+		return noiseFloor, noiseFloorCount
+	maximumWindow = _noiseFloorMaxima(magnitude, samplesTimeConstant)[samplesTimeConstant - 1:None]
+	noiseFloorRunning = numpy.minimum.accumulate(maximumWindow)
+	countRunning = _countSinceChange(maximumWindow == noiseFloorRunning, noiseFloorRunning)
+	isFull = endsSegment >= samplesTimeConstant
+	noiseFloor[isFull] = noiseFloorRunning[endsSegment[isFull] - samplesTimeConstant]
+	noiseFloorCount[isFull] = countRunning[endsSegment[isFull] - samplesTimeConstant]
+	return noiseFloor, noiseFloorCount
+
+def _noiseFloorMaxima(magnitude: numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]], samplesTimeConstant: int) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]]:
+	"""Return the front of the deque of `astats` after each sample.
+
+	When a sample leaves the window, `astats` removes the front of the deque if the front has the
+	same value as the sample, even if the front is a later sample. After such a removal, the deque
+	holds the maxima of a window that starts after the removed front. So, after sample `index`, the
+	front is the maximum of `magnitude[start:index + 1]`, and `start` only changes at a removal.
+
+	If the deque holds exactly two values, a removal empties the deque. A removal at step `index` can
+	only move `start` if `magnitude[index - samplesTimeConstant]` also occurs later in the window with
+	no larger value after it, or if the removal empties the deque, so a scalar loop visits only those
+	steps. Each candidate needs the last position at or after which the window holds the leaving
+	value, and the last position before it that holds a larger value, and the front after each step
+	needs a range maximum: the three are computed for blocks of steps with binary lifting over the
+	maxima of power-of-two windows.
+	"""
+	lengthSignal: int = magnitude.size
+	widthsWindow: list[int] = [1 << exponent for exponent in range(samplesTimeConstant.bit_length())]
+	stepsCandidate: list[int] = []
+	lastAtLeast: list[int] = []
+	lastLarger: list[int] = []
+	isPairCandidate: list[bool] = []
+	for startBlock in range(samplesTimeConstant, lengthSignal, samplesPerBlockNoiseFloor):
+		stopBlock: int = min(startBlock + samplesPerBlockNoiseFloor, lengthSignal)
+		offset: int = max(startBlock - 2 * samplesTimeConstant, 0)
+		magnitudeBlock = magnitude[offset:stopBlock]
+		listMaxima = _maximaTrailing(magnitudeBlock, widthsWindow)
+		steps = numpy.arange(startBlock, stopBlock) - offset
+		valueLeaving = magnitudeBlock[steps - samplesTimeConstant]
+		# The last position, before the step, of a value at least as large as the leaving value.
+		positionAtLeast = _liftLeft(listMaxima, widthsWindow, steps, valueLeaving, isStrict=False) - 1
+		isLeavingFront = magnitudeBlock[positionAtLeast] == valueLeaving
+		# The deque holds exactly two values if the previous sample is the largest value after the front.
+		isPair = numpy.zeros(steps.size, dtype=numpy.bool_)
+		isFollowed = isLeavingFront & (positionAtLeast < steps - 1)
+		stepsFollowed = steps[isFollowed]
+		isPair[isFollowed] = _liftLeft(listMaxima, widthsWindow, stepsFollowed - 1, magnitudeBlock[stepsFollowed - 1], isStrict=True) - 1 == positionAtLeast[isFollowed]
+		isCandidate = isLeavingFront & ((positionAtLeast > steps - samplesTimeConstant) | isPair)
+		positionLarger = _liftLeft(listMaxima, widthsWindow, positionAtLeast[isCandidate], valueLeaving[isCandidate], isStrict=True) - 1
+		stepsCandidate.extend((steps[isCandidate] + offset).tolist())
+		lastAtLeast.extend((positionAtLeast[isCandidate] + offset).tolist())
+		lastLarger.extend((positionLarger + offset).tolist())
+		isPairCandidate.extend(isPair[isCandidate].tolist())
+
+	startWindow: int = 0
+	startsAfterRemoval = numpy.zeros(lengthSignal, dtype=numpy.int64)
+	for step, positionAtLeast, positionLarger, isPairStep in zip(stepsCandidate, lastAtLeast, lastLarger, isPairCandidate, strict=True):
+		startEffective: int = max(startWindow, step - samplesTimeConstant)
+		# The front is the leaving value if no larger value follows `startEffective`, and then the front is the sample at `positionAtLeast`.
+		if positionLarger < startEffective <= positionAtLeast:
+			# Like FFmpeg, a removal from a deque of two values also removes the other value.
+			startWindow = step if isPairStep else positionAtLeast + 1
+			startsAfterRemoval[step] = startWindow
+	startsWindow = numpy.maximum(numpy.maximum.accumulate(startsAfterRemoval), numpy.arange(lengthSignal) - samplesTimeConstant + 1)
+
+	front = maximum_filter1d(magnitude, samplesTimeConstant, origin=(samplesTimeConstant - 1) // 2, mode='nearest')
+	# Where no removal moved the start of the window, the front is the maximum of the last `samplesTimeConstant` samples.
+	isShortened = startsWindow > numpy.arange(lengthSignal) - samplesTimeConstant + 1
+	for startBlock in range(0, lengthSignal, samplesPerBlockNoiseFloor):
+		stopBlock = min(startBlock + samplesPerBlockNoiseFloor, lengthSignal)
+		stepsShortened = numpy.flatnonzero(isShortened[startBlock:stopBlock]) + startBlock
+		if stepsShortened.size == 0:
+			continue
+		offset = max(startBlock - samplesTimeConstant, 0)
+		listMaxima = _maximaTrailing(magnitude[offset:stopBlock], widthsWindow)
+		position = stepsShortened - offset + 1
+		lengthWindow = stepsShortened + 1 - startsWindow[stepsShortened]
+		frontShortened = numpy.zeros(stepsShortened.size, dtype=numpy.float32)
+		for widthWindow, maxima in zip(reversed(widthsWindow), reversed(listMaxima), strict=True):
+			hasWidth = (lengthWindow & widthWindow) != 0
+			frontShortened = numpy.where(hasWidth, numpy.maximum(frontShortened, maxima[position - 1]), frontShortened)
+			position -= widthWindow * hasWidth
+		front[stepsShortened] = frontShortened
+	return front
+
+def _maximaTrailing(values: numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]], widthsWindow: list[int]) -> list[numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]]]:
+	"""Return, for each width, the maximum of the window of that width that ends at each position."""
+	listMaxima: list[numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]]] = [values]
+	for widthWindow in widthsWindow[0:-1]:
+		maxima = listMaxima[-1].copy()
+		numpy.maximum(maxima[widthWindow:None], listMaxima[-1][0:-widthWindow], out=maxima[widthWindow:None])
+		listMaxima.append(maxima)
+	return listMaxima
+
+def _liftLeft(listMaxima: list[numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]]], widthsWindow: list[int], positions: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]
+		, thresholds: numpy.ndarray[tuple[int], numpy.dtype[numpy.float32]], *, isStrict: bool) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]:
+	"""Move each position left past the values below each threshold, or, if `isStrict`, past the values at most each threshold."""
+	positions = positions.copy()
+	for widthWindow, maxima in zip(reversed(widthsWindow), reversed(listMaxima), strict=True):
+		isInside = positions - widthWindow >= 0
+		maximaWindow = maxima[numpy.maximum(positions - 1, 0)]
+		isBelow = (maximaWindow <= thresholds) if isStrict else (maximaWindow < thresholds)
+		positions -= widthWindow * (isInside & isBelow)
+	return positions
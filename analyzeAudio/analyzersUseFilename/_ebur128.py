@@ -18,10 +18,10 @@ arrayOverallDataEmpty: ArrayOverallData = numpy.array([], dtype=numpy.float64).r
 def analyzeTruePeakChannel(pathFilename: str | PathLike[Any]) -> ArrayChannelData:
 	keepGoing: bool = True
 	channel: int = 0
-	listAspectChannels: list[ArrayOverallData] = [ffprobeAllInclusiveCache(pathFilename).get(f'true_peaks_ch{channel}', arrayOverallDataEmpty)]
+	listAspectChannels: list[ArrayOverallData] = [ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get(f'true_peaks_ch{channel}', arrayOverallDataEmpty)]
 	while keepGoing:
 		channel += 1
-		aspectChannel: ArrayOverallData | None = ffprobeAllInclusiveCache(pathFilename).get(f'true_peaks_ch{channel}', None)
+		aspectChannel: ArrayOverallData | None = ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get(f'true_peaks_ch{channel}', None)
 		if aspectChannel is not None:
 			listAspectChannels.append(aspectChannel)
 		else:
@@ -51,7 +51,7 @@ def analyzeTruePeak(pathFilename: str | PathLike[Any]) -> ArrayOverallData:
 		true-peak audio level.
 		https://www.itu.int/dms_pubrec/itu-r/rec/bs/R-REC-BS.1770-5-202311-I!!PDF-E.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('true_peak', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get('true_peak', arrayOverallDataEmpty)
 
 @registrationAudioAspect('true_peak maximum')
 def analyzeTruePeakOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -95,7 +95,7 @@ def analyzeLUFSMomentary(pathFilename: str | PathLike[Any]) -> ArrayOverallData:
 		true-peak audio level.
 		https://www.itu.int/dms_pubrec/itu-r/rec/bs/R-REC-BS.1770-5-202311-I!!PDF-E.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('M', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get('M', arrayOverallDataEmpty)
 
 @registrationAudioAspect('LUFS momentary maximum')
 def analyzeLUFSMomentaryOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -140,7 +140,7 @@ def analyzeLUFSShortTerm(pathFilename: str | PathLike[Any]) -> ArrayOverallData:
 		true-peak audio level.
 		https://www.itu.int/dms_pubrec/itu-r/rec/bs/R-REC-BS.1770-5-202311-I!!PDF-E.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('S', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get('S', arrayOverallDataEmpty)
 
 @registrationAudioAspect('LUFS short-term maximum')
 def analyzeLUFSShortTermOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -203,7 +203,7 @@ def analyzeLUFSIntegrated(pathFilename: str | PathLike[Any]) -> ArrayOverallData
 		true-peak audio level.
 		https://www.itu.int/dms_pubrec/itu-r/rec/bs/R-REC-BS.1770-5-202311-I!!PDF-E.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('I', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get('I', arrayOverallDataEmpty)
 
 @registrationAudioAspect('LUFS integrated')
 def analyzeLUFSIntegratedOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -271,7 +271,7 @@ def analyzeLRA(pathFilename: str | PathLike[Any]) -> ArrayOverallData:
 		true-peak audio level.
 		https://www.itu.int/dms_pubrec/itu-r/rec/bs/R-REC-BS.1770-5-202311-I!!PDF-E.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('LRA', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get('LRA', arrayOverallDataEmpty)
 
 @registrationAudioAspect('LUFS loudness range')
 def analyzeLRAOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -327,7 +327,7 @@ def analyzeLUFSlow(pathFilename: str | PathLike[Any]) -> ArrayOverallData:
 		normalisation.
 		https://tech.ebu.ch/docs/tech/tech3342.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('LRA.low', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get('LRA.low', arrayOverallDataEmpty)
 
 @registrationAudioAspect('LUFS low')
 def analyzeLUFSlowOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -383,7 +383,7 @@ def analyzeLUFShigh(pathFilename: str | PathLike[Any]) -> ArrayOverallData:
 		normalisation.
 		https://tech.ebu.ch/docs/tech/tech3342.pdf
 	"""
-	return ffprobeAllInclusiveCache(pathFilename).get('LRA.high', arrayOverallDataEmpty)
+	return ffprobeAllInclusiveCache(pathFilename, ('ebur128',)).get('LRA.high', arrayOverallDataEmpty)
 
 @registrationAudioAspect('LUFS high')
 def analyzeLUFShighOverall(pathFilename: str | PathLike[Any]) -> float | None:
@@ -0,0 +1,379 @@
+"""Compute the statistics of the FFmpeg filter `ebur128` from decoded samples with NumPy.
+
+(AI generated docstring)
+
+You can use this module instead of an FFprobe process to compute the loudness statistics that
+`analyzeAudio.analyzersUseFilename._ebur128` reads. The statistics have the keys, shapes, and
+framing of the statistics that `ffprobeAllInclusiveCache` [1] parses from FFprobe: `ebur128` reports
+the statistics after each 100 ms of samples. The K-weighting filter runs as second-order sections,
+the energies of the 400 ms and 3 s blocks are differences of prefix sums, and the true peak is the
+peak of the 192 kHz polyphase interpolation that FFmpeg uses [2][3].
+
+Contents
+--------
+Functions
+	blockEnergiesEBUR128
+		Return the K-weighted mean square of each channel in the momentary and short-term blocks.
+	ebur128NumPy
+		Return the statistics of `ebur128` for decoded samples.
+	gatedStatisticsEBUR128
+		Return the gated statistics of `ebur128` from the momentary and short-term loudness of each frame.
+
+References
+----------
+[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+[2] ITU-R BS.1770-5. (2023). Algorithms to measure audio programme loudness and
+	true-peak audio level.
+	https://www.itu.int/dms_pubrec/itu-r/rec/bs/R-REC-BS.1770-5-202311-I!!PDF-E.pdf
+
+[3] FFmpeg `af_ebur128.c`
+	https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_ebur128.c
+
+"""
+from __future__ import annotations
+
+from analyzeAudio.analyzersUseFilename._astatsNumPy import roundMetadataFFmpeg
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import sosfilt
+from scipy.special import i0
+import math
+import numpy
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from analyzeAudio import ArrayChannelData, ArrayOverallData, Audio
+
+decimalsMetadataFFmpeg: int = 3
+"""Number of decimal places of each statistic in the metadata of `ebur128`."""
+
+loudnessAbsoluteGate: float = -70
+"""Absolute gate in LUFS, which is also the lowest loudness of the histograms of `ebur128`."""
+
+loudnessHistogramCeiling: float = 10
+"""Highest loudness of the histograms of `ebur128` in LUFS."""
+
+binsPerLoudnessUnit: int = 100
+"""Number of histogram bins per loudness unit in `ebur128`."""
+
+loudnessRelativeGateIntegrated: float = -10
+"""Relative gate of the integrated loudness in loudness units."""
+
+loudnessRelativeGateRange: float = -20
+"""Relative gate of the loudness range in loudness units."""
+
+percentilesLoudnessRange: tuple[int, int] = (10, 95)
+"""Percentiles of the short-term loudness that bound the loudness range."""
+
+panLawDualMono: float = -3.01029995663978
+"""`ebur128=dualmono=true` measures a mono file as two identical channels, which adds the negative of this pan law."""
+
+sampleRateTruePeak: int = 192000
+"""Sample rate in hertz of the interpolation from which `ebur128` measures the true peak."""
+
+tapsTruePeak: int = 32
+"""Number of taps of each phase of the interpolation filter of FFmpeg's resampler."""
+
+kaiserBetaTruePeak: float = 9
+"""Beta of the Kaiser window of the interpolation filter of FFmpeg's resampler."""
+
+rowsPerBlockTruePeak: int = 2**10
+"""Number of rows of input samples that `_truePeaksCumulative` interpolates at once, which bounds its memory."""
+
+def blockEnergiesEBUR128(waveform: Audio, sampleRate: int) -> tuple[ArrayChannelData, ArrayChannelData]:
+	"""Return the K-weighted mean square of each channel in the momentary and short-term blocks.
+
+	You can use this function to reuse the block energies from which `ebur128` computes every
+	loudness statistic. After each 100 ms of samples, the momentary block holds the last 400 ms and
+	the short-term block holds the last 3 s, as in `ebur128` [1][2].
+
+	Parameters
+	----------
+	waveform : Audio
+		Samples with shape (channels, samples), such as `waveform` of `AudioIntermediates`.
+	sampleRate : int
+		Sample rate of `waveform` in hertz.
+
+	Returns
+	-------
+	energiesMomentary : ArrayChannelData
+		Mean square of the K-weighted samples of each 400 ms block with shape (channels, frames), or
+		`numpy.nan` where fewer than 400 ms of samples precede the end of the frame.
+	energiesShortTerm : ArrayChannelData
+		Mean square of the K-weighted samples of each 3 s block with shape (channels, frames), or
+		`numpy.nan` where fewer than 3 s of samples precede the end of the frame.
+
+	References
+	----------
+	[1] ITU-R BS.1770-5. (2023). Algorithms to measure audio programme loudness and
+		true-peak audio level.
+		https://www.itu.int/dms_pubrec/itu-r/rec/bs/R-REC-BS.1770-5-202311-I!!PDF-E.pdf
+
+	[2] FFmpeg `af_ebur128.c`
+		https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_ebur128.c
+
+	"""
+	sumsSquaresMomentary, sumsSquaresShortTerm = _sumsSquaresBlocks(waveform, sampleRate)
+	return sumsSquaresMomentary / (sampleRate * 4 // 10), sumsSquaresShortTerm / (sampleRate * 3)
+
+def ebur128NumPy(waveform: Audio, sampleRate: int) -> dict[str, ArrayChannelData | ArrayOverallData]:
+	"""Return the statistics of `ebur128` for decoded samples.
+
+	You can use this function to compute, in this process, the statistics that FFprobe reports for
+	`ebur128=metadata=1:dualmono=true:framelog=verbose:peak=true` after FFmpeg decodes a mono or stereo
+	audio file. Like FFmpeg [2], the integrated loudness and the loudness range come from histograms
+	with 0.01 LU bins, and the true peak is the peak of the samples interpolated to 192 kHz with the
+	polyphase filter of FFmpeg's resampler. Each statistic matches FFmpeg to the three decimal places
+	that FFprobe prints, except for rounding.
+
+	Parameters
+	----------
+	waveform : Audio
+		Samples with shape (channels, samples), such as `waveform` of `AudioIntermediates`.
+	sampleRate : int
+		Sample rate of `waveform` in hertz.
+
+	Returns
+	-------
+	dictionaryAspects : dict[str, ArrayChannelData | ArrayOverallData]
+		Dictionary mapping each statistic of `ebur128` to an array with shape (frames,). The
+		dictionary is empty if `waveform` has fewer than 100 ms of samples.
+
+	Raises
+	------
+	ValueError
+		If `waveform` does not have one or two channels: `ebur128` weights surround channels by their
+		position, which raw samples do not carry.
+
+	References
+	----------
+	[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+	[2] FFmpeg `af_ebur128.c`
+		https://github.com/FFmpeg/FFmpeg/blob/master/libavfilter/af_ebur128.c
+
+	"""
+	channels: int = waveform.shape[0]
+	if channels not in {1, 2}:
+		message: str = f'I received `{waveform.shape = }`, but I need one or two channels.'
+		raise ValueError(message)
+	sumsSquaresMomentary, sumsSquaresShortTerm = _sumsSquaresBlocks(waveform, sampleRate)
+	countFrames: int = sumsSquaresMomentary.shape[-1]
+	if countFrames == 0:
+		return {}
+
+	# `ebur128` reports a power of 1e-12 until the block is full.
+	powerMomentary = numpy.nan_to_num((1e-12 + numpy.sum(sumsSquaresMomentary, axis=0)) / (sampleRate * 4 // 10), nan=1e-12)
+	powerShortTerm = numpy.nan_to_num((1e-12 + numpy.sum(sumsSquaresShortTerm, axis=0)) / (sampleRate * 3), nan=1e-12)
+	loudnessMomentary = _loudness(powerMomentary)
+	loudnessShortTerm = _loudness(powerShortTerm)
+	# `dualmono` changes the reported loudness, but the gates compare the loudness of the one channel.
+	correctionDualMono: float = -panLawDualMono if channels == 1 else 0
+
+	dictionaryAspects: dict[str, ArrayChannelData | ArrayOverallData] = {
+		'M': loudnessMomentary + correctionDualMono,
+		'S': loudnessShortTerm + correctionDualMono,
+		'I': _loudnessIntegrated(powerMomentary, loudnessMomentary, correctionDualMono),
+	}
+	loudnessLow, loudnessHigh = _loudnessRangeBounds(powerShortTerm, loudnessShortTerm)
+	dictionaryAspects['LRA'] = loudnessHigh - loudnessLow
+	dictionaryAspects['LRA.low'] = loudnessLow
+	dictionaryAspects['LRA.high'] = loudnessHigh
+
+	samplesPerFrame: int = max(sampleRate // 10, 1)
+	endsFrame = numpy.arange(1, countFrames + 1) * samplesPerFrame
+	listTruePeaks: list[ArrayOverallData] = []
+	for indexChannel in range(channels):
+		listTruePeaks.append(_truePeaksCumulative(numpy.asarray(waveform[indexChannel], dtype=numpy.float64), sampleRate, endsFrame))
+		dictionaryAspects[f'true_peaks_ch{indexChannel}'] = listTruePeaks[-1]
+	dictionaryAspects['true_peak'] = numpy.max(listTruePeaks, axis=0)
+	return {keyName: roundMetadataFFmpeg(arrayAspect, decimalsMetadataFFmpeg) for keyName, arrayAspect in dictionaryAspects.items()}
+
+def gatedStatisticsEBUR128(loudnessMomentary: ArrayOverallData, loudnessShortTerm: ArrayOverallData, channels: int) -> dict[str, ArrayOverallData]:
+	"""Return the gated statistics of `ebur128` from the momentary and short-term loudness of each frame.
+
+	You can use this function to compute the integrated loudness and the loudness range of a file
+	whose frames were measured in pieces, such as the time segments of `ffprobeAllInclusiveCache` [1]:
+	the gates of `ebur128` depend on every earlier frame, but the momentary and short-term loudness of
+	a frame depend only on its block. `ebur128` gates the histogram bins of 0.01 LU, so the loudness
+	that FFprobe reports with three decimal places gives the same statistics, except when the rounding
+	moves a loudness across the edge of a bin.
+
+	Parameters
+	----------
+	loudnessMomentary : ArrayOverallData
+		Momentary loudness 'M' of each frame in LUFS, as `ebur128` reports it.
+	loudnessShortTerm : ArrayOverallData
+		Short-term loudness 'S' of each frame in LUFS, as `ebur128` reports it.
+	channels : int
+		Number of channels of the measured samples; `ebur128` adds the dual-mono correction to the
+		loudness of one channel.
+
+	Returns
+	-------
+	dictionaryAspects : dict[str, ArrayOverallData]
+		Dictionary mapping 'I', 'LRA', 'LRA.low', and 'LRA.high' to the value after each frame.
+
+	References
+	----------
+	[1] `analyzeAudio.analyzersUseFilename._wideRange.ffprobeAllInclusiveCache`
+
+	"""
+	correctionDualMono: float = -panLawDualMono if channels == 1 else 0
+	loudnessMomentary = numpy.asarray(loudnessMomentary, dtype=numpy.float64) - correctionDualMono
+	loudnessShortTerm = numpy.asarray(loudnessShortTerm, dtype=numpy.float64) - correctionDualMono
+	loudnessLow, loudnessHigh = _loudnessRangeBounds(_power(loudnessShortTerm), loudnessShortTerm)
+	dictionaryAspects: dict[str, ArrayOverallData] = {
+		'I': _loudnessIntegrated(_power(loudnessMomentary), loudnessMomentary, correctionDualMono),
+		'LRA': loudnessHigh - loudnessLow,
+		'LRA.low': loudnessLow,
+		'LRA.high': loudnessHigh,
+	}
+	return {keyName: roundMetadataFFmpeg(arrayAspect, decimalsMetadataFFmpeg) for keyName, arrayAspect in dictionaryAspects.items()}
+
+def _sumsSquaresBlocks(waveform: Audio, sampleRate: int) -> tuple[ArrayChannelData, ArrayChannelData]:
+	"""Return the sum of the squared K-weighted samples of each channel in the momentary and short-term blocks, or `numpy.nan` where a block is not full."""
+	samplesPerFrame: int = max(sampleRate // 10, 1)
+	endsFrame = numpy.arange(1, waveform.shape[-1] // samplesPerFrame + 1) * samplesPerFrame
+	signalWeighted = sosfilt(_sectionsKWeighting(sampleRate), numpy.asarray(waveform, dtype=numpy.float64), axis=-1)
+	sumSquaresCumulative = numpy.concatenate((numpy.zeros((signalWeighted.shape[0], 1)), numpy.cumsum(signalWeighted * signalWeighted, axis=-1)), axis=-1)
+	listSumsSquares: list[ArrayChannelData] = []
+	for samplesBlock in (sampleRate * 4 // 10, sampleRate * 3):
+		sumsSquares = sumSquaresCumulative[:, endsFrame] - sumSquaresCumulative[:, numpy.maximum(endsFrame - samplesBlock, 0)]
+		sumsSquares[:, endsFrame < samplesBlock] = numpy.nan
+		listSumsSquares.append(sumsSquares)
+	return listSumsSquares[0], listSumsSquares[1]
+
+def _sectionsKWeighting(sampleRate: int) -> numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float64]]:
+	"""Return the high-shelf and high-pass sections of the K-weighting filter for `sampleRate`, with the coefficients of FFmpeg."""
+	frequencyShelf: float = 1681.974450955533
+	gainShelf: float = 3.999843853973347
+	qualityShelf: float = 0.7071752369554196
+	K: float = math.tan(math.pi * frequencyShelf / sampleRate)
+	gainHigh: float = 10 ** (gainShelf / 20)
+	gainBand: float = gainHigh ** 0.4996667741545416
+	a0: float = 1 + K / qualityShelf + K * K
+	sectionShelf: list[float] = [(gainHigh + gainBand * K / qualityShelf + K * K) / a0, 2 * (K * K - gainHigh) / a0, (gainHigh - gainBand * K / qualityShelf + K * K) / a0
+		, 1, 2 * (K * K - 1) / a0, (1 - K / qualityShelf + K * K) / a0]
+
+	frequencyHighPass: float = 38.13547087602444
+	qualityHighPass: float = 0.5003270373238773
+	K = math.tan(math.pi * frequencyHighPass / sampleRate)
+	a0 = 1 + K / qualityHighPass + K * K
+	sectionHighPass: list[float] = [1, -2, 1, 1, 2 * (K * K - 1) / a0, (1 - K / qualityHighPass + K * K) / a0]
+	return numpy.array([sectionShelf, sectionHighPass])
+
+def _loudness(power: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	return 10 * numpy.log10(power) - 0.691
+
+def _power(loudness: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	return 10 ** ((loudness + 0.691) / 10)
+
+def _binsHistogram(loudness: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]:
+	"""Return the histogram bin of each loudness, truncated toward zero like the C cast in `ebur128`."""
+	countBins: int = int((loudnessHistogramCeiling - loudnessAbsoluteGate) * binsPerLoudnessUnit) + 1
+	return numpy.clip(numpy.trunc((loudness - loudnessAbsoluteGate) * binsPerLoudnessUnit), 0, countBins - 1).astype(numpy.int64)
+
+def _gatesRelative(power: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], loudness: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]
+		, loudnessGate: float) -> tuple[numpy.ndarray[tuple[int], numpy.dtype[numpy.intp]], numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]], numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]]:
+	"""Return the frames above the absolute gate, the histogram bin of each, and the histogram bin of the relative gate after each."""
+	framesKept = numpy.flatnonzero(loudness >= loudnessAbsoluteGate)
+	powerMean = numpy.cumsum(power[framesKept]) / numpy.arange(1, framesKept.size + 1)
+	return framesKept, _binsHistogram(loudness[framesKept]), _binsHistogram(_loudness(powerMean) + loudnessGate)
+
+def _loudnessIntegrated(power: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], loudness: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]
+		, correctionDualMono: float) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	"""Return the integrated loudness after each frame, from the energies of the histogram bins above the relative gate.
+
+	`ebur128` adds `correctionDualMono` only when it updates the integrated loudness, so the initial value stays at the absolute gate.
+	"""
+	countBins: int = int((loudnessHistogramCeiling - loudnessAbsoluteGate) * binsPerLoudnessUnit) + 1
+	energyBins = numpy.exp2(math.log2(10) * ((numpy.arange(countBins) / binsPerLoudnessUnit + loudnessAbsoluteGate + 0.691) / 10))
+	framesKept, binsKept, binsGate = _gatesRelative(power, loudness, loudnessRelativeGateIntegrated)
+	loudnessAfterKept = numpy.full(framesKept.size, numpy.nan)
+	histogram = numpy.zeros(countBins, dtype=numpy.int64)
+	for indexKept, (binKept, binGate) in enumerate(zip(binsKept.tolist(), binsGate.tolist(), strict=True)):
+		histogram[binKept] += 1
+		countAboveGate: int = int(histogram[binGate:None].sum())
+		if countAboveGate:
+			loudnessAfterKept[indexKept] = _loudness(numpy.dot(histogram[binGate:None], energyBins[binGate:None]) / countAboveGate) + correctionDualMono
+	return _holdSinceUpdate(loudnessAfterKept, framesKept, loudness.size, loudnessAbsoluteGate)
+
+def _loudnessRangeBounds(power: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], loudness: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]
+		) -> tuple[numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]]:
+	"""Return the low and high percentiles of the short-term loudness above the relative gate after each frame."""
+	countBins: int = int((loudnessHistogramCeiling - loudnessAbsoluteGate) * binsPerLoudnessUnit) + 1
+	percentileLow, percentileHigh = percentilesLoudnessRange
+	framesKept, binsKept, binsGate = _gatesRelative(power, loudness, loudnessRelativeGateRange)
+	loudnessLowAfterKept = numpy.full(framesKept.size, numpy.nan)
+	loudnessHighAfterKept = numpy.full(framesKept.size, numpy.nan)
+	histogram = numpy.zeros(countBins, dtype=numpy.int64)
+	for indexKept, (binKept, binGate) in enumerate(zip(binsKept.tolist(), binsGate.tolist(), strict=True)):
+		histogram[binKept] += 1
+		countCumulative = numpy.cumsum(histogram[binGate:None])
+		countAboveGate: int = int(countCumulative[-1])
+		if countAboveGate:
+			# `ebur128` rounds the rank of each percentile with the same floating-point operations.
+			rankLow: int = int(percentileLow * countAboveGate * 0.01 + 0.5)
+			rankHigh: int = int(percentileHigh * countAboveGate * 0.01 + 0.5)
+			binLow: int = binGate + int(numpy.searchsorted(countCumulative, rankLow, side='left'))
+			binHigh: int = binGate + int(numpy.searchsorted(countCumulative, rankHigh, side='left'))
+			loudnessLowAfterKept[indexKept] = binLow / binsPerLoudnessUnit + loudnessAbsoluteGate
+			loudnessHighAfterKept[indexKept] = binHigh / binsPerLoudnessUnit + loudnessAbsoluteGate
+	return (_holdSinceUpdate(loudnessLowAfterKept, framesKept, loudness.size, 0), _holdSinceUpdate(loudnessHighAfterKept, framesKept, loudness.size, 0))
+
+def _holdSinceUpdate(valuesAfterKept: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], framesKept: numpy.ndarray[tuple[int], numpy.dtype[numpy.intp]]
+		, countFrames: int, valueInitial: float) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	"""Spread the value after each update to the frames until the next update, as `ebur128` keeps a statistic until it changes."""
+	valuesFrame = numpy.full(countFrames, numpy.nan)
+	valuesFrame[framesKept] = valuesAfterKept
+	isUpdated = ~numpy.isnan(valuesFrame)
+	indexLastUpdate = numpy.maximum.accumulate(numpy.where(isUpdated, numpy.arange(countFrames), -1))
+	return numpy.where(indexLastUpdate >= 0, valuesFrame[numpy.maximum(indexLastUpdate, 0)], valueInitial)
+
+def _truePeaksCumulative(samples: numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]], sampleRate: int, endsFrame: numpy.ndarray[tuple[int], numpy.dtype[numpy.int64]]) -> numpy.ndarray[tuple[int], numpy.dtype[numpy.float64]]:
+	"""Return the peak of the 192 kHz interpolation of `samples` through the end of each frame.
+
+	FFmpeg's resampler computes the interpolated sample at each multiple of `phaseStride / phases`
+	input samples from `tapsTruePeak` input samples, and it mirrors the first samples to interpolate
+	the start. Output `index` needs input sample `index * phaseStride // phases + tapsTruePeak // 2`,
+	so the peak through the end of a frame only includes the output samples whose inputs arrived.
+
+	The outputs are computed as a matrix product: row `row` of a strided view holds the input samples
+	of outputs `row * phases` through `row * phases + phases - 1`, and column `phase` of the
+	interpolation matrix holds, at the position of the inputs of that output, the filter of its phase.
+	"""
+	divisor: int = math.gcd(sampleRate, sampleRateTruePeak)
+	phases: int = sampleRateTruePeak // divisor
+	phaseStride: int = sampleRate // divisor
+	offsetCenter: int = (tapsTruePeak - 1) // 2
+	countOutputs = numpy.maximum(((endsFrame - tapsTruePeak // 2) * phases - 1) // phaseStride + 1, 0)
+	if countOutputs[-1] == 0:
+		return numpy.zeros(endsFrame.size)
+
+	positionTaps = numpy.arange(tapsTruePeak) - offsetCenter - numpy.arange(phases)[:, None] / phases
+	positionWindow = 2 * positionTaps / tapsTruePeak
+	filterPhases = numpy.sinc(positionTaps) * i0(kaiserBetaTruePeak * numpy.sqrt(numpy.maximum(1 - positionWindow * positionWindow, 0)))
+	# The resampler normalizes every phase by the sum of the taps of phase 0.
+	filterPhases /= filterPhases[0].sum()
+	outputs = numpy.arange(phases)
+	interpolation = numpy.zeros((phaseStride + tapsTruePeak, phases))
+	interpolation[(outputs * phaseStride // phases)[:, None] + numpy.arange(tapsTruePeak), outputs[:, None]] = filterPhases[outputs * phaseStride % phases]
+
+	rows: int = -(-int(countOutputs[-1]) // phases)
+	samplesMirrored = numpy.zeros(rows * phaseStride + phaseStride + tapsTruePeak)
+	samplesMirrored[offsetCenter:offsetCenter + samples.size] = samples[0:samplesMirrored.size - offsetCenter]
+	samplesMirrored[0:offsetCenter] = samples[offsetCenter:0:-1]
+	rowsSamples = sliding_window_view(samplesMirrored, phaseStride + tapsTruePeak)[0:rows * phaseStride:phaseStride]
+
+	# Frame `frame` adds outputs `boundsFrame[frame]` through `boundsFrame[frame + 1] - 1`.
+	boundsFrame = numpy.concatenate(([0], countOutputs))
+	peaksFrame = numpy.zeros(endsFrame.size)
+	for startRows in range(0, rows, rowsPerBlockTruePeak):
+		startOutputs: int = startRows * phases
+		magnitude = numpy.abs(rowsSamples[startRows:startRows + rowsPerBlockTruePeak] @ interpolation).ravel()
+		boundsBlock = numpy.clip(boundsFrame, startOutputs, startOutputs + magnitude.size) - startOutputs
+		hasOutputs = boundsBlock[1:None] > boundsBlock[0:-1]
+		peaksFrame[hasOutputs] = numpy.maximum(peaksFrame[hasOutputs], numpy.maximum.reduceat(magnitude[0:boundsBlock[-1]], boundsBlock[0:-1][hasOutputs]))
+	return numpy.maximum.accumulate(peaksFrame)
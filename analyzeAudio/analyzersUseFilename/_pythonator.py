@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Any, NamedTuple
+from functools import cache
+from itertools import chain
+from operator import itemgetter
+from typing import Any, NamedTuple, TYPE_CHECKING
+import codecs
 import json
 import numpy
 
+if TYPE_CHECKING:
+	from collections.abc import Iterable, Iterator
+	from io import BufferedIOBase
+
 # NOTE hey! hey! hey!
 # Is blackdetect broken?
 # 1. You don't have pytest tests for anything in the entire fricken package
@@ -19,6 +27,148 @@ class Blackdetect(NamedTuple):
 	black_start: float | None = None
 	black_end: float | None = None
 
+Z0Z_register: frozenset[str] = frozenset({
+	'aspectralstats',
+	'astats',
+	'r128',
+	'signalstats',
+})
+
+framesPerChunk: int = 1024
+"""Number of frames of one tag layout that I hold as strings before I convert their values to `numpy.float64`."""
+
+@cache
+def _parseKeyName(keyName: str) -> tuple[str, int | None, str] | None:
+	"""Return (registrant, channel, statistic) of a tag name, `lavfi.<registrant>.[channel.]statistic`, or `None` for other tags."""
+	if 'lavfi' in (keyNameDeconstructed := keyName.split('.'))[0]:
+		channel = None
+		if (registrant := keyNameDeconstructed[1]) in Z0Z_register:
+			keyNameDeconstructed = keyNameDeconstructed[2:]
+			if keyNameDeconstructed[0].isdigit():
+				channel = int(keyNameDeconstructed[0])
+				keyNameDeconstructed = keyNameDeconstructed[1:]
+			return registrant, channel, '.'.join(keyNameDeconstructed)
+	return None
+
+@cache
+def _compileLayout(keyNames: tuple[str, ...]) -> tuple[tuple[int, ...], tuple[tuple[str, int | None, str], ...]]:
+	"""Return the positions of the statistics among the tags of a frame and (registrant, channel, statistic) of each position."""
+	listPositions: list[int] = []
+	listParsed: list[tuple[str, int | None, str]] = []
+	for position, keyName in enumerate(keyNames):
+		if (parsed := _parseKeyName(keyName)) is not None:
+			listPositions.append(position)
+			listParsed.append(parsed)
+	return tuple(listPositions), tuple(listParsed)
+
+def _convertValues(keyNames: tuple[str, ...], listIndicesFrame: list[int], listValues: list[list[str]]) -> tuple[numpy.ndarray[Any, Any], numpy.ndarray[Any, Any]]:
+	listPositions = _compileLayout(keyNames)[0]
+	# `float` of each string, as the tags are read, but without an array element assignment for each tag.
+	if len(listPositions) == len(keyNames):
+		iterableValues: Iterable[str] = chain.from_iterable(listValues)
+	elif len(listPositions) == 1:
+		iterableValues = map(itemgetter(listPositions[0]), listValues)
+	else:
+		iterableValues = chain.from_iterable(map(itemgetter(*listPositions), listValues))
+	arrayValues = numpy.fromiter(map(float, iterableValues), dtype=numpy.float64, count=len(listIndicesFrame) * len(listPositions)).reshape(len(listIndicesFrame), len(listPositions))
+	return numpy.array(listIndicesFrame, dtype=numpy.intp), arrayValues
+
+def _foldTags(iterableStreamTags: Iterable[tuple[int, dict[str, str]]]) -> dict[int, dict[str, dict[str, numpy.ndarray[Any, Any]]]]:
+	"""Return the arrays of statistics of each output stream from the stream and the tags of each frame, in frame order; a frame without tags is an empty dictionary."""
+	# Frames of one stream with the same tag names, in the same order, share one column layout, so I parse each layout once and convert its values in bulk.
+	dictionaryLayoutPending: dict[tuple[int, tuple[str, ...]], tuple[list[int], list[list[str]]]] = {}
+	dictionaryLayoutChunks: dict[tuple[int, tuple[str, ...]], list[tuple[numpy.ndarray[Any, Any], numpy.ndarray[Any, Any]]]] = {}
+	dictionaryCountFrames: dict[int, int] = {}
+	for stream, tags in iterableStreamTags:
+		indexFrame: int = dictionaryCountFrames.get(stream, 0)
+		dictionaryCountFrames[stream] = indexFrame + 1
+		if tags and _compileLayout(keyNames := tuple(tags))[0]:
+			listIndicesFrame, listValues = dictionaryLayoutPending.setdefault((stream, keyNames), ([], []))
+			listIndicesFrame.append(indexFrame)
+			listValues.append(list(tags.values()))
+			if framesPerChunk <= len(listIndicesFrame):
+				dictionaryLayoutChunks.setdefault((stream, keyNames), []).append(_convertValues(keyNames, listIndicesFrame, listValues))
+				del dictionaryLayoutPending[stream, keyNames]
+	for (stream, keyNames), (listIndicesFrame, listValues) in dictionaryLayoutPending.items():
+		dictionaryLayoutChunks.setdefault((stream, keyNames), []).append(_convertValues(keyNames, listIndicesFrame, listValues))
+
+	# (stream, registrant, statistic): lists of (frame indices, channel, position of the tag in the frame, values), one entry for each chunk.
+	dictionaryColumns: dict[tuple[int, str, str], list[tuple[numpy.ndarray[Any, Any], int | None, int, numpy.ndarray[Any, Any]]]] = {}
+	for (stream, keyNames), listChunks in dictionaryLayoutChunks.items():
+		listPositions, listParsed = _compileLayout(keyNames)
+		for arrayIndicesFrame, arrayValues in listChunks:
+			for column, (position, (registrant, channel, statistic)) in enumerate(zip(listPositions, listParsed, strict=True)):
+				dictionaryColumns.setdefault((stream, registrant, statistic), []).append((arrayIndicesFrame, channel, position, arrayValues[:, column]))
+
+	# The first tag of each statistic, in frame order and then in tag order, fixes the order of the keys.
+	listKeysOrdered = sorted(dictionaryColumns, key=lambda streamRegistrantStatistic: min(
+		(int(arrayIndicesFrame[0]), position) for arrayIndicesFrame, _channel, position, _values in dictionaryColumns[streamRegistrantStatistic]))
+
+	dictionaryStreams: dict[int, dict[str, dict[str, numpy.ndarray[Any, Any]]]] = {stream: {} for stream in sorted(dictionaryCountFrames)}
+	for stream, registrant, statistic in listKeysOrdered:
+		countFrames: int = dictionaryCountFrames[stream]
+		listColumns = dictionaryColumns[stream, registrant, statistic]
+		if listColumns[0][1] is None:
+			arrayStatistic = numpy.zeros(countFrames)
+			for arrayIndicesFrame, _channel, _position, arrayValues in listColumns:
+				arrayStatistic[arrayIndicesFrame] = arrayValues
+		else:
+			# Every tag of a statistic, in the order that the tags appear in the JSON.
+			arrayIndicesFrame = numpy.concatenate([column[0] for column in listColumns])
+			arrayChannels = numpy.concatenate([numpy.full(len(column[0]), column[1], dtype=numpy.intp) for column in listColumns])
+			arrayPositions = numpy.concatenate([numpy.full(len(column[0]), column[2], dtype=numpy.intp) for column in listColumns])
+			arrayValues = numpy.concatenate([column[3] for column in listColumns])
+			order = numpy.lexsort((arrayPositions, arrayIndicesFrame))
+			arrayIndicesFrame, arrayChannels, arrayValues = arrayIndicesFrame[order], arrayChannels[order], arrayValues[order]
+			# A channel higher than every earlier channel adds rows with `numpy.resize`, which fills the new rows with copies of the existing rows.
+			arrayChannelsMaximum = numpy.maximum.accumulate(arrayChannels)
+			listIndicesResize = (numpy.flatnonzero(arrayChannels[1:] > arrayChannelsMaximum[:-1]) + 1).tolist()
+			arrayStatistic = numpy.zeros((int(arrayChannels[0]), countFrames))
+			indexStart = 0
+			for indexStop in [*listIndicesResize, len(arrayChannels)]:
+				if indexStart:
+					arrayStatistic = numpy.resize(arrayStatistic, (int(arrayChannels[indexStart]), countFrames))
+				arrayStatistic[arrayChannels[indexStart:indexStop] - 1, arrayIndicesFrame[indexStart:indexStop]] = arrayValues[indexStart:indexStop]
+				indexStart = indexStop
+		dictionaryStreams[stream].setdefault(registrant, {})[statistic] = arrayStatistic
+	return dictionaryStreams
+
+def _iterateTagsBlackdetect(iterableFrames: Iterable[dict[str, Any]], listTuplesBlackdetect: list[Blackdetect]) -> Iterator[tuple[int, dict[str, str]]]:
+	"""Yield the output stream and the tags of each frame after I move the blackdetect tags of the frame to `listTuplesBlackdetect`."""
+	for FFframe in iterableFrames:
+		if 'tags' in FFframe:
+			if 'lavfi.black_start' in FFframe['tags']:
+				# listTuplesBlackdetect.append(float(FFframe['tags']['lavfi.black_start'])) # uncommentToFixBlackdetect
+				listTuplesBlackdetect.append(Blackdetect(black_start=float(FFframe['tags']['lavfi.black_start'])))
+				del FFframe['tags']['lavfi.black_start']
+			if 'lavfi.black_end' in FFframe['tags']:
+				# listTuplesBlackdetect[-1] = (listTuplesBlackdetect[-1], float(FFframe['tags']['lavfi.black_end'])) # uncommentToFixBlackdetect
+				tupleBlackdetectLast = listTuplesBlackdetect.pop() if listTuplesBlackdetect else Blackdetect()
+				match tupleBlackdetectLast.black_end:
+					case None:
+						listTuplesBlackdetect.append(Blackdetect(tupleBlackdetectLast.black_start, float(FFframe['tags']['lavfi.black_end'])))
+					case _:
+						if tupleBlackdetectLast.black_start is not None:
+							listTuplesBlackdetect.append(tupleBlackdetectLast)
+						listTuplesBlackdetect.append(Blackdetect(black_end=(float(FFframe['tags']['lavfi.black_end']))))
+				del FFframe['tags']['lavfi.black_end']
+
+			if not FFframe['tags']:  # empty = False
+				del FFframe['tags']
+		yield FFframe.get('stream_index', 0), FFframe.get('tags', {})
+
+def _arrayBlackdetect(listTuplesBlackdetect: list[Blackdetect]) -> numpy.ndarray[Any, Any]:
+	# 2025-03-06 I am _shocked_ that I was able to create a numpy structured array whenever it was when I originally wrote this code.
+	return numpy.array(
+		[(
+			-1.0 if detect.black_start is None else detect.black_start,
+			-1.0 if detect.black_end is None else detect.black_end
+		) for detect in listTuplesBlackdetect],
+		dtype=[('black_start', numpy.float64), ('black_end', numpy.float64)],
+		copy=False
+	)
+	# Z0Z_dictionaries['blackdetect'] = numpy.array(listTuplesBlackdetect, dtype=[('black_start', numpy.float32), ('black_end', numpy.float32)], copy=False) # uncommentToFixBlackdetect
+
 def pythonizeFFprobe(FFprobeJSON_utf8: str) -> tuple[defaultdict[str, Any] | dict[str, Any], dict[str, numpy.ndarray[Any, Any] | dict[str, numpy.ndarray[Any, Any]]]]:
 	FFroot: dict[str, Any] = json.loads(FFprobeJSON_utf8)
 	Z0Z_dictionaries: dict[str, numpy.ndarray[Any, Any] | dict[str, numpy.ndarray[Any, Any]]] = {}
@@ -33,93 +183,98 @@ def pythonizeFFprobe(FFprobeJSON_utf8: str) -> tuple[defaultdict[str, Any] | dic
 				raise ValueError(message)
 		del FFroot['packets_and_frames']
 
-	Z0Z_register = [
-		'aspectralstats',
-		'astats',
-		'r128',
-		'signalstats',
-	]
 	leftCrumbs = False
 	if 'frames' in FFroot:
-		leftCrumbs = False
 		# listTuplesBlackdetect = [] # uncommentToFixBlackdetect
 		listTuplesBlackdetect: list[Blackdetect] = []
-		for indexFrame, FFframe in enumerate(FFroot['frames']):
-			if 'tags' in FFframe:
-				if 'lavfi.black_start' in FFframe['tags']:
-					# listTuplesBlackdetect.append(float(FFframe['tags']['lavfi.black_start'])) # uncommentToFixBlackdetect
-					listTuplesBlackdetect.append(Blackdetect(black_start=float(FFframe['tags']['lavfi.black_start'])))
-					del FFframe['tags']['lavfi.black_start']
-				if 'lavfi.black_end' in FFframe['tags']:
-					# listTuplesBlackdetect[-1] = (listTuplesBlackdetect[-1], float(FFframe['tags']['lavfi.black_end'])) # uncommentToFixBlackdetect
-					tupleBlackdetectLast = listTuplesBlackdetect.pop() if listTuplesBlackdetect else Blackdetect()
-					match tupleBlackdetectLast.black_end:
-						case None:
-							listTuplesBlackdetect.append(Blackdetect(tupleBlackdetectLast.black_start, float(FFframe['tags']['lavfi.black_end'])))
-						case _:
-							if tupleBlackdetectLast.black_start is not None:
-								listTuplesBlackdetect.append(tupleBlackdetectLast)
-							listTuplesBlackdetect.append(Blackdetect(black_end=(float(FFframe['tags']['lavfi.black_end']))))
-					del FFframe['tags']['lavfi.black_end']
-
-				# This is not the way to do it
-				for keyName, keyValue in FFframe['tags'].items():
-					if 'lavfi' in (keyNameDeconstructed := keyName.split('.'))[0]:
-						channel = None
-						if (registrant := keyNameDeconstructed[1]) in Z0Z_register:
-							keyNameDeconstructed = keyNameDeconstructed[2:]
-							if keyNameDeconstructed[0].isdigit():
-								channel = int(keyNameDeconstructed[0])
-								keyNameDeconstructed = keyNameDeconstructed[1:]
-							statistic = '.'.join(keyNameDeconstructed)
-							if channel is None:
-								while True:
-									try:
-										Z0Z_dictionaries[registrant][statistic][indexFrame] = float(keyValue)
-										break  # If successful, exit the loop
-									except KeyError:
-										if registrant not in Z0Z_dictionaries:
-											Z0Z_dictionaries[registrant] = {}
-										elif statistic not in Z0Z_dictionaries[registrant]:
-											Z0Z_dictionaries[registrant][statistic] = numpy.zeros(len(FFroot['frames']))
-										else:
-											raise  # Re-raise the exception
-							else:
-								while True:
-									try:
-										Z0Z_dictionaries[registrant][statistic][channel - 1, indexFrame] = float(keyValue)
-										break  # If successful, exit the loop
-									except KeyError:
-										if registrant not in Z0Z_dictionaries:
-											Z0Z_dictionaries[registrant] = {}
-										elif statistic not in Z0Z_dictionaries[registrant]:
-												valueSherpa = numpy.zeros((channel, len(FFroot['frames'])))
-												Z0Z_dictionaries[registrant][statistic] = valueSherpa
-										else:
-											raise  # Re-raise the exception
-									except IndexError:
-										if channel > Z0Z_dictionaries[registrant][statistic].shape[0]:
-											Z0Z_dictionaries[registrant][statistic] = numpy.resize(Z0Z_dictionaries[registrant][statistic], (channel, len(FFroot['frames'])))
-											# Z0Z_dictionaries[registrant][statistic].resize((channel, len(FFroot['frames'])))
-										else:
-											raise  # Re-raise the exception
-
-				if not FFframe['tags']:  # empty = False
-					del FFframe['tags']
-			if FFframe:
-				leftCrumbs = True
+		Z0Z_dictionaries.update(_foldTags(_iterateTagsBlackdetect(FFroot['frames'], listTuplesBlackdetect)).get(0, {}))
+		leftCrumbs = any(FFroot['frames'])
 		if listTuplesBlackdetect:
-			# 2025-03-06 I am _shocked_ that I was able to create a numpy structured array whenever it was when I originally wrote this code.
-			arrayBlackdetect = numpy.array(
-				[(
-					-1.0 if detect.black_start is None else detect.black_start,
-					-1.0 if detect.black_end is None else detect.black_end
-				) for detect in listTuplesBlackdetect],
-				dtype=[('black_start', numpy.float64), ('black_end', numpy.float64)],
-				copy=False
-			)
-			Z0Z_dictionaries['blackdetect'] = arrayBlackdetect
-			# Z0Z_dictionaries['blackdetect'] = numpy.array(listTuplesBlackdetect, dtype=[('black_start', numpy.float32), ('black_end', numpy.float32)], copy=False) # uncommentToFixBlackdetect
+			Z0Z_dictionaries['blackdetect'] = _arrayBlackdetect(listTuplesBlackdetect)
 	if not leftCrumbs:
 		del FFroot['frames']
 	return FFroot, Z0Z_dictionaries
+
+prefixFramesJSON: str = '{"frames":['
+"""Start of FFprobe JSON output whose first section is `frames`, without whitespace."""
+
+def _iterateFramesFFprobeJSON(readStream: BufferedIOBase, listTextUnparsed: list[str]) -> Iterator[dict[str, Any]]:
+	"""Yield each frame of the `frames` section of FFprobe JSON output as soon as `readStream` holds the whole frame.
+
+	If the output does not begin with the `frames` section, I yield nothing and put the whole output in `listTextUnparsed`.
+	"""
+	decoderJSON = json.JSONDecoder()
+	decoderUTF8 = codecs.getincrementaldecoder('utf-8')()
+	textBuffer: str = ''
+	index: int = 0
+	endOfStream: bool = False
+
+	def readMore() -> bool:
+		nonlocal textBuffer, index
+		chunk: bytes = readStream.read1(2**16)
+		textBuffer = textBuffer[index:] + decoderUTF8.decode(chunk, final=not chunk)
+		index = 0
+		return not chunk
+
+	# Before the first frame, I only look at the text without whitespace.
+	while (textCompact := ''.join(textBuffer[0:256].split())[0:len(prefixFramesJSON)]) != prefixFramesJSON:
+		if endOfStream or not prefixFramesJSON.startswith(textCompact):
+			while not endOfStream:
+				endOfStream = readMore()
+			listTextUnparsed.append(textBuffer)
+			return
+		endOfStream = readMore()
+	index = textBuffer.index('[') + 1
+
+	while True:
+		while index < len(textBuffer) and textBuffer[index] in ' \t\r\n,':
+			index += 1
+		if index == len(textBuffer):
+			if endOfStream:
+				break
+			endOfStream = readMore()
+			continue
+		if textBuffer[index] == ']':
+			break
+		try:
+			FFframe, index = decoderJSON.raw_decode(textBuffer, index)
+		except json.JSONDecodeError:
+			if endOfStream:
+				raise
+			endOfStream = readMore()
+			continue
+		yield FFframe
+
+	# The rest of the output, if any, is not part of the `frames` section.
+	while not endOfStream:
+		endOfStream = readMore()
+
+def pythonizeFFprobeStream(readStream: BufferedIOBase) -> dict[str, numpy.ndarray[Any, Any] | dict[str, numpy.ndarray[Any, Any]]]:
+	"""Return the arrays of statistics of FFprobe JSON output while FFprobe writes the output.
+
+	I parse each frame as soon as `readStream` holds the frame, and I keep the values as `numpy.float64`
+	instead of keeping the JSON text, so the memory follows the size of the arrays. The result equals
+	`pythonizeFFprobe(readStream.read().decode('utf-8'))[-1]`.
+	"""
+	return pythonizeFFprobeStreams(readStream)[0]
+
+def pythonizeFFprobeStreams(readStream: BufferedIOBase) -> list[dict[str, numpy.ndarray[Any, Any] | dict[str, numpy.ndarray[Any, Any]]]]:
+	"""Return the arrays of statistics of each output stream of FFprobe JSON output while FFprobe writes the output.
+
+	A filter graph with more than one output, such as two instances of one filter after `asplit`,
+	writes metadata with the same keys to each output. If FFprobe shows the `stream_index` of each
+	frame, I fold the frames of each output stream into their own dictionary, so the statistics of
+	one instance do not overwrite the statistics of another. A frame without `stream_index` belongs to
+	the first output stream. Otherwise, I parse the output like `pythonizeFFprobeStream`.
+	"""
+	listTextUnparsed: list[str] = []
+	# listTuplesBlackdetect = [] # uncommentToFixBlackdetect
+	listTuplesBlackdetect: list[Blackdetect] = []
+	dictionaryStreams = _foldTags(_iterateTagsBlackdetect(_iterateFramesFFprobeJSON(readStream, listTextUnparsed), listTuplesBlackdetect))
+	if listTextUnparsed:
+		return [pythonizeFFprobe(listTextUnparsed[0])[-1]]
+	listDictionaries: list[dict[str, numpy.ndarray[Any, Any] | dict[str, numpy.ndarray[Any, Any]]]] = [
+		dict(dictionaryStreams.get(stream, {})) for stream in range(max(dictionaryStreams, default=0) + 1)]
+	if listTuplesBlackdetect:
+		listDictionaries[0]['blackdetect'] = _arrayBlackdetect(listTuplesBlackdetect)
+	return listDictionaries
@@ -1,92 +1,600 @@
 """Analyzers that use the filename of an audio file to analyze its audio data."""
 from __future__ import annotations
 
-from analyzeAudio.analyzersUseFilename._pythonator import pythonizeFFprobe
-from functools import cache
-from operator import getitem
+from analyzeAudio._cacheFFprobe import CacheFFprobe
+from analyzeAudio._intermediates import AudioIntermediates
+from analyzeAudio.analyzersUseFilename._aspectralstatsNumPy import aspectralstatsNumPy, aspectralstatsSpectrogram
+from analyzeAudio.analyzersUseFilename._astatsNumPy import astatsNumPy
+from analyzeAudio.analyzersUseFilename._ebur128NumPy import ebur128NumPy, gatedStatisticsEBUR128
+from analyzeAudio.analyzersUseFilename._pythonator import pythonizeFFprobeStreams
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hunterHearsPy import stft
 from typing import TYPE_CHECKING
+import math
+import numpy
 import pathlib
+import soundfile
 import subprocess  # noqa: S404
 
 if TYPE_CHECKING:
-	from analyzeAudio import ArrayChannelData, ArrayOverallData
+	from analyzeAudio import ArrayChannelData, ArrayOverallData, Audio, SpectrogramMagnitude
+	from collections.abc import Callable, Iterable, Iterator
 	from os import PathLike
-	from typing import Any
+	from typing import Any, Literal
 
 # https://ffmpeg.org/ffmpeg-filters.html#drmeter
 # Potential aspect, but it doesn't work.
 # ffmpeg -hide_banner -i /data/MusicDemixingBenchmarks/synthetic/melody_000_mixture.wav -filter_complex "[0]ebur128,drmeter,astats" -map 0 -f null -
 
-@cache
-def ffprobeAllInclusiveCache(pathFilename: str | PathLike[Any]) -> dict[str, ArrayChannelData | ArrayOverallData]:
-	"""I use this shared extractor to collect audio aspects from one analysis pass.
+dictionaryFiltersFFmpeg: dict[str, str] = {
+	'aspectralstats': "aspectralstats",
+	'ebur128': "ebur128=metadata=1:dualmono=true:framelog=verbose:peak=true",
+	# by default length=0.05, 50ms. Set to 0.1, 100ms to match ebur128.
+	# TODO FFmpeg might have a bug. per-channel `Abs_Peak_count` is not inserted in the metadata, but it is in the parsed_stats summary.
+	'astats': "astats=metadata=1:length=0.1:measure_perchannel=all:measure_overall=Number_of_samples+RMS_level+Abs_Peak_count",
+	# `reset=1` after frames of 100 ms: the statistics of each frame instead of the statistics of every sample so far.
+	'astatsFramewise': "astats=metadata=1:length=0.1:reset=1:measure_perchannel=all:measure_overall=Number_of_samples+RMS_level+Abs_Peak_count",
+}
+"""Map the name of each FFmpeg filter that `ffprobeAllInclusiveCache` can run to the filter and its options.
+
+A name can be a second configuration of a filter. If two filters report a statistic with the same name,
+the filter later in the dictionary wins, unless the later filter is in `setFiltersNamespaced`.
+"""
+
+dictionaryFilterRegistrant: dict[str, str] = {'aspectralstats': 'aspectralstats', 'ebur128': 'r128', 'astats': 'astats', 'astatsFramewise': 'astats'}
+"""Map the name of each FFmpeg filter to the registrant in its metadata keys, `lavfi.<registrant>.<statistic>`."""
+
+setFiltersNamespaced: frozenset[str] = frozenset(filterName for indexFilter, filterName in enumerate(dictionaryFilterRegistrant)
+	if dictionaryFilterRegistrant[filterName] in list(dictionaryFilterRegistrant.values())[0:indexFilter])
+"""Names of the filters whose registrant belongs to an earlier filter; `ffprobeAllInclusiveCache` prefixes each statistic with `<filterName>.`."""
+
+dictionaryChannelLayouts: dict[int, str] = {1: 'mono', 2: 'stereo'}
+"""Map a number of channels to the FFmpeg channel layout of samples that `ffprobeAllInclusiveCache` writes to FFprobe.
+
+Raw samples carry no channel layout, and `ebur128` weights surround channels by their position, so
+samples with more channels are read by FFmpeg from the file.
+"""
+
+samplesPerHopAspectralstats: int = 1024
+"""Number of samples between the windows of `aspectralstats`, which is half of its default window of 2048 samples."""
+
+cacheFFprobe: CacheFFprobe = CacheFFprobe()
+"""Statistics of each filter that already ran on each recently analyzed file."""
+
+setFiltersSegmented: frozenset[str] = frozenset({'ebur128', 'aspectralstats'})
+"""Names of the filters whose statistics FFprobe can measure in concurrent time segments of a file."""
+
+_contextEnginesFFmpeg: ContextVar[dict[str, str] | None] = ContextVar('_contextEnginesFFmpeg', default=None)
+
+_contextSegmentsFFprobe: ContextVar[int] = ContextVar('_contextSegmentsFFprobe', default=1)
+
+def getFilterFFmpeg(analyzer: Callable[..., Any]) -> str | None:
+	"""Return the name of the FFmpeg filter that computes the statistics of `analyzer`.
+
+	Parameters
+	----------
+	analyzer : Callable[..., Any]
+		Registered analyzer function.
+
+	Returns
+	-------
+	filterName : str | None
+		Key of `dictionaryFiltersFFmpeg`, or `None` if `analyzer` does not read FFprobe statistics.
+
+	"""
+	filterName: str = analyzer.__module__.rpartition('.')[2].removeprefix('_')
+	return filterName if filterName in dictionaryFiltersFFmpeg else None
+
+def getEnginesFFmpeg(*, astatsEngine: str = 'FFmpeg', ebur128Engine: str = 'FFmpeg', aspectralstatsEngine: str = 'FFmpeg') -> dict[str, str]:
+	"""Return the engine that computes the statistics of each FFmpeg filter.
+
+	Parameters
+	----------
+	astatsEngine : str = 'FFmpeg'
+		Engine that computes the statistics of `astats`.
+	ebur128Engine : str = 'FFmpeg'
+		Engine that computes the statistics of `ebur128`.
+	aspectralstatsEngine : str = 'FFmpeg'
+		Engine that computes the statistics of `aspectralstats`.
+
+	Returns
+	-------
+	dictionaryEngines : dict[str, str]
+		Map each key of `dictionaryFiltersFFmpeg` to its engine. FFmpeg computes `astatsFramewise`.
+
+	"""
+	return {'aspectralstats': aspectralstatsEngine, 'ebur128': ebur128Engine, 'astats': astatsEngine, 'astatsFramewise': 'FFmpeg'}
+
+def getSegmentsFilter(filterName: str, engine: str, segmentsFFprobe: int) -> int:
+	"""Return the number of time segments in which `engine` measures the statistics of `filterName`.
+
+	Parameters
+	----------
+	filterName : str
+		Key of `dictionaryFiltersFFmpeg`.
+	engine : str
+		Engine that computes the statistics, such as 'FFmpeg' or 'NumPy'.
+	segmentsFFprobe : int
+		Number of time segments that concurrent FFprobe processes measure.
+
+	Returns
+	-------
+	segmentsFilter : int
+		`segmentsFFprobe` if FFmpeg computes the statistics of a filter in `setFiltersSegmented`,
+		otherwise 1.
+
+	"""
+	return segmentsFFprobe if engine == 'FFmpeg' and filterName in setFiltersSegmented else 1
 
-	I use this function to convert one structured analysis result into a dictionary of array audio
-	aspects.
+def getKeyCacheFFprobe(filterName: str, engine: str, segmentsFFprobe: int = 1) -> str:
+	"""Return the key of the statistics of `filterName` from `engine` in `cacheFFprobe`.
+
+	Parameters
+	----------
+	filterName : str
+		Key of `dictionaryFiltersFFmpeg`.
+	engine : str
+		Engine that computed the statistics, such as 'FFmpeg' or 'NumPy'.
+	segmentsFFprobe : int = 1
+		Number of time segments that concurrent FFprobe processes measured.
+
+	Returns
+	-------
+	keyCache : str
+		`filterName` for the statistics of FFmpeg, otherwise '<filterName>:<engine>', such as
+		'astats:NumPy'. If FFprobe measured the filter in more than one time segment, the key ends
+		with ':segments<segmentsFFprobe>', such as 'ebur128:segments4', because the joined segments
+		can differ from one process.
+
+	"""
+	keyCache: str = filterName if engine == 'FFmpeg' else f'{filterName}:{engine}'
+	segmentsFilter: int = getSegmentsFilter(filterName, engine, segmentsFFprobe)
+	return keyCache if segmentsFilter == 1 else f'{keyCache}:segments{segmentsFilter}'
+
+@contextmanager
+def enginesFFmpeg(*, astatsEngine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', ebur128Engine: Literal['FFmpeg', 'NumPy'] = 'FFmpeg', aspectralstatsEngine: Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg', segmentsFFprobe: int = 1) -> Iterator[None]:
+	"""Make the engines of each FFmpeg filter and `segmentsFFprobe` the defaults of `ffprobeAllInclusiveCache` until the `with` block ends.
+
+	An analyzer of FFprobe statistics, such as `analyzeLUFSIntegratedOverall`, calls
+	`ffprobeAllInclusiveCache` with only `pathFilename` and the name of its filter. Inside the `with`
+	block, `ffprobeAllInclusiveCache` reads the statistics of the engines and of the time segments of
+	the block, so the analyzer receives the statistics that `analyzeAudio.analyzeAudioFile` [1]
+	computed instead of starting FFprobe.
+
+	Parameters
+	----------
+	astatsEngine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `astats`.
+	ebur128Engine : Literal['FFmpeg', 'NumPy'] = 'FFmpeg'
+		Engine that computes the statistics of `ebur128`.
+	aspectralstatsEngine : Literal['FFmpeg', 'NumPy', 'spectrogram'] = 'FFmpeg'
+		Engine that computes the statistics of `aspectralstats`.
+	segmentsFFprobe : int = 1
+		Number of time segments that concurrent FFprobe processes measure.
+
+	Yields
+	------
+	None
+		Control returns to the enclosed code.
+
+	References
+	----------
+	[1] `analyzeAudio.analyze.analyzeAudioFile`
+
+	"""
+	tokenContext = _contextEnginesFFmpeg.set(getEnginesFFmpeg(astatsEngine=astatsEngine, ebur128Engine=ebur128Engine, aspectralstatsEngine=aspectralstatsEngine))
+	tokenContextSegments = _contextSegmentsFFprobe.set(segmentsFFprobe)
+	try:
+		yield
+	finally:
+		_contextSegmentsFFprobe.reset(tokenContextSegments)
+		_contextEnginesFFmpeg.reset(tokenContext)
+
+def ffprobeAllInclusiveCache(pathFilename: str | PathLike[Any], filterNames: Iterable[str] = tuple(dictionaryFiltersFFmpeg), *, waveformAndSampleRate: tuple[Audio, int] | None = None, astatsEngine: Literal['FFmpeg', 'NumPy'] | None = None, ebur128Engine: Literal['FFmpeg', 'NumPy'] | None = None, aspectralstatsEngine: Literal['FFmpeg', 'NumPy', 'spectrogram'] | None = None, spectrogramMagnitudeAndSampleRate: tuple[SpectrogramMagnitude, int] | None = None, segmentsFFprobe: int | None = None) -> dict[str, ArrayChannelData | ArrayOverallData]:
+	"""Return the statistics of the FFmpeg filters in `filterNames` for the audio file at `pathFilename`.
+
+	Only the filters whose statistics are not in `cacheFFprobe` run, and their statistics join the
+	statistics of the filters that already ran, so asking for 'LUFS integrated' does not pay for the
+	spectral statistics.
+
+	The frames of each filter do not depend on the other filters. When `astats` runs without
+	`aspectralstats`, `astats` receives the 32-bit floating-point frames of 1024 samples that
+	`aspectralstats` would give it, and the statistics of `aspectralstats` and `astats` are read from
+	frames of 100 ms, as if `ebur128` followed them. `ebur128` runs in its own FFprobe process, at the
+	same time as the other filters.
+
+	A filter can run more than once with different options. `astatsFramewise` is `astats` with
+	`reset=1`, so each frame of 100 ms has the statistics of only its own samples. `asplit` sends the
+	decoded samples to both instances of `astats` in one FFprobe process, and the metadata of each
+	instance comes from its own output of the filter graph. Each statistic of a filter in
+	`setFiltersNamespaced` has the prefix `<filterName>.`, such as 'astatsFramewise.RMS_level', so
+	the two instances do not overwrite each other.
+
+	If you already decoded `pathFilename`, pass the samples in `waveformAndSampleRate`: FFprobe then
+	reads the samples as raw 32-bit floating point from a pipe, so FFmpeg does not decode
+	`pathFilename` again. The filters compute the same statistics from the same samples. FFmpeg reads
+	a file with more than two channels itself, because raw samples do not carry the channel layout
+	that `ebur128` needs.
+
+	If `astatsEngine` is 'NumPy', `astatsNumPy` [1] computes the statistics of `astats` in this
+	process instead of FFprobe. `astatsNumPy` reproduces the frames and the statistics of `astats`, so
+	the statistics are the same except for rounding. Without `waveformAndSampleRate`, `pathFilename`
+	is decoded first. For short files, FFprobe spends more time starting than computing, so
+	`astatsNumPy` is faster.
+
+	If `ebur128Engine` is 'NumPy', `ebur128NumPy` [2] computes the statistics of `ebur128` in the same
+	way. `ebur128NumPy` measures one or two channels, so FFprobe measures a file with more channels.
+	When both engines are 'NumPy', `pathFilename` is decoded once for both.
+
+	If `aspectralstatsEngine` is 'NumPy', `aspectralstatsNumPy` [3] computes the statistics of
+	`aspectralstats` with the window, the hop, and the framing of FFmpeg. If `aspectralstatsEngine` is
+	'spectrogram', `aspectralstatsSpectrogram` [4] computes the statistics from the frames of the
+	magnitude spectrogram of `AudioIntermediates` instead, so the spectral aspects and the spectrogram
+	aspects share one STFT: pass the spectrogram in `spectrogramMagnitudeAndSampleRate`, or it is
+	computed. These statistics differ from the statistics of FFmpeg.
+
+	Each engine computes somewhat different statistics, so `cacheFFprobe` keeps the statistics of a
+	filter from each engine apart, with the key from `getKeyCacheFFprobe` [6], and a request with one
+	engine never receives the statistics of another engine. An engine that is `None` is the engine of
+	the enclosing `enginesFFmpeg` [7] block, or 'FFmpeg' outside of a block, and likewise for
+	`segmentsFFprobe`, which is 1 outside of a block.
+
+	One FFprobe process measures a filter on one core, so a long file can leave the other cores idle.
+	If `segmentsFFprobe` is more than 1, the samples of `ebur128` and of `aspectralstats` are split
+	into that many time segments, and a process measures each segment at the same time. Each process
+	also measures the samples just before its segment, 3 s for `ebur128` and two hops for
+	`aspectralstats`, so the first frame of a segment has the same window as in one process. The
+	frames of the segments are joined in order, the true peak is the largest peak so far, and
+	`gatedStatisticsEBUR128` [5] computes the integrated loudness and the loudness range again from
+	the joined momentary and short-term loudness, which can differ from one process by one histogram
+	bin of 0.01 LU. `astats` reports statistics of every earlier sample, so `astats` still measures the
+	whole file in one process. If `soundfile` cannot read the length of `pathFilename`, one process
+	measures the whole file.
 
 	Parameters
 	----------
 	pathFilename : str | PathLike[Any]
 		Path of the audio file to analyze.
+	filterNames : Iterable[str] = tuple(dictionaryFiltersFFmpeg)
+		Keys of `dictionaryFiltersFFmpeg`.
+	waveformAndSampleRate : tuple[Audio, int] | None = None
+		Decoded samples of `pathFilename` with shape (channels, samples) and the sample rate in
+		hertz, such as `waveform` and `sampleRate` of `AudioIntermediates`.
+	astatsEngine : Literal['FFmpeg', 'NumPy'] | None = None
+		Engine that computes the statistics of `astats`.
+	ebur128Engine : Literal['FFmpeg', 'NumPy'] | None = None
+		Engine that computes the statistics of `ebur128`.
+	aspectralstatsEngine : Literal['FFmpeg', 'NumPy', 'spectrogram'] | None = None
+		Engine that computes the statistics of `aspectralstats`.
+	spectrogramMagnitudeAndSampleRate : tuple[SpectrogramMagnitude, int] | None = None
+		Magnitude spectrogram of `pathFilename` and the sample rate in hertz, such as
+		`spectrogramMagnitude` and `sampleRate` of `AudioIntermediates`, for the 'spectrogram' engine.
+	segmentsFFprobe : int | None = None
+		Number of time segments of `pathFilename` that concurrent FFprobe processes measure for
+		`ebur128` and `aspectralstats`.
 
 	Returns
 	-------
 	dictionaryAspects : dict[str, ArrayChannelData | ArrayOverallData]
-		Dictionary mapping aspect identifiers to array numeric values.
+		Dictionary mapping aspect identifiers to array numeric values of the filters in `filterNames`.
+
+	Raises
+	------
+	ValueError
+		If a name in `filterNames` is not a key of `dictionaryFiltersFFmpeg`.
+	ValueError
+		If `astatsEngine` or `ebur128Engine` is not 'FFmpeg' or 'NumPy'.
+	ValueError
+		If `aspectralstatsEngine` is not 'FFmpeg', 'NumPy', or 'spectrogram'.
+	ValueError
+		If `segmentsFFprobe` is less than 1.
+
+	References
+	----------
+	[1] `analyzeAudio.analyzersUseFilename._astatsNumPy.astatsNumPy`
+
+	[2] `analyzeAudio.analyzersUseFilename._ebur128NumPy.ebur128NumPy`
+
+	[3] `analyzeAudio.analyzersUseFilename._aspectralstatsNumPy.aspectralstatsNumPy`
+
+	[4] `analyzeAudio.analyzersUseFilename._aspectralstatsNumPy.aspectralstatsSpectrogram`
+
+	[5] `analyzeAudio.analyzersUseFilename._ebur128NumPy.gatedStatisticsEBUR128`
+
+	[6] `analyzeAudio.analyzersUseFilename._wideRange.getKeyCacheFFprobe`
+
+	[7] `analyzeAudio.analyzersUseFilename._wideRange.enginesFFmpeg`
+
 	"""
-	# TODO Investigate, why `PureWindowsPath`?
-	# `as_posix` because using lavfi bypasses the CLI sanitation/standardization functions, AND lavfi
-	# either never works with NT paths or doesn't always work with NT paths, but POSIX is always safe
-	# IF escaped properly. Does this work in POSIX filesystems? IDK. The "contest" aspects, like
-	# SI-SDR use a different FFmpeg call that treats the filenames with
-	# `str(pathlib.Path(pathFilenameBeta))`.
-	pFn = pathlib.PureWindowsPath(pathFilename)
-	# for lavfi amovie/movie, the colons after driveLetter letters need to be escaped twice.
-	lavfiPathFilename = pFn.drive.replace(":", "\\\\:") + pathlib.PureWindowsPath(pFn.root, pFn.relative_to(pFn.anchor)).as_posix()
-
-	filterChain: list[str] = []
-	filterChain += ["aspectralstats"]
-	# by default length=0.05, 50ms. Set to 0.1, 100ms to match ebur128.
-	# TODO FFmpeg might have a bug. per-channel `Abs_Peak_count` is not inserted in the metadata, but it is in the parsed_stats summary.
-	filterChain += ["astats=metadata=1:length=0.1:measure_perchannel=all:measure_overall=Number_of_samples+RMS_level+Abs_Peak_count"]
-	filterChain += ["ebur128=metadata=1:dualmono=true:framelog=verbose:peak=true"]
-
-	entriesFFprobe: list[str] = ["frame_tags"]
-
-	commandLineFFprobe: list[str] = [
-		"ffprobe"
-		, "-hide_banner"
-		, "-f"
-		, "lavfi"
-		, f"amovie={lavfiPathFilename},{','.join(filterChain)}"
-		, "-show_entries"
-		, ':'.join(entriesFFprobe)
-		, "-output_format"
-		, "json=compact=1"
-	]
-
-	systemProcessFFprobe = subprocess.Popen(commandLineFFprobe, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-	stdoutFFprobe, _DISCARDstderr = systemProcessFFprobe.communicate()
-	FFprobeStructured = getitem(pythonizeFFprobe(stdoutFFprobe.decode('utf-8')), -1)
+	setFilterNames: set[str] = set(filterNames)
+	if not setFilterNames.issubset(dictionaryFiltersFFmpeg):
+		message: str = f'I received `{sorted(setFilterNames.difference(dictionaryFiltersFFmpeg)) = }`, but I only know the FFmpeg filters {list(dictionaryFiltersFFmpeg)}.'
+		raise ValueError(message)
+	dictionaryEngines: dict[str, str] = _resolveEnginesFFmpeg(astatsEngine, ebur128Engine, aspectralstatsEngine)
+	if segmentsFFprobe is None:
+		segmentsFFprobe = _contextSegmentsFFprobe.get()
+	if segmentsFFprobe < 1:
+		message = f"I received `{segmentsFFprobe = }`, but I need at least 1 segment."
+		raise ValueError(message)
 
-	dictionaryAspects: dict[str, ArrayChannelData | ArrayOverallData] = {}
-	if 'aspectralstats' in FFprobeStructured:
-		"""No matter how many channels, each keyName is `numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float64]]`
-		where `tuple[int, int]` is (channel, frame)
-		"""
-		dictionaryAspects.update(FFprobeStructured['aspectralstats'])
-	if 'r128' in FFprobeStructured:
-		dictionaryAspects.update(FFprobeStructured['r128'])
-		# index -1 is the cumulative value for LUFS I, low, and high and peak; plus, the array has 3 significant digits instead of the summary's 1.
-	if 'astats' in FFprobeStructured:
-		dictionaryAspects.update(FFprobeStructured['astats'])
-		# TODO Crest_factor "standard ratio of peak to RMS level (note: not in dB)"
-
-		# TODO Bit_depth: 'Bit_depth', 'Bit_depth2', 'Bit_depth3', 'Bit_depth4',
-
-		# If I ran two passes of the filter, I could force per-frame values for all aspects with
-		# `reset=1`. astats is pretty fast because there are no transformations. But I would need to
-		# change pythonator because it will use the same key names for both passes, overwriting the
-		# first pass.
+	dictionaryKeysCache: dict[str, str] = {filterName: getKeyCacheFFprobe(filterName, dictionaryEngines[filterName], segmentsFFprobe) for filterName in setFilterNames}
+	identityFile: str = cacheFFprobe.identifyFile(pathFilename)
+	dictionaryFilterAspectsCached: dict[str, dict[str, ArrayChannelData | ArrayOverallData]] = cacheFFprobe.getFilterAspects(identityFile, dictionaryKeysCache.values())
+	dictionaryFilterAspects: dict[str, dict[str, ArrayChannelData | ArrayOverallData]] = {
+		filterName: dictionaryFilterAspectsCached[keyCache] for filterName, keyCache in dictionaryKeysCache.items() if keyCache in dictionaryFilterAspectsCached}
+	setFilterNamesMissing: set[str] = setFilterNames.difference(dictionaryFilterAspects)
+	dictionaryFilterAspects.update(_filterAspectsInProcess(pathFilename, setFilterNamesMissing, dictionaryEngines, waveformAndSampleRate, spectrogramMagnitudeAndSampleRate))
+	setFilterNamesFFprobe: set[str] = setFilterNamesMissing.difference(dictionaryFilterAspects)
+	if setFilterNamesFFprobe:
+		dictionaryFilterAspects.update(_filterAspectsFFprobe(pathFilename, setFilterNamesFFprobe, waveformAndSampleRate, segmentsFFprobe))
 
+	if setFilterNamesMissing:
+		cacheFFprobe.setFilterAspects(identityFile, {dictionaryKeysCache[filterName]: dictionaryFilterAspects[filterName] for filterName in setFilterNamesMissing})
+
+	dictionaryAspects: dict[str, ArrayChannelData | ArrayOverallData] = {}
+	for filterName in dictionaryFiltersFFmpeg:
+		if filterName in setFilterNames:
+			if filterName in setFiltersNamespaced:
+				dictionaryAspects.update({f'{filterName}.{keyName}': arrayAspect for keyName, arrayAspect in dictionaryFilterAspects[filterName].items()})
+			else:
+				dictionaryAspects.update(dictionaryFilterAspects[filterName])
 	return dictionaryAspects
+
+def _resolveEnginesFFmpeg(astatsEngine: str | None, ebur128Engine: str | None, aspectralstatsEngine: str | None) -> dict[str, str]:
+	"""I use this function to replace the engines of the enclosing `enginesFFmpeg` block with each engine that is not `None`, and to check each engine."""
+	dictionaryEngines: dict[str, str] = dict(_contextEnginesFFmpeg.get() or getEnginesFFmpeg())
+	for filterName, engine in (('astats', astatsEngine), ('ebur128', ebur128Engine), ('aspectralstats', aspectralstatsEngine)):
+		if engine is not None:
+			dictionaryEngines[filterName] = engine
+	astatsEngine, ebur128Engine, aspectralstatsEngine = dictionaryEngines['astats'], dictionaryEngines['ebur128'], dictionaryEngines['aspectralstats']
+	if astatsEngine not in {'FFmpeg', 'NumPy'}:
+		message: str = f"I received `{astatsEngine = }`, but I need 'FFmpeg' or 'NumPy'."
+		raise ValueError(message)
+	if ebur128Engine not in {'FFmpeg', 'NumPy'}:
+		message = f"I received `{ebur128Engine = }`, but I need 'FFmpeg' or 'NumPy'."
+		raise ValueError(message)
+	if aspectralstatsEngine not in {'FFmpeg', 'NumPy', 'spectrogram'}:
+		message = f"I received `{aspectralstatsEngine = }`, but I need 'FFmpeg', 'NumPy', or 'spectrogram'."
+		raise ValueError(message)
+	return dictionaryEngines
+
+def _filterAspectsInProcess(pathFilename: str | PathLike[Any], setFilterNames: set[str], dictionaryEngines: dict[str, str], waveformAndSampleRate: tuple[Audio, int] | None, spectrogramMagnitudeAndSampleRate: tuple[SpectrogramMagnitude, int] | None) -> dict[str, dict[str, ArrayChannelData | ArrayOverallData]]:
+	"""I use this function to compute, in this process, the statistics of each filter in `setFilterNames` whose engine is not FFmpeg; FFprobe measures the other filters."""
+	dictionaryEnginesNumPy: dict[str, Callable[[Audio, int], dict[str, ArrayChannelData | ArrayOverallData]]] = {}
+	if dictionaryEngines['astats'] == 'NumPy':
+		dictionaryEnginesNumPy['astats'] = astatsNumPy
+	if dictionaryEngines['ebur128'] == 'NumPy':
+		dictionaryEnginesNumPy['ebur128'] = ebur128NumPy
+	if dictionaryEngines['aspectralstats'] == 'NumPy':
+		dictionaryEnginesNumPy['aspectralstats'] = aspectralstatsNumPy
+	elif dictionaryEngines['aspectralstats'] == 'spectrogram':
+		dictionaryEnginesNumPy['aspectralstats'] = _aspectralstatsShortTimeFFT
+
+	dictionaryFilterAspects: dict[str, dict[str, ArrayChannelData | ArrayOverallData]] = {}
+	setFilterNamesNumPy: set[str] = setFilterNames.intersection(dictionaryEnginesNumPy)
+	if dictionaryEngines['aspectralstats'] == 'spectrogram' and spectrogramMagnitudeAndSampleRate is not None and 'aspectralstats' in setFilterNamesNumPy:
+		dictionaryFilterAspects['aspectralstats'] = aspectralstatsSpectrogram(*spectrogramMagnitudeAndSampleRate)
+		setFilterNamesNumPy.discard('aspectralstats')
+	if setFilterNamesNumPy:
+		if waveformAndSampleRate is None:
+			audioIntermediates = AudioIntermediates(pathFilename, ('waveform', 'sampleRate'))
+			waveformAndSampleRate = (audioIntermediates.waveform, audioIntermediates.sampleRate)
+		if waveformAndSampleRate[0].shape[0] not in dictionaryChannelLayouts:
+			setFilterNamesNumPy.discard('ebur128')
+		for filterName in setFilterNamesNumPy:
+			dictionaryFilterAspects[filterName] = dictionaryEnginesNumPy[filterName](*waveformAndSampleRate)
+	return dictionaryFilterAspects
+
+def _filterAspectsFFprobe(pathFilename: str | PathLike[Any], setFilterNames: set[str], waveformAndSampleRate: tuple[Audio, int] | None, segmentsFFprobe: int) -> dict[str, dict[str, ArrayChannelData | ArrayOverallData]]:
+	"""I use this function to measure the filters in `setFilterNames` with concurrent FFprobe processes, and to join the statistics of the time segments."""
+	samplesInterleaved: numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float32]] | None = None
+	sampleRateFFprobe: int = 0
+	if waveformAndSampleRate is not None and waveformAndSampleRate[0].shape[0] in dictionaryChannelLayouts:
+		waveform, sampleRateFFprobe = waveformAndSampleRate
+		# A memory-mapped WAV file with 32-bit floating-point samples is already interleaved, so the pipe receives the mapped pages without a copy.
+		samplesInterleaved = numpy.ascontiguousarray(waveform.T, dtype='<f4')
+		lavfiSource: str = f"amovie=pipe\\\\:0:f=f32le:format_opts=sample_rate={sampleRateFFprobe}\\\\:ch_layout={dictionaryChannelLayouts[waveform.shape[0]]}"
+	else:
+		lavfiSource = f"amovie={_lavfiPathFilename(pathFilename)}"
+		if segmentsFFprobe > 1 or not setFilterNames.isdisjoint({'aspectralstats', 'astats', 'astatsFramewise'}):
+			sampleRateFFprobe = _getSampleRate(pathFilename)
+
+	countSamples: int = 0
+	channels: int = 0
+	if segmentsFFprobe > 1:
+		countSamples, channels = (samplesInterleaved.shape[0], samplesInterleaved.shape[1]) if samplesInterleaved is not None else _getCountSamplesAndChannels(pathFilename)
+
+	listJobsFFprobe: list[tuple[list[tuple[list[str], list[str]]], tuple[int, int, int] | None]] = _planJobsFFprobe(setFilterNames, sampleRateFFprobe, countSamples, segmentsFFprobe)
+	listListsFFprobeStructured: list[list[dict[str, Any]]] = _runJobsFFprobe(lavfiSource, listJobsFFprobe, sampleRateFFprobe, samplesInterleaved)
+	return _mergeJobsFFprobe(listJobsFFprobe, listListsFFprobeStructured, sampleRateFFprobe, countSamples, channels)
+
+def _lavfiPathFilename(pathFilename: str | PathLike[Any]) -> str:
+	"""Return `pathFilename` in the form that the `amovie` source of a lavfi filter graph reads."""
+	# The lavfi device passes the filter graph to FFmpeg without the path handling of the command line, and the filter graph reads
+	# `/` as a separator on every system but not always `\`. `PureWindowsPath` accepts both `\` and `/` as separators and knows a
+	# drive, such as 'C:', so `as_posix` writes a path of either system with `/`.
+	pathFilenameWindows = pathlib.PureWindowsPath(pathFilename)
+	# The colon after a drive letter separates the options of `amovie` and the filters of the graph, so it needs two escapes.
+	return pathFilenameWindows.drive.replace(":", "\\\\:") + pathlib.PureWindowsPath(pathFilenameWindows.root, pathFilenameWindows.relative_to(pathFilenameWindows.anchor)).as_posix()
+
+def _planJobsFFprobe(setFilterNames: set[str], sampleRate: int, countSamples: int, segmentsFFprobe: int) -> list[tuple[list[tuple[list[str], list[str]]], tuple[int, int, int] | None]]:
+	"""I use this function to plan one job for each FFprobe process: the filters and the filter chain of each output of the filter graph, and the samples of the time segment, or `None` for the whole file."""
+	listJobsFFprobe: list[tuple[list[tuple[list[str], list[str]]], tuple[int, int, int] | None]] = []
+	setFilterNamesSegmented: set[str] = set()
+	for filterName in ('ebur128', 'aspectralstats'):
+		if filterName in setFilterNames and countSamples:
+			listSegments: list[tuple[int, int, int]] = _segmentsFFprobe(countSamples, segmentsFFprobe, *_samplesAlignmentAndOverlap(filterName, sampleRate))
+			if len(listSegments) > 1:
+				setFilterNamesSegmented.add(filterName)
+				# `aspectralstats` without `asetnsamples` reports each hop, and `_joinSegmentsAspectralstats` picks the hop of each frame of 100 ms.
+				listJobsFFprobe.extend(([([filterName], [dictionaryFiltersFFmpeg[filterName]])], segment) for segment in listSegments)
+	setFilterNamesWhole: set[str] = setFilterNames.difference(setFilterNamesSegmented)
+	if 'ebur128' in setFilterNamesWhole:
+		listJobsFFprobe.append(([(['ebur128'], [dictionaryFiltersFFmpeg['ebur128']])], None))
+	listBranches: list[tuple[list[str], list[str]]] = []
+	if not setFilterNamesWhole.isdisjoint({'aspectralstats', 'astats'}):
+		filterChain: list[str] = []
+		if 'aspectralstats' in setFilterNamesWhole:
+			filterChain += [dictionaryFiltersFFmpeg['aspectralstats']]
+		else:
+			# `aspectralstats` converts the samples to planar 32-bit floating point and hops 1024 samples, and `astats` reports different statistics for different frames.
+			filterChain += ["aformat=sample_fmts=fltp", "asetnsamples=n=1024:p=0"]
+		if 'astats' in setFilterNamesWhole:
+			filterChain += [dictionaryFiltersFFmpeg['astats']]
+		# `ebur128` gathers the frames into frames of 100 ms, so each statistic has one value for each 100 ms.
+		filterChain += [f"asetnsamples=n={sampleRate // 10}:p=0"]
+		listBranches.append(([filterName for filterName in ('aspectralstats', 'astats') if filterName in setFilterNamesWhole], filterChain))
+	if 'astatsFramewise' in setFilterNamesWhole:
+		# `reset=1` starts the statistics again at each frame, so each frame of 100 ms has the statistics of only its own samples.
+		listBranches.append((['astatsFramewise'], ["aformat=sample_fmts=fltp", f"asetnsamples=n={sampleRate // 10}:p=0", dictionaryFiltersFFmpeg['astatsFramewise']]))
+	if listBranches:
+		# One process decodes the samples once for both instances of `astats`.
+		listJobsFFprobe.append((listBranches, None))
+	return listJobsFFprobe
+
+def _runJobsFFprobe(lavfiSource: str, listJobsFFprobe: list[tuple[list[tuple[list[str], list[str]]], tuple[int, int, int] | None]], sampleRate: int, samplesInterleaved: numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float32]] | None) -> list[list[dict[str, Any]]]:
+	"""I use this function to start one FFprobe process for each job at the same time, and to return the structured output of each process."""
+	listSystemProcesses: list[subprocess.Popen[bytes]] = []
+	for listBranchesJob, segment in listJobsFFprobe:
+		lavfiSourceJob: str = lavfiSource
+		if segment is not None and samplesInterleaved is None:
+			sampleFirst, _sampleStart, sampleStop = segment
+			# FFmpeg seeks to a frame of the file before the seek point, and `atrim` keeps exactly the samples of the segment.
+			if sampleFirst > sampleRate:
+				lavfiSourceJob += f":sp={sampleFirst / sampleRate - 1}"
+			lavfiSourceJob += f",asettb=1/sr,atrim=start_pts={sampleFirst}:end_pts={sampleStop}"
+		# With more than one output, the `stream_index` of each frame tells which instance of a filter wrote its metadata.
+		entriesFFprobe: list[str] = ["frame_tags"] if len(listBranchesJob) == 1 else ["frame=stream_index", "frame_tags"]
+		commandLineFFprobe: list[str] = [
+			"ffprobe"
+			, "-hide_banner"
+			, "-f"
+			, "lavfi"
+			, _graphFilters(lavfiSourceJob, [filterChain for _listFilterNames, filterChain in listBranchesJob])
+			, "-show_entries"
+			, ':'.join(entriesFFprobe)
+			, "-output_format"
+			, "json=compact=1"
+		]
+		# `framelog=verbose` writes a line for each frame to stderr: a full stderr pipe would stop the process.
+		listSystemProcesses.append(subprocess.Popen(commandLineFFprobe
+			, stdin=subprocess.DEVNULL if samplesInterleaved is None else subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL))
+
+	# Each process has its own thread that parses its output while FFprobe writes it, so a full stdout pipe never stops a process.
+	# Likewise, each process has its own thread that writes the samples, so a full stdin pipe never stops the other processes.
+	with ThreadPoolExecutor(2 * len(listSystemProcesses)) as concurrencyManager:
+		if samplesInterleaved is not None:
+			for (_listBranches, segment), systemProcessFFprobe in zip(listJobsFFprobe, listSystemProcesses, strict=True):
+				concurrencyManager.submit(_writeSamples, systemProcessFFprobe, samplesInterleaved if segment is None else samplesInterleaved[segment[0]:segment[2]])
+		return list(concurrencyManager.map(_pythonizeSystemProcess, listSystemProcesses))
+
+def _mergeJobsFFprobe(listJobsFFprobe: list[tuple[list[tuple[list[str], list[str]]], tuple[int, int, int] | None]], listListsFFprobeStructured: list[list[dict[str, Any]]], sampleRate: int, countSamples: int, channels: int) -> dict[str, dict[str, ArrayChannelData | ArrayOverallData]]:
+	"""I use this function to give each filter of each job the statistics of its output, and to join the statistics of the time segments of each filter."""
+	dictionaryFilterAspects: dict[str, dict[str, ArrayChannelData | ArrayOverallData]] = {}
+	dictionarySegmentsFilter: dict[str, list[tuple[dict[str, Any], tuple[int, int, int]]]] = {}
+	for (listBranchesJob, segment), listFFprobeStructured in zip(listJobsFFprobe, listListsFFprobeStructured, strict=True):
+		for indexBranch, (listFilterNames, _filterChain) in enumerate(listBranchesJob):
+			# An output without frames has no dictionary.
+			FFprobeStructured: dict[str, Any] = listFFprobeStructured[indexBranch] if indexBranch < len(listFFprobeStructured) else {}
+			# No matter how many channels, each `aspectralstats` keyName is `numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float64]]`
+			# where `tuple[int, int]` is (channel, frame). For `r128`, index -1 is the cumulative value for LUFS I, low, and high and
+			# peak; plus, the array has 3 significant digits instead of the summary's 1.
+			for filterName in listFilterNames:
+				if segment is None:
+					dictionaryFilterAspects[filterName] = FFprobeStructured.get(dictionaryFilterRegistrant[filterName], {})
+				else:
+					dictionarySegmentsFilter.setdefault(filterName, []).append((FFprobeStructured.get(dictionaryFilterRegistrant[filterName], {}), segment))
+	if 'ebur128' in dictionarySegmentsFilter:
+		dictionaryFilterAspects['ebur128'] = _joinSegmentsEbur128(dictionarySegmentsFilter['ebur128'], sampleRate, channels)
+	if 'aspectralstats' in dictionarySegmentsFilter:
+		dictionaryFilterAspects['aspectralstats'] = _joinSegmentsAspectralstats(dictionarySegmentsFilter['aspectralstats'], sampleRate, countSamples)
+	return dictionaryFilterAspects
+
+def _aspectralstatsShortTimeFFT(waveform: Audio, sampleRate: int) -> dict[str, ArrayChannelData]:
+	"""I use this function to compute the statistics of `aspectralstats` from the spectrogram that `AudioIntermediates` would compute."""
+	return aspectralstatsSpectrogram(numpy.absolute(stft(waveform, sampleRate=sampleRate)), sampleRate)
+
+def _samplesAlignmentAndOverlap(filterName: str, sampleRate: int) -> tuple[int, int]:
+	"""Return the multiple of samples at which a segment of `filterName` starts, and the samples before the segment that its first frame needs."""
+	samplesPerFrame: int = max(sampleRate // 10, 1)
+	if filterName == 'ebur128':
+		# The short-term block is 3 s, and one more frame lets the K-weighting filter and the true-peak interpolation settle.
+		return samplesPerFrame, (math.ceil(3 * sampleRate / samplesPerFrame) + 1) * samplesPerFrame
+	# Each hop of `aspectralstats` is the second half of a window of two hops, and the spectral flux compares it with the hop before.
+	return samplesPerHopAspectralstats, 2 * samplesPerHopAspectralstats
+
+def _segmentsFFprobe(countSamples: int, segments: int, samplesAlignment: int, samplesOverlap: int) -> list[tuple[int, int, int]]:
+	"""Return the first sample that FFprobe reads, the first sample, and the stop sample of each time segment."""
+	listStarts: list[int] = sorted({countSamples * indexSegment // segments // samplesAlignment * samplesAlignment for indexSegment in range(segments)})
+	return [(max(sampleStart - samplesOverlap, 0), sampleStart, sampleStop) for sampleStart, sampleStop in zip(listStarts, [*listStarts[1:None], countSamples], strict=True)]
+
+def _joinSegmentsEbur128(listSegments: list[tuple[dict[str, Any], tuple[int, int, int]]], sampleRate: int, channels: int) -> dict[str, ArrayChannelData | ArrayOverallData]:
+	"""Join the frames of `ebur128` of each time segment, and compute the statistics that depend on every earlier frame again."""
+	samplesPerFrame: int = max(sampleRate // 10, 1)
+	listDictionariesKept: list[dict[str, Any]] = []
+	for dictionaryAspects, (sampleFirst, sampleStart, sampleStop) in listSegments:
+		frameStart: int = (sampleStart - sampleFirst) // samplesPerFrame
+		frameStop: int = frameStart + (sampleStop - sampleStart) // samplesPerFrame
+		listDictionariesKept.append({keyName: arrayAspect[..., frameStart:frameStop] for keyName, arrayAspect in dictionaryAspects.items()})
+	if not all(listDictionariesKept):
+		return {}
+	dictionaryJoined: dict[str, ArrayChannelData | ArrayOverallData] = {}
+	for keyName in listDictionariesKept[0]:
+		dictionaryJoined[keyName] = numpy.concatenate([dictionaryAspects[keyName] for dictionaryAspects in listDictionariesKept], axis=-1)
+		if keyName.startswith('true_peak'):
+			dictionaryJoined[keyName] = numpy.maximum.accumulate(dictionaryJoined[keyName], axis=-1)
+	dictionaryJoined.update(gatedStatisticsEBUR128(dictionaryJoined['M'], dictionaryJoined['S'], channels))
+	return dictionaryJoined
+
+def _joinSegmentsAspectralstats(listSegments: list[tuple[dict[str, Any], tuple[int, int, int]]], sampleRate: int, countSamples: int) -> dict[str, ArrayChannelData | ArrayOverallData]:
+	"""Join the hops of `aspectralstats` of each time segment, and pick the hop of each frame of 100 ms, as `asetnsamples` would."""
+	listDictionariesKept: list[dict[str, Any]] = []
+	for dictionaryAspects, (sampleFirst, sampleStart, sampleStop) in listSegments:
+		hopStart: int = (sampleStart - sampleFirst) // samplesPerHopAspectralstats
+		hopStop: int = hopStart + math.ceil((sampleStop - sampleStart) / samplesPerHopAspectralstats)
+		listDictionariesKept.append({keyName: arrayAspect[..., hopStart:hopStop] for keyName, arrayAspect in dictionaryAspects.items()})
+	if not all(listDictionariesKept):
+		return {}
+	samplesPerFrame: int = max(sampleRate // 10, 1)
+	# `asetnsamples` gives each frame of 100 ms the metadata of the hop that holds its first sample.
+	hopsFrame = numpy.arange(math.ceil(countSamples / samplesPerFrame)) * samplesPerFrame // samplesPerHopAspectralstats
+	return {keyName: numpy.concatenate([dictionaryAspects[keyName] for dictionaryAspects in listDictionariesKept], axis=-1)[..., hopsFrame]
+		for keyName in listDictionariesKept[0]}
+
+def _graphFilters(lavfiSource: str, listFilterChains: list[list[str]]) -> str:
+	"""Return the filter graph that reads `lavfiSource` once and sends the samples through each filter chain to its own output."""
+	if len(listFilterChains) == 1:
+		return f"{lavfiSource},{','.join(listFilterChains[0])}"
+	# `asplit` copies the samples to each chain, and the lavfi device names the outputs `out0`, `out1`, and so on.
+	labelsSplit: str = ''.join(f"[split{indexChain}]" for indexChain in range(len(listFilterChains)))
+	return f"{lavfiSource},asplit={len(listFilterChains)}{labelsSplit};" + ';'.join(
+		f"[split{indexChain}]{','.join(filterChain)}[out{indexChain}]" for indexChain, filterChain in enumerate(listFilterChains))
+
+def _pythonizeSystemProcess(systemProcessFFprobe: subprocess.Popen[bytes]) -> list[dict[str, Any]]:
+	with systemProcessFFprobe:
+		return pythonizeFFprobeStreams(systemProcessFFprobe.stdout)  # pyright: ignore[reportArgumentType]
+
+def _writeSamples(systemProcessFFprobe: subprocess.Popen[bytes], samplesInterleaved: numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float32]]) -> None:
+	try:
+		systemProcessFFprobe.stdin.write(memoryview(samplesInterleaved).cast('B'))  # pyright: ignore[reportOptionalMemberAccess]
+		systemProcessFFprobe.stdin.close()  # pyright: ignore[reportOptionalMemberAccess]
+	except BrokenPipeError:
+		# FFprobe stopped before it read every sample; `_pythonizeSystemProcess` reads whatever FFprobe wrote.
+		pass
+
+def _getCountSamplesAndChannels(pathFilename: str | PathLike[Any]) -> tuple[int, int]:
+	"""Return the number of samples in each channel and the number of channels, or zeros if `soundfile` cannot read `pathFilename`."""
+	try:
+		infoSoundfile = soundfile.info(pathFilename)
+	except (OSError, RuntimeError):
+		return 0, 0
+	return infoSoundfile.frames, infoSoundfile.channels
+
+def _getSampleRate(pathFilename: str | PathLike[Any]) -> int:
+	try:
+		return soundfile.info(pathFilename).samplerate
+	except (OSError, RuntimeError):
+		commandLineFFprobe: list[str] = ["ffprobe", "-hide_banner", "-v", "error", "-select_streams", "a:0", "-show_entries", "stream=sample_rate", "-output_format", "csv=p=0", str(pathFilename)]
+		return int(subprocess.run(commandLineFFprobe, capture_output=True, check=True).stdout)
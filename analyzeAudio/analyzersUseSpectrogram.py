@@ -1,16 +1,21 @@
 # ruff: noqa: D100
 from __future__ import annotations
 
-from analyzeAudio.registry import registrationAudioAspect
+from analyzeAudio._filterbanks import filterbankChroma, resolutionTuning
+from analyzeAudio._spectralFeatures import spectralFeaturesShared
+from analyzeAudio._summaryStatistics import SummaryStatistics
+from analyzeAudio.registry import registrationAudioAspect, registrationAudioAspectStreaming, registrationAudioAspectSummary
 from numpy import log10
 from typing import TYPE_CHECKING
 import librosa
+import numpy
 import sys
 import warnings
 
 if TYPE_CHECKING:
 	from analyzeAudio import ArrayAspect, ArrayAspectSpectrogramFramewise, SpectrogramMagnitude, SpectrogramPower
 	from numpy import dtype, float32, ndarray
+	from analyzeAudio._spectralFeatures import SpectralFeatures
 	from typing import Any
 
 def analyzeChromagram(spectrogramPower: SpectrogramPower, sampleRate: int, **keywordArguments: Any) -> ndarray[tuple[int, int, int], dtype[float32]]:
@@ -29,7 +34,9 @@ def analyzeChromagram(spectrogramPower: SpectrogramPower, sampleRate: int, **key
 	sampleRate : int
 		Sampling rate of the analyzed signal in hertz.
 	keywordArguments : Any
-		Additional keyword arguments forwarded to ``librosa.feature.chroma_stft``.
+		Additional keyword arguments of ``librosa.feature.chroma_stft``. The chroma filterbank comes
+		from `filterbankChroma` [3], which every call with the same parameters shares. If you do not
+		pass `tuning`, the estimated tuning is a multiple of `resolutionTuning`, 0.01 of a chroma bin.
 
 	Returns
 	-------
@@ -57,10 +64,25 @@ def analyzeChromagram(spectrogramPower: SpectrogramPower, sampleRate: int, **key
 	[2] Lee, K., & Slaney, M. (2006). Automatic chord recognition from audio
 		using a HMM with supervised learning. Proceedings of the International Society for Music
 		Information Retrieval, 133–137. https://ccrma.stanford.edu/~kglee/pubs/klee-ismir06.pdf
+	[3] `analyzeAudio._filterbanks.filterbankChroma`
 	"""
+	# `librosa.feature.chroma_stft` with `S`, but the chroma filterbank comes from the cache of the process.
+	dictionaryParameters: dict[str, Any] = {parameterName: argument for parameterName, argument in keywordArguments.items()
+		if parameterName not in {'center', 'hop_length', 'pad_mode', 'win_length', 'window'}}
+	normChromagram: float | None = dictionaryParameters.pop('norm', numpy.inf)
+	tuning: float | None = dictionaryParameters.pop('tuning', None)
+	countChroma: int = dictionaryParameters.pop('n_chroma', 12)
+	lengthFFT: int = dictionaryParameters.pop('n_fft', 2048)
+	if lengthFFT // 2 + 1 != spectrogramPower.shape[-2]:
+		lengthFFT = 2 * (spectrogramPower.shape[-2] - 1)
 	with warnings.catch_warnings(record=True) as warningMessages:
 		warnings.simplefilter('always', UserWarning)
-		chromagram = librosa.feature.chroma_stft(S=spectrogramPower, sr=sampleRate, **keywordArguments)
+		if tuning is None:
+			# `librosa.estimate_tuning` returns an edge of its histogram of `resolutionTuning`, and rounding away the floating-point error of the edge
+			# leaves at most `1 / resolutionTuning + 1` estimated tunings, so the files of a batch share their chroma filterbanks.
+			tuning = round(float(librosa.estimate_tuning(S=spectrogramPower, sr=sampleRate, bins_per_octave=countChroma, resolution=resolutionTuning)) / resolutionTuning) * resolutionTuning
+		filterbank = filterbankChroma(sr=sampleRate, n_fft=lengthFFT, n_chroma=countChroma, tuning=tuning, **dictionaryParameters)
+		chromagram = librosa.util.normalize(numpy.einsum('cf,...ft->...ct', filterbank, spectrogramPower, optimize=True), norm=normChromagram, axis=-2)
 
 	for warningMessage in warningMessages:
 		if str(warningMessage.message) == 'Trying to estimate tuning from empty frequency set.':
@@ -86,6 +108,8 @@ def analyzeChromagramMean(spectrogramPower: SpectrogramPower, sampleRate: int, *
 	"""
 	return float(analyzeChromagram(spectrogramPower, sampleRate, **keywordArguments).mean().item())
 
+@registrationAudioAspectSummary('RMS Spectrogram')
+@registrationAudioAspectStreaming('RMS Spectrogram mean')
 def analyzeRMSSpectrogram(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
 	"""Compute framewise root-mean-square magnitude from a spectrogram.
 
@@ -108,9 +132,10 @@ def analyzeRMSSpectrogram(spectrogramMagnitude: SpectrogramMagnitude, **keywordA
 		Framewise root-mean-square magnitude.
 
 	"""
+	if (spectralFeature := _spectralFeatureShared(spectrogramMagnitude, 'rootMeanSquare', keywordArguments)) is not None:
+		return spectralFeature
 	return librosa.feature.rms(S=spectrogramMagnitude, **keywordArguments)
 
-@registrationAudioAspect('RMS Spectrogram mean')
 def analyzeRMSSpectrogramMean(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> float:
 	"""Aspect 'RMS Spectrogram mean': mean framewise RMS magnitude.
 
@@ -120,8 +145,10 @@ def analyzeRMSSpectrogramMean(spectrogramMagnitude: SpectrogramMagnitude, **keyw
 		Arithmetic mean of the framewise RMS magnitude.
 
 	"""
-	return float(analyzeRMSSpectrogram(spectrogramMagnitude, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeRMSSpectrogram(spectrogramMagnitude, **keywordArguments)).mean
 
+@registrationAudioAspectSummary('RMS Spectrogram dB')
+@registrationAudioAspectStreaming('RMS Spectrogram dB mean')
 def analyzeRMSSpectrogram_dB(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
 	"""Compute framewise RMS spectrogram magnitude in decibels.
 
@@ -144,10 +171,11 @@ def analyzeRMSSpectrogram_dB(spectrogramMagnitude: SpectrogramMagnitude, **keywo
 		Framewise RMS spectrogram magnitude in decibels.
 
 	"""
+	if (spectralFeature := _spectralFeatureShared(spectrogramMagnitude, 'rootMeanSquare_dB', keywordArguments)) is not None:
+		return spectralFeature
 	rootMeanSquare: ArrayAspectSpectrogramFramewise = analyzeRMSSpectrogram(spectrogramMagnitude, **keywordArguments)
 	return 20 * log10(rootMeanSquare, where=(rootMeanSquare != 0), out=None)
 
-@registrationAudioAspect('RMS Spectrogram dB mean')
 def analyzeRMSSpectrogram_dBMean(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> float:
 	"""Aspect 'RMS Spectrogram dB mean': mean framewise RMS spectrogram magnitude in decibels.
 
@@ -157,8 +185,10 @@ def analyzeRMSSpectrogram_dBMean(spectrogramMagnitude: SpectrogramMagnitude, **k
 		Mean value of the time-varying RMS spectrogram magnitude in decibels.
 
 	"""
-	return float(analyzeRMSSpectrogram_dB(spectrogramMagnitude, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeRMSSpectrogram_dB(spectrogramMagnitude, **keywordArguments)).mean
 
+@registrationAudioAspectSummary('Spectral Bandwidth')
+@registrationAudioAspectStreaming('Spectral Bandwidth mean')
 def analyzeSpectralBandwidth(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
 	"""Compute spectral spread around the framewise centroid.
 
@@ -203,10 +233,11 @@ def analyzeSpectralBandwidth(spectrogramMagnitude: SpectrogramMagnitude, **keywo
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
+	if (spectralFeature := _spectralFeatureShared(spectrogramMagnitude, 'spectralBandwidth', keywordArguments)) is not None:
+		return spectralFeature
 	centroid: ArrayAspectSpectrogramFramewise = analyzeSpectralCentroid(spectrogramMagnitude, **keywordArguments)
 	return librosa.feature.spectral_bandwidth(S=spectrogramMagnitude, centroid=centroid, **keywordArguments)
 
-@registrationAudioAspect('Spectral Bandwidth mean')
 def analyzeSpectralBandwidthMean(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> float:
 	"""Aspect 'Spectral Bandwidth mean': mean of the framewise spectral bandwidth.
 
@@ -216,8 +247,10 @@ def analyzeSpectralBandwidthMean(spectrogramMagnitude: SpectrogramMagnitude, **k
 		Mean value of the time-varying spectral bandwidth.
 
 	"""
-	return float(analyzeSpectralBandwidth(spectrogramMagnitude, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeSpectralBandwidth(spectrogramMagnitude, **keywordArguments)).mean
 
+@registrationAudioAspectSummary('Spectral Centroid')
+@registrationAudioAspectStreaming('Spectral Centroid mean')
 def analyzeSpectralCentroid(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
 	"""Compute the frequency center of mass of each analysis frame.
 
@@ -263,9 +296,10 @@ def analyzeSpectralCentroid(spectrogramMagnitude: SpectrogramMagnitude, **keywor
 		Acoustical Society of America, 130(5), 2902–2916.
 		https://www.mcgill.ca/mpcl/files/mpcl/peeters_2011_jasa.pdf
 	"""
+	if (spectralFeature := _spectralFeatureShared(spectrogramMagnitude, 'spectralCentroid', keywordArguments)) is not None:
+		return spectralFeature
 	return librosa.feature.spectral_centroid(S=spectrogramMagnitude, **keywordArguments)
 
-@registrationAudioAspect('Spectral Centroid mean')
 def analyzeSpectralCentroidMean(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> float:
 	"""Aspect 'Spectral Centroid mean': mean of the framewise spectral centroid.
 
@@ -275,8 +309,9 @@ def analyzeSpectralCentroidMean(spectrogramMagnitude: SpectrogramMagnitude, **ke
 		Mean value of the time-varying spectral centroid.
 
 	"""
-	return float(analyzeSpectralCentroid(spectrogramMagnitude, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeSpectralCentroid(spectrogramMagnitude, **keywordArguments)).mean
 
+@registrationAudioAspectSummary('Spectral Contrast')
 def analyzeSpectralContrast(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspect:
 	"""Compute octave-band peak-to-valley contrast.
 
@@ -326,9 +361,10 @@ def analyzeSpectralContrast(spectrogramMagnitude: SpectrogramMagnitude, **keywor
 		Conference on Multimedia and Expo, 113–116.
 		https://hcsi.cs.tsinghua.edu.cn/Paper/Paper02/200218.pdf
 	"""
+	if (spectralFeature := _spectralFeatureShared(spectrogramMagnitude, 'spectralContrast', keywordArguments)) is not None:
+		return spectralFeature
 	return librosa.feature.spectral_contrast(S=spectrogramMagnitude, **keywordArguments)
 
-@registrationAudioAspect('Spectral Contrast mean')
 def analyzeSpectralContrastMean(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> float:
 	"""Aspect 'Spectral Contrast mean': mean of the framewise spectral contrast.
 
@@ -338,8 +374,10 @@ def analyzeSpectralContrastMean(spectrogramMagnitude: SpectrogramMagnitude, **ke
 		Mean value of the time-varying spectral contrast.
 
 	"""
-	return float(analyzeSpectralContrast(spectrogramMagnitude, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeSpectralContrast(spectrogramMagnitude, **keywordArguments)).mean
 
+@registrationAudioAspectSummary('Spectral Flatness')
+@registrationAudioAspectStreaming('Spectral Flatness mean')
 def analyzeSpectralFlatness(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
 	"""Compute the spectral flatness ratio for each analysis frame.
 
@@ -383,9 +421,10 @@ def analyzeSpectralFlatness(spectrogramMagnitude: SpectrogramMagnitude, **keywor
 		studying the autocorrelation method of linear prediction of speech analysis. IEEE Transactions
 		on Acoustics, Speech, and Signal Processing, 22(3), 207–217.
 	"""
+	if (spectralFeature := _spectralFeatureShared(spectrogramMagnitude, 'spectralFlatness', keywordArguments)) is not None:
+		return spectralFeature
 	return librosa.feature.spectral_flatness(S=spectrogramMagnitude, **keywordArguments)
 
-@registrationAudioAspect('Spectral Flatness mean')
 def analyzeSpectralFlatnessMean(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> float:
 	"""Aspect 'Spectral Flatness mean': mean of the framewise spectral flatness.
 
@@ -395,8 +434,10 @@ def analyzeSpectralFlatnessMean(spectrogramMagnitude: SpectrogramMagnitude, **ke
 		Mean value of the time-varying spectral flatness ratio.
 
 	"""
-	return float(analyzeSpectralFlatness(spectrogramMagnitude, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeSpectralFlatness(spectrogramMagnitude, **keywordArguments)).mean
 
+@registrationAudioAspectSummary('Spectral Flatness dB')
+@registrationAudioAspectStreaming('Spectral Flatness dB mean')
 def analyzeSpectralFlatness_dB(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
 	"""Compute spectral flatness in decibels.
 
@@ -440,10 +481,11 @@ def analyzeSpectralFlatness_dB(spectrogramMagnitude: SpectrogramMagnitude, **key
 		studying the autocorrelation method of linear prediction of speech analysis. IEEE Transactions
 		on Acoustics, Speech, and Signal Processing, 22(3), 207–217.
 	"""
+	if (spectralFeature := _spectralFeatureShared(spectrogramMagnitude, 'spectralFlatness_dB', keywordArguments)) is not None:
+		return spectralFeature
 	spectralFlatness: ArrayAspectSpectrogramFramewise = analyzeSpectralFlatness(spectrogramMagnitude, **keywordArguments)
 	return 20 * log10(spectralFlatness, where=(spectralFlatness != 0), out=None)
 
-@registrationAudioAspect('Spectral Flatness dB mean')
 def analyzeSpectralFlatness_dBMean(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> float:
 	"""Aspect 'Spectral Flatness dB mean': mean of the framewise spectral flatness in decibels.
 
@@ -453,4 +495,11 @@ def analyzeSpectralFlatness_dBMean(spectrogramMagnitude: SpectrogramMagnitude, *
 		Mean value of the time-varying spectral flatness in decibels.
 
 	"""
-	return float(analyzeSpectralFlatness_dB(spectrogramMagnitude, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeSpectralFlatness_dB(spectrogramMagnitude, **keywordArguments)).mean
+
+def _spectralFeatureShared(spectrogramMagnitude: SpectrogramMagnitude, featureName: str, keywordArguments: dict[str, Any]) -> ArrayAspect | None:
+	"""I use this function to read a feature from the `SpectralFeatures` that the aspects of one spectrogram share, or to return `None` so that the analyzer computes the feature."""
+	spectralFeatures: SpectralFeatures | None = spectralFeaturesShared(spectrogramMagnitude, **keywordArguments)
+	if spectralFeatures is None:
+		return None
+	return getattr(spectralFeatures, featureName)
@@ -1,7 +1,10 @@
 """Analyzers that use the waveform of audio data."""
 from __future__ import annotations
 
-from analyzeAudio.registry import registrationAudioAspect
+from analyzeAudio import LinearDecibels
+from analyzeAudio._summaryStatistics import dictionaryStatistics, SummaryStatistics
+from analyzeAudio.registry import (
+	registrationAudioAspect, registrationAudioAspectOutputs, registrationAudioAspectStreaming, registrationAudioAspectSummary)
 from typing import TYPE_CHECKING
 import librosa
 import numpy
@@ -56,9 +59,8 @@ def analyzeRMSWaveform(waveform: Audio, **keywordArguments: Any) -> ArrayAspectW
 	"""
 	return librosa.feature.rms(y=waveform, **keywordArguments)
 
-@registrationAudioAspect('RMS Waveform mean')
 def analyzeRMSWaveformMean(waveform: Audio, **keywordArguments: Any) -> float:
-	"""Aspect 'RMS Waveform mean': mean framewise RMS level in decibels.
+	"""Aspect 'RMS Waveform mean': mean framewise RMS amplitude.
 
 	Returns
 	-------
@@ -66,7 +68,26 @@ def analyzeRMSWaveformMean(waveform: Audio, **keywordArguments: Any) -> float:
 		Arithmetic mean of the framewise RMS amplitude.
 
 	"""
-	return float(analyzeRMSWaveform(waveform, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeRMSWaveform(waveform, **keywordArguments)).mean
+
+@registrationAudioAspectStreaming('RMS Waveform mean')
+def analyzeRMSWaveformBlock(waveformPaddedConstant: Audio) -> ArrayAspectWaveformFramewise:
+	"""Compute framewise root-mean-square amplitude of one block of frames.
+
+	Parameters
+	----------
+	waveformPaddedConstant : Audio
+		Samples of the frames in one block. The samples come from the waveform after it was padded on
+		both sides with `frame_length // 2` zeros, which is how `librosa.feature.rms` pads a centered
+		waveform.
+
+	Returns
+	-------
+	rootMeanSquare : ArrayAspectWaveformFramewise
+		Framewise root-mean-square amplitude of the frames in the block.
+
+	"""
+	return analyzeRMSWaveform(waveformPaddedConstant, center=False)
 
 def analyzeRMSWaveform_dB(waveform: Audio, **keywordArguments: Any) -> ArrayAspectWaveformFramewise:
 	"""Compute framewise RMS level in decibels.
@@ -105,7 +126,6 @@ def analyzeRMSWaveform_dB(waveform: Audio, **keywordArguments: Any) -> ArrayAspe
 	arrayRMS: ArrayAspectWaveformFramewise = analyzeRMSWaveform(waveform, **keywordArguments)
 	return 20 * numpy.log10(arrayRMS, where=(arrayRMS != 0), out=None)
 
-@registrationAudioAspect('RMS Waveform dB mean')
 def analyzeRMSWaveform_dBMean(waveform: Audio, **keywordArguments: Any) -> float:
 	"""Aspect 'RMS Waveform dB mean': mean framewise RMS level in decibels.
 
@@ -115,7 +135,40 @@ def analyzeRMSWaveform_dBMean(waveform: Audio, **keywordArguments: Any) -> float
 		Mean value of the time-varying RMS level in decibels.
 
 	"""
-	return float(analyzeRMSWaveform_dB(waveform, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeRMSWaveform_dB(waveform, **keywordArguments)).mean
+
+@registrationAudioAspectOutputs({f'RMS Waveform {statistic}': f'linear.{attributeName}' for statistic, attributeName in dictionaryStatistics.items()}
+	| {f'RMS Waveform dB {statistic}': f'decibels.{attributeName}' for statistic, attributeName in dictionaryStatistics.items()})
+def analyzeRMSWaveformSummaries(waveform: Audio, **keywordArguments: Any) -> LinearDecibels:
+	"""Aspects 'RMS Waveform' and 'RMS Waveform dB' with each summary statistic from one computation of the framewise RMS amplitude.
+
+	Returns
+	-------
+	rootMeanSquareSummaries : LinearDecibels
+		`linear` summarizes the value of `analyzeRMSWaveform`, and `decibels` summarizes the value of
+		`analyzeRMSWaveform_dB`, such as 'RMS Waveform median' and 'RMS Waveform dB mean'.
+
+	"""
+	arrayRMS: ArrayAspectWaveformFramewise = analyzeRMSWaveform(waveform, **keywordArguments)
+	arrayRMS_dB: ArrayAspectWaveformFramewise = 20 * numpy.log10(arrayRMS, where=(arrayRMS != 0), out=None)
+	return LinearDecibels(linear=SummaryStatistics(arrayRMS), decibels=SummaryStatistics(arrayRMS_dB))
+
+@registrationAudioAspectStreaming('RMS Waveform dB mean')
+def analyzeRMSWaveform_dBBlock(waveformPaddedConstant: Audio) -> ArrayAspectWaveformFramewise:
+	"""Compute framewise RMS level in decibels of one block of frames.
+
+	Parameters
+	----------
+	waveformPaddedConstant : Audio
+		Samples of the frames in one block, as described in `analyzeRMSWaveformBlock`.
+
+	Returns
+	-------
+	rootMeanSquare_dB : ArrayAspectWaveformFramewise
+		Framewise RMS level in decibels (dB) of the frames in the block.
+
+	"""
+	return analyzeRMSWaveform_dB(waveformPaddedConstant, center=False)
 
 def analyzeTempogram(waveform: Audio, sampleRate: int, **keywordArguments: Any) -> ArrayAspect:
 	"""Compute a local autocorrelation tempogram from the waveform.
@@ -262,6 +315,7 @@ def analyzeZeroCrossings(waveform: Audio, **keywordArguments: Any) -> ArrayAspec
 def analyzeZeroCrossingsTotal(waveform: Audio, **keywordArguments: Any) -> float:  # noqa: D103
 	return float(analyzeZeroCrossings(waveform, **keywordArguments).sum(axis=-1).mean().item())
 
+@registrationAudioAspectSummary('Zero Crossing Rate')
 def analyzeZeroCrossingRate(waveform: Audio, **keywordArguments: Any) -> ArrayAspectWaveformFramewise:
 	"""Compute the zero-crossing rate of the waveform.
 
@@ -307,7 +361,6 @@ def analyzeZeroCrossingRate(waveform: Audio, **keywordArguments: Any) -> ArrayAs
 	"""
 	return librosa.feature.zero_crossing_rate(y=waveform, **keywordArguments)
 
-@registrationAudioAspect('Zero Crossing Rate mean')
 def analyzeZeroCrossingRateMean(waveform: Audio, **keywordArguments: Any) -> float:
 	"""Aspect 'Zero Crossing Rate mean': mean framewise zero-crossing rate.
 
@@ -317,4 +370,23 @@ def analyzeZeroCrossingRateMean(waveform: Audio, **keywordArguments: Any) -> flo
 		Mean value of the framewise zero-crossing rate.
 
 	"""
-	return float(analyzeZeroCrossingRate(waveform, **keywordArguments).mean().item())
+	return SummaryStatistics(analyzeZeroCrossingRate(waveform, **keywordArguments)).mean
+
+@registrationAudioAspectStreaming('Zero Crossing Rate mean')
+def analyzeZeroCrossingRateBlock(waveformPaddedEdge: Audio) -> ArrayAspectWaveformFramewise:
+	"""Compute the zero-crossing rate of one block of frames.
+
+	Parameters
+	----------
+	waveformPaddedEdge : Audio
+		Samples of the frames in one block. The samples come from the waveform after it was padded on
+		both sides with `frame_length // 2` copies of the edge samples, which is how
+		`librosa.feature.zero_crossing_rate` pads a centered waveform.
+
+	Returns
+	-------
+	zeroCrossingRate : ArrayAspectWaveformFramewise
+		Framewise zero-crossing rate of the frames in the block.
+
+	"""
+	return analyzeZeroCrossingRate(waveformPaddedEdge, center=False)
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from analyzeAudio import BleedFull, BleedFullArray, ParametersMelSpectrogram
-from analyzeAudio.registry import registrationAudioContest
+from analyzeAudio._filterbanks import filterbankMel
+from analyzeAudio.registry import registrationAudioContestOutputs
 from typing import TYPE_CHECKING
 from typing_extensions import Unpack
 import librosa
@@ -121,10 +122,16 @@ def analyzeBleedFullMelDB(
 
 	top_db: float | None = keywordArguments.get('top_db', 80.0)
 
+	# `librosa.feature.melspectrogram` with `S`, but the mel filterbank comes from the cache of the process.
+	lengthFFT: int = parametersMelSpectrogram['n_fft']
+	if lengthFFT // 2 + 1 != spectrogramMagnitudeAlfa.shape[-2]:
+		lengthFFT = 2 * (spectrogramMagnitudeAlfa.shape[-2] - 1)
 	with warnings.catch_warnings(record=True) as warningMessages:
 		warnings.simplefilter('always', UserWarning)
-		spectrogramMagnitudeAlfa = librosa.feature.melspectrogram(S=spectrogramMagnitudeAlfa, **parametersMelSpectrogram)
-		spectrogramMagnitudeBeta = librosa.feature.melspectrogram(S=spectrogramMagnitudeBeta, **parametersMelSpectrogram)
+		filterbank = filterbankMel(sr=parametersMelSpectrogram['sr'], n_fft=lengthFFT, n_mels=parametersMelSpectrogram['n_mels'], fmin=parametersMelSpectrogram['fmin']
+			, fmax=parametersMelSpectrogram['fmax'], htk=parametersMelSpectrogram['htk'], norm=parametersMelSpectrogram['norm'], dtype=parametersMelSpectrogram['dtype'])
+	spectrogramMagnitudeAlfa = numpy.einsum('...ft,mf->...mt', spectrogramMagnitudeAlfa, filterbank, optimize=True)
+	spectrogramMagnitudeBeta = numpy.einsum('...ft,mf->...mt', spectrogramMagnitudeBeta, filterbank, optimize=True)
 	for warningMessage in warningMessages:
 		if str(warningMessage.message).startswith('Empty filters detected in mel frequency basis.'):
 			message: str = (
@@ -143,6 +150,7 @@ def _bleedFullArrays(spectrogramAlfa: SpectrogramMagnitude, spectrogramBeta: Spe
 
 	return BleedFullArray(arrayBleed=arrayDifferences[0 < arrayDifferences], arrayFull=arrayDifferences[arrayDifferences < 0])
 
+@registrationAudioContestOutputs({'Bleedless Mel-scaled dB mean': 'bleed', 'Fullness Mel-scaled dB mean': 'full'})
 def analyzeBleedFullMelDBMean(
 		spectrogramMagnitudeAlfa: SpectrogramMagnitude
 		, spectrogramMagnitudeBeta: SpectrogramMagnitude
@@ -218,7 +226,6 @@ def analyzeBleedFullMelDBMean(
 
 	return BleedFull(bleed=bleed, full=full)
 
-@registrationAudioContest('Bleedless Mel-scaled dB mean')
 def analyzeBleedlessMelDBMean(
 		spectrogramMagnitudeAlfa: SpectrogramMagnitude
 		, spectrogramMagnitudeBeta: SpectrogramMagnitude
@@ -226,7 +233,6 @@ def analyzeBleedlessMelDBMean(
 ) -> float:
 	return analyzeBleedFullMelDBMean(spectrogramMagnitudeAlfa, spectrogramMagnitudeBeta, **keywordArguments).bleed
 
-@registrationAudioContest('Fullness Mel-scaled dB mean')
 def analyzeFullnessMelDBMean(
 		spectrogramMagnitudeAlfa: SpectrogramMagnitude
 		, spectrogramMagnitudeBeta: SpectrogramMagnitude
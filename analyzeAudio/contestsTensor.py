@@ -2,8 +2,10 @@
 # ruff: noqa: D100 DOC201
 from __future__ import annotations
 
-from analyzeAudio.analyzersUseSpectrogram import analyzeChromagram
+from analyzeAudio._cacheSTFT import stftShared
+from analyzeAudio._filterbanks import filterbankChroma, filterbankMel, filterbanksLimit
 from analyzeAudio.registry import registrationAudioContest
+from functools import lru_cache, partial
 from torch import tensor
 from torchaudio.functional import resample  # pyright: ignore[reportMissingTypeStubs]
 from torchmetrics.functional.audio import (
@@ -12,12 +14,14 @@ from torchmetrics.functional.audio import (
 	source_aggregated_signal_distortion_ratio)
 from typing import cast, TYPE_CHECKING
 import auraloss
+import librosa
 import numpy
+import torch
 import torch_l1_snr
 import torch_log_wmse
 
 if TYPE_CHECKING:
-	from analyzeAudio import AuralossChromaSTFTLoss, SpectrogramPower
+	from analyzeAudio import AuralossChromaSTFTLoss
 	from collections.abc import Callable
 	from torch import nn, Tensor
 	from typing import Any
@@ -598,7 +602,26 @@ def analyzePermutationInvariantTrainingMean(
 
 # ======== Analyze Loss ===============================================================================
 
+def _stftAuraloss(aspect: auraloss.freq.STFTLoss, tensorAudio: Tensor) -> tuple[Tensor, Tensor]:
+	# The magnitude and the phase of `auraloss.freq.STFTLoss.stft`, from the STFT that the request shares.
+	spectrogram: Tensor = stftShared(tensorAudio, aspect.fft_size, aspect.hop_size, aspect.win_length, aspect.window)
+	return torch.sqrt(torch.clamp((spectrogram.real ** 2) + (spectrogram.imag ** 2), min=aspect.eps)), torch.angle(spectrogram)
+
+@lru_cache(maxsize=filterbanksLimit)
+def _tuningIdentity(sampleRate: int, lengthFFT: int, countChroma: int) -> float:
+	"""I use this function to estimate the tuning of the identity matrix once for each resolution.
+
+	`analyzeChromagram` of the identity matrix is the chroma filterbank at the tuning that `librosa`
+	estimates from the identity matrix, so the chroma basis of `analyzeChromaSTFTLoss` needs only this
+	tuning and `filterbankChroma`.
+	"""
+	arrayIdentityFrequencyPower: numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float32]] = numpy.identity((lengthFFT // 2) + 1, dtype=numpy.float32)
+	return float(librosa.estimate_tuning(S=arrayIdentityFrequencyPower, sr=sampleRate, bins_per_octave=countChroma))
+
 def _analyzeLoss(aspect: nn.Module, tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor) -> Tensor:
+	for module in aspect.modules():
+		if isinstance(module, auraloss.freq.STFTLoss):
+			module.stft = partial(_stftAuraloss, module)
 	return aspect(*map(_unsqueezeTo3axes, [tensorAudioAlfa, tensorAudioBeta]))
 
 def analyzeDCLoss(tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor, **keywordArguments: Any) -> Tensor:
@@ -944,7 +967,8 @@ def analyzeMelSTFTLoss(tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor, sampleR
 
 	You can use this function to compute the registered `MelSTFTLoss` audio aspect
 	for `tensorAudioAlfa` and `tensorAudioBeta` at `sampleRate` with the upstream
-	`auraloss.freq.MelSTFTLoss` implementation [1].
+	`auraloss.freq.MelSTFTLoss` implementation [1]. The mel filterbank comes from
+	`filterbankMel` [2], which builds it once for each set of parameters.
 
 	Parameters
 	----------
@@ -979,8 +1003,18 @@ def analyzeMelSTFTLoss(tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor, sampleR
 	----------
 	[1] Steinmetz, C. J., Reiss, J. D., & Bryan, N. J. `csteinmetz1/auraloss`.
 		https://github.com/csteinmetz1/auraloss
+	[2] `analyzeAudio._filterbanks.filterbankMel`
 	"""
-	return _analyzeLoss(auraloss.freq.MelSTFTLoss(**{'sample_rate': sampleRate, **keywordArguments}), tensorAudioAlfa, tensorAudioBeta)
+	# `auraloss.freq.MelSTFTLoss`, but the mel filterbank comes from the cache of the process.
+	dictionaryParameters: dict[str, Any] = {'sample_rate': sampleRate, **keywordArguments}
+	integerMelBins: int = int(dictionaryParameters.pop('n_mels', 128))
+	aspect = auraloss.freq.STFTLoss(**dictionaryParameters)
+	aspect.scale = 'mel'
+	aspect.n_bins = integerMelBins
+	aspect.fb = tensor(filterbankMel(sr=aspect.sample_rate, n_fft=aspect.fft_size, n_mels=integerMelBins)).unsqueeze(0)
+	if aspect.device is not None:
+		aspect.fb = aspect.fb.to(aspect.device)
+	return _analyzeLoss(aspect, tensorAudioAlfa, tensorAudioBeta)
 
 @registrationAudioContest('analyzeMelSTFTLoss mean')
 def analyzeMelSTFTLossMean(tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor, sampleRate: int, **keywordArguments: Any) -> float:
@@ -995,7 +1029,9 @@ def analyzeChromaSTFTLoss(tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor, samp
 	You can use this function to compute the registered `ChromaSTFTLoss` audio
 	aspect for `tensorAudioAlfa` and `tensorAudioBeta` at `sampleRate`. This
 	function configures `auraloss.freq.STFTLoss` to `scale='chroma'` and replaces
-	the frequency basis with a chromagram transform from `analyzeChromagram` [1, 2].
+	the frequency basis with a chromagram transform from `analyzeChromagram` [1, 2]. The
+	transform of the identity matrix is a chroma filterbank, so the function reads it from
+	`filterbankChroma` [3], which builds it once for each resolution.
 
 	Parameters
 	----------
@@ -1039,6 +1075,7 @@ def analyzeChromaSTFTLoss(tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor, samp
 	[1] Steinmetz, C. J., Reiss, J. D., & Bryan, N. J. `csteinmetz1/auraloss`.
 		https://github.com/csteinmetz1/auraloss
 	[2] `analyzeChromagram`
+	[3] `analyzeAudio._filterbanks.filterbankChroma`
 	"""
 	dictionaryParameters: dict[str, Any] = {'sample_rate': sampleRate, **keywordArguments}
 	integerChromaBins: int = int(dictionaryParameters.pop('n_chroma', dictionaryParameters.pop('n_bins', 12)))
@@ -1046,13 +1083,9 @@ def analyzeChromaSTFTLoss(tensorAudioAlfa: Tensor, tensorAudioBeta: Tensor, samp
 	aspect = cast('AuralossChromaSTFTLoss', auraloss.freq.STFTLoss(**dictionaryParameters))
 	aspect.scale = 'chroma'
 	aspect.n_bins = integerChromaBins
-	integerFrequencyBins: int = (aspect.fft_size // 2) + 1
-	arrayIdentityFrequencyPower: numpy.ndarray[tuple[int, int], numpy.dtype[numpy.float32]] = numpy.identity(
-		integerFrequencyBins, dtype=numpy.float32
-	)
 	aspect.fb = tensor(
-		analyzeChromagram(
-			cast('SpectrogramPower', arrayIdentityFrequencyPower), sampleRate, n_fft=aspect.fft_size, n_chroma=integerChromaBins, norm=None
+		filterbankChroma(
+			sr=sampleRate, n_fft=aspect.fft_size, n_chroma=integerChromaBins, tuning=_tuningIdentity(sampleRate, aspect.fft_size, integerChromaBins)
 		),
 		dtype=aspect.window.dtype,
 	).unsqueeze(0)
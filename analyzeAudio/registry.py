@@ -11,24 +11,40 @@ Contents
 Variables
 	audioAspects
 		Store analyzer metadata by registered audio aspect name.
+	audioAspectsStreaming
+		Store block analyzer metadata by registered audio aspect name.
 
 Functions
 	getListAvailableAudioAspects
 		Return the registered audio aspect names in sorted order.
+	getAnalyzerOutput
+		Return the value of one registered name from the result of its analyzer.
 	registrationAudioAspect
 		Register one analyzer function under one audio aspect name.
+	registrationAudioAspectOutputs
+		Register one analyzer function under several audio aspect names, one for each output.
+	registrationAudioAspectStreaming
+		Register one block analyzer function under one audio aspect name.
+	registrationAudioAspectSummary
+		Register one framewise analyzer function under one audio aspect name for each summary statistic.
+	registrationAudioContestOutputs
+		Register one contest analyzer function under several contest names, one for each output.
 """
 
 from __future__ import annotations
 
+from analyzeAudio._summaryStatistics import dictionaryStatistics, SummaryStatistics
+from functools import wraps
 from multiprocessing import set_start_method as multiprocessing_set_start_method
 from typing import TYPE_CHECKING
 import contextlib
 import inspect
+import operator
 
 if TYPE_CHECKING:
 	from analyzeAudio import AnalyzerAudioAspects, 归个, 形
-	from collections.abc import Callable
+	from collections.abc import Callable, Iterable
+	from typing import Any
 
 with contextlib.suppress(RuntimeError):
 	multiprocessing_set_start_method('spawn')
@@ -40,6 +56,15 @@ You can inspect `audioAspects` to retrieve the analyzer function and the ordered
 parameter names for each registered audio aspect.
 """
 
+audioAspectsStreaming: dict[str, AnalyzerAudioAspects] = {}
+"""Store block analyzer metadata by registered audio aspect name.
+
+Each block analyzer returns the framewise values of one block of frames. The aspect value is the
+mean of the framewise values of every block, so you can compute the aspect value without holding
+the whole file in memory. You can inspect `audioAspectsStreaming` to retrieve the block analyzer
+function and the ordered list of parameter names for each registered audio aspect.
+"""
+
 audioContests: dict[str, AnalyzerAudioAspects] = {}
 """Store analyzer metadata by registered audio aspect name.
 
@@ -110,6 +135,198 @@ def registrationAudioAspect(aspectName: str) -> Callable[[Callable[形, 归个]]
 		return registrant
 	return registrar
 
+def registrationAudioAspectOutputs(dictionaryAspectNames: dict[str, str]) -> Callable[[Callable[形, 归个]], Callable[形, 归个]]:
+	"""Register one analyzer function under several audio aspect names, one for each output.
+
+	You can use this function as a decorator factory when one analyzer computes the values of several
+	aspects at once, such as a value and the same value in decibels. The analyzer returns a named
+	tuple, and each aspect name reads one field of the named tuple. A request for any subset of the
+	aspect names calls the analyzer once, and `getAnalyzerOutput` [1] reads the value of each
+	requested aspect name from the one result.
+
+	Parameters
+	----------
+	dictionaryAspectNames : dict[str, str]
+		Map each audio aspect name to the field of the result of the analyzer that holds its value. A
+		dotted field, such as 'linear.median', reads an attribute of a field.
+
+	Returns
+	-------
+	registrar : Callable[[Callable[形, 归个]], Callable[形, 归个]]
+		A decorator that records one analyzer function under each aspect name and then returns the same
+		analyzer function.
+
+	Examples
+	--------
+	```python
+	@registrationAudioAspectOutputs({'RMS Waveform mean': 'linear.mean', 'RMS Waveform dB mean': 'decibels.mean'})
+	def analyzeRMSWaveformSummaries(waveform: Audio, **keywordArguments: Any) -> LinearDecibels:
+	```
+
+	References
+	----------
+	[1] `getAnalyzerOutput`
+
+	"""
+
+	def registrar(registrant: Callable[形, 归个]) -> Callable[形, 归个]:
+		"""I use this nested function to record one analyzer function under each aspect name in the module registry.
+
+		Parameters
+		----------
+		registrant : Callable[形, 归个]
+			The analyzer function to register under the enclosing aspect names.
+
+		Returns
+		-------
+		registrant : Callable[形, 归个]
+			The same analyzer function after the registry entries have been written.
+
+		"""
+		analyzerParameters: list[str] = inspect.getfullargspec(registrant).args
+		for aspectName, analyzerOutput in dictionaryAspectNames.items():
+			audioAspects[aspectName] = {'analyzer': registrant, 'analyzerParameters': analyzerParameters, 'analyzerOutput': analyzerOutput}
+		return registrant
+	return registrar
+
+def registrationAudioAspectStreaming(aspectName: str) -> Callable[[Callable[形, 归个]], Callable[形, 归个]]:
+	"""Register one block analyzer function under one audio aspect name.
+
+	You can use this function as a decorator factory when a framewise analyzer can compute the
+	framewise values of one block of frames at a time. The returned decorator stores the block
+	analyzer function and its ordered parameter names in `audioAspectsStreaming` [1] without changing
+	the analyzer function behavior. `analyzeAudio.analyzeAudioFileStreaming` [2] supplies each block
+	and averages the framewise values of every block.
+
+	Parameters
+	----------
+	aspectName : str
+		The audio aspect name that the returned decorator will use as the registry key. The aspect
+		name should also be registered in `audioAspects` with an analyzer that returns the mean of the
+		same framewise values.
+
+	Returns
+	-------
+	registrar : Callable[[Callable[形, 归个]], Callable[形, 归个]]
+		A decorator that records one block analyzer function and then returns the same function.
+
+	Examples
+	--------
+	The analyzer modules use `registrationAudioAspectStreaming` in declarations such as the following.
+
+	```python
+	@registrationAudioAspectStreaming('Spectral Centroid mean')
+	def analyzeSpectralCentroid(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
+	```
+
+	References
+	----------
+	[1] `audioAspectsStreaming`
+
+	[2] `analyzeAudio.analyze.analyzeAudioFileStreaming`
+
+	"""
+
+	def registrar(registrant: Callable[形, 归个]) -> Callable[形, 归个]:
+		"""I use this nested function to record one block analyzer function in the module registry.
+
+		Parameters
+		----------
+		registrant : Callable[形, 归个]
+			The block analyzer function to register under the enclosing `aspectName`.
+
+		Returns
+		-------
+		registrant : Callable[形, 归个]
+			The same block analyzer function after the registry entry has been written.
+
+		"""
+		audioAspectsStreaming[aspectName] = {'analyzer': registrant, 'analyzerParameters': inspect.getfullargspec(registrant).args}
+		return registrant
+	return registrar
+
+def registrationAudioAspectSummary(featureName: str, listStatistics: Iterable[str] = tuple(dictionaryStatistics)) -> Callable[[Callable[形, 归个]], Callable[形, 归个]]:
+	"""Register one framewise analyzer function under one audio aspect name for each summary statistic.
+
+	You can use this function as a decorator factory when an analyzer returns framewise values, such
+	as the spectral centroid of each frame. For each statistic in `listStatistics`, the returned
+	decorator registers the aspect name f'{featureName} {statistic}', such as 'Spectral Centroid
+	median', in `audioAspects` [1]. Every aspect name of the feature has the same analyzer, which calls
+	the framewise analyzer and returns a `SummaryStatistics` [2], so a request for any subset of the
+	statistics calls the framewise analyzer once and computes only the requested statistics.
+
+	Parameters
+	----------
+	featureName : str
+		The name of the framewise feature, which is the start of each aspect name.
+	listStatistics : Iterable[str] = tuple(dictionaryStatistics)
+		The statistics to register, from the keys of `dictionaryStatistics` [3]: 'mean', 'median',
+		'standard deviation', 'minimum', 'maximum', '5th percentile', and '95th percentile'.
+
+	Returns
+	-------
+	registrar : Callable[[Callable[形, 归个]], Callable[形, 归个]]
+		A decorator that records one summary analyzer under each aspect name and then returns the same
+		framewise analyzer function.
+
+	Raises
+	------
+	ValueError
+		If a statistic of `listStatistics` is not a key of `dictionaryStatistics`.
+
+	Registration
+	------------
+	If an aspect name already exists in the registry, the later registration replaces the earlier
+	registry entry. If another analyzer already computes a statistic of the feature, leave the
+	statistic out of `listStatistics`.
+
+	Examples
+	--------
+	```python
+	@registrationAudioAspectSummary('Spectral Centroid')
+	def analyzeSpectralCentroid(spectrogramMagnitude: SpectrogramMagnitude, **keywordArguments: Any) -> ArrayAspectSpectrogramFramewise:
+	```
+
+	References
+	----------
+	[1] `audioAspects`
+
+	[2] `analyzeAudio._summaryStatistics.SummaryStatistics`
+
+	[3] `analyzeAudio._summaryStatistics.dictionaryStatistics`
+
+	"""
+	listStatistics = list(listStatistics)
+	for statistic in listStatistics:
+		if statistic not in dictionaryStatistics:
+			message = f"I received `{statistic = }` for '{featureName}', but I need one of {list(dictionaryStatistics)}."
+			raise ValueError(message)
+
+	def registrar(registrant: Callable[形, 归个]) -> Callable[形, 归个]:
+		"""I use this nested function to record one summary analyzer of `registrant` under each aspect name in the module registry.
+
+		Parameters
+		----------
+		registrant : Callable[形, 归个]
+			The framewise analyzer function to summarize under the enclosing `featureName`.
+
+		Returns
+		-------
+		registrant : Callable[形, 归个]
+			The same framewise analyzer function after the registry entries have been written.
+
+		"""
+		# `wraps` keeps the module and the name of `registrant`, which select the FFmpeg filter and identify the analyzer.
+		@wraps(registrant)
+		def analyzerSummary(*arguments: 形.args, **keywordArguments: 形.kwargs) -> SummaryStatistics:
+			return SummaryStatistics(registrant(*arguments, **keywordArguments))  # pyright: ignore[reportArgumentType]
+
+		analyzerParameters: list[str] = inspect.getfullargspec(registrant).args
+		for statistic in listStatistics:
+			audioAspects[f'{featureName} {statistic}'] = {'analyzer': analyzerSummary, 'analyzerParameters': analyzerParameters, 'analyzerOutput': dictionaryStatistics[statistic]}
+		return registrant
+	return registrar
+
 def registrationAudioContest(aspectName: str) -> Callable[[Callable[形, 归个]], Callable[形, 归个]]:
 	"""Register one analyzer function under one audio aspect name.
 
@@ -174,6 +391,82 @@ def registrationAudioContest(aspectName: str) -> Callable[[Callable[形, 归个]
 		return registrant
 	return registrar
 
+def registrationAudioContestOutputs(dictionaryContestNames: dict[str, str]) -> Callable[[Callable[形, 归个]], Callable[形, 归个]]:
+	"""Register one contest analyzer function under several contest names, one for each output.
+
+	You can use this function as a decorator factory when one contest analyzer computes the values of
+	several contests at once. The analyzer returns a named tuple, and each contest name reads one field
+	of the named tuple, as with `registrationAudioAspectOutputs` [1].
+
+	Parameters
+	----------
+	dictionaryContestNames : dict[str, str]
+		Map each contest name to the field of the result of the analyzer that holds its value.
+
+	Returns
+	-------
+	registrar : Callable[[Callable[形, 归个]], Callable[形, 归个]]
+		A decorator that records one analyzer function under each contest name and then returns the
+		same analyzer function.
+
+	Examples
+	--------
+	```python
+	@registrationAudioContestOutputs({'Bleedless Mel-scaled dB mean': 'bleed', 'Fullness Mel-scaled dB mean': 'full'})
+	def analyzeBleedFullMelDBMean(spectrogramMagnitudeAlfa: SpectrogramMagnitude, spectrogramMagnitudeBeta: SpectrogramMagnitude) -> BleedFull:
+	```
+
+	References
+	----------
+	[1] `registrationAudioAspectOutputs`
+
+	"""
+
+	def registrar(registrant: Callable[形, 归个]) -> Callable[形, 归个]:
+		"""I use this nested function to record one analyzer function under each contest name in the module registry.
+
+		Parameters
+		----------
+		registrant : Callable[形, 归个]
+			The analyzer function to register under the enclosing contest names.
+
+		Returns
+		-------
+		registrant : Callable[形, 归个]
+			The same analyzer function after the registry entries have been written.
+
+		"""
+		analyzerParameters: list[str] = inspect.getfullargspec(registrant).args
+		for contestName, analyzerOutput in dictionaryContestNames.items():
+			audioContests[contestName] = {'analyzer': registrant, 'analyzerParameters': analyzerParameters, 'analyzerOutput': analyzerOutput}
+		return registrant
+	return registrar
+
+def getAnalyzerOutput(analyzerAudioAspects: AnalyzerAudioAspects, analyzerResult: Any) -> Any:
+	"""Return the value of one registered name from the result of its analyzer.
+
+	If the registry entry has an `analyzerOutput`, the analyzer computes several registered names at
+	once, and the value is the field `analyzerOutput` of `analyzerResult`, or the attribute of a
+	field if `analyzerOutput` is dotted, such as 'linear.median'. Otherwise, the value is
+	`analyzerResult`.
+
+	Parameters
+	----------
+	analyzerAudioAspects : AnalyzerAudioAspects
+		Registry entry of the name, from `audioAspects` or `audioContests`.
+	analyzerResult : Any
+		Result of `analyzerAudioAspects['analyzer']`.
+
+	Returns
+	-------
+	aspectValue : Any
+		Value of the registered name.
+
+	"""
+	if 'analyzerOutput' in analyzerAudioAspects:
+		return operator.attrgetter(analyzerAudioAspects['analyzerOutput'])(analyzerResult)
+	return analyzerResult
+
 def getListAvailableAudioAspects() -> list[str]:
 	"""Return the registered audio aspect names in sorted order.
 
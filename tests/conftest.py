@@ -1,6 +1,7 @@
 # pyright: reportUnknownMemberType=false
 from __future__ import annotations
 
+from analyzeAudio.analyzersUseFilename._wideRange import cacheFFprobe
 from collections import ChainMap
 from hunterHearsPy import readAudioFile, stft
 from tests import (
@@ -14,6 +15,7 @@ from typing import TYPE_CHECKING
 import numpy
 import pytest
 import soundfile
+import subprocess  # noqa: S404
 import torch
 
 if TYPE_CHECKING:
@@ -21,6 +23,7 @@ if TYPE_CHECKING:
 	from hunterHearsPy.theTypes import Spectrogram, Waveform
 	from pathlib import Path
 	from torch import Tensor
+	from typing import Any, NoReturn
 
 #================== Settings =====================================================================
 
@@ -63,6 +66,19 @@ def assert_contest(actual: float | None, expected: float | None, pytest_rel: flo
 		actual, expected, analyzer, pathFilenameAlfa=contestPathFilenames.alfa.name, pathFilenameBeta=contestPathFilenames.beta.name, sampleRate=sampleRate
 	)
 
+def assert_keyCacheFFprobe(pathFilename: Path, keyCache: str) -> None:
+	"""Assert that `cacheFFprobe` holds the statistics of `keyCache` for `pathFilename`, and empty `cacheFFprobe`."""
+	dictionaryFilterAspects = cacheFFprobe.getFilterAspects(cacheFFprobe.identifyFile(pathFilename), [keyCache])
+	cacheFFprobe.evict()
+	assert keyCache in dictionaryFilterAspects, f'{pathFilename.name}: `cacheFFprobe` does not hold {keyCache!r}.'
+
+def forbidFFprobe(monkeypatch: pytest.MonkeyPatch) -> None:
+	"""Make each new subprocess, such as `ffprobe`, raise `FileNotFoundError`, so a test can show that no engine started FFprobe."""
+	def PopenForbidden(*arguments: Any, **_keywordArguments: Any) -> NoReturn:
+		raise FileNotFoundError(arguments[0][0] if arguments else 'subprocess')
+
+	monkeypatch.setattr(subprocess, 'Popen', PopenForbidden)
+
 #================== Audio and data =================================================================
 
 @pytest.fixture(params=listPathFilenamesDataSamples, ids=lambda pathFilename: pathFilename.name, scope='session')
@@ -1208,7 +1208,7 @@ expectedFilename: dict[str, dict[str, float | None]] = {
 		, 'ch2_44100_60s_f32le_20RMS.wav': -20.248
 		, 'ch2_44100_60s_f32le_40RMS.wav': -40.248
 		, 'ch2_44100_60s_f32le_60RMS.wav': -60.248
-		, 'ch2_44100_7.1s_s16le.wav': 0.0
+		, 'ch2_44100_7.1s_s16le.wav': -20.315
 		, 'ch2_44100_83s_LUFS23_VoiceAndMusic.wav': 0.0
 		, 'ch2_44100_83s_LUFS24_VoiceAndMusic.wav': 0.0
 		, 'ch2_48000_04s_LUFS10_RelGate.wav': -7.093
@@ -1240,7 +1240,7 @@ expectedFilename: dict[str, dict[str, float | None]] = {
 		, 'ch2_44100_60s_f32le_20RMS.wav': -20.369
 		, 'ch2_44100_60s_f32le_40RMS.wav': -40.369
 		, 'ch2_44100_60s_f32le_60RMS.wav': -60.369
-		, 'ch2_44100_7.1s_s16le.wav': 0.0
+		, 'ch2_44100_7.1s_s16le.wav': -20.398
 		, 'ch2_44100_83s_LUFS23_VoiceAndMusic.wav': 0.0
 		, 'ch2_44100_83s_LUFS24_VoiceAndMusic.wav': 0.0
 		, 'ch2_48000_04s_LUFS10_RelGate.wav': -10.437
@@ -1272,7 +1272,7 @@ expectedFilename: dict[str, dict[str, float | None]] = {
 		, 'ch2_44100_60s_f32le_20RMS.wav': -20.426
 		, 'ch2_44100_60s_f32le_40RMS.wav': -40.426
 		, 'ch2_44100_60s_f32le_60RMS.wav': -60.426
-		, 'ch2_44100_7.1s_s16le.wav': 0.0
+		, 'ch2_44100_7.1s_s16le.wav': -20.427
 		, 'ch2_44100_83s_LUFS23_VoiceAndMusic.wav': 0.0
 		, 'ch2_44100_83s_LUFS24_VoiceAndMusic.wav': 0.0
 		, 'ch2_48000_04s_LUFS10_RelGate.wav': -10.035
@@ -1304,7 +1304,7 @@ expectedFilename: dict[str, dict[str, float | None]] = {
 		, 'ch2_44100_60s_f32le_20RMS.wav': 0.07
 		, 'ch2_44100_60s_f32le_40RMS.wav': 0.07
 		, 'ch2_44100_60s_f32le_60RMS.wav': 0.07
-		, 'ch2_44100_7.1s_s16le.wav': 0.0
+		, 'ch2_44100_7.1s_s16le.wav': 0.04
 		, 'ch2_44100_83s_LUFS23_VoiceAndMusic.wav': 0.0
 		, 'ch2_44100_83s_LUFS24_VoiceAndMusic.wav': 0.0
 		, 'ch2_48000_04s_LUFS10_RelGate.wav': 0.06
@@ -1336,7 +1336,7 @@ expectedFilename: dict[str, dict[str, float | None]] = {
 		, 'ch2_44100_60s_f32le_20RMS.wav': -20.46
 		, 'ch2_44100_60s_f32le_40RMS.wav': -40.46
 		, 'ch2_44100_60s_f32le_60RMS.wav': -60.46
-		, 'ch2_44100_7.1s_s16le.wav': 0.0
+		, 'ch2_44100_7.1s_s16le.wav': -20.45
 		, 'ch2_44100_83s_LUFS23_VoiceAndMusic.wav': 0.0
 		, 'ch2_44100_83s_LUFS24_VoiceAndMusic.wav': 0.0
 		, 'ch2_48000_04s_LUFS10_RelGate.wav': -10.52
@@ -1368,7 +1368,7 @@ expectedFilename: dict[str, dict[str, float | None]] = {
 		, 'ch2_44100_60s_f32le_20RMS.wav': -20.39
 		, 'ch2_44100_60s_f32le_40RMS.wav': -40.39
 		, 'ch2_44100_60s_f32le_60RMS.wav': -60.39
-		, 'ch2_44100_7.1s_s16le.wav': 0.0
+		, 'ch2_44100_7.1s_s16le.wav': -20.41
 		, 'ch2_44100_83s_LUFS23_VoiceAndMusic.wav': 0.0
 		, 'ch2_44100_83s_LUFS24_VoiceAndMusic.wav': 0.0
 		, 'ch2_48000_04s_LUFS10_RelGate.wav': -10.46
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from analyzeAudio import AnalysisSession
+from analyzeAudio.analyze import analyzeAudioFile, analyzeAudioIterablePathFilenames, analyzeAudioListPathFilenames
+from tests import listPathFilenamesDataSamples
+import pytest
+
+@pytest.mark.parametrize('warmUp', [False, True])
+def test_AnalysisSession(warmUp: bool) -> None:
+	listAspectNames: list[str] = ['RMS Waveform mean']
+	dictionaryExpected: dict[str, list[str | float]] = {pathFilename.as_posix(): [pathFilename.as_posix(), *analyzeAudioFile(pathFilename, listAspectNames)]
+		for pathFilename in listPathFilenamesDataSamples[0:3]}
+
+	with AnalysisSession(CPUlimit=2, warmUp=warmUp) as analysisSession:
+		concurrencyManager = analysisSession.concurrencyManager
+		for _batch in range(2):
+			listRows: list[list[str | float]] = analyzeAudioListPathFilenames(listPathFilenamesDataSamples[0:3], listAspectNames, analysisSession=analysisSession)
+			assert sorted(listRows) == sorted(dictionaryExpected.values()), f'{listRows = }'
+		listRows = list(analyzeAudioIterablePathFilenames(listPathFilenamesDataSamples[0:3], listAspectNames, inputOrder=True, analysisSession=analysisSession))
+		assert listRows == list(dictionaryExpected.values()), f'{listRows = }'
+		assert analysisSession.concurrencyManager is concurrencyManager, 'The session replaced its worker pool.'
+
+	with pytest.raises(RuntimeError):
+		analysisSession.concurrencyManager  # noqa: B018
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from analyzeAudio import SummaryStatistics
+from analyzeAudio.analyze import (
+	analyzeAudioFile, analyzeAudioFileStreaming, analyzeAudioIterablePathFilenames, analyzeAudioListPathFilenames, analyzeContestListPathFilenames,
+	analyzeContestReference)
+from analyzeAudio.analyzersUseFilename._wideRange import cacheFFprobe
+from analyzeAudio.analyzersUseWaveform import analyzeRMSWaveform, analyzeRMSWaveform_dB, analyzeRMSWaveform_dBMean, analyzeRMSWaveformMean
+from analyzeAudio.registry import audioAspects, audioContests
+from collections import ChainMap
+from concurrent.futures import wait
+from pathlib import Path
+from tests import ContestPathFilenames, listPathFilenamesContests, listPathFilenamesDataSamples, pathFilenameMixture
+from tests.conftest import assert_approx, assert_contest, assert_keyCacheFFprobe, forbidFFprobe
+from tests.dataSamples.SpeakSoftly_BrokenMan60sec import expected as contestExpected
+from typing import TYPE_CHECKING
+import analyzeAudio.analyze
+import pytest
+import soundfile
+
+if TYPE_CHECKING:
+	from analyzeAudio import AnalyzerAudioAspects
+	from collections.abc import Callable
+	from typing import Any, Literal
+
+@pytest.mark.parametrize(('aspectName', 'expectedAspect'), [
+	('Chromagram mean', 'analyzeChromagramMean'),
+	('RMS Waveform mean', 'analyzeRMSWaveformMean'),
+	('Spectral Centroid mean', 'analyzeSpectralCentroidMean'),
+	('Spectral Flatness dB mean', 'analyzeSpectralFlatness_dBMean'),
+], indirect=['expectedAspect'])
+def test_analyzeAudioFile(pathFilename: Path, aspectName: str, expectedAspect: float | None, approx_rel: float, approx_abs: float) -> None:
+	actual, notFound = analyzeAudioFile(pathFilename, [aspectName, 'aspect that is not registered'])
+	assert notFound == 'not found', f'analyzeAudioFile({pathFilename.name}) returned {notFound!r} for an unregistered aspect name.'
+	assert_approx(actual, expectedAspect, approx_rel, approx_abs, aspectName, pathFilename)  # pyright: ignore[reportArgumentType]
+
+def _countCalls(registry: dict[str, AnalyzerAudioAspects], listNames: list[str], monkeypatch: pytest.MonkeyPatch) -> list[str]:
+	"""Replace the analyzer of each entry of `listNames` with one wrapper that records each call."""
+	listCalls: list[str] = []
+	analyzer: Callable[..., Any] = registry[listNames[0]]['analyzer']
+
+	def analyzerCounted(*arguments: Any, **keywordArguments: Any) -> Any:
+		listCalls.append(analyzer.__name__)
+		return analyzer(*arguments, **keywordArguments)
+
+	for name in listNames:
+		monkeypatch.setitem(registry, name, {**registry[name], 'analyzer': analyzerCounted})
+	return listCalls
+
+def test_analyzeAudioFileOutputs(pathFilename: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	waveform, _sampleRate = soundfile.read(pathFilename, dtype='float32')
+	listAspectNames: list[str] = ['RMS Waveform dB mean', 'RMS Waveform mean', 'RMS Waveform median', 'RMS Waveform dB 95th percentile']
+	listCalls: list[str] = _countCalls(audioAspects, listAspectNames, monkeypatch)
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	assert len(listCalls) == 1, f'analyzeAudioFile({pathFilename.name}) called {listCalls} for the outputs of one analyzer.'
+	summaryStatistics = SummaryStatistics(analyzeRMSWaveform(waveform.T))
+	summaryStatistics_dB = SummaryStatistics(analyzeRMSWaveform_dB(waveform.T))
+	aspectValuesExpected = (analyzeRMSWaveform_dBMean(waveform.T), analyzeRMSWaveformMean(waveform.T), summaryStatistics.median, summaryStatistics_dB.percentile95)
+	assert aspectValues == pytest.approx(aspectValuesExpected), f'analyzeAudioFile({pathFilename.name}) returned {aspectValues}, not {aspectValuesExpected}.'  # pyright: ignore[reportUnknownMemberType]
+
+def test_analyzeAudioFileShareWaveformWithFFmpeg(pathFilename: Path) -> None:
+	listAspectNames: list[str] = ['RMS Waveform mean', 'LUFS integrated', 'true_peak maximum', 'Crest_factor mean', 'Spectral centroid mean']
+	cacheFFprobe.evict()
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	cacheFFprobe.evict()
+	aspectValuesShared = analyzeAudioFile(pathFilename, listAspectNames, shareWaveformWithFFmpeg=True)
+	cacheFFprobe.evict()
+	assert aspectValuesShared == aspectValues, f'analyzeAudioFile({pathFilename.name}, shareWaveformWithFFmpeg=True) returned {aspectValuesShared}, not {aspectValues}.'
+
+@pytest.mark.parametrize('shareWaveformWithFFmpeg', [False, True])
+def test_analyzeAudioFileAstatsEngine(pathFilename: Path, shareWaveformWithFFmpeg: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+	listAspectNames: list[str] = ['RMS Waveform mean', 'LUFS integrated', 'Crest_factor mean', 'Noise_floor_count total', 'Bit_depth mean']
+	cacheFFprobe.evict()
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	# FFmpeg already measured 'LUFS integrated', so a new subprocess could only measure `astats` with FFmpeg.
+	forbidFFprobe(monkeypatch)
+	aspectValuesNumPy = analyzeAudioFile(pathFilename, listAspectNames, shareWaveformWithFFmpeg=shareWaveformWithFFmpeg, astatsEngine='NumPy')
+	assert_keyCacheFFprobe(pathFilename, 'astats:NumPy')
+	assert aspectValuesNumPy == pytest.approx(aspectValues, rel=1e-9, nan_ok=True), f"analyzeAudioFile({pathFilename.name}, astatsEngine='NumPy') returned {aspectValuesNumPy}, not {aspectValues}."
+
+@pytest.mark.parametrize('shareWaveformWithFFmpeg', [False, True])
+def test_analyzeAudioFileEbur128Engine(pathFilename: Path, shareWaveformWithFFmpeg: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+	listAspectNames: list[str] = ['RMS Waveform mean', 'LUFS integrated', 'LUFS loudness range', 'LUFS momentary maximum', 'true_peak maximum', 'Crest_factor mean']
+	cacheFFprobe.evict()
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	cacheFFprobe.evict()
+	forbidFFprobe(monkeypatch)
+	aspectValuesNumPy = analyzeAudioFile(pathFilename, listAspectNames, shareWaveformWithFFmpeg=shareWaveformWithFFmpeg, astatsEngine='NumPy', ebur128Engine='NumPy')
+	assert_keyCacheFFprobe(pathFilename, 'ebur128:NumPy')
+	assert aspectValuesNumPy == pytest.approx(aspectValues, rel=0, abs=0.0011, nan_ok=True), f"analyzeAudioFile({pathFilename.name}, ebur128Engine='NumPy') returned {aspectValuesNumPy}, not {aspectValues}."
+
+def test_analyzeAudioFileAspectralstatsEngine(pathFilename: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	listAspectNames: list[str] = ['Spectral Centroid mean', 'Spectral centroid mean', 'Spectral flatness mean', 'Spectral rolloff mean', 'Spectral slope mean']
+	cacheFFprobe.evict()
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	cacheFFprobe.evict()
+	forbidFFprobe(monkeypatch)
+	aspectValuesNumPy = analyzeAudioFile(pathFilename, listAspectNames, aspectralstatsEngine='NumPy')
+	assert_keyCacheFFprobe(pathFilename, 'aspectralstats:NumPy')
+	aspectValuesSpectrogram = analyzeAudioFile(pathFilename, listAspectNames, aspectralstatsEngine='spectrogram')
+	assert_keyCacheFFprobe(pathFilename, 'aspectralstats:spectrogram')
+	assert aspectValuesNumPy == pytest.approx(aspectValues, rel=5e-4, nan_ok=True), f"analyzeAudioFile({pathFilename.name}, aspectralstatsEngine='NumPy') returned {aspectValuesNumPy}, not {aspectValues}."
+	assert aspectValuesSpectrogram[0] == aspectValues[0], f"analyzeAudioFile({pathFilename.name}, aspectralstatsEngine='spectrogram') changed {listAspectNames[0]!r}."
+	assert all(isinstance(aspectValue, float) for aspectValue in aspectValuesSpectrogram), f"analyzeAudioFile({pathFilename.name}, aspectralstatsEngine='spectrogram') returned {aspectValuesSpectrogram}."
+
+@pytest.mark.parametrize('aspectralstatsEngine', ['NumPy', 'spectrogram'])
+def test_analyzeAudioFileEnginesWithoutFFprobe(pathFilename: Path, aspectralstatsEngine: Literal['NumPy', 'spectrogram'], monkeypatch: pytest.MonkeyPatch) -> None:
+	listAspectNames: list[str] = ['RMS_level overall', 'Crest_factor mean', 'LUFS integrated', 'true_peak maximum', 'Spectral centroid mean']
+	cacheFFprobe.evict()
+	forbidFFprobe(monkeypatch)
+	# Each analyzer reads the statistics of the requested engine, so no analyzer starts FFprobe.
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames, astatsEngine='NumPy', ebur128Engine='NumPy', aspectralstatsEngine=aspectralstatsEngine)
+	listKeysCache: list[str] = ['astats:NumPy', 'ebur128:NumPy', f'aspectralstats:{aspectralstatsEngine}']
+	dictionaryFilterAspects = cacheFFprobe.getFilterAspects(cacheFFprobe.identifyFile(pathFilename), listKeysCache)
+	cacheFFprobe.evict()
+	assert all(isinstance(aspectValue, float) for aspectValue in aspectValues), f'analyzeAudioFile({pathFilename.name}) returned {aspectValues} without FFprobe.'
+	assert sorted(dictionaryFilterAspects) == sorted(listKeysCache), f'{pathFilename.name}: `cacheFFprobe` holds {list(dictionaryFilterAspects)}, not {listKeysCache}.'
+
+def test_analyzeAudioFileSegmentsFFprobe(pathFilename: Path) -> None:
+	listAspectNames: list[str] = ['Spectral centroid mean', 'LUFS momentary maximum', 'true_peak maximum', 'Crest_factor mean']
+	cacheFFprobe.evict()
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	cacheFFprobe.evict()
+	aspectValuesSegments = analyzeAudioFile(pathFilename, listAspectNames, segmentsFFprobe=3)
+	# The analyzers read the statistics of the segments instead of starting FFprobe for the whole file.
+	listKeysCache: list[str] = sorted(cacheFFprobe.getFilterAspects(cacheFFprobe.identifyFile(pathFilename), ['aspectralstats', 'aspectralstats:segments3', 'astats', 'ebur128', 'ebur128:segments3']))
+	cacheFFprobe.evict()
+	assert listKeysCache == ['aspectralstats:segments3', 'astats', 'ebur128:segments3'], f'{pathFilename.name}: `cacheFFprobe` holds {listKeysCache}.'
+	assert aspectValuesSegments == pytest.approx(aspectValues, rel=1e-12, nan_ok=True), f'analyzeAudioFile({pathFilename.name}, segmentsFFprobe=3) returned {aspectValuesSegments}, not {aspectValues}.'
+
+@pytest.mark.parametrize('framesPerBlock', [3, 1024])
+@pytest.mark.parametrize(('aspectName', 'expectedAspect'), [
+	('RMS Waveform dB mean', 'analyzeRMSWaveform_dBMean'),
+	('RMS Waveform mean', 'analyzeRMSWaveformMean'),
+	('Spectral Bandwidth mean', 'analyzeSpectralBandwidthMean'),
+	('Spectral Centroid mean', 'analyzeSpectralCentroidMean'),
+	('Spectral Flatness dB mean', 'analyzeSpectralFlatness_dBMean'),
+	('Spectral Flatness mean', 'analyzeSpectralFlatnessMean'),
+	('Zero Crossing Rate mean', 'analyzeZeroCrossingRateMean'),
+], indirect=['expectedAspect'])
+def test_analyzeAudioFileStreaming(pathFilename: Path, aspectName: str, expectedAspect: float | None, framesPerBlock: int, rtol: float, approx_abs: float) -> None:
+	actual, notFound = analyzeAudioFileStreaming(pathFilename, [aspectName, 'aspect that is not registered'], framesPerBlock=framesPerBlock)
+	assert notFound == 'not found', f'analyzeAudioFileStreaming({pathFilename.name}) returned {notFound!r} for an unregistered aspect name.'
+	assert_approx(actual, expectedAspect, rtol, approx_abs, f'{aspectName} ({framesPerBlock = })', pathFilename)  # pyright: ignore[reportArgumentType]
+
+@pytest.mark.parametrize(('inputOrder', 'filesPendingLimit'), [(False, None), (True, 1), (True, 3)])
+def test_analyzeAudioIterablePathFilenames(inputOrder: bool, filesPendingLimit: int | None) -> None:
+	listAspectNames: list[str] = ['RMS Waveform mean']
+	listRows: list[list[str | float]] = list(analyzeAudioIterablePathFilenames(
+		iter(listPathFilenamesDataSamples), listAspectNames, CPUlimit=2, inputOrder=inputOrder, filesPendingLimit=filesPendingLimit))
+	listPathFilenamesExpected: list[str] = [pathFilename.as_posix() for pathFilename in listPathFilenamesDataSamples]
+	listPathFilenamesActual: list[str] = [str(row[0]) for row in listRows]
+	if not inputOrder:
+		listPathFilenamesExpected.sort()
+		listPathFilenamesActual.sort()
+	assert listPathFilenamesActual == listPathFilenamesExpected, f'{inputOrder = } and {filesPendingLimit = }: {listPathFilenamesActual = }.'
+	for row in listRows:
+		assert row[1:] == list(analyzeAudioFile(str(row[0]), listAspectNames)), f'{row = } differs from `analyzeAudioFile`.'
+
+@pytest.mark.parametrize('listAspectNames', [
+	['LUFS integrated', 'Crest_factor mean'],
+	['RMS Waveform mean', 'LUFS integrated', 'aspect that is not registered'],
+])
+def test_analyzeAudioIterablePathFilenamesFFprobeLimit(listAspectNames: list[str]) -> None:
+	listRows: list[list[str | float]] = list(analyzeAudioIterablePathFilenames(
+		listPathFilenamesDataSamples, listAspectNames, CPUlimit=1, inputOrder=True, FFprobeLimit=2))
+	listPathFilenamesActual: list[str] = [str(row[0]) for row in listRows]
+	listPathFilenamesExpected: list[str] = [pathFilename.as_posix() for pathFilename in listPathFilenamesDataSamples]
+	assert listPathFilenamesActual == listPathFilenamesExpected, f'{listAspectNames = }: {listPathFilenamesActual = }.'
+	for row in listRows:
+		assert row[1:] == list(analyzeAudioFile(str(row[0]), listAspectNames)), f'{row = } differs from `analyzeAudioFile`.'
+
+def test_analyzeAudioIterablePathFilenamesWaitBlocks(monkeypatch: pytest.MonkeyPatch) -> None:
+	# The FFprobe thread of a file finishes long before its worker process starts, so a `wait` on the done future would return at once.
+	listAspectNames: list[str] = ['RMS Waveform mean', 'Spectral centroid mean']
+	listCallsWait: list[int] = []
+
+	def waitCounted(futures: Any, **keywordArguments: Any) -> Any:
+		listFutures = list(futures)
+		listCallsWait.append(len(listFutures))
+		return wait(listFutures, **keywordArguments)
+
+	monkeypatch.setattr(analyzeAudio.analyze, 'wait', waitCounted)
+	listRows: list[list[str | float]] = list(analyzeAudioIterablePathFilenames(listPathFilenamesDataSamples, listAspectNames, CPUlimit=1, FFprobeLimit=2))
+	assert len(listRows) == len(listPathFilenamesDataSamples), f'{listRows = }.'
+	assert len(listCallsWait) <= 2 * len(listPathFilenamesDataSamples), f'analyzeAudioIterablePathFilenames called `wait` {len(listCallsWait)} times for {len(listPathFilenamesDataSamples)} files.'
+
+@pytest.mark.parametrize('scheduleLongestFirst', [False, True])
+def test_analyzeAudioListPathFilenames(scheduleLongestFirst: bool) -> None:
+	listAspectNames: list[str] = ['RMS Waveform mean']
+	listRows: list[list[str | float]] = analyzeAudioListPathFilenames(listPathFilenamesDataSamples, listAspectNames, CPUlimit=1, scheduleLongestFirst=scheduleLongestFirst)
+	listPathFilenamesActual: list[str] = [str(row[0]) for row in listRows]
+	listPathFilenamesExpected: list[str] = [pathFilename.as_posix() for pathFilename in listPathFilenamesDataSamples]
+	if scheduleLongestFirst:
+		listPathFilenamesExpected.sort(key=lambda pathFilename: soundfile.info(pathFilename).duration, reverse=True)
+	assert listPathFilenamesActual == listPathFilenamesExpected, f'{scheduleLongestFirst = }: {listPathFilenamesActual = }.'
+
+def test_analyzeAudioListPathFilenamesDurationUnknown(monkeypatch: pytest.MonkeyPatch) -> None:
+	pathFilenameUnknown: Path = listPathFilenamesDataSamples[-1]
+	getDurationSeconds = analyzeAudio.analyze._getDurationSeconds
+	monkeypatch.setattr(analyzeAudio.analyze, '_getDurationSeconds', lambda pathFilename: None if Path(pathFilename) == pathFilenameUnknown else getDurationSeconds(pathFilename))
+	listRows: list[list[str | float]] = analyzeAudioListPathFilenames(listPathFilenamesDataSamples, ['RMS Waveform mean'], CPUlimit=1)
+	assert str(listRows[0][0]) == pathFilenameUnknown.as_posix(), f'The file whose duration is unknown was not submitted first: {[row[0] for row in listRows]}.'
+
+def test_getDurationSeconds(pathFilename: Path, tmp_path: Path) -> None:
+	assert analyzeAudio.analyze._getDurationSeconds(pathFilename) == soundfile.info(pathFilename).duration, f'{pathFilename.name}'
+	pathFilenameNotAudio: Path = tmp_path / 'notAudio.wav'
+	pathFilenameNotAudio.write_text('not audio')
+	assert analyzeAudio.analyze._getDurationSeconds(pathFilenameNotAudio) is None, f'{pathFilenameNotAudio.name}'
+
+def test_analyzeContestListPathFilenames(approx_rel: float, approx_abs: float) -> None:
+	listContestNames: list[str] = ['SI-SDR mean', 'analyzeLogWMSE mean', 'SpectralConvergenceLoss mean', 'Bleedless Mel-scaled dB mean', 'contest that is not registered']
+	listRows: list[list[str | float]] = analyzeContestListPathFilenames(listPathFilenamesContests, listContestNames, pathFilenameMixture=pathFilenameMixture, CPUlimit=1)
+	listPairsActual: list[tuple[str, str]] = sorted((str(row[0]), str(row[1])) for row in listRows)
+	listPairsExpected: list[tuple[str, str]] = sorted((contestPathFilenames.alfa.as_posix(), contestPathFilenames.beta.as_posix()) for contestPathFilenames in listPathFilenamesContests)
+	assert listPairsActual == listPairsExpected, f'{listPairsActual = }.'
+	dictionaryExpectedContest = ChainMap(contestExpected.expectedTensorSpectrogram, contestExpected.expectedSpectrogram, contestExpected.expectedTensor)
+	for row in listRows:
+		contestPathFilenames = ContestPathFilenames(Path(str(row[0])), Path(str(row[1])))
+		assert row[-1] == 'not found', f'analyzeContestListPathFilenames returned {row[-1]!r} for an unregistered contest name.'
+		for contestName, actual in zip(listContestNames[:-1], row[2:-1], strict=True):
+			# A contest analyzer with several outputs has the expected values of each output under the name of a function with one output.
+			analyzer: str = {'Bleedless Mel-scaled dB mean': 'analyzeBleedlessMelDBMean'}.get(contestName, audioContests[contestName]['analyzer'].__name__)
+			expected: float = dictionaryExpectedContest[analyzer][(contestPathFilenames.alfa.name, contestPathFilenames.beta.name)]
+			assert_contest(actual, expected, approx_rel, approx_abs, analyzer, contestPathFilenames, 44100)  # pyright: ignore[reportArgumentType]
+
+def test_analyzeContestReferenceOutputs(monkeypatch: pytest.MonkeyPatch) -> None:
+	listContestNames: list[str] = ['Fullness Mel-scaled dB mean', 'SI-SDR mean', 'Bleedless Mel-scaled dB mean']
+	contestPathFilenames: ContestPathFilenames = listPathFilenamesContests[0]
+	listContestValues: list[tuple[str | float, ...]] = analyzeContestReference(contestPathFilenames.alfa, [contestPathFilenames.beta], listContestNames)
+	listCalls: list[str] = _countCalls(audioContests, ['Bleedless Mel-scaled dB mean', 'Fullness Mel-scaled dB mean'], monkeypatch)
+	assert analyzeContestReference(contestPathFilenames.alfa, [contestPathFilenames.beta], listContestNames) == listContestValues
+	assert len(listCalls) == 1, f'analyzeContestReference called {listCalls} for the outputs of one analyzer.'
+	dictionaryExpectedContest = ChainMap(contestExpected.expectedTensorSpectrogram, contestExpected.expectedSpectrogram, contestExpected.expectedTensor)
+	for analyzer, actual in [('analyzeFullnessMelDBMean', listContestValues[0][0]), ('analyzeBleedlessMelDBMean', listContestValues[0][2])]:
+		assert actual == pytest.approx(dictionaryExpectedContest[analyzer][(contestPathFilenames.alfa.name, contestPathFilenames.beta.name)]), f'{analyzer}: {actual = }.'  # pyright: ignore[reportUnknownMemberType]
+
+def test_analyzeContestListPathFilenamesMixture() -> None:
+	with pytest.raises(ValueError, match='mixture'):
+		analyzeContestListPathFilenames(listPathFilenamesContests, ['analyzeLogWMSE mean'])
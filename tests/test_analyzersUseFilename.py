@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from analyzeAudio import analyzeAudioFile, audioAspects, blockEnergiesEBUR128
 from analyzeAudio.analyzersUseFilename import (
 	analyzeAbs_Peak_countTotal, analyzeBit_depthMean, analyzeCrest_factorMean, analyzeDC_offsetMean, analyzeDynamic_rangeOverall,
 	analyzeEntropyMean, analyzeFlat_factorMean, analyzeLRAOverall, analyzeLUFShighOverall, analyzeLUFSIntegratedOverall, analyzeLUFSlowOverall,
@@ -11,13 +12,22 @@ from analyzeAudio.analyzersUseFilename import (
 	analyzeSpectral_kurtosis_mean, analyzeSpectral_mean_mean, analyzeSpectral_rolloff_mean, analyzeSpectral_skewness_mean,
 	analyzeSpectral_slope_mean, analyzeSpectral_spread_mean, analyzeSpectral_variance_mean, analyzeTruePeakOverall,
 	analyzeZero_crossings_rateOverall, analyzeZero_crossingsTotal)
-from tests.conftest import assert_approx
+from analyzeAudio.analyzersUseFilename._aspectralstatsNumPy import aspectralstatsSpectrogram
+from analyzeAudio.analyzersUseFilename._ebur128NumPy import ebur128NumPy
+from analyzeAudio.analyzersUseFilename._wideRange import cacheFFprobe, dictionaryFiltersFFmpeg, ffprobeAllInclusiveCache
+from tests.conftest import assert_approx, assert_keyCacheFFprobe, forbidFFprobe
 from typing import TYPE_CHECKING
+import numpy
 import os
 import pytest
+import soundfile
 
 if TYPE_CHECKING:
+	from analyzeAudio import Audio
+	from collections.abc import Callable
 	from pathlib import Path
+	from tests._dataBaskets import WaveformAndData
+	from typing import Any
 
 pytestmark: pytest.MarkDecorator = pytest.mark.skipif(os.getenv('GITHUB_ACTIONS') == 'true', reason='Skipped in GitHub Actions')
 
@@ -235,3 +245,257 @@ def test_analyzeZero_crossingsTotal(pathFilename: Path, expectedAspect: float |
 def test_analyzeZero_crossings_rateOverall(pathFilename: Path, expectedAspect: float | None, approx_rel: float, approx_abs: float) -> None:
 	actual = analyzeZero_crossings_rateOverall(pathFilename)
 	assert_approx(actual, expectedAspect, approx_rel, approx_abs, 'analyzeZero_crossings_rateOverall', pathFilename)
+
+@pytest.mark.parametrize('filterNames', [('aspectralstats',), ('astats',), ('ebur128',), ('astats', 'ebur128')])
+def test_ffprobeAllInclusiveCacheFilterNames(pathFilename: Path, filterNames: tuple[str, ...]) -> None:
+	cacheFFprobe.evict()
+	identityFile: str = cacheFFprobe.identifyFile(pathFilename)
+	dictionaryAspectsSubset = ffprobeAllInclusiveCache(pathFilename, filterNames)
+	setFilterNamesCached = set(cacheFFprobe.getFilterAspects(identityFile, dictionaryFiltersFFmpeg))
+	assert setFilterNamesCached == set(filterNames), f'ffprobeAllInclusiveCache({pathFilename.name}, {filterNames}) ran {setFilterNamesCached}.'
+	# The filters that did not run yet run now, and the filters that already ran keep their statistics.
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename)
+	assert set(cacheFFprobe.getFilterAspects(identityFile, dictionaryFiltersFFmpeg)) == set(dictionaryFiltersFFmpeg)
+	cacheFFprobe.evict()
+	dictionaryAspectsOnePass = ffprobeAllInclusiveCache(pathFilename)
+	assert dictionaryAspects.keys() == dictionaryAspectsOnePass.keys(), f'{pathFilename.name}: {dictionaryAspects.keys() ^ dictionaryAspectsOnePass.keys() = }.'
+	for keyName, arrayAspect in dictionaryAspectsOnePass.items():
+		assert numpy.array_equal(dictionaryAspects[keyName], arrayAspect, equal_nan=True), f'{pathFilename.name}: {keyName!r} differs after {filterNames = }.'
+		if keyName in dictionaryAspectsSubset:
+			assert numpy.array_equal(dictionaryAspectsSubset[keyName], arrayAspect, equal_nan=True), f'{pathFilename.name}: {keyName!r} of {filterNames = } differs.'
+
+def test_ffprobeAllInclusiveCacheWaveform(pathFilename: Path) -> None:
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename)
+	cacheFFprobe.evict()
+	waveform, sampleRate = soundfile.read(pathFilename, dtype='float32', always_2d=True)
+	dictionaryAspectsWaveform = ffprobeAllInclusiveCache(pathFilename, waveformAndSampleRate=(waveform.T, sampleRate))
+	cacheFFprobe.evict()
+	assert dictionaryAspects.keys() == dictionaryAspectsWaveform.keys(), f'{pathFilename.name}: {dictionaryAspects.keys() ^ dictionaryAspectsWaveform.keys() = }.'
+	for keyName, arrayAspect in dictionaryAspects.items():
+		assert numpy.array_equal(dictionaryAspectsWaveform[keyName], arrayAspect, equal_nan=True), f'{pathFilename.name}: {keyName!r} differs when FFprobe reads the waveform.'
+
+@pytest.mark.parametrize(('analyzer', 'expectedAspect'), [
+	(analyzeAbs_Peak_countTotal, 'analyzeAbs_Peak_countTotal'),
+	(analyzeBit_depthMean, 'analyzeBit_depthMean'),
+	(analyzeCrest_factorMean, 'analyzeCrest_factorMean'),
+	(analyzeDC_offsetMean, 'analyzeDC_offsetMean'),
+	(analyzeDynamic_rangeOverall, 'analyzeDynamic_rangeOverall'),
+	(analyzeEntropyMean, 'analyzeEntropyMean'),
+	(analyzeFlat_factorMean, 'analyzeFlat_factorMean'),
+	(analyzeMax_differenceOverall, 'analyzeMax_differenceOverall'),
+	(analyzeMax_levelOverall, 'analyzeMax_levelOverall'),
+	(analyzeMean_differenceMean, 'analyzeMean_differenceMean'),
+	(analyzeMin_differenceOverall, 'analyzeMin_differenceOverall'),
+	(analyzeMin_levelOverall, 'analyzeMin_levelOverall'),
+	(analyzeNoise_floor_countTotal, 'analyzeNoise_floor_countTotal'),
+	(analyzeNoise_floorOverall, 'analyzeNoise_floorOverall'),
+	(analyzeNumber_of_samplesTotal, 'analyzeNumber_of_samplesTotal'),
+	(analyzePeak_countTotal, 'analyzePeak_countTotal'),
+	(analyzePeak_levelOverall, 'analyzePeak_levelOverall'),
+	(analyzeRMS_differenceOverall, 'analyzeRMS_differenceOverall'),
+	(analyzeRMS_levelOverall, 'analyzeRMS_levelOverall'),
+	(analyzeRMS_peakOverall, 'analyzeRMS_peakOverall'),
+	(analyzeRMS_troughOverall, 'analyzeRMS_troughOverall'),
+	(analyzeZero_crossingsTotal, 'analyzeZero_crossingsTotal'),
+	(analyzeZero_crossings_rateOverall, 'analyzeZero_crossings_rateOverall'),
+], indirect=['expectedAspect'])
+def test_astatsNumPy(pathFilename: Path, analyzer: Callable[[Path], float | None], expectedAspect: float | None, approx_rel: float, approx_abs: float, monkeypatch: pytest.MonkeyPatch) -> None:
+	cacheFFprobe.evict()
+	forbidFFprobe(monkeypatch)
+	actual = analyzeAudioFile(pathFilename, [_getAspectName(analyzer)], astatsEngine='NumPy')[0]
+	assert_keyCacheFFprobe(pathFilename, 'astats:NumPy')
+	assert_approx(actual, expectedAspect, approx_rel, approx_abs, analyzer.__name__, pathFilename)  # pyright: ignore[reportArgumentType]
+
+def test_ffprobeAllInclusiveCacheAstatsEngine(pathFilename: Path, rtol: float, atol: float) -> None:
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename, ('astats',))
+	cacheFFprobe.evict()
+	dictionaryAspectsNumPy = ffprobeAllInclusiveCache(pathFilename, ('astats',), astatsEngine='NumPy')
+	cacheFFprobe.evict()
+	assert list(dictionaryAspects) == list(dictionaryAspectsNumPy), f'{pathFilename.name}: {dictionaryAspects.keys() ^ dictionaryAspectsNumPy.keys() = }.'
+	for keyName, arrayAspect in dictionaryAspects.items():
+		assert numpy.allclose(dictionaryAspectsNumPy[keyName], arrayAspect, rtol=rtol, atol=atol, equal_nan=True), f'{pathFilename.name}: {keyName!r} of `astatsNumPy` differs from `astats`.'
+
+@pytest.mark.parametrize(('analyzer', 'expectedAspect'), [
+	(analyzeLRAOverall, 'analyzeLRAOverall'),
+	(analyzeLUFShighOverall, 'analyzeLUFShighOverall'),
+	(analyzeLUFSIntegratedOverall, 'analyzeLUFSIntegratedOverall'),
+	(analyzeLUFSlowOverall, 'analyzeLUFSlowOverall'),
+	(analyzeLUFSMomentaryOverall, 'analyzeLUFSMomentaryOverall'),
+	(analyzeLUFSShortTermOverall, 'analyzeLUFSShortTermOverall'),
+	(analyzeTruePeakOverall, 'analyzeTruePeakOverall'),
+], indirect=['expectedAspect'])
+def test_ebur128NumPy(pathFilename: Path, analyzer: Callable[[Path], float | None], expectedAspect: float | None, approx_rel: float, approx_abs: float, monkeypatch: pytest.MonkeyPatch) -> None:
+	cacheFFprobe.evict()
+	forbidFFprobe(monkeypatch)
+	actual = analyzeAudioFile(pathFilename, [_getAspectName(analyzer)], ebur128Engine='NumPy')[0]
+	assert_keyCacheFFprobe(pathFilename, 'ebur128:NumPy')
+	assert_approx(actual, expectedAspect, approx_rel, approx_abs, analyzer.__name__, pathFilename)  # pyright: ignore[reportArgumentType]
+
+def test_ffprobeAllInclusiveCacheEbur128Engine(pathFilename: Path) -> None:
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename, ('ebur128',))
+	cacheFFprobe.evict()
+	dictionaryAspectsNumPy = ffprobeAllInclusiveCache(pathFilename, ('ebur128',), ebur128Engine='NumPy')
+	cacheFFprobe.evict()
+	assert dictionaryAspects.keys() == dictionaryAspectsNumPy.keys(), f'{pathFilename.name}: {dictionaryAspects.keys() ^ dictionaryAspectsNumPy.keys() = }.'
+	for keyName, arrayAspect in dictionaryAspects.items():
+		# FFprobe prints three decimal places, and FFmpeg sums the blocks in a different order, so the last decimal place can differ.
+		assert numpy.allclose(dictionaryAspectsNumPy[keyName], arrayAspect, rtol=0, atol=0.0011), f'{pathFilename.name}: {keyName!r} of `ebur128NumPy` differs from `ebur128`.'
+
+def test_blockEnergiesEBUR128(waveformAndData: WaveformAndData) -> None:
+	waveform: Audio = numpy.atleast_2d(waveformAndData.waveform)
+	sampleRate: int = waveformAndData.sampleRate
+	energiesMomentary, energiesShortTerm = blockEnergiesEBUR128(waveform, sampleRate)
+	dictionaryAspects = ebur128NumPy(waveform, sampleRate)
+	correctionDualMono: float = 3.01029995663978 if waveform.shape[0] == 1 else 0
+	for energies, keyName in ((energiesMomentary, 'M'), (energiesShortTerm, 'S')):
+		assert energies.shape == (waveform.shape[0], dictionaryAspects[keyName].size)
+		isFull = ~numpy.isnan(energies[0])
+		loudness = 10 * numpy.log10(numpy.sum(energies[:, isFull], axis=0)) - 0.691 + correctionDualMono
+		assert numpy.allclose(loudness, dictionaryAspects[keyName][isFull], rtol=0, atol=0.0006), f'{keyName!r} of `blockEnergiesEBUR128` differs from `ebur128NumPy`.'
+
+def test_ebur128NumPyChannels() -> None:
+	with pytest.raises(ValueError, match='one or two channels'):
+		ebur128NumPy(numpy.zeros((3, 48000), dtype=numpy.float32), 48000)
+
+@pytest.mark.parametrize(('aspectName', 'expectedAspect'), [
+	('Spectral centroid mean', 'analyzeSpectral_centroid_mean'),
+	('Spectral crest mean', 'analyzeSpectral_crest_mean'),
+	('Spectral decrease mean', 'analyzeSpectral_decrease_mean'),
+	('Spectral entropy mean', 'analyzeSpectral_entropy_mean'),
+	('Spectral flatness mean', 'analyzeSpectral_flatness_mean'),
+	('Spectral flux mean', 'analyzeSpectral_flux_mean'),
+	('Spectral kurtosis mean', 'analyzeSpectral_kurtosis_mean'),
+	('Power spectral density mean', 'analyzeSpectral_mean_mean'),
+	('Spectral rolloff mean', 'analyzeSpectral_rolloff_mean'),
+	('Spectral skewness mean', 'analyzeSpectral_skewness_mean'),
+	('Spectral slope mean', 'analyzeSpectral_slope_mean'),
+	('Spectral spread mean', 'analyzeSpectral_spread_mean'),
+	('Spectral variance mean', 'analyzeSpectral_variance_mean'),
+], indirect=['expectedAspect'])
+def test_aspectralstatsNumPy(pathFilename: Path, aspectName: str, expectedAspect: float | None, approx_abs: float, monkeypatch: pytest.MonkeyPatch) -> None:
+	cacheFFprobe.evict()
+	forbidFFprobe(monkeypatch)
+	actual = analyzeAudioFile(pathFilename, [aspectName], aspectralstatsEngine='NumPy')[0]
+	assert_keyCacheFFprobe(pathFilename, 'aspectralstats:NumPy')
+	# FFmpeg and NumPy round the 32-bit FFT differently, and the quiet frequency bins amplify the difference in the higher moments.
+	assert_approx(actual, expectedAspect, 5e-4, approx_abs, aspectName, pathFilename)  # pyright: ignore[reportArgumentType]
+
+def test_ffprobeAllInclusiveCacheAspectralstatsEngine(pathFilename: Path) -> None:
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',))
+	cacheFFprobe.evict()
+	dictionaryAspectsNumPy = ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',), aspectralstatsEngine='NumPy')
+	cacheFFprobe.evict()
+	assert dictionaryAspects.keys() == dictionaryAspectsNumPy.keys(), f'{pathFilename.name}: {dictionaryAspects.keys() ^ dictionaryAspectsNumPy.keys() = }.'
+	hertzPerBin: float = soundfile.info(pathFilename).samplerate // 2 / 1024
+	for keyName, arrayAspect in dictionaryAspects.items():
+		assert dictionaryAspectsNumPy[keyName].shape == arrayAspect.shape, f'{pathFilename.name}: {keyName!r} of `aspectralstatsNumPy` has shape {dictionaryAspectsNumPy[keyName].shape}, not {arrayAspect.shape}.'
+		# A rounding difference in the FFT can move the rolloff to the next frequency bin.
+		atol: float = hertzPerBin * 1.001 if keyName.endswith('rolloff') else 1e-4
+		assert numpy.allclose(dictionaryAspectsNumPy[keyName], arrayAspect, rtol=2e-3, atol=atol), f'{pathFilename.name}: {keyName!r} of `aspectralstatsNumPy` differs from `aspectralstats`.'
+
+def test_ffprobeAllInclusiveCacheSpectrogramEngine(pathFilename: Path) -> None:
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',))
+	cacheFFprobe.evict()
+	dictionaryAspectsSpectrogram = ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',), aspectralstatsEngine='spectrogram')
+	cacheFFprobe.evict()
+	assert dictionaryAspects.keys() == dictionaryAspectsSpectrogram.keys(), f'{pathFilename.name}: {dictionaryAspects.keys() ^ dictionaryAspectsSpectrogram.keys() = }.'
+
+@pytest.mark.parametrize('hertzTone', [750, 3000])
+def test_aspectralstatsSpectrogramTone(hertzTone: int) -> None:
+	sampleRate: int = 48000
+	lengthFFT: int = 2048
+	frames: int = 24
+	waveform: Audio = numpy.atleast_2d(numpy.sin(2 * numpy.pi * hertzTone * numpy.arange(frames * lengthFFT) / sampleRate))
+	spectrogramMagnitude = numpy.absolute(numpy.fft.rfft(waveform.reshape(1, -1, lengthFFT) * numpy.hanning(lengthFFT), axis=-1)).swapaxes(-1, -2)
+	dictionaryAspects = aspectralstatsSpectrogram(spectrogramMagnitude, sampleRate)
+	keyCentroid: str = next(keyName for keyName in dictionaryAspects if keyName.endswith('centroid'))
+	assert dictionaryAspects[keyCentroid].shape == (1, frames)
+	assert numpy.allclose(dictionaryAspects[keyCentroid], hertzTone, rtol=1e-3), f'The spectral centroid of a {hertzTone} Hz tone is {dictionaryAspects[keyCentroid]}.'
+
+@pytest.mark.parametrize('shareWaveformWithFFmpeg', [False, True])
+@pytest.mark.parametrize('segmentsFFprobe', [2, 5])
+def test_ffprobeAllInclusiveCacheSegments(waveformAndData: WaveformAndData, segmentsFFprobe: int, shareWaveformWithFFmpeg: bool) -> None:
+	pathFilename: Path = waveformAndData.pathFilename
+	waveformAndSampleRate: tuple[Audio, int] | None = (numpy.atleast_2d(waveformAndData.waveform), waveformAndData.sampleRate) if shareWaveformWithFFmpeg else None
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename)
+	cacheFFprobe.evict()
+	dictionaryAspectsSegments = ffprobeAllInclusiveCache(pathFilename, waveformAndSampleRate=waveformAndSampleRate, segmentsFFprobe=segmentsFFprobe)
+	cacheFFprobe.evict()
+	assert list(dictionaryAspects) == list(dictionaryAspectsSegments), f'{pathFilename.name}: {dictionaryAspects.keys() ^ dictionaryAspectsSegments.keys() = }.'
+	for keyName, arrayAspect in dictionaryAspects.items():
+		if keyName in {'I', 'LRA', 'LRA.low', 'LRA.high'}:
+			# The loudness that FFprobe rounds to three decimal places can cross into the next histogram bin of 0.01 LU.
+			assert numpy.allclose(dictionaryAspectsSegments[keyName], arrayAspect, rtol=0, atol=0.03), f'{pathFilename.name}: {keyName!r} of {segmentsFFprobe} segments differs from one process.'
+		else:
+			assert numpy.array_equal(dictionaryAspectsSegments[keyName], arrayAspect, equal_nan=True), f'{pathFilename.name}: {keyName!r} of {segmentsFFprobe} segments differs from one process.'
+
+@pytest.mark.parametrize('shareWaveformWithFFmpeg', [False, True])
+def test_ffprobeAllInclusiveCacheAstatsFramewise(waveformAndData: WaveformAndData, shareWaveformWithFFmpeg: bool) -> None:
+	pathFilename: Path = waveformAndData.pathFilename
+	waveform: Audio = numpy.atleast_2d(waveformAndData.waveform)
+	waveformAndSampleRate: tuple[Audio, int] | None = (waveform, waveformAndData.sampleRate) if shareWaveformWithFFmpeg else None
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename, ('astats',))
+	cacheFFprobe.evict()
+	dictionaryAspectsBoth = ffprobeAllInclusiveCache(pathFilename, ('astats', 'astatsFramewise'), waveformAndSampleRate=waveformAndSampleRate)
+	cacheFFprobe.evict()
+	for keyName, arrayAspect in dictionaryAspects.items():
+		assert numpy.array_equal(dictionaryAspectsBoth[keyName], arrayAspect, equal_nan=True), f'{pathFilename.name}: {keyName!r} differs when `astatsFramewise` shares the filter graph.'
+	assert set(dictionaryAspectsBoth) - set(dictionaryAspects) == {f'astatsFramewise.{keyName}' for keyName in dictionaryAspects}
+	# Each frame of 100 ms has the RMS level of only its own samples.
+	samplesPerFrame: int = waveformAndData.sampleRate // 10
+	frames: int = waveform.shape[-1] // samplesPerFrame
+	framesRMS = numpy.sqrt(numpy.mean(numpy.square(waveform[..., 0:frames * samplesPerFrame].astype(numpy.float64).reshape(waveform.shape[0], frames, samplesPerFrame)), axis=-1))
+	with numpy.errstate(divide='ignore'):
+		framesRMS_level = 20 * numpy.log10(framesRMS)
+	assert numpy.allclose(dictionaryAspectsBoth['astatsFramewise.RMS_level'][..., 0:frames], framesRMS_level, rtol=0, atol=1e-4), f'{pathFilename.name}: the RMS level of each frame differs.'
+
+@pytest.mark.parametrize(('filterName', 'keywordArguments'), [
+	('astats', {'astatsEngine': 'NumPy'}),
+	('ebur128', {'ebur128Engine': 'NumPy'}),
+	('aspectralstats', {'aspectralstatsEngine': 'NumPy'}),
+	('aspectralstats', {'aspectralstatsEngine': 'spectrogram'}),
+])
+def test_ffprobeAllInclusiveCacheEnginesApart(pathFilename: Path, filterName: str, keywordArguments: dict[str, Any]) -> None:
+	cacheFFprobe.evict()
+	dictionaryAspectsEngine = ffprobeAllInclusiveCache(pathFilename, (filterName,), **keywordArguments)
+	cacheFFprobe.evict()
+	dictionaryAspects = ffprobeAllInclusiveCache(pathFilename, (filterName,))
+	# The cache holds the statistics of FFmpeg, and a request with another engine receives the statistics of its own engine.
+	dictionaryAspectsEngineCached = ffprobeAllInclusiveCache(pathFilename, (filterName,), **keywordArguments)
+	dictionaryAspectsCached = ffprobeAllInclusiveCache(pathFilename, (filterName,))
+	cacheFFprobe.evict()
+	for keyName, arrayAspect in dictionaryAspectsEngine.items():
+		assert numpy.array_equal(dictionaryAspectsEngineCached[keyName], arrayAspect, equal_nan=True), f'{pathFilename.name}: {keyName!r} with {keywordArguments} differs after FFmpeg ran.'
+	for keyName, arrayAspect in dictionaryAspects.items():
+		assert numpy.array_equal(dictionaryAspectsCached[keyName], arrayAspect, equal_nan=True), f'{pathFilename.name}: {keyName!r} of FFmpeg differs after {keywordArguments}.'
+
+def test_ffprobeAllInclusiveCacheUnknownFilter(pathFilename: Path) -> None:
+	with pytest.raises(ValueError, match='FFmpeg filters'):
+		ffprobeAllInclusiveCache(pathFilename, ('drmeter',))
+
+def test_ffprobeAllInclusiveCacheUnknownAstatsEngine(pathFilename: Path) -> None:
+	with pytest.raises(ValueError, match='astatsEngine'):
+		ffprobeAllInclusiveCache(pathFilename, ('astats',), astatsEngine='SoX')  # pyright: ignore[reportArgumentType]
+
+def test_ffprobeAllInclusiveCacheUnknownEbur128Engine(pathFilename: Path) -> None:
+	with pytest.raises(ValueError, match='ebur128Engine'):
+		ffprobeAllInclusiveCache(pathFilename, ('ebur128',), ebur128Engine='libebur128')  # pyright: ignore[reportArgumentType]
+
+def test_ffprobeAllInclusiveCacheUnknownAspectralstatsEngine(pathFilename: Path) -> None:
+	with pytest.raises(ValueError, match='aspectralstatsEngine'):
+		ffprobeAllInclusiveCache(pathFilename, ('aspectralstats',), aspectralstatsEngine='Essentia')  # pyright: ignore[reportArgumentType]
+
+def test_ffprobeAllInclusiveCacheSegmentsFFprobe(pathFilename: Path) -> None:
+	with pytest.raises(ValueError, match='segmentsFFprobe'):
+		ffprobeAllInclusiveCache(pathFilename, ('ebur128',), segmentsFFprobe=0)
+
+def _getAspectName(analyzer: Callable[..., Any]) -> str:
+	"""Return the aspect name of a registered analyzer."""
+	return next(aspectName for aspectName, analyzerAudioAspects in audioAspects.items() if analyzerAudioAspects['analyzer'] is analyzer)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from analyzeAudio import CacheAspectValues
+from analyzeAudio._cacheAspectValues import getAnalyzerVersion
+from analyzeAudio.analyze import analyzeAudioFile
+from analyzeAudio.registry import audioAspects
+from pathlib import Path
+from tests import listPathFilenamesDataSamples
+import analyzeAudio._cacheAspectValues
+import analyzeAudio.analyzersUseFilename._wideRange
+import os
+import pytest
+import shutil
+
+@pytest.mark.parametrize('identifyByContent', [False, True])
+def test_analyzeAudioFileCacheAspectValues(tmp_path: Path, identifyByContent: bool) -> None:
+	pathFilename: Path = tmp_path / listPathFilenamesDataSamples[0].name
+	shutil.copyfile(listPathFilenamesDataSamples[0], pathFilename)
+	listAspectNames: list[str] = ['RMS Waveform mean', 'Spectral Centroid mean', 'aspect that is not registered']
+	cacheAspectValues = CacheAspectValues(tmp_path / 'cache.sqlite', identifyByContent=identifyByContent)
+
+	expected: tuple[str | float, ...] = analyzeAudioFile(pathFilename, listAspectNames)
+	assert analyzeAudioFile(pathFilename, listAspectNames, cacheAspectValues=cacheAspectValues) == expected
+	identityFile: str = cacheAspectValues.identifyFile(pathFilename)
+	assert cacheAspectValues.getAspectValues(identityFile, listAspectNames[0:2]) == dict(zip(listAspectNames[0:2], expected[0:2], strict=True))
+
+	cacheAspectValues.setAspectValues(identityFile, {'RMS Waveform mean': -1.0})
+	assert analyzeAudioFile(pathFilename, listAspectNames, cacheAspectValues=cacheAspectValues) == (-1.0, *expected[1:])
+
+	statFile: os.stat_result = pathFilename.stat()
+	os.utime(pathFilename, ns=(statFile.st_atime_ns, statFile.st_mtime_ns + 10**9))
+	assert (cacheAspectValues.identifyFile(pathFilename) == identityFile) is identifyByContent
+
+@pytest.mark.parametrize('bytesLimit', [0, 400, None])
+def test_CacheAspectValuesEvict(tmp_path: Path, bytesLimit: int | None) -> None:
+	cacheAspectValues = CacheAspectValues(tmp_path / 'cache.sqlite', bytesLimit=bytesLimit)
+	for index, pathFilename in enumerate(listPathFilenamesDataSamples):
+		cacheAspectValues.setAspectValues(cacheAspectValues.identifyFile(pathFilename), {'RMS Waveform mean': float(index)})
+		assert bytesLimit is None or cacheAspectValues.getSizeBytes() <= bytesLimit
+
+	identityFileNewest: str = cacheAspectValues.identifyFile(listPathFilenamesDataSamples[-1])
+	dictionaryExpected: dict[str, float] = {} if bytesLimit == 0 else {'RMS Waveform mean': float(len(listPathFilenamesDataSamples) - 1)}
+	assert cacheAspectValues.getAspectValues(identityFileNewest, ['RMS Waveform mean']) == dictionaryExpected
+
+	cacheAspectValues.evict()
+	assert cacheAspectValues.getSizeBytes() == 0
+
+def test_CacheAspectValuesEngines(tmp_path: Path) -> None:
+	pathFilename: Path = tmp_path / listPathFilenamesDataSamples[0].name
+	shutil.copyfile(listPathFilenamesDataSamples[0], pathFilename)
+	listAspectNames: list[str] = ['RMS_level overall', 'LUFS integrated', 'Spectral centroid mean', 'Spectral Centroid mean']
+	cacheAspectValues = CacheAspectValues(tmp_path / 'cache.sqlite')
+	dictionaryEngines: dict[str, str] = {'astatsEngine': 'NumPy', 'ebur128Engine': 'NumPy', 'aspectralstatsEngine': 'NumPy'}
+
+	expected: tuple[str | float, ...] = analyzeAudioFile(pathFilename, listAspectNames, **dictionaryEngines)
+	analyzeAudioFile(pathFilename, listAspectNames, cacheAspectValues=cacheAspectValues)
+	assert analyzeAudioFile(pathFilename, listAspectNames, cacheAspectValues=cacheAspectValues, **dictionaryEngines) == expected
+
+	identityFile: str = cacheAspectValues.identifyFile(pathFilename)
+	cacheAspectValues.setAspectValues(identityFile, {'RMS_level overall': -1.0})
+	assert analyzeAudioFile(pathFilename, listAspectNames[0:1], cacheAspectValues=cacheAspectValues) == (-1.0,)
+	assert analyzeAudioFile(pathFilename, listAspectNames[0:1], cacheAspectValues=cacheAspectValues, **dictionaryEngines) == expected[0:1]
+
+def test_CacheAspectValuesStatements(tmp_path: Path) -> None:
+	listAspectNames: list[str] = ['RMS Waveform mean', 'Spectral Centroid mean', 'LUFS integrated', 'Spectral flux median']
+	cacheAspectValues = CacheAspectValues(tmp_path / 'cache.sqlite')
+	identityFile: str = cacheAspectValues.identifyFile(listPathFilenamesDataSamples[0])
+	cacheAspectValues.setAspectValues(identityFile, dict.fromkeys(listAspectNames[0:3], 1.0))
+	listStatements: list[str] = []
+	cacheAspectValues.connection.set_trace_callback(listStatements.append)
+	assert cacheAspectValues.getAspectValues(identityFile, listAspectNames) == dict.fromkeys(listAspectNames[0:3], 1.0)
+	listKinds: list[str] = [statement.split(' ', 1)[0] for statement in listStatements]
+	assert listKinds == ['SELECT', 'BEGIN', 'UPDATE', 'UPDATE', 'UPDATE', 'COMMIT'], f'getAspectValues ran {listStatements}.'
+
+def test_CacheAspectValuesSizeBytes(tmp_path: Path) -> None:
+	cacheAspectValues = CacheAspectValues(tmp_path / 'cache.sqlite', bytesLimit=600)
+	for index, pathFilename in enumerate(listPathFilenamesDataSamples):
+		identityFile: str = cacheAspectValues.identifyFile(pathFilename)
+		cacheAspectValues.setAspectValues(identityFile, {'RMS Waveform mean': float(index), 'Spectral Centroid mean': 'x' * index})
+		cacheAspectValues.setAspectValues(identityFile, {'RMS Waveform mean': 'x' * index})
+		sizeBytes: int = cacheAspectValues.connection.execute('SELECT COALESCE(SUM(sizeBytes), 0) FROM aspectValues').fetchone()[0]
+		assert cacheAspectValues.getSizeBytes() == sizeBytes, f'The running total is {cacheAspectValues.getSizeBytes()}, not {sizeBytes}.'
+	assert CacheAspectValues(tmp_path / 'cache.sqlite').getSizeBytes() == cacheAspectValues.getSizeBytes()
+
+def test_CacheAspectValuesSegmentsFFprobe(tmp_path: Path) -> None:
+	cacheAspectValues = CacheAspectValues(tmp_path / 'cache.sqlite')
+	identityFile: str = cacheAspectValues.identifyFile(listPathFilenamesDataSamples[0])
+	dictionaryAspectValues: dict[str, float] = {'LUFS integrated': -1.0, 'Spectral centroid mean': -2.0, 'RMS_level overall': -3.0, 'RMS Waveform mean': -4.0}
+	cacheAspectValues.setAspectValues(identityFile, dictionaryAspectValues)
+	# `astats` always measures the whole file, and an analyzer without an FFmpeg filter does not depend on FFprobe.
+	assert cacheAspectValues.getAspectValues(identityFile, dictionaryAspectValues, segmentsFFprobe=4) == {'RMS_level overall': -3.0, 'RMS Waveform mean': -4.0}
+	dictionaryEngines: dict[str, str] = {'ebur128': 'NumPy', 'aspectralstats': 'NumPy'}
+	cacheAspectValues.setAspectValues(identityFile, dictionaryAspectValues, dictionaryEngines=dictionaryEngines)
+	assert cacheAspectValues.getAspectValues(identityFile, dictionaryAspectValues, dictionaryEngines=dictionaryEngines, segmentsFFprobe=4) == dictionaryAspectValues
+
+@pytest.mark.parametrize(('aspectName', 'changed'), [('LUFS integrated', True), ('Spectral flux median', True), ('RMS Waveform mean', False), ('Spectral Centroid mean', False)])
+def test_getAnalyzerVersionDependencies(aspectName: str, changed: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+	analyzer = audioAspects[aspectName]['analyzer']
+	analyzerVersion: str = getAnalyzerVersion(analyzer)
+	pathFilenameHelper: Path = Path(analyzeAudio.analyzersUseFilename._wideRange.__file__)
+	readBytes = Path.read_bytes
+	getAnalyzerVersion.cache_clear()
+	analyzeAudio._cacheAspectValues._getDigestModule.cache_clear()
+	# An edit to a helper of the FFprobe analyzers, such as `ffprobeAllInclusiveCache`, changes the version of only the analyzers that import it.
+	monkeypatch.setattr(Path, 'read_bytes', lambda pathFilename: b'edited' if pathFilename == pathFilenameHelper else readBytes(pathFilename))
+	try:
+		assert (getAnalyzerVersion(analyzer) != analyzerVersion) is changed, f'{aspectName = }'
+	finally:
+		getAnalyzerVersion.cache_clear()
+		analyzeAudio._cacheAspectValues._getDigestModule.cache_clear()
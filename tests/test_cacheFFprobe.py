@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from analyzeAudio import CacheFFprobe
+from analyzeAudio.analyzersUseFilename._wideRange import cacheFFprobe, ffprobeAllInclusiveCache
+from pathlib import Path
+from tests import listPathFilenamesDataSamples
+import numpy
+import os
+import pytest
+import shutil
+
+def dictionaryFilterAspectsOfSize(sizeBytes: int) -> dict[str, dict[str, numpy.ndarray]]:
+	return {'astats': {'RMS_level': numpy.zeros(sizeBytes // 8)}}
+
+def test_CacheFFprobeLeastRecentlyUsed() -> None:
+	cache = CacheFFprobe(bytesLimit=2000)
+	cache.setFilterAspects('alfa\x001\x001', dictionaryFilterAspectsOfSize(800))
+	cache.setFilterAspects('beta\x001\x001', dictionaryFilterAspectsOfSize(800))
+	assert cache.getFilterAspects('alfa\x001\x001', ['astats']), 'The cache lost the entry of alfa.'
+	cache.setFilterAspects('gamma\x001\x001', dictionaryFilterAspectsOfSize(800))
+	assert cache.getSizeBytes() == 1600, f'{cache.getSizeBytes() = }.'
+	assert not cache.getFilterAspects('beta\x001\x001', ['astats']), 'The cache kept the least recently used entry, beta.'
+	assert cache.getFilterAspects('alfa\x001\x001', ['astats']), 'The cache evicted alfa, which was used more recently than beta.'
+	assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 1), f'{(cache.hits, cache.misses, cache.evictions) = }.'
+	cache.evict()
+	assert cache.getSizeBytes() == 0, f'{cache.getSizeBytes() = }.'
+
+def test_CacheFFprobeFilterNames() -> None:
+	cache = CacheFFprobe(bytesLimit=None)
+	cache.setFilterAspects('alfa\x001\x001', dictionaryFilterAspectsOfSize(80))
+	assert list(cache.getFilterAspects('alfa\x001\x001', ['astats', 'ebur128'])) == ['astats']
+	cache.setFilterAspects('alfa\x001\x001', {'ebur128': {'I': numpy.zeros(10)}})
+	assert set(cache.getFilterAspects('alfa\x001\x001', ['astats', 'ebur128'])) == {'astats', 'ebur128'}
+	assert (cache.hits, cache.misses, cache.getSizeBytes()) == (1, 1, 160), f'{(cache.hits, cache.misses, cache.getSizeBytes()) = }.'
+
+def test_CacheFFprobeBytesLimit() -> None:
+	with pytest.raises(ValueError, match='bytesLimit'):
+		CacheFFprobe(bytesLimit=-1)
+
+def test_ffprobeAllInclusiveCacheIdentity(tmp_path: Path) -> None:
+	pathFilename: Path = tmp_path / 'audio.wav'
+	shutil.copyfile(listPathFilenamesDataSamples[0], pathFilename)
+	cacheFFprobe.evict()
+	hitsBefore, missesBefore = cacheFFprobe.hits, cacheFFprobe.misses
+	LUFSintegrated = ffprobeAllInclusiveCache(pathFilename, ['ebur128'])['I'][-1]
+	ffprobeAllInclusiveCache(str(pathFilename), ['ebur128'])
+	ffprobeAllInclusiveCache(tmp_path / '.' / 'audio.wav', ['ebur128'])
+	assert (cacheFFprobe.hits - hitsBefore, cacheFFprobe.misses - missesBefore) == (2, 1), 'The spellings of one path did not share one entry.'
+
+	# A file rewritten in place is analyzed again, and the entry of its earlier content is evicted.
+	shutil.copyfile(listPathFilenamesDataSamples[1], pathFilename)
+	os.utime(pathFilename, ns=(1, 1))
+	assert ffprobeAllInclusiveCache(pathFilename, ['ebur128'])['I'][-1] != LUFSintegrated, 'ffprobeAllInclusiveCache returned the statistics of the earlier content.'
+	assert cacheFFprobe.misses - missesBefore == 2, f'{cacheFFprobe.misses - missesBefore = }.'
+	assert cacheFFprobe.getSizeBytes() == sum(arrayAspect.nbytes for arrayAspect in ffprobeAllInclusiveCache(pathFilename, ['ebur128']).values())
+	cacheFFprobe.evict()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from analyzeAudio import CacheSTFT
+from analyzeAudio._cacheSTFT import stftShared
+from analyzeAudio.contestsTensor import (
+	analyzeChromaSTFTLossMean, analyzeMelSTFTLossMean, analyzeMultiResolutionSTFTLossMean, analyzeSTFTLossMean,
+	analyzeSumAndDifferenceSTFTLossMean)
+from typing import TYPE_CHECKING
+import gc
+import pytest
+import torch
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+	from tests import ContestTensor
+
+@pytest.mark.parametrize(('analyzer', 'reusesSTFT'), [
+	(lambda contestTensor: analyzeSTFTLossMean(contestTensor.tensorAlfa, contestTensor.tensorBeta), True),
+	(lambda contestTensor: analyzeMelSTFTLossMean(contestTensor.tensorAlfa, contestTensor.tensorBeta, contestTensor.sampleRateAlfa), True),
+	(lambda contestTensor: analyzeChromaSTFTLossMean(contestTensor.tensorAlfa, contestTensor.tensorBeta, contestTensor.sampleRateAlfa), True),
+	(lambda contestTensor: analyzeMultiResolutionSTFTLossMean(contestTensor.tensorAlfa, contestTensor.tensorBeta), True),
+	# The sum and the difference are new signals in each evaluation.
+	(lambda contestTensor: analyzeSumAndDifferenceSTFTLossMean(contestTensor.tensorAlfa, contestTensor.tensorBeta), False),
+], ids=['STFTLoss', 'MelSTFTLoss', 'ChromaSTFTLoss', 'MultiResolutionSTFTLoss', 'SumAndDifferenceSTFTLoss'])
+def test_CacheSTFTContests(contestTensor: ContestTensor, analyzer: Callable[[ContestTensor], float], reusesSTFT: bool) -> None:
+	contestValue: float = analyzer(contestTensor)
+	with CacheSTFT() as cacheSTFT:
+		assert analyzer(contestTensor) == contestValue, f'{contestTensor.paths}: the contest differs with shared STFTs.'
+		misses: int = cacheSTFT.misses
+		assert misses > 0, 'The contest did not read its STFTs from the cache.'
+		assert analyzer(contestTensor) == contestValue, f'{contestTensor.paths}: the contest differs when it reads cached STFTs.'
+		assert (cacheSTFT.misses == misses) is reusesSTFT, f'The second evaluation computed {cacheSTFT.misses - misses} STFTs again.'
+	assert len(cacheSTFT) == 0, 'The cache kept STFTs after the `with` block.'
+
+def test_CacheSTFTSharedResolution(contestTensor: ContestTensor) -> None:
+	with CacheSTFT() as cacheSTFT:
+		analyzeSTFTLossMean(contestTensor.tensorAlfa, contestTensor.tensorBeta)
+		analyzeChromaSTFTLossMean(contestTensor.tensorAlfa, contestTensor.tensorBeta, contestTensor.sampleRateAlfa)
+		# `ChromaSTFTLoss` has the resolution of `STFTLoss`, so it reads both STFTs from the cache.
+		assert (cacheSTFT.hits, cacheSTFT.misses) == (2, 2), f'{(cacheSTFT.hits, cacheSTFT.misses) = }.'
+
+def test_CacheSTFTReleasesSignal() -> None:
+	window = torch.hann_window(1024)
+	signalAlfa = torch.randn(2, 48000)
+	with CacheSTFT() as cacheSTFT:
+		signalBeta = torch.randn(2, 48000)
+		stftShared(signalAlfa, 1024, 256, 1024, window)
+		stftShared(signalBeta.view(-1, 48000), 1024, 256, 1024, window)
+		stftShared(signalBeta[0], 1024, 256, 1024, window)
+		assert len(cacheSTFT) == 3, f'{len(cacheSTFT) = }.'
+		del signalBeta
+		gc.collect()
+		assert len(cacheSTFT) == 1, 'The cache kept the STFTs of a released signal.'
+	assert len(cacheSTFT) == 0, 'The cache kept STFTs after the `with` block.'
+
+def test_CacheSTFTInPlace() -> None:
+	window = torch.hann_window(512)
+	signal = torch.randn(16000)
+	with CacheSTFT() as cacheSTFT:
+		spectrogram = stftShared(signal, 512, 128, 512, window)
+		assert stftShared(signal, 512, 128, 512, window) is spectrogram
+		assert stftShared(signal, 512, 128, 512, window, center=False) is not spectrogram
+		signal.mul_(0.5)
+		assert torch.allclose(stftShared(signal, 512, 128, 512, window), spectrogram * 0.5, atol=1e-5), 'The cache returned the STFT of the samples before the change.'
+		assert (cacheSTFT.hits, cacheSTFT.misses) == (1, 3), f'{(cacheSTFT.hits, cacheSTFT.misses) = }.'
+
+def test_stftSharedWithoutCache() -> None:
+	window = torch.hann_window(2048)
+	signal = torch.randn(3, 44100)
+	assert torch.equal(stftShared(signal, 2048, 512, 2048, window), torch.stft(signal, 2048, 512, 2048, window, return_complex=True))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from analyzeAudio._filterbanks import _filterbankChroma, _filterbankMel, filterbankChroma, filterbankMel
+from analyzeAudio.analyzersUseSpectrogram import analyzeChromagram
+from typing import Any, TYPE_CHECKING
+import librosa
+import numpy
+import pytest
+
+if TYPE_CHECKING:
+	from tests._dataBaskets import SpectrogramPowerAndData
+
+@pytest.mark.parametrize('parametersMel', [
+	{'sr': 44100, 'n_fft': 4096, 'n_mels': 512},
+	{'sr': 16000, 'n_fft': 1024, 'n_mels': 40, 'fmin': 80.0, 'fmax': 7600.0, 'htk': True, 'norm': None, 'dtype': numpy.float64},
+])
+def test_filterbankMel(parametersMel: dict[str, Any]) -> None:
+	filterbank = filterbankMel(**parametersMel)
+	assert numpy.array_equal(filterbank, librosa.filters.mel(**parametersMel)), f'The mel filterbank of {parametersMel} differs from librosa.'
+	assert filterbankMel(**parametersMel) is filterbank, 'The second call built the mel filterbank again.'
+	assert not filterbank.flags.writeable, 'A caller can change the shared mel filterbank.'
+
+@pytest.mark.parametrize('parametersChroma', [
+	{'sr': 44100, 'n_fft': 2048},
+	{'sr': 22050, 'n_fft': 1024, 'n_chroma': 24, 'tuning': -0.24, 'octwidth': None, 'norm': numpy.inf, 'base_c': False},
+])
+def test_filterbankChroma(parametersChroma: dict[str, Any]) -> None:
+	filterbank = filterbankChroma(**parametersChroma)
+	assert numpy.array_equal(filterbank, librosa.filters.chroma(**parametersChroma)), f'The chroma filterbank of {parametersChroma} differs from librosa.'
+	assert filterbankChroma(**parametersChroma) is filterbank, 'The second call built the chroma filterbank again.'
+	assert not filterbank.flags.writeable, 'A caller can change the shared chroma filterbank.'
+
+def test_filterbankMelRepeatsWarnings() -> None:
+	parametersMel: dict[str, Any] = {'sr': 8000, 'n_fft': 256, 'n_mels': 128, 'fmax': 1000.0}
+	for _call in range(2):
+		with pytest.warns(UserWarning, match='Empty filters detected in mel frequency basis.'):
+			filterbankMel(**parametersMel)
+	assert _filterbankMel.cache_info().hits >= 1
+
+@pytest.mark.parametrize('keywordArguments', [{}, {'norm': None, 'n_chroma': 24}, {'tuning': 0.1, 'norm': 1}])
+def test_analyzeChromagramFilterbank(spectrogramPowerAndData: SpectrogramPowerAndData, keywordArguments: dict[str, Any]) -> None:
+	spectrogramPower = spectrogramPowerAndData.spectrogramPower
+	sampleRate: int = spectrogramPowerAndData.sampleRate
+	chromagram = analyzeChromagram(spectrogramPower, sampleRate, **keywordArguments)
+	assert numpy.allclose(chromagram, librosa.feature.chroma_stft(S=spectrogramPower, sr=sampleRate, **keywordArguments), rtol=1e-6, atol=0), f'The chromagram with {keywordArguments} differs from librosa.'
+
+def test_analyzeChromagramTuningResolution(monkeypatch: pytest.MonkeyPatch) -> None:
+	spectrogramPower = numpy.abs(numpy.random.default_rng(0).standard_normal((1025, 40))).astype(numpy.float32)
+	# Two edges of the histogram of `librosa.estimate_tuning` that differ only by floating-point error.
+	listTunings: list[float] = [0.1 + 0.2 - 0.17, 0.13]
+	monkeypatch.setattr(librosa, 'estimate_tuning', lambda **_keywordArguments: listTunings.pop(0))
+	_filterbankChroma.cache_clear()
+	chromagram = analyzeChromagram(spectrogramPower, 44100)
+	assert numpy.array_equal(analyzeChromagram(spectrogramPower, 44100), chromagram)
+	assert _filterbankChroma.cache_info().misses == 1, f'{_filterbankChroma.cache_info() = }.'
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from analyzeAudio import InstrumentationAnalysis
+from analyzeAudio.analyze import analyzeAudioFile, analyzeAudioListPathFilenames
+from tests import listPathFilenamesDataSamples
+from typing import TYPE_CHECKING
+import pytest
+import tracemalloc
+
+if TYPE_CHECKING:
+	from pathlib import Path
+
+@pytest.mark.parametrize('traceAllocations', [False, True])
+def test_InstrumentationAnalysis(pathFilename: Path, traceAllocations: bool) -> None:
+	listAspectNames: list[str] = ['Spectral Centroid mean', 'RMS Waveform mean', 'aspect that is not registered']
+	instrumentation = InstrumentationAnalysis(traceAllocations=traceAllocations)
+	assert analyzeAudioFile(pathFilename, listAspectNames, instrumentation=instrumentation) == analyzeAudioFile(pathFilename, listAspectNames)
+	listKindName: list[tuple[str, str]] = [(record.kind, record.name) for record in instrumentation.listRecords]
+	assert listKindName == [('intermediate', 'waveform'), ('intermediate', 'spectrogram'), ('intermediate', 'spectrogramMagnitude')
+		, ('aspect', 'Spectral Centroid mean'), ('aspect', 'RMS Waveform mean')], f'{listKindName = }'
+	for record in instrumentation.listRecords:
+		assert record.pathFilename == pathFilename.as_posix(), f'{record = }'
+		assert 0 <= record.secondsWall and 0 <= record.secondsCPU, f'{record = }'
+		if not traceAllocations:
+			assert record.bytesPeak == 0, f'{record = }'
+
+def test_InstrumentationAnalysisTracingOfCaller(pathFilename: Path) -> None:
+	instrumentation = InstrumentationAnalysis()
+	tracemalloc.start()
+	try:
+		listAllocated: list[bytes] = [bytes(2 ** 20)]
+		bytesPeakCaller: int = tracemalloc.get_traced_memory()[1]
+		del listAllocated
+		analyzeAudioFile(pathFilename, ['RMS Waveform mean'], instrumentation=instrumentation)
+		assert tracemalloc.is_tracing(), 'InstrumentationAnalysis.measure stopped the tracing of the caller.'
+		assert bytesPeakCaller <= tracemalloc.get_traced_memory()[1], 'InstrumentationAnalysis.measure reset the peak of the caller.'
+	finally:
+		tracemalloc.stop()
+	assert all(record.bytesPeak == 0 for record in instrumentation.listRecords), f'{instrumentation.listRecords = }'
+
+def test_InstrumentationAnalysisWorkers() -> None:
+	instrumentation = InstrumentationAnalysis()
+	analyzeAudioListPathFilenames(listPathFilenamesDataSamples, ['RMS Waveform mean'], CPUlimit=1, instrumentation=instrumentation)
+	tableRows: list[list[str | float]] = instrumentation.getTableRows()
+	assert sorted(row[0:3] for row in tableRows) == [
+		['aspect', 'RMS Waveform mean', len(listPathFilenamesDataSamples)], ['intermediate', 'waveform', len(listPathFilenamesDataSamples)]], f'{tableRows = }'
+	assert all(len(row) == len(instrumentation.tableColumns) for row in tableRows), f'{tableRows = }'
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from analyzeAudio._memoryMapWAV import memoryMapWAV, toFloat32
+from tests import pathFilenameMixture
+from typing import TYPE_CHECKING
+import numpy
+import pytest
+import soundfile
+
+if TYPE_CHECKING:
+	from pathlib import Path
+
+def test_memoryMapWAV(pathFilename: Path) -> None:
+	samplesAndSampleRate = memoryMapWAV(pathFilename)
+	assert samplesAndSampleRate is not None, f'memoryMapWAV({pathFilename.name}) returned `None` for a PCM WAV file.'
+	samples, sampleRate = samplesAndSampleRate
+	waveformExpected, sampleRateExpected = soundfile.read(pathFilename, dtype='float32', always_2d=True)
+	assert sampleRate == sampleRateExpected, f'memoryMapWAV({pathFilename.name}) returned {sampleRate = }.'
+	numpy.testing.assert_array_equal(toFloat32(samples), waveformExpected, err_msg=f'memoryMapWAV({pathFilename.name})')
+
+@pytest.mark.parametrize('subtype', ['FLOAT', 'PCM_16', 'PCM_24', 'PCM_32'])
+def test_memoryMapWAVSubtype(tmp_path: Path, subtype: str) -> None:
+	pathFilenameWAV: Path = tmp_path / f'{subtype}.wav'
+	soundfile.write(pathFilenameWAV, numpy.random.default_rng(0).uniform(-1, 1, (1000, 3)).astype(numpy.float32), 22050, subtype=subtype)
+	samplesAndSampleRate = memoryMapWAV(pathFilenameWAV)
+	if subtype == 'PCM_24':
+		assert samplesAndSampleRate is None, 'memoryMapWAV returned samples for 24-bit PCM, which it does not map.'
+		return
+	assert samplesAndSampleRate is not None, f'memoryMapWAV returned `None` for {subtype}.'
+	numpy.testing.assert_array_equal(toFloat32(samplesAndSampleRate[0]), soundfile.read(pathFilenameWAV, dtype='float32', always_2d=True)[0], err_msg=subtype)
+	if subtype == 'FLOAT':
+		assert toFloat32(samplesAndSampleRate[0]) is samplesAndSampleRate[0], 'toFloat32 copied 32-bit floating-point samples.'
+
+def test_memoryMapWAVNotWAV() -> None:
+	assert memoryMapWAV(pathFilenameMixture) is None, f'memoryMapWAV({pathFilenameMixture.name}) returned samples for a FLAC file.'
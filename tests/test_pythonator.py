@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from analyzeAudio.analyzersUseFilename._pythonator import pythonizeFFprobe, pythonizeFFprobeStream, pythonizeFFprobeStreams
+import io
+import json
+import numpy
+import pytest
+
+# A channel that first appears after other channels adds rows that start as copies of the existing rows.
+FFprobeJSON_utf8: str = json.dumps({'frames': [
+	{},
+	{'tags': {'lavfi.astats.1.X': '1', 'comment': 'not a statistic'}},
+	{'tags': {'lavfi.astats.1.X': '2', 'lavfi.astats.2.X': '3', 'lavfi.r128.M': '-5'}},
+	{'tags': {'lavfi.astats.3.X': '4', 'lavfi.astats.Overall.Y': 'nan'}},
+	{'tags': {'lavfi.r128.M': '-6', 'lavfi.astats.1.X': '7'}},
+]})
+
+@pytest.mark.parametrize(('registrant', 'statistic', 'expected'), [
+	('astats', 'X', [[0, 1, 2, 0, 7], [0, 1, 3, 0, 0], [0, 1, 2, 4, 0]]),
+	('astats', 'Overall.Y', [0, 0, 0, numpy.nan, 0]),
+	('r128', 'M', [0, 0, -5, 0, -6]),
+])
+def test_pythonizeFFprobe(registrant: str, statistic: str, expected: list[float] | list[list[float]]) -> None:
+	FFroot, dictionaryRegistrants = pythonizeFFprobe(FFprobeJSON_utf8)
+	assert list(dictionaryRegistrants) == ['astats', 'r128'], f'{list(dictionaryRegistrants) = }.'
+	assert list(dictionaryRegistrants['astats']) == ['X', 'Overall.Y'], f'{list(dictionaryRegistrants["astats"]) = }.'
+	assert len(FFroot['frames']) == 5, f'{FFroot["frames"] = }.'
+	actual = dictionaryRegistrants[registrant][statistic]
+	assert actual.dtype == numpy.float64, f'{registrant}.{statistic}: {actual.dtype = }.'
+	assert numpy.array_equal(actual, numpy.array(expected, dtype=numpy.float64), equal_nan=True), f'{registrant}.{statistic}: {actual = }.'
+
+class ReadStreamChunked(io.BytesIO):
+	"""Return at most `sizeChunk` bytes from each read, like a pipe that FFprobe has not filled yet."""
+
+	def __init__(self, data: bytes, sizeChunk: int) -> None:
+		super().__init__(data)
+		self.sizeChunk: int = sizeChunk
+
+	def read1(self, size: int | None = -1) -> bytes:  # noqa: ARG002
+		return super().read1(self.sizeChunk)
+
+@pytest.mark.parametrize('sizeChunk', [1, 5, 65536])
+@pytest.mark.parametrize('FFprobeJSON', [
+	FFprobeJSON_utf8,
+	# The layout of `-output_format json=compact=1`: one line for each frame.
+	'{\n    "frames": [\n' + ',\n'.join('        ' + json.dumps(FFframe) for FFframe in json.loads(FFprobeJSON_utf8)['frames']) + '\n    ]\n}\n',
+	json.dumps({'packets_and_frames': [{'type': 'frame', 'tags': {'lavfi.r128.M': '-5'}}]}),
+], ids=['one line', 'one line for each frame', 'packets_and_frames'])
+def test_pythonizeFFprobeStream(FFprobeJSON: str, sizeChunk: int) -> None:
+	expected = pythonizeFFprobe(FFprobeJSON)[-1]
+	actual = pythonizeFFprobeStream(ReadStreamChunked(FFprobeJSON.encode('utf-8'), sizeChunk))
+	assert list(actual) == list(expected), f'{list(actual) = }.'
+	for registrant, dictionaryStatistics in expected.items():
+		assert list(actual[registrant]) == list(dictionaryStatistics), f'{registrant}: {list(actual[registrant]) = }.'  # pyright: ignore[reportArgumentType]
+		for statistic, arrayStatistic in dictionaryStatistics.items():  # pyright: ignore[reportAttributeAccessIssue]
+			assert numpy.array_equal(actual[registrant][statistic], arrayStatistic, equal_nan=True), f'{registrant}.{statistic}: {actual[registrant][statistic] = }.'  # pyright: ignore[reportIndexIssue]
+
+# Two instances of `astats` after `asplit` write the same keys to two output streams, and FFprobe interleaves their frames.
+FFprobeJSONStreams_utf8: str = json.dumps({'frames': [
+	{'stream_index': 0, 'tags': {'lavfi.astats.1.X': '1'}},
+	{'stream_index': 1, 'tags': {'lavfi.astats.1.X': '10'}},
+	{'stream_index': 1, 'tags': {'lavfi.astats.1.X': '20'}},
+	{'stream_index': 0, 'tags': {'lavfi.astats.1.X': '2'}},
+	{'stream_index': 1, 'tags': {'lavfi.astats.1.X': '30', 'lavfi.astats.Overall.Y': '5'}},
+]})
+
+@pytest.mark.parametrize('sizeChunk', [1, 65536])
+def test_pythonizeFFprobeStreams(sizeChunk: int) -> None:
+	listDictionaries = pythonizeFFprobeStreams(ReadStreamChunked(FFprobeJSONStreams_utf8.encode('utf-8'), sizeChunk))
+	assert len(listDictionaries) == 2, f'{len(listDictionaries) = }.'
+	assert numpy.array_equal(listDictionaries[0]['astats']['X'], [[1, 2]]), f'{listDictionaries[0] = }.'  # pyright: ignore[reportArgumentType, reportIndexIssue]
+	assert numpy.array_equal(listDictionaries[1]['astats']['X'], [[10, 20, 30]]), f'{listDictionaries[1] = }.'  # pyright: ignore[reportArgumentType, reportIndexIssue]
+	assert numpy.array_equal(listDictionaries[1]['astats']['Overall.Y'], [0, 0, 5]), f'{listDictionaries[1] = }.'  # pyright: ignore[reportArgumentType, reportIndexIssue]
+	assert 'Overall.Y' not in listDictionaries[0]['astats'], f'{listDictionaries[0] = }.'  # pyright: ignore[reportOperatorIssue]
+
+def test_pythonizeFFprobeStreamsOneStream() -> None:
+	listDictionaries = pythonizeFFprobeStreams(ReadStreamChunked(FFprobeJSON_utf8.encode('utf-8'), 65536))
+	expected = pythonizeFFprobe(FFprobeJSON_utf8)[-1]
+	assert len(listDictionaries) == 1, f'{len(listDictionaries) = }.'
+	assert list(listDictionaries[0]) == list(expected), f'{list(listDictionaries[0]) = }.'
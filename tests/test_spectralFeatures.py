@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from analyzeAudio import analyzeAudioFile, CacheSpectralFeatures, SpectralFeatures
+from analyzeAudio.analyzersUseSpectrogram import (
+	analyzeRMSSpectrogramMean, analyzeSpectralBandwidthMean, analyzeSpectralCentroidMean, analyzeSpectralContrastMean, analyzeSpectralFlatnessMean)
+from typing import TYPE_CHECKING
+import analyzeAudio._spectralFeatures
+import librosa
+import numpy
+import pytest
+
+if TYPE_CHECKING:
+	from analyzeAudio import ArrayAspect
+	from collections.abc import Callable
+	from pathlib import Path
+	from tests import SpectrogramMagnitudeAndData
+	from typing import Any
+
+listAspectNamesSpectral: list[str] = ['RMS Spectrogram mean', 'RMS Spectrogram dB mean', 'Spectral Bandwidth mean', 'Spectral Centroid mean'
+	, 'Spectral Contrast mean', 'Spectral Flatness mean', 'Spectral Flatness dB mean']
+
+@pytest.mark.parametrize(('featureName', 'analyzer', 'parametersAnalyzer'), [
+	('rootMeanSquare', librosa.feature.rms, {'frame_length'}),
+	('spectralBandwidth', librosa.feature.spectral_bandwidth, {'sr', 'p', 'norm'}),
+	('spectralCentroid', librosa.feature.spectral_centroid, {'sr'}),
+	('spectralContrast', librosa.feature.spectral_contrast, {'sr', 'fmin', 'n_bands', 'quantile', 'linear'}),
+	('spectralFlatness', librosa.feature.spectral_flatness, {'amin', 'power'}),
+], ids=['rms', 'spectral_bandwidth', 'spectral_centroid', 'spectral_contrast', 'spectral_flatness'])
+@pytest.mark.parametrize('keywordArguments', [{}, {'sr': 44100, 'p': 3.0, 'power': 1.0, 'n_bands': 5}], ids=['default', 'parameters'])
+def test_SpectralFeatures(spectrogramMagnitudeAndData: SpectrogramMagnitudeAndData, featureName: str, analyzer: Callable[..., ArrayAspect], parametersAnalyzer: set[str], keywordArguments: dict[str, Any]) -> None:
+	spectralFeatures = SpectralFeatures(spectrogramMagnitudeAndData.spectrogramMagnitude, **keywordArguments)
+	expected: ArrayAspect = analyzer(S=spectrogramMagnitudeAndData.spectrogramMagnitude, **{parameterName: argument for parameterName, argument in keywordArguments.items() if parameterName in parametersAnalyzer})
+	actual: ArrayAspect = getattr(spectralFeatures, featureName)
+	assert actual.shape == expected.shape, f'{spectrogramMagnitudeAndData.pathFilename.name}: {featureName} has shape {actual.shape}, not {expected.shape}.'
+	assert numpy.allclose(actual, expected, rtol=1e-6, atol=1e-9), f'{spectrogramMagnitudeAndData.pathFilename.name}: {featureName} differs from `librosa.feature.{analyzer.__name__}`.'
+
+def test_SpectralFeaturesNegative() -> None:
+	with pytest.raises(librosa.ParameterError):
+		SpectralFeatures(-numpy.ones((1025, 4), dtype=numpy.float32)).spectralCentroid  # noqa: B018
+
+@pytest.mark.parametrize('analyzerMean', [analyzeRMSSpectrogramMean, analyzeSpectralBandwidthMean, analyzeSpectralCentroidMean, analyzeSpectralContrastMean, analyzeSpectralFlatnessMean])
+def test_CacheSpectralFeaturesMean(spectrogramMagnitudeAndData: SpectrogramMagnitudeAndData, analyzerMean: Callable[..., float]) -> None:
+	expected: float = analyzerMean(spectrogramMagnitudeAndData.spectrogramMagnitude)
+	with CacheSpectralFeatures() as cacheSpectralFeatures:
+		actual: float = analyzerMean(spectrogramMagnitudeAndData.spectrogramMagnitude)
+		assert analyzerMean(spectrogramMagnitudeAndData.spectrogramMagnitude) == actual
+		assert (cacheSpectralFeatures.hits, cacheSpectralFeatures.misses) == (1, 1), f'{(cacheSpectralFeatures.hits, cacheSpectralFeatures.misses) = }.'
+	assert actual == pytest.approx(expected, rel=1e-6), f'{spectrogramMagnitudeAndData.pathFilename.name}: `{analyzerMean.__name__}` is {actual} with shared features, not {expected}.'  # pyright: ignore[reportUnknownMemberType]
+	assert len(cacheSpectralFeatures) == 0, 'The cache kept features after the `with` block.'
+
+def test_CacheSpectralFeaturesKeywordArguments() -> None:
+	spectrogramMagnitude = numpy.abs(numpy.random.default_rng(0).standard_normal((1025, 40))).astype(numpy.float32)
+	with CacheSpectralFeatures() as cacheSpectralFeatures:
+		analyzeSpectralCentroidMean(spectrogramMagnitude)
+		analyzeSpectralCentroidMean(spectrogramMagnitude, sr=48000)
+		# `SpectralFeatures` does not accept `n_fft`, so the analyzer computes its feature with `librosa`.
+		analyzeSpectralCentroidMean(spectrogramMagnitude, n_fft=2048)
+		assert (cacheSpectralFeatures.hits, cacheSpectralFeatures.misses) == (0, 2), f'{(cacheSpectralFeatures.hits, cacheSpectralFeatures.misses) = }.'
+		assert len(cacheSpectralFeatures) == 2, f'{len(cacheSpectralFeatures) = }.'
+	assert len(cacheSpectralFeatures) == 0, 'The cache kept features after the `with` block.'
+
+def test_analyzeAudioFileSpectralFeatures(pathFilename: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	aspectValuesSeparate: list[float] = [analyzeAudioFile(pathFilename, [aspectName])[0] for aspectName in listAspectNamesSpectral]  # pyright: ignore[reportAssignmentType]
+	listSpectralFeatures: list[SpectralFeatures] = []
+
+	class SpectralFeaturesCounted(SpectralFeatures):
+		def __init__(self, *arguments: Any, **keywordArguments: Any) -> None:
+			super().__init__(*arguments, **keywordArguments)
+			listSpectralFeatures.append(self)
+
+	monkeypatch.setattr(analyzeAudio._spectralFeatures, 'SpectralFeatures', SpectralFeaturesCounted)
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNamesSpectral)
+	assert len(listSpectralFeatures) == 1, f'analyzeAudioFile({pathFilename.name}) made {len(listSpectralFeatures)} `SpectralFeatures` for the spectral aspects.'
+	assert aspectValues == pytest.approx(aspectValuesSeparate, rel=1e-9, nan_ok=True), f'analyzeAudioFile({pathFilename.name}) returned {aspectValues}, not {aspectValuesSeparate}.'  # pyright: ignore[reportUnknownMemberType]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from analyzeAudio import analyzeAudioFile, SummaryStatistics
+from analyzeAudio._summaryStatistics import dictionaryStatistics
+from analyzeAudio.analyzersUseFilename import analyzeSpectral_flux
+from analyzeAudio.registry import audioAspects, registrationAudioAspectSummary
+from typing import TYPE_CHECKING
+import analyzeAudio.analyzersUseSpectrogram
+import numpy
+import pytest
+import warnings
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+	from numpy.typing import NDArray
+	from pathlib import Path
+	from typing import Any
+
+dictionaryStatisticsNumPy: dict[str, Callable[[NDArray[Any]], Any]] = {
+	'mean': numpy.mean,
+	'median': numpy.median,
+	'standardDeviation': numpy.std,
+	'minimum': numpy.min,
+	'maximum': numpy.max,
+	'percentile5': lambda arrayFramewise: numpy.percentile(arrayFramewise, 5),
+	'percentile95': lambda arrayFramewise: numpy.percentile(arrayFramewise, 95),
+}
+
+@pytest.mark.parametrize('arrayFramewise', [
+	numpy.array([[0.5, 0.25, 2.0, 1.0, 0.125]], dtype=numpy.float32),
+	numpy.array([[4.0, -1.0, 3.0, 2.0], [8.0, 6.0, -5.0, 7.0]]),
+	numpy.array([[3.0]]),
+], ids=['float32', 'channels', 'one frame'])
+@pytest.mark.parametrize('attributeName', list(dictionaryStatistics.values()))
+def test_SummaryStatistics(arrayFramewise: NDArray[Any], attributeName: str) -> None:
+	actual: float = getattr(SummaryStatistics(arrayFramewise), attributeName)
+	expected: float = float(dictionaryStatisticsNumPy[attributeName](arrayFramewise))
+	assert isinstance(actual, float), f'{attributeName} is {type(actual)}, not float.'
+	assert actual == pytest.approx(expected, rel=1e-6), f'{attributeName} is {actual}, not {expected}.'  # pyright: ignore[reportUnknownMemberType]
+
+@pytest.mark.parametrize(('arrayFramewise', 'dictionaryExpected'), [
+	(numpy.array([[1.0, 2.0, 3.0, 4.0]]), {'mean': 2.5, 'median': 2.5, 'minimum': 1.0, 'maximum': 4.0, 'percentile5': 1.15, 'percentile95': 3.85}),
+	(numpy.array([[4.0, 1.0, 3.0, 2.0], [8.0, 6.0, 5.0, 7.0]]), {'mean': 4.5, 'median': 4.5, 'standardDeviation': 5.25 ** 0.5, 'minimum': 1.0, 'maximum': 8.0, 'percentile5': 1.35, 'percentile95': 7.65}),
+], ids=['even frames', 'even frames per channel'])
+def test_SummaryStatisticsKnown(arrayFramewise: NDArray[Any], dictionaryExpected: dict[str, float]) -> None:
+	summaryStatistics = SummaryStatistics(arrayFramewise)
+	for attributeName, expected in dictionaryExpected.items():
+		actual: float = getattr(summaryStatistics, attributeName)
+		assert actual == pytest.approx(expected, rel=1e-12), f'{attributeName} is {actual}, not {expected}.'  # pyright: ignore[reportUnknownMemberType]
+
+@pytest.mark.parametrize('arrayFramewise', [numpy.array([[1.0, numpy.nan, 2.0]]), numpy.array([], dtype=numpy.float64).reshape(0, 0)], ids=['NaN', 'empty'])
+def test_SummaryStatisticsNaN(arrayFramewise: NDArray[Any]) -> None:
+	summaryStatistics = SummaryStatistics(arrayFramewise)
+	# The mean of an empty array is NaN with the `RuntimeWarning` of `numpy.mean`, as in the mean aspects.
+	with warnings.catch_warnings():
+		warnings.simplefilter('ignore', RuntimeWarning)
+		assert numpy.isnan(summaryStatistics.mean), f'{summaryStatistics.mean = }.'
+	for attributeName in list(dictionaryStatistics.values())[1:]:
+		assert numpy.isnan(getattr(summaryStatistics, attributeName)), f'{attributeName} is {getattr(summaryStatistics, attributeName)}, not NaN.'
+
+def test_registrationAudioAspectSummaryStatistic() -> None:
+	with pytest.raises(ValueError, match='statistic'):
+		registrationAudioAspectSummary('Spectral flux', ['mean', 'mode'])
+
+def test_analyzeAudioFileSummary(pathFilename: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	listAspectNames: list[str] = [f'Spectral flux {statistic}' for statistic in dictionaryStatistics]
+	listCalls: list[str] = []
+	analyzer: Callable[..., Any] = audioAspects[listAspectNames[0]]['analyzer']
+
+	def analyzerCounted(*arguments: Any, **keywordArguments: Any) -> Any:
+		listCalls.append(analyzer.__name__)
+		return analyzer(*arguments, **keywordArguments)
+
+	for aspectName in listAspectNames:
+		monkeypatch.setitem(audioAspects, aspectName, {**audioAspects[aspectName], 'analyzer': analyzerCounted})
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	assert listCalls == ['analyzeSpectral_flux'], f'analyzeAudioFile({pathFilename.name}) called {listCalls} for {len(listAspectNames)} statistics of one analyzer.'
+	summaryStatistics = SummaryStatistics(analyzeSpectral_flux(pathFilename))
+	aspectValuesExpected: list[float] = [getattr(summaryStatistics, attributeName) for attributeName in dictionaryStatistics.values()]
+	assert aspectValues == pytest.approx(aspectValuesExpected, nan_ok=True), f'analyzeAudioFile({pathFilename.name}) returned {aspectValues}, not {aspectValuesExpected}.'  # pyright: ignore[reportUnknownMemberType]
+
+def test_analyzeAudioFileSummarySpectralFeatures(pathFilename: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+	listAspectNames: list[str] = ['Spectral Centroid mean', 'Spectral Centroid median', 'Spectral Bandwidth 95th percentile', 'Spectral Flatness dB minimum', 'RMS Spectrogram standard deviation']
+	aspectValuesSeparate: list[float] = [analyzeAudioFile(pathFilename, [aspectName])[0] for aspectName in listAspectNames]  # pyright: ignore[reportAssignmentType]
+	listFeatureNames: list[str] = []
+	spectralFeatureShared: Callable[..., Any] = analyzeAudio.analyzersUseSpectrogram._spectralFeatureShared
+
+	def spectralFeatureSharedCounted(spectrogramMagnitude: Any, featureName: str, keywordArguments: dict[str, Any]) -> Any:
+		listFeatureNames.append(featureName)
+		return spectralFeatureShared(spectrogramMagnitude, featureName, keywordArguments)
+
+	monkeypatch.setattr(analyzeAudio.analyzersUseSpectrogram, '_spectralFeatureShared', spectralFeatureSharedCounted)
+	aspectValues = analyzeAudioFile(pathFilename, listAspectNames)
+	assert sorted(listFeatureNames) == ['rootMeanSquare', 'spectralBandwidth', 'spectralCentroid', 'spectralFlatness_dB'], f'analyzeAudioFile({pathFilename.name}) read the features {listFeatureNames}.'
+	assert aspectValues == pytest.approx(aspectValuesSeparate, rel=1e-9, nan_ok=True), f'analyzeAudioFile({pathFilename.name}) returned {aspectValues}, not {aspectValuesSeparate}.'  # pyright: ignore[reportUnknownMemberType]